@@ -23,13 +23,16 @@ namespace JetClustering {
     std::vector<fastjet::PseudoJet> jets;
     std::vector<std::vector<int>> constituents;
     std::vector<float>
-        exclusive_dmerge;  // vector of Nmax_dmerge  values associated with merging from n + 1 to n jets, for n =1, 2, ... 10
+        exclusive_dmerge;  // vector of Nmax_dmerge  values associated with merging from n + 1 to n jets, for n =1, 2, ... 10, empty if not computed
     std::vector<float> exclusive_dmerge_max;
   };
 
   /** @name JetClustering
    *  Jet clustering interface.
    This represents a set functions and utilities to perfom jet clustering from a list of.
+   A functor keeps one clustering sequence per slot (arg_nslots, e.g. ROOT::GetThreadPoolSize()),
+   so that the same instance can be used by all the threads of the event loop.
+   The exclusive d_merge values are only computed with arg_dmerge = true.
   */
   ///@{
 
@@ -41,7 +44,9 @@ namespace JetClustering {
                   int arg_exclusive = 0,
                   float arg_cut = 5,
                   int arg_sorted = 0,
-                  int arg_recombination = 0);
+                  int arg_recombination = 0,
+                  unsigned int arg_nslots = 1,
+                  bool arg_dmerge = true);
     FCCAnalysesJet operator()(const std::vector<fastjet::PseudoJet>& jets);
 
   private:
@@ -52,7 +57,8 @@ namespace JetClustering {
     int _recombination;  ///< E_scheme=0, pt_scheme=1, pt2_scheme=2, Et_scheme=3, Et2_scheme=4, BIpt_scheme=5, BIpt2_scheme=6
     fastjet::JetAlgorithm _jetAlgorithm{fastjet::JetAlgorithm::undefined_jet_algorithm};  ///<internal jet algorithm
     fastjet::RecombinationScheme _recombScheme;  ///<internal recombination scheme
-    fastjet::ClusterSequence _cs;                ///<internal clustering sequence
+    std::vector<fastjet::ClusterSequence> _cs;   ///<internal clustering sequences, one per slot
+    bool _dmerge;                                ///<compute the exclusive d_merge values (get_exclusive_dmerge)
     fastjet::JetDefinition _def;                 ///<internal jetdefinition sequence
   };
 
@@ -63,7 +69,9 @@ namespace JetClustering {
                       int arg_exclusive = 0,
                       float arg_cut = 5.,
                       int arg_sorted = 0,
-                      int arg_recombination = 0);
+                      int arg_recombination = 0,
+                      unsigned int arg_nslots = 1,
+                      bool arg_dmerge = true);
     FCCAnalysesJet operator()(const std::vector<fastjet::PseudoJet>& jets);
 
   private:
@@ -74,7 +82,8 @@ namespace JetClustering {
     int _recombination;  ///< E_scheme=0, pt_scheme=1, pt2_scheme=2, Et_scheme=3, Et2_scheme=4, BIpt_scheme=5, BIpt2_scheme=6
     fastjet::JetAlgorithm _jetAlgorithm{fastjet::JetAlgorithm::undefined_jet_algorithm};  ///<internal jet algorithm
     fastjet::RecombinationScheme _recombScheme;  ///<internal recombination scheme
-    fastjet::ClusterSequence _cs;                ///<internal clustering sequence
+    std::vector<fastjet::ClusterSequence> _cs;   ///<internal clustering sequences, one per slot
+    bool _dmerge;                                ///<compute the exclusive d_merge values (get_exclusive_dmerge)
     fastjet::JetDefinition _def;                 ///<internal jetdefinition sequence
   };
 
@@ -85,7 +94,9 @@ namespace JetClustering {
                          int arg_exclusive = 0,
                          float arg_cut = 5.,
                          int arg_sorted = 0,
-                         int arg_recombination = 0);
+                         int arg_recombination = 0,
+                         unsigned int arg_nslots = 1,
+                         bool arg_dmerge = true);
     FCCAnalysesJet operator()(const std::vector<fastjet::PseudoJet>& jets);
 
   private:
@@ -96,14 +107,20 @@ namespace JetClustering {
     int _recombination;  ///< E_scheme=0, pt_scheme=1, pt2_scheme=2, Et_scheme=3, Et2_scheme=4, BIpt_scheme=5, BIpt2_scheme=6, E0_scheme=10, p_scheme=11,
     fastjet::JetAlgorithm _jetAlgorithm{fastjet::JetAlgorithm::undefined_jet_algorithm};  ///<internal jet algorithm
     fastjet::RecombinationScheme _recombScheme;  ///<internal recombination scheme
-    fastjet::ClusterSequence _cs;                ///<internal clustering sequence
+    std::vector<fastjet::ClusterSequence> _cs;   ///<internal clustering sequences, one per slot
+    bool _dmerge;                                ///<compute the exclusive d_merge values (get_exclusive_dmerge)
     fastjet::JetDefinition _def;                 ///<internal jetdefinition sequence
   };
 
   ///Jet Clustering interface for ee_kt
   struct clustering_ee_kt {
   public:
-    clustering_ee_kt(int arg_exclusive = 0, float arg_cut = 5., int arg_sorted = 0, int arg_recombination = 0);
+    clustering_ee_kt(int arg_exclusive = 0,
+                     float arg_cut = 5.,
+                     int arg_sorted = 0,
+                     int arg_recombination = 0,
+                     unsigned int arg_nslots = 1,
+                     bool arg_dmerge = true);
     FCCAnalysesJet operator()(const std::vector<fastjet::PseudoJet>& jets);
 
     int _exclusive;  ///< flag for exclusive jet clustering. Possible choices are 0=inclusive clustering, 1=exclusive clustering that would be obtained when running the algorithm with the given dcut, 2=exclusive clustering when the event is clustered (in the exclusive sense) to exactly njets, 3=exclusive clustering when the event is clustered (in the exclusive sense) up to exactly njets, 4=exclusive jets obtained at the given ycut
@@ -112,7 +129,8 @@ namespace JetClustering {
     int _recombination;  ///< E_scheme=0, pt_scheme=1, pt2_scheme=2, Et_scheme=3, Et2_scheme=4, BIpt_scheme=5, BIpt2_scheme=6, E0_scheme=10, p_scheme=11
     fastjet::JetAlgorithm _jetAlgorithm{fastjet::JetAlgorithm::undefined_jet_algorithm};  ///<internal jet algorithm
     fastjet::RecombinationScheme _recombScheme;  ///<internal recombination scheme
-    fastjet::ClusterSequence _cs;                ///<internal clustering sequence
+    std::vector<fastjet::ClusterSequence> _cs;   ///<internal clustering sequences, one per slot
+    bool _dmerge;                                ///<compute the exclusive d_merge values (get_exclusive_dmerge)
     fastjet::JetDefinition _def;                 ///<internal jetdefinition sequence
   };
 
@@ -124,7 +142,9 @@ namespace JetClustering {
                         float arg_cut = 5.,
                         int arg_sorted = 0,
                         int arg_recombination = 0,
-                        float arg_exponent = 0.);
+                        float arg_exponent = 0.,
+                        unsigned int arg_nslots = 1,
+                        bool arg_dmerge = true);
     FCCAnalysesJet operator()(const std::vector<fastjet::PseudoJet>& jets);
 
   private:
@@ -136,7 +156,8 @@ namespace JetClustering {
     float _exponent;     /// anti-kT algorithm=-1, cambridge algorithm=0, kT algorithm=1
     fastjet::JetAlgorithm _jetAlgorithm{fastjet::JetAlgorithm::undefined_jet_algorithm};  ///<internal jet algorithm
     fastjet::RecombinationScheme _recombScheme;  ///<internal recombination scheme
-    fastjet::ClusterSequence _cs;                ///<internal clustering sequence
+    std::vector<fastjet::ClusterSequence> _cs;   ///<internal clustering sequences, one per slot
+    bool _dmerge;                                ///<compute the exclusive d_merge values (get_exclusive_dmerge)
     fastjet::JetDefinition _def;                 ///<internal jetdefinition sequence
   };
 
@@ -148,7 +169,9 @@ namespace JetClustering {
                      float arg_cut = 5.,
                      int arg_sorted = 0,
                      int arg_recombination = 0,
-                     float arg_exponent = 0.);
+                     float arg_exponent = 0.,
+                     unsigned int arg_nslots = 1,
+                     bool arg_dmerge = true);
     FCCAnalysesJet operator()(const std::vector<fastjet::PseudoJet>& jets);
 
   private:
@@ -160,7 +183,8 @@ namespace JetClustering {
     float _exponent;     /// anti-kT algorithm=-1, cambridge algorithm=0, kT algorithm=1
     fastjet::JetAlgorithm _jetAlgorithm{fastjet::JetAlgorithm::undefined_jet_algorithm};  ///<internal jet algorithm
     fastjet::RecombinationScheme _recombScheme;  ///<internal recombination scheme
-    fastjet::ClusterSequence _cs;                ///<internal clustering sequence
+    std::vector<fastjet::ClusterSequence> _cs;   ///<internal clustering sequences, one per slot
+    bool _dmerge;                                ///<compute the exclusive d_merge values (get_exclusive_dmerge)
     fastjet::JetDefinition _def;                 ///<internal jetdefinition sequence
   };
 
@@ -173,7 +197,9 @@ namespace JetClustering {
                         int arg_sorted = 0,
                         int arg_recombination = 0,
                         float arg_beta = 1.,
-                        float arg_gamma = 1.);
+                        float arg_gamma = 1.,
+                        unsigned int arg_nslots = 1,
+                        bool arg_dmerge = true);
     FCCAnalysesJet operator()(const std::vector<fastjet::PseudoJet>& jets);
 
   private:
@@ -187,7 +213,8 @@ namespace JetClustering {
     //fastjet::JetAlgorithm _jetAlgorithm {fastjet::JetAlgorithm::undefined_jet_algorithm};///<internal jet algorithm
     fastjet::contrib::ValenciaPlugin* _jetAlgorithm;
     fastjet::RecombinationScheme _recombScheme;  ///<internal recombination scheme
-    fastjet::ClusterSequence _cs;                ///<internal clustering sequence
+    std::vector<fastjet::ClusterSequence> _cs;   ///<internal clustering sequences, one per slot
+    bool _dmerge;                                ///<compute the exclusive d_merge values (get_exclusive_dmerge)
     fastjet::JetDefinition _def;                 ///<internal jetdefinition sequence
   };
 
@@ -198,7 +225,9 @@ namespace JetClustering {
                     int arg_exclusive = 0,
                     float arg_cut = 5.,
                     int arg_sorted = 0,
-                    int arg_recombination = 0);
+                    int arg_recombination = 0,
+                    unsigned int arg_nslots = 1,
+                    bool arg_dmerge = true);
     FCCAnalysesJet operator()(const std::vector<fastjet::PseudoJet>& jets);
 
   private:
@@ -210,7 +239,8 @@ namespace JetClustering {
     //fastjet::JetAlgorithm _jetAlgorithm {fastjet::JetAlgorithm::undefined_jet_algorithm};///<internal jet algorithm
     fastjet::JadePlugin* _jetAlgorithm;
     fastjet::RecombinationScheme _recombScheme;  ///<internal recombination scheme
-    fastjet::ClusterSequence _cs;                ///<internal clustering sequence
+    std::vector<fastjet::ClusterSequence> _cs;   ///<internal clustering sequences, one per slot
+    bool _dmerge;                                ///<compute the exclusive d_merge values (get_exclusive_dmerge)
     fastjet::JetDefinition _def;                 ///<internal jetdefinition sequence
   };
   ///@}
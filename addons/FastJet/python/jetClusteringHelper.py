@@ -4,7 +4,7 @@ import ROOT
 ROOT.gROOT.SetBatch(True)
 
 class ExclusiveJetClusteringHelper:
-    def __init__(self, coll, njets, tag=""):
+    def __init__(self, coll, njets, tag="", dmerge=False):
 
         self.input_coll = coll
         self.njets = njets
@@ -55,7 +55,11 @@ class ExclusiveJetClusteringHelper:
         )
 
         # run jet clustering with all reconstructed particles. ee_kt_algorithm, R=1.5, inclusive clustering, E-scheme
-        self.definition[_jet] = "JetClustering::clustering_ee_kt(2, {}, 1, 0)({})".format(njets, pjetc)
+        # a single clustering functor is shared by all the slots of the event loop, each slot reusing its own clustering sequence
+        nslots = ROOT.GetThreadPoolSize() if ROOT.GetThreadPoolSize() > 0 else 1
+        # the exclusive d_merge values are only computed if the dmerge columns are asked for
+        self.clustering = ROOT.JetClustering.clustering_ee_kt(2, njets, 1, 0, nslots, dmerge)
+        self.definition[_jet] = (self.clustering, [pjetc])
 
         # get the jets out of the struct
         self.definition[jet] = "JetClusteringUtils::get_pseudoJets({})".format(_jet)
@@ -77,10 +81,20 @@ class ExclusiveJetClusteringHelper:
         self.definition[self.jet_obs["nconst"]] = "JetConstituentsUtils::count_consts({})".format(self.constituents)
         self.definition[event_njet] = "JetConstituentsUtils::count_jets({})".format(self.constituents)
 
+        # d_{n,n+1}, distance at which the event goes from n+1 to n jets
+        if dmerge:
+            for n in range(1, njets + 1):
+                event_dmerge = "event_d{}{}{}".format(n, n + 1, self.tag)
+                self.definition[event_dmerge] = "JetClusteringUtils::get_exclusive_dmerge({}, {})".format(_jet, n)
+
     def define(self, df):
 
         for var, call in self.definition.items():
-            df = df.Define(var, call)
+            if isinstance(call, str):
+                df = df.Define(var, call)
+            else:
+                # C++ functor and its input columns
+                df = df.Define(var, *call)
 
         return df
 
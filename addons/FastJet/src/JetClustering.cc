@@ -7,10 +7,62 @@
 #include "fastjet/PseudoJet.hh"
 #include "fastjet/Selector.hh"
 
+#include <algorithm>
+
+#include <tbb/task_arena.h>
+
 namespace JetClustering {
 
-  clustering_kt::clustering_kt(
-      float arg_radius, int arg_exclusive, float arg_cut, int arg_sorted, int arg_recombination) {
+  namespace {
+    FCCAnalysesJet build_jets(fastjet::ClusterSequence& cs, int exclusive, float cut, int sorted, bool do_dmerge) {
+      //cluster jets
+      std::vector<fastjet::PseudoJet> pjets = FCCAnalyses::JetClusteringUtils::build_jets(cs, exclusive, cut, sorted);
+      //get dmerged elements, only if asked for
+      std::vector<float> dmerge, dmerge_max;
+      if (do_dmerge) {
+        dmerge = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(cs, 0);
+        dmerge_max = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(cs, 1);
+      }
+
+      //transform to FCCAnalysesJet
+      return FCCAnalyses::JetClusteringUtils::build_FCCAnalysesJet(pjets, dmerge, dmerge_max);
+    }
+
+    /// clusters the input with the clustering sequence of the calling thread, so that
+    /// a functor shared by all the RDataFrame slots can be used concurrently
+    FCCAnalysesJet cluster(std::vector<fastjet::ClusterSequence>& slots,
+                           const fastjet::JetDefinition& def,
+                           const std::vector<fastjet::PseudoJet>& input,
+                           int exclusive,
+                           float cut,
+                           int sorted,
+                           bool do_dmerge) {
+      //return empty struct
+      if (FCCAnalyses::JetClusteringUtils::check(input.size(), exclusive, cut) == false)
+        return FCCAnalyses::JetClusteringUtils::initialise_FCCAnalysesJet();
+
+      auto const tbb_slot = std::max(tbb::this_task_arena::current_thread_index(), 0);
+      if (static_cast<unsigned int>(tbb_slot) < slots.size()) {
+        // a new sequence is built for every event, it replaces the one of the previous event of this thread and
+        // stays alive until the next one, as the jets returned still refer to it (FastJet has no way to rerun an
+        // existing sequence on a new input, so its storage is not reused)
+        slots[tbb_slot] = fastjet::ClusterSequence(input, def);
+        return build_jets(slots[tbb_slot], exclusive, cut, sorted, do_dmerge);
+      }
+
+      //more threads than slots (e.g. a functor built on the fly in a Define), use a clustering sequence of its own
+      fastjet::ClusterSequence cs(input, def);
+      return build_jets(cs, exclusive, cut, sorted, do_dmerge);
+    }
+  }  // namespace
+
+  clustering_kt::clustering_kt(float arg_radius,
+                               int arg_exclusive,
+                               float arg_cut,
+                               int arg_sorted,
+                               int arg_recombination,
+                               unsigned int arg_nslots,
+                               bool arg_dmerge) {
     _radius = arg_radius;
     _exclusive = arg_exclusive;
     _cut = arg_cut;
@@ -24,33 +76,24 @@ namespace JetClustering {
     _recombScheme = FCCAnalyses::JetClusteringUtils::recomb_scheme(_recombination);
 
     //define the clustering sequence and jet definition
-    fastjet::ClusterSequence _cs;
+    _cs.resize(std::max(arg_nslots, 1U));
+    _dmerge = arg_dmerge;
     _def = fastjet::JetDefinition(_jetAlgorithm, _radius, _recombScheme);
     if (_recombScheme == fastjet::RecombinationScheme::external_scheme)
       _def.set_recombiner(new ExternalRecombiner(_recombination));
   }
 
   FCCAnalysesJet clustering_kt::operator()(const std::vector<fastjet::PseudoJet>& input) {
-    //return empty struct
-    if (FCCAnalyses::JetClusteringUtils::check(input.size(), _exclusive, _cut) == false)
-      return FCCAnalyses::JetClusteringUtils::initialise_FCCAnalysesJet();
-
-    _cs = fastjet::ClusterSequence(input, _def);
-
-    //cluster jets
-    std::vector<fastjet::PseudoJet> pjets = FCCAnalyses::JetClusteringUtils::build_jets(_cs, _exclusive, _cut, _sorted);
-    //get dmerged elements
-    std::vector<float> dmerge = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 0);
-    std::vector<float> dmerge_max = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 1);
-
-    //transform to FCCAnalysesJet
-    FCCAnalysesJet result = FCCAnalyses::JetClusteringUtils::build_FCCAnalysesJet(pjets, dmerge, dmerge_max);
-
-    return result;
+    return cluster(_cs, _def, input, _exclusive, _cut, _sorted, _dmerge);
   }
 
-  clustering_antikt::clustering_antikt(
-      float arg_radius, int arg_exclusive, float arg_cut, int arg_sorted, int arg_recombination) {
+  clustering_antikt::clustering_antikt(float arg_radius,
+                                       int arg_exclusive,
+                                       float arg_cut,
+                                       int arg_sorted,
+                                       int arg_recombination,
+                                       unsigned int arg_nslots,
+                                       bool arg_dmerge) {
     _radius = arg_radius;
     _exclusive = arg_exclusive;
     _cut = arg_cut;
@@ -65,33 +108,24 @@ namespace JetClustering {
     _recombScheme = FCCAnalyses::JetClusteringUtils::recomb_scheme(_recombination);
 
     //define the clustering sequence and jet definition
-    fastjet::ClusterSequence _cs;
+    _cs.resize(std::max(arg_nslots, 1U));
+    _dmerge = arg_dmerge;
     _def = fastjet::JetDefinition(_jetAlgorithm, _radius, _recombScheme);
     if (_recombScheme == fastjet::RecombinationScheme::external_scheme)
       _def.set_recombiner(new ExternalRecombiner(_recombination));
   }
 
   FCCAnalysesJet clustering_antikt::operator()(const std::vector<fastjet::PseudoJet>& input) {
-    //return empty struct
-    if (FCCAnalyses::JetClusteringUtils::check(input.size(), _exclusive, _cut) == false)
-      return FCCAnalyses::JetClusteringUtils::initialise_FCCAnalysesJet();
-
-    _cs = fastjet::ClusterSequence(input, _def);
-
-    //cluster jets
-    std::vector<fastjet::PseudoJet> pjets = FCCAnalyses::JetClusteringUtils::build_jets(_cs, _exclusive, _cut, _sorted);
-    //get dmerged elements
-    std::vector<float> dmerge = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 0);
-    std::vector<float> dmerge_max = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 1);
-
-    //transform to FCCAnalysesJet
-    FCCAnalysesJet result = FCCAnalyses::JetClusteringUtils::build_FCCAnalysesJet(pjets, dmerge, dmerge_max);
-
-    return result;
+    return cluster(_cs, _def, input, _exclusive, _cut, _sorted, _dmerge);
   }
 
-  clustering_cambridge::clustering_cambridge(
-      float arg_radius, int arg_exclusive, float arg_cut, int arg_sorted, int arg_recombination) {
+  clustering_cambridge::clustering_cambridge(float arg_radius,
+                                             int arg_exclusive,
+                                             float arg_cut,
+                                             int arg_sorted,
+                                             int arg_recombination,
+                                             unsigned int arg_nslots,
+                                             bool arg_dmerge) {
     _radius = arg_radius;
     _exclusive = arg_exclusive;
     _cut = arg_cut;
@@ -105,30 +139,23 @@ namespace JetClustering {
     _recombScheme = FCCAnalyses::JetClusteringUtils::recomb_scheme(_recombination);
 
     //define the clustering sequence and jet definition
-    fastjet::ClusterSequence _cs;
+    _cs.resize(std::max(arg_nslots, 1U));
+    _dmerge = arg_dmerge;
     _def = fastjet::JetDefinition(_jetAlgorithm, _radius, _recombScheme);
     if (_recombScheme == fastjet::RecombinationScheme::external_scheme)
       _def.set_recombiner(new ExternalRecombiner(_recombination));
   }
 
   FCCAnalysesJet clustering_cambridge::operator()(const std::vector<fastjet::PseudoJet>& input) {
-    //return empty struct
-    if (FCCAnalyses::JetClusteringUtils::check(input.size(), _exclusive, _cut) == false)
-      return FCCAnalyses::JetClusteringUtils::initialise_FCCAnalysesJet();
-
-    _cs = fastjet::ClusterSequence(input, _def);
-
-    //cluster jets
-    std::vector<fastjet::PseudoJet> pjets = FCCAnalyses::JetClusteringUtils::build_jets(_cs, _exclusive, _cut, _sorted);
-    //get dmerged elements
-    std::vector<float> dmerge = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 0);
-    std::vector<float> dmerge_max = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 1);
-
-    //transform to FCCAnalysesJet
-    return FCCAnalyses::JetClusteringUtils::build_FCCAnalysesJet(pjets, dmerge, dmerge_max);
+    return cluster(_cs, _def, input, _exclusive, _cut, _sorted, _dmerge);
   }
 
-  clustering_ee_kt::clustering_ee_kt(int arg_exclusive, float arg_cut, int arg_sorted, int arg_recombination) {
+  clustering_ee_kt::clustering_ee_kt(int arg_exclusive,
+                                     float arg_cut,
+                                     int arg_sorted,
+                                     int arg_recombination,
+                                     unsigned int arg_nslots,
+                                     bool arg_dmerge) {
     _exclusive = arg_exclusive;
     _cut = arg_cut;
     _sorted = arg_sorted;
@@ -141,31 +168,25 @@ namespace JetClustering {
     _recombScheme = FCCAnalyses::JetClusteringUtils::recomb_scheme(_recombination);
 
     //define the clustering sequence and jet definition
-    fastjet::ClusterSequence _cs;
+    _cs.resize(std::max(arg_nslots, 1U));
+    _dmerge = arg_dmerge;
     _def = fastjet::JetDefinition(_jetAlgorithm, _recombScheme);
     if (_recombScheme == fastjet::RecombinationScheme::external_scheme)
       _def.set_recombiner(new ExternalRecombiner(_recombination));
   }
 
   FCCAnalysesJet clustering_ee_kt::operator()(const std::vector<fastjet::PseudoJet>& input) {
-    //return empty struct
-    if (FCCAnalyses::JetClusteringUtils::check(input.size(), _exclusive, _cut) == false)
-      return FCCAnalyses::JetClusteringUtils::initialise_FCCAnalysesJet();
-
-    _cs = fastjet::ClusterSequence(input, _def);
-
-    //cluster jets
-    std::vector<fastjet::PseudoJet> pjets = FCCAnalyses::JetClusteringUtils::build_jets(_cs, _exclusive, _cut, _sorted);
-    //get dmerged elements
-    std::vector<float> dmerge = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 0);
-    std::vector<float> dmerge_max = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 1);
-
-    //transform to FCCAnalysesJet
-    return FCCAnalyses::JetClusteringUtils::build_FCCAnalysesJet(pjets, dmerge, dmerge_max);
+    return cluster(_cs, _def, input, _exclusive, _cut, _sorted, _dmerge);
   }
 
-  clustering_ee_genkt::clustering_ee_genkt(
-      float arg_radius, int arg_exclusive, float arg_cut, int arg_sorted, int arg_recombination, float arg_exponent) {
+  clustering_ee_genkt::clustering_ee_genkt(float arg_radius,
+                                           int arg_exclusive,
+                                           float arg_cut,
+                                           int arg_sorted,
+                                           int arg_recombination,
+                                           float arg_exponent,
+                                           unsigned int arg_nslots,
+                                           bool arg_dmerge) {
     _radius = arg_radius;
     _exclusive = arg_exclusive;
     _cut = arg_cut;
@@ -180,31 +201,25 @@ namespace JetClustering {
     _recombScheme = FCCAnalyses::JetClusteringUtils::recomb_scheme(_recombination);
 
     //define the clustering sequence and jet definition
-    fastjet::ClusterSequence _cs;
+    _cs.resize(std::max(arg_nslots, 1U));
+    _dmerge = arg_dmerge;
     _def = fastjet::JetDefinition(_jetAlgorithm, _radius, _exponent, _recombScheme);
     if (_recombScheme == fastjet::RecombinationScheme::external_scheme)
       _def.set_recombiner(new ExternalRecombiner(_recombination));
   }
 
   FCCAnalysesJet clustering_ee_genkt::operator()(const std::vector<fastjet::PseudoJet>& input) {
-    //return empty struct
-    if (FCCAnalyses::JetClusteringUtils::check(input.size(), _exclusive, _cut) == false)
-      return FCCAnalyses::JetClusteringUtils::initialise_FCCAnalysesJet();
-
-    _cs = fastjet::ClusterSequence(input, _def);
-
-    //cluster jets
-    std::vector<fastjet::PseudoJet> pjets = FCCAnalyses::JetClusteringUtils::build_jets(_cs, _exclusive, _cut, _sorted);
-    //get dmerged elements
-    std::vector<float> dmerge = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 0);
-    std::vector<float> dmerge_max = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 1);
-
-    //transform to FCCAnalysesJet
-    return FCCAnalyses::JetClusteringUtils::build_FCCAnalysesJet(pjets, dmerge, dmerge_max);
+    return cluster(_cs, _def, input, _exclusive, _cut, _sorted, _dmerge);
   }
 
-  clustering_genkt::clustering_genkt(
-      float arg_radius, int arg_exclusive, float arg_cut, int arg_sorted, int arg_recombination, float arg_exponent) {
+  clustering_genkt::clustering_genkt(float arg_radius,
+                                     int arg_exclusive,
+                                     float arg_cut,
+                                     int arg_sorted,
+                                     int arg_recombination,
+                                     float arg_exponent,
+                                     unsigned int arg_nslots,
+                                     bool arg_dmerge) {
     _radius = arg_radius;
     _exclusive = arg_exclusive;
     _cut = arg_cut;
@@ -219,27 +234,15 @@ namespace JetClustering {
     _recombScheme = FCCAnalyses::JetClusteringUtils::recomb_scheme(_recombination);
 
     //define the clustering sequence and jet definition
-    fastjet::ClusterSequence _cs;
+    _cs.resize(std::max(arg_nslots, 1U));
+    _dmerge = arg_dmerge;
     _def = fastjet::JetDefinition(_jetAlgorithm, _radius, _exponent, _recombScheme);
     if (_recombScheme == fastjet::RecombinationScheme::external_scheme)
       _def.set_recombiner(new ExternalRecombiner(_recombination));
   }
 
   FCCAnalysesJet clustering_genkt::operator()(const std::vector<fastjet::PseudoJet>& input) {
-    //return empty struct
-    if (FCCAnalyses::JetClusteringUtils::check(input.size(), _exclusive, _cut) == false)
-      return FCCAnalyses::JetClusteringUtils::initialise_FCCAnalysesJet();
-
-    _cs = fastjet::ClusterSequence(input, _def);
-
-    //cluster jets
-    std::vector<fastjet::PseudoJet> pjets = FCCAnalyses::JetClusteringUtils::build_jets(_cs, _exclusive, _cut, _sorted);
-
-    //get dmerged elements
-    std::vector<float> dmerge = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 0);
-    std::vector<float> dmerge_max = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 1);
-
-    return FCCAnalyses::JetClusteringUtils::build_FCCAnalysesJet(pjets, dmerge, dmerge_max);
+    return cluster(_cs, _def, input, _exclusive, _cut, _sorted, _dmerge);
   }
 
   clustering_valencia::clustering_valencia(float arg_radius,
@@ -248,7 +251,9 @@ namespace JetClustering {
                                            int arg_sorted,
                                            int arg_recombination,
                                            float arg_beta,
-                                           float arg_gamma) {
+                                           float arg_gamma,
+                                           unsigned int arg_nslots,
+                                           bool arg_dmerge) {
     _radius = arg_radius;
     _exclusive = arg_exclusive;
     _cut = arg_cut;
@@ -264,7 +269,8 @@ namespace JetClustering {
     _recombScheme = FCCAnalyses::JetClusteringUtils::recomb_scheme(_recombination);
 
     //define the clustering sequence and jet definition
-    fastjet::ClusterSequence _cs;
+    _cs.resize(std::max(arg_nslots, 1U));
+    _dmerge = arg_dmerge;
     _def = fastjet::JetDefinition(_jetAlgorithm);
     _def.set_recombination_scheme(_recombScheme);
     if (_recombScheme == fastjet::RecombinationScheme::external_scheme)
@@ -272,24 +278,16 @@ namespace JetClustering {
   }
 
   FCCAnalysesJet clustering_valencia::operator()(const std::vector<fastjet::PseudoJet>& input) {
-    //return empty struct
-    if (FCCAnalyses::JetClusteringUtils::check(input.size(), _exclusive, _cut) == false)
-      return FCCAnalyses::JetClusteringUtils::initialise_FCCAnalysesJet();
-
-    _cs = fastjet::ClusterSequence(input, _def);
-
-    //cluster jets
-    std::vector<fastjet::PseudoJet> pjets = FCCAnalyses::JetClusteringUtils::build_jets(_cs, _exclusive, _cut, _sorted);
-    //get dmerged elements
-    std::vector<float> dmerge = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 0);
-    std::vector<float> dmerge_max = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 1);
-
-    //transform to FCCAnalysesJet
-    return FCCAnalyses::JetClusteringUtils::build_FCCAnalysesJet(pjets, dmerge, dmerge_max);
+    return cluster(_cs, _def, input, _exclusive, _cut, _sorted, _dmerge);
   }
 
-  clustering_jade::clustering_jade(
-      float arg_radius, int arg_exclusive, float arg_cut, int arg_sorted, int arg_recombination) {
+  clustering_jade::clustering_jade(float arg_radius,
+                                   int arg_exclusive,
+                                   float arg_cut,
+                                   int arg_sorted,
+                                   int arg_recombination,
+                                   unsigned int arg_nslots,
+                                   bool arg_dmerge) {
     _radius = arg_radius;
     _exclusive = arg_exclusive;
     _cut = arg_cut;
@@ -302,7 +300,8 @@ namespace JetClustering {
     // initialize recombination scheme
     fastjet::RecombinationScheme _recombScheme = FCCAnalyses::JetClusteringUtils::recomb_scheme(_recombination);
 
-    fastjet::ClusterSequence _cs;
+    _cs.resize(std::max(arg_nslots, 1U));
+    _dmerge = arg_dmerge;
     _def = fastjet::JetDefinition(_jetAlgorithm);
     _def.set_recombination_scheme(_recombScheme);
     if (_recombScheme == fastjet::RecombinationScheme::external_scheme)
@@ -310,21 +309,7 @@ namespace JetClustering {
   }
 
   FCCAnalysesJet clustering_jade::operator()(const std::vector<fastjet::PseudoJet>& input) {
-    //return empty struct
-    if (FCCAnalyses::JetClusteringUtils::check(input.size(), _exclusive, _cut) == false)
-      return FCCAnalyses::JetClusteringUtils::initialise_FCCAnalysesJet();
-
-    _cs = fastjet::ClusterSequence(input, _def);
-
-    //cluster jets
-    std::vector<fastjet::PseudoJet> pjets = FCCAnalyses::JetClusteringUtils::build_jets(_cs, _exclusive, _cut, _sorted);
-
-    //get dmerged elements
-    std::vector<float> dmerge = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 0);
-    std::vector<float> dmerge_max = FCCAnalyses::JetClusteringUtils::exclusive_dmerge(_cs, 1);
-
-    //transform to FCCAnalysesJet
-    return FCCAnalyses::JetClusteringUtils::build_FCCAnalysesJet(pjets, dmerge, dmerge_max);
+    return cluster(_cs, _def, input, _exclusive, _cut, _sorted, _dmerge);
   }
 
 }  // namespace JetClustering
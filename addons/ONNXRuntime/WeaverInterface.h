@@ -11,14 +11,25 @@ public:
   using ConstituentVars = rv::RVec<float>;
 
   /// Initialise an inference model from Weaver output ONNX/JSON files and
-  /// a list of variables to be provided for each event/jet
+  /// a list of variables to be provided for each event/jet, and the maximum number of jets evaluated in one ONNX
+  /// session call (0 for no limit)
   explicit WeaverInterface(const std::string& onnx_filename = "",
                            const std::string& json_filename = "",
-                           const rv::RVec<std::string>& vars = {});
+                           const rv::RVec<std::string>& vars = {},
+                           size_t max_batch_size = 0);
 
   /// Run inference given a list of jet constituents variables
   rv::RVec<float> run(const rv::RVec<ConstituentVars>&);
 
+  /// Run inference for several jets in as few ONNX session calls as possible, given the
+  /// list of constituents variables of each jet. Jets are padded to a common length only if
+  /// the model declares a mask input, otherwise only jets of equal padded lengths are evaluated together
+  rv::RVec<rv::RVec<float> > run_batch(const rv::RVec<rv::RVec<ConstituentVars> >&);
+
+  /// Key of a jet for the batching: jets with equal keys can be evaluated in a single ONNX session call
+  /// (padded lengths of all inputs, empty if the model declares a mask input)
+  std::vector<size_t> batchKey(const rv::RVec<ConstituentVars>&) const;
+
 private:
   struct PreprocessParams {
     struct VarInfo {
@@ -60,13 +71,16 @@ private:
                                      float min = 0,
                                      float max = -1);
   size_t variablePos(const std::string&) const;
+  /// Run inference in a single ONNX session call for the selected jets, padded to the length of the longest one
+  rv::RVec<rv::RVec<float> > run_padded(const rv::RVec<rv::RVec<ConstituentVars> >&, const std::vector<size_t>&);
 
   std::unique_ptr<ONNXRuntime> onnx_;
   std::vector<std::string> variables_names_;
-  ONNXRuntime::Tensor<long> input_shapes_;
   std::vector<unsigned int> input_sizes_;
   std::unordered_map<std::string, PreprocessParams> prep_info_map_;
   ONNXRuntime::Tensor<float> data_;
+  size_t max_batch_size_{0};
+  bool has_mask_{false};  ///< padded constituents are masked out by the model
 };
 
 #endif
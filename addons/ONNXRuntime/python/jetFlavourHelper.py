@@ -34,173 +34,33 @@ class JetFlavourHelper:
             self.particle
         )
 
-        # build jet constituents lists
-        self.definition["pfcand_isMu{}".format(self.tag)] = "JetConstituentsUtils::get_isMu({})".format(self.const)
-        self.definition["pfcand_isEl{}".format(self.tag)] = "JetConstituentsUtils::get_isEl({})".format(self.const)
-        self.definition["pfcand_isChargedHad{}".format(self.tag)] = "JetConstituentsUtils::get_isChargedHad({})".format(
-            self.const
-        )
-        self.definition["pfcand_isGamma{}".format(self.tag)] = "JetConstituentsUtils::get_isGamma({})".format(
-            self.const
-        )
-        self.definition["pfcand_isNeutralHad{}".format(self.tag)] = "JetConstituentsUtils::get_isNeutralHad({})".format(
-            self.const
-        )
-
-        # kinematics, displacement, PID
-        self.definition["pfcand_e{}".format(self.tag)] = "JetConstituentsUtils::get_e({})".format(self.const)
-        self.definition["pfcand_p{}".format(self.tag)] = "JetConstituentsUtils::get_p({})".format(self.const)
-        self.definition["pfcand_theta{}".format(self.tag)] = "JetConstituentsUtils::get_theta({})".format(self.const)
-        self.definition["pfcand_phi{}".format(self.tag)] = "JetConstituentsUtils::get_phi({})".format(self.const)
-        self.definition["pfcand_charge{}".format(self.tag)] = "JetConstituentsUtils::get_charge({})".format(self.const)
-        self.definition["pfcand_type{}".format(self.tag)] = "JetConstituentsUtils::get_type({})".format(self.const)
-        self.definition["pfcand_erel{}".format(self.tag)] = "JetConstituentsUtils::get_erel_cluster({}, {})".format(
-            jet, self.const
-        )
-
-        self.definition[
-            "pfcand_erel_log{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_erel_log_cluster({}, {})".format(jet, self.const)
-
-        self.definition[
-            "pfcand_thetarel{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_thetarel_cluster({}, {})".format(jet, self.const)
-
-        self.definition["pfcand_phirel{}".format(self.tag)] = "JetConstituentsUtils::get_phirel_cluster({}, {})".format(
-            jet, self.const
-        )
-
-        self.definition[
-            "pfcand_dndx{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_dndx({}, {}, {}, pfcand_isChargedHad{})".format(
-            self.const, self.dndx, self.pftrack, self.tag
-        )
-
-        self.definition[
-            "pfcand_mtof{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_mtof({}, {}, {}, {}, {}, {}, {}, pv{})".format(
-            self.const, self.l, self.pftrack, self.trackerhits, self.pfphoton, self.pfnh, self.calohits, self.tag
-        )
-
         self.definition["Bz{}".format(self.tag)] = "{}[0]".format(self.bz)
 
-        self.definition[
-            "pfcand_dxy{}".format(self.tag)
-        ] = "JetConstituentsUtils::XPtoPar_dxy({}, {}, pv{}, Bz{})".format(
-            self.const, self.trackstate, self.tag, self.tag
-        )
-
-        self.definition["pfcand_dz{}".format(self.tag)] = "JetConstituentsUtils::XPtoPar_dz({}, {}, pv{}, Bz{})".format(
-            self.const, self.trackstate, self.tag, self.tag
-        )
-
-        self.definition[
-            "pfcand_phi0{}".format(self.tag)
-        ] = "JetConstituentsUtils::XPtoPar_phi({}, {}, pv{}, Bz{})".format(
-            self.const, self.trackstate, self.tag, self.tag
-        )
-
-        self.definition["pfcand_C{}".format(self.tag)] = "JetConstituentsUtils::XPtoPar_C({}, {}, Bz{})".format(
-            self.const, self.trackstate, self.tag
-        )
-
-        self.definition["pfcand_ct{}".format(self.tag)] = "JetConstituentsUtils::XPtoPar_ct({}, {}, Bz{})".format(
-            self.const, self.trackstate, self.tag
-        )
-
-        self.definition["pfcand_dptdpt{}".format(self.tag)] = "JetConstituentsUtils::get_omega_cov({}, {})".format(
-            self.const, self.trackstate
-        )
-
-        self.definition["pfcand_dxydxy{}".format(self.tag)] = "JetConstituentsUtils::get_d0_cov({}, {})".format(
-            self.const, self.trackstate
-        )
-
-        self.definition["pfcand_dzdz{}".format(self.tag)] = "JetConstituentsUtils::get_z0_cov({}, {})".format(
-            self.const, self.trackstate
-        )
-
-        self.definition["pfcand_dphidphi{}".format(self.tag)] = "JetConstituentsUtils::get_phi0_cov({}, {})".format(
-            self.const, self.trackstate
-        )
-
-        self.definition[
-            "pfcand_detadeta{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_tanlambda_cov({}, {})".format(self.const, self.trackstate)
-
-        self.definition["pfcand_dxydz{}".format(self.tag)] = "JetConstituentsUtils::get_d0_z0_cov({}, {})".format(
-            self.const, self.trackstate
-        )
-
-        self.definition["pfcand_dphidxy{}".format(self.tag)] = "JetConstituentsUtils::get_phi0_d0_cov({}, {})".format(
-            self.const, self.trackstate
-        )
-
-        self.definition["pfcand_phidz{}".format(self.tag)] = "JetConstituentsUtils::get_phi0_z0_cov({}, {})".format(
-            self.const, self.trackstate
-        )
-
-        self.definition[
-            "pfcand_phictgtheta{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_tanlambda_phi0_cov({}, {})".format(self.const, self.trackstate)
-
-        self.definition[
-            "pfcand_dxyctgtheta{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_tanlambda_d0_cov({}, {})".format(self.const, self.trackstate)
-
-        self.definition[
-            "pfcand_dlambdadz{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_tanlambda_z0_cov({}, {})".format(self.const, self.trackstate)
-
-        self.definition[
-            "pfcand_cctgtheta{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_omega_tanlambda_cov({}, {})".format(self.const, self.trackstate)
-
-        self.definition["pfcand_phic{}".format(self.tag)] = "JetConstituentsUtils::get_omega_phi0_cov({}, {})".format(
-            self.const, self.trackstate
-        )
-
-        self.definition["pfcand_dxyc{}".format(self.tag)] = "JetConstituentsUtils::get_omega_d0_cov({}, {})".format(
-            self.const, self.trackstate
-        )
-
-        self.definition["pfcand_cdz{}".format(self.tag)] = "JetConstituentsUtils::get_omega_z0_cov({}, {})".format(
-            self.const, self.trackstate
-        )
-
-        self.definition[
-            "pfcand_btagSip2dVal{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_Sip2dVal_clusterV({}, pfcand_dxy{}, pfcand_phi0{}, Bz{})".format(
-            jet, self.tag, self.tag, self.tag
-        )
-
-        self.definition[
-            "pfcand_btagSip2dSig{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_Sip2dSig(pfcand_btagSip2dVal{}, pfcand_dxydxy{})".format(self.tag, self.tag)
-
-        self.definition[
-            "pfcand_btagSip3dVal{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_Sip3dVal_clusterV({}, pfcand_dxy{}, pfcand_dz{}, pfcand_phi0{}, Bz{})".format(
-            jet, self.tag, self.tag, self.tag, self.tag
-        )
-
-        self.definition[
-            "pfcand_btagSip3dSig{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_Sip3dSig(pfcand_btagSip3dVal{}, pfcand_dxydxy{}, pfcand_dzdz{})".format(
-            self.tag, self.tag, self.tag
-        )
-
-        self.definition[
-            "pfcand_btagJetDistVal{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_JetDistVal_clusterV({}, {}, pfcand_dxy{}, pfcand_dz{}, pfcand_phi0{}, Bz{})".format(
-            jet, self.const, self.tag, self.tag, self.tag, self.tag
-        )
-
-        self.definition[
-            "pfcand_btagJetDistSig{}".format(self.tag)
-        ] = "JetConstituentsUtils::get_JetDistSig(pfcand_btagJetDistVal{}, pfcand_dxydxy{}, pfcand_dzdz{})".format(
-            self.tag, self.tag, self.tag
-        )
+        # identification, kinematics, displacement, PID of all the jet constituents, computed in a single pass
+        self.features = "pfcand_features{}".format(self.tag)
+        self.definition[self.features] = (
+            "JetConstituentsUtils::get_features_cluster({}, {}, {}, pv{}, Bz{}, {}, {}, {}, {}, {}, {}, {})".format(
+                jet,
+                self.const,
+                self.trackstate,
+                self.tag,
+                self.tag,
+                self.dndx,
+                self.pftrack,
+                self.l,
+                self.trackerhits,
+                self.pfphoton,
+                self.pfnh,
+                self.calohits,
+            )
+        )
+
+        # one column per feature, as views on the features tensor
+        self.features_names = [str(name) for name in ROOT.JetConstituentsUtils.get_features_names()]
+        for name in self.features_names:
+            self.definition["{}{}".format(name, self.tag)] = 'JetConstituentsUtils::get_feature({}, "{}")'.format(
+                self.features, name
+            )
 
         self.definition["jet_nmu{}".format(self.tag)] = "JetConstituentsUtils::count_type(pfcand_isMu{})".format(
             self.tag
@@ -225,7 +85,7 @@ class JetFlavourHelper:
 
         return df
 
-    def inference(self, jsonCfg, onnxCfg, df):
+    def inference(self, jsonCfg, onnxCfg, df, batch_size=0):
 
         ## extract input variables/score name and ordering from json file
         initvars, self.variables, self.scores = [], [], []
@@ -256,10 +116,13 @@ class JetFlavourHelper:
                 print("ERROR: {} variables was not defined.".format(varname))
                 sys.exit()
 
-        self.get_weight_str = "JetFlavourUtils::get_weights(rdfslot_, "
-        for var in self.variables:
-            self.get_weight_str += "{},".format(var)
-        self.get_weight_str = "{})".format(self.get_weight_str[:-1])
+        if all(var in self.features_names for var in initvars):
+            # feed the features tensor directly, without copying each variable column
+            self.get_weight_str = "JetFlavourUtils::get_weights_from_features(rdfslot_, {})".format(self.features)
+            jets_vars_str = "JetFlavourUtils::get_jets_variables_from_features({})".format(self.features)
+        else:
+            self.get_weight_str = "JetFlavourUtils::get_weights(rdfslot_, {})".format(", ".join(self.variables))
+            jets_vars_str = "JetFlavourUtils::get_jets_variables({})".format(", ".join(self.variables))
 
         from ROOT import JetFlavourUtils
 
@@ -268,7 +131,18 @@ class JetFlavourHelper:
             jsonCfg,  # .json file produced by weaver during training
             initvars,
             ROOT.GetThreadPoolSize() if ROOT.GetThreadPoolSize() > 0 else 1,
-        )
+            batch_size,  # max. number of jets per inference call, 0 for all jets of an event scored per event
+        )
+
+        if batch_size > 0:
+            # score the jets of many events per inference call, batch_size jets at a time, in an event loop run
+            # now over the same entries; the weights are then read back by entry number
+            jets_col = "MVAJets_{}".format(self.tag)
+            njets = JetFlavourUtils.cache_weights(
+                ROOT.RDF.AsRNode(df.Define(jets_col, jets_vars_str)), jets_col, batch_size
+            )
+            print("----> INFO: {} jets scored in batches of {} jets".format(njets.GetValue(), batch_size))
+            self.get_weight_str = "JetFlavourUtils::get_cached_weights(rdfentry_)"
 
         # run inference and cast scores
         df = df.Define("MVAVec_{}".format(self.tag), self.get_weight_str)
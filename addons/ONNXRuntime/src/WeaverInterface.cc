@@ -3,11 +3,13 @@
 #include "nlohmann/json.hpp"
 #include <fstream>
 #include <iostream>
+#include <map>
 
 WeaverInterface::WeaverInterface(const std::string& onnx_filename,
                                  const std::string& json_filename,
-                                 const rv::RVec<std::string>& vars)
-    : variables_names_(vars.begin(), vars.end()) {
+                                 const rv::RVec<std::string>& vars,
+                                 size_t max_batch_size)
+    : variables_names_(vars.begin(), vars.end()), max_batch_size_(max_batch_size) {
   if (onnx_filename.empty())
     throw std::runtime_error("ONNX modeld input file not specified!");
   if (json_filename.empty())
@@ -25,14 +27,15 @@ WeaverInterface::WeaverInterface(const std::string& onnx_filename,
       info.name = input;
       // retrieve the variables names
       group_params.at("var_names").get_to(info.var_names);
-      // retrieve the shapes for all variables
+      for (const auto& name : info.var_names)
+        if (name.find("_mask") != std::string::npos)
+          has_mask_ = true;
+      // retrieve the lengths for all variables (tensor shapes are set for each batch)
       if (group_params.contains("var_length")) {
         info.min_length = info.max_length = group_params.at("var_length");
-        input_shapes_.push_back({1, (int64_t)info.var_names.size(), (int64_t)info.min_length});
       } else {
         info.min_length = group_params.at("min_length");
         info.max_length = group_params.at("max_length");
-        input_shapes_.push_back({1, (int64_t)info.var_names.size(), -1});
       }
       // for all variables, retrieve the allowed range
       const auto& var_info_params = group_params.at("var_infos");
@@ -92,42 +95,95 @@ size_t WeaverInterface::variablePos(const std::string& var_name) const {
 }
 
 rv::RVec<float> WeaverInterface::run(const rv::RVec<ConstituentVars>& constituents) {
+  return run_batch({constituents}).at(0);
+}
+
+std::vector<size_t> WeaverInterface::batchKey(const rv::RVec<ConstituentVars>& constituents) const {
+  std::vector<size_t> lengths;
+  if (has_mask_)  // padded constituents are ignored by the model, all jets can be padded to a common length
+    return lengths;
+  // without a mask, each jet has to keep its own padded length for all inputs
+  for (const auto& name : onnx_->inputNames()) {
+    const auto& params = prep_info_map_.at(name);
+    lengths.emplace_back(std::clamp(constituents.at(0).size(), params.min_length, params.max_length));
+  }
+  return lengths;
+}
+
+rv::RVec<rv::RVec<float> > WeaverInterface::run_batch(const rv::RVec<rv::RVec<ConstituentVars> >& jets) {
+  rv::RVec<rv::RVec<float> > out(jets.size());
+  // indices of the jets which can be evaluated together
+  std::vector<std::vector<size_t> > groups;
+  std::map<std::vector<size_t>, size_t> group_of_key;
+  for (size_t i = 0; i < jets.size(); ++i) {
+    const auto [it, inserted] = group_of_key.try_emplace(batchKey(jets.at(i)), groups.size());
+    if (inserted)
+      groups.emplace_back();
+    groups.at(it->second).emplace_back(i);
+  }
+  for (const auto& group : groups) {
+    const size_t batch_size = max_batch_size_ > 0 ? max_batch_size_ : group.size();
+    for (size_t first = 0; first < group.size(); first += batch_size) {
+      const std::vector<size_t> batch(group.begin() + first,
+                                      group.begin() + std::min(first + batch_size, group.size()));
+      auto scores = run_padded(jets, batch);
+      for (size_t j = 0; j < batch.size(); ++j)
+        out[batch[j]] = std::move(scores[j]);
+    }
+  }
+  return out;
+}
+
+rv::RVec<rv::RVec<float> > WeaverInterface::run_padded(const rv::RVec<rv::RVec<ConstituentVars> >& jets,
+                                                       const std::vector<size_t>& batch) {
+  rv::RVec<rv::RVec<float> > out;
+  const size_t num_jets = batch.size();
+  if (num_jets == 0)
+    return out;
+  ONNXRuntime::Tensor<long> input_shapes;
   size_t i = 0;
   for (const auto& name : onnx_->inputNames()) {
     const auto& params = prep_info_map_.at(name);
+    // all jets of the batch are padded to a common length to build a rectangular tensor
+    size_t length = params.min_length;
+    for (auto ijet : batch)
+      length = std::max(length, std::clamp(jets.at(ijet).at(0).size(), params.min_length, params.max_length));
     auto& values = data_[i];
-    values.resize(input_sizes_.at(i));
+    values.resize(num_jets * params.var_names.size() * length);
     std::fill(values.begin(), values.end(), 0);
     size_t it_pos = 0;
     ConstituentVars jc;
-    for (size_t j = 0; j < params.var_names.size(); ++j) {  // transform and add the proper amount of padding
-      const auto& var_name = params.var_names.at(j);
-      //if (std::find(variables_names_.begin(), variables_names_.end(), "pfcand_mask") == variables_names_.end())
-      //  jc = ConstituentVars(constituents.at(0).size(), 1.f);
-
-        if (var_name.find("_mask") != std::string::npos) {
+    for (auto ijet : batch) {
+      const auto& constituents = jets.at(ijet);
+      for (size_t j = 0; j < params.var_names.size(); ++j) {  // transform and add the proper amount of padding
+        const auto& var_name = params.var_names.at(j);
+        if (var_name.find("_mask") != std::string::npos)
           jc = ConstituentVars(constituents.at(0).size(), 1.f);
-        }
-
-      else
-        jc = constituents.at(variablePos(var_name));
-      const auto& var_info = params.info(var_name);
-      auto val = center_norm_pad(jc,
-                                 var_info.center,
-                                 var_info.norm_factor,
-                                 params.min_length,
-                                 params.max_length,
-                                 var_info.pad,
-                                 var_info.replace_inf_value,
-                                 var_info.lower_bound,
-                                 var_info.upper_bound);
-      std::copy(val.begin(), val.end(), values.begin() + it_pos);
-      it_pos += val.size();
+        else
+          jc = constituents.at(variablePos(var_name));
+        const auto& var_info = params.info(var_name);
+        auto val = center_norm_pad(jc,
+                                   var_info.center,
+                                   var_info.norm_factor,
+                                   length,
+                                   length,
+                                   var_info.pad,
+                                   var_info.replace_inf_value,
+                                   var_info.lower_bound,
+                                   var_info.upper_bound);
+        std::copy(val.begin(), val.end(), values.begin() + it_pos);
+        it_pos += val.size();
+      }
     }
-    values.resize(it_pos);
+    input_shapes.push_back({(int64_t)num_jets, (int64_t)params.var_names.size(), (int64_t)length});
     ++i;
   }
-  return onnx_->run<float>(data_, input_shapes_)[0];
+  const auto scores = onnx_->run<float>(data_, input_shapes, num_jets)[0];
+  // one row of scores per jet
+  const size_t num_scores = scores.size() / num_jets;
+  for (size_t j = 0; j < num_jets; ++j)
+    out.emplace_back(scores.begin() + j * num_scores, scores.begin() + (j + 1) * num_scores);
+  return out;
 }
 
 void WeaverInterface::PreprocessParams::dumpVars() const {
@@ -1,4 +1,5 @@
 #include "FCCAnalyses/JetFlavourUtils.h"
+#include "ONNXRuntime/WeaverInterface.h"
 
 #include <catch2/catch_test_macros.hpp>
 #include <catch2/catch_approx.hpp>
@@ -21,3 +22,88 @@ TEST_CASE("flavtagging", "[onnx]") {
   REQUIRE(out.at(0).size() == 5);                              // weaver model-specific feature
   REQUIRE(ROOT::VecOps::Sum(out.at(0)) == Catch::Approx(1.));  // all weights should add up to unity
 }
+
+TEST_CASE("flavtagging_batch", "[onnx]") {
+  WeaverInterface weaver(TEST_FILE("fccee_flavtagging_dummy.onnx"),
+                         TEST_FILE("preprocess.json"),
+                         {"pfcand_e", "pfcand_theta", "pfcand_phi", "pfcand_pid", "pfcand_charge"});
+
+  const ROOT::VecOps::RVec<ROOT::VecOps::RVec<float> > jet1 = {
+      {1.38285, 19.3685}, {1.97631, 1.7312}, {-1.50803, -1.36646}, {0, 0}, {1, -1}};
+  const ROOT::VecOps::RVec<ROOT::VecOps::RVec<float> > jet2 = {
+      {5.1, 2.3, 0.7}, {1.2, 0.9, 1.4}, {0.3, 0.2, 0.5}, {0, 0, 0}, {-1, 1, 0}};
+
+  const auto out = weaver.run_batch({jet1, jet2});
+  const auto out1 = weaver.run(jet1);
+  const auto out2 = weaver.run(jet2);
+
+  REQUIRE(out.size() == 2);  // one collection of weights per jet
+  for (size_t i = 0; i < out1.size(); ++i) {
+    REQUIRE(out.at(0).at(i) == Catch::Approx(out1.at(i)));
+    REQUIRE(out.at(1).at(i) == Catch::Approx(out2.at(i)));
+  }
+}
+
+TEST_CASE("flavtagging_batch_size", "[onnx]") {
+  WeaverInterface weaver(TEST_FILE("fccee_flavtagging_dummy.onnx"),
+                         TEST_FILE("preprocess.json"),
+                         {"pfcand_e", "pfcand_theta", "pfcand_phi", "pfcand_pid", "pfcand_charge"});
+  WeaverInterface weaver_single(TEST_FILE("fccee_flavtagging_dummy.onnx"),
+                                TEST_FILE("preprocess.json"),
+                                {"pfcand_e", "pfcand_theta", "pfcand_phi", "pfcand_pid", "pfcand_charge"},
+                                1);
+
+  const ROOT::VecOps::RVec<ROOT::VecOps::RVec<float> > jet1 = {
+      {1.38285, 19.3685}, {1.97631, 1.7312}, {-1.50803, -1.36646}, {0, 0}, {1, -1}};
+  const ROOT::VecOps::RVec<ROOT::VecOps::RVec<float> > jet2 = {
+      {5.1, 2.3, 0.7}, {1.2, 0.9, 1.4}, {0.3, 0.2, 0.5}, {0, 0, 0}, {-1, 1, 0}};
+  const ROOT::VecOps::RVec<ROOT::VecOps::RVec<float> > jet3 = {
+      {2.4, 0.8}, {0.5, 2.1}, {1.1, -0.4}, {0, 0}, {-1, 1}};
+
+  // jets of different lengths are interleaved, the weights keep the ordering of the jets
+  const auto out = weaver.run_batch({jet1, jet2, jet3});
+  const auto out_single = weaver_single.run_batch({jet1, jet2, jet3});
+
+  REQUIRE(out.size() == 3);
+  REQUIRE(out_single.size() == 3);
+  for (size_t j = 0; j < out.size(); ++j)
+    for (size_t i = 0; i < out.at(j).size(); ++i)
+      REQUIRE(out.at(j).at(i) == Catch::Approx(out_single.at(j).at(i)));
+}
+
+TEST_CASE("flavtagging_cache", "[onnx]") {
+  FCCAnalyses::JetFlavourUtils::setup_weaver(TEST_FILE("fccee_flavtagging_dummy.onnx"),
+                                             TEST_FILE("preprocess.json"),
+                                             {"pfcand_e", "pfcand_theta", "pfcand_phi", "pfcand_pid", "pfcand_charge"}, 1,
+                                             2);
+  WeaverInterface weaver(TEST_FILE("fccee_flavtagging_dummy.onnx"),
+                         TEST_FILE("preprocess.json"),
+                         {"pfcand_e", "pfcand_theta", "pfcand_phi", "pfcand_pid", "pfcand_charge"});
+
+  const ROOT::VecOps::RVec<FCCAnalyses::JetFlavourUtils::Variables> jets = {
+      {{1.38285, 19.3685}, {1.97631, 1.7312}, {-1.50803, -1.36646}, {0, 0}, {1, -1}},
+      {{5.1, 2.3, 0.7}, {1.2, 0.9, 1.4}, {0.3, 0.2, 0.5}, {0, 0, 0}, {-1, 1, 0}},
+      {{2.4, 0.8}, {0.5, 2.1}, {1.1, -0.4}, {0, 0}, {-1, 1}}};
+
+  // entry i holds the first i jets, jets of different events are scored together
+  ROOT::RDataFrame df(4);
+  auto df_jets = df.Define("jets",
+                           [&jets](ULong64_t entry) {
+                             return ROOT::VecOps::RVec<FCCAnalyses::JetFlavourUtils::Variables>(jets.begin(),
+                                                                                               jets.begin() + entry);
+                           },
+                           {"rdfentry_"});
+  auto num_jets = FCCAnalyses::JetFlavourUtils::cache_weights(df_jets, "jets", 2);
+  REQUIRE(*num_jets == 6);
+
+  for (ULong64_t entry = 0; entry < 4; ++entry) {
+    const auto out = FCCAnalyses::JetFlavourUtils::get_cached_weights(entry);
+    REQUIRE(out.size() == entry);
+    for (size_t j = 0; j < entry; ++j) {
+      const auto ref = weaver.run(jets.at(j));
+      REQUIRE(out.at(j).size() == ref.size());
+      for (size_t i = 0; i < ref.size(); ++i)
+        REQUIRE(out.at(j).at(i) == Catch::Approx(ref.at(i)));
+    }
+  }
+}
@@ -2,20 +2,74 @@
 #define TMVAHelper_TMVAHelper_h
 
 #include <tbb/task_arena.h>
+#include "ROOT/RDataFrame.hxx"
 #include "ROOT/RVec.hxx"
 #include "TMVA/RBDT.hxx"
 
+#include <unordered_map>
+
+
+class tmva_helper_xgb_cache;
 
 class tmva_helper_xgb {
     public:
         explicit tmva_helper_xgb(const std::string &filename, const std::string &name, const unsigned &nvars, const unsigned int nslots = 1);
         virtual ~tmva_helper_xgb();
-        ROOT::VecOps::RVec<float> operator()(const ROOT::VecOps::RVec<float> vars);
+        ROOT::VecOps::RVec<float> operator()(const ROOT::VecOps::RVec<float> &vars);
+        // evaluate nrows events at once, from a row-major buffer of nrows x nvars values
+        ROOT::VecOps::RVec<float> compute_batch(const ROOT::VecOps::RVec<float> &rows, const unsigned int nrows);
+        // book the evaluation of all the entries of the dataframe, the events of each slot being evaluated batch_size
+        // at a time, the scores being kept by entry number for a later event loop (cached)
+        ROOT::RDF::RResultPtr<ULong64_t> cache_batch(ROOT::RDF::RNode df, const std::string &column, const unsigned int batch_size);
+        // scores of an entry evaluated by the last event loop running cache_batch
+        ROOT::VecOps::RVec<float> cached(ULong64_t entry) const;
 
     private:
+        friend class tmva_helper_xgb_cache;
+        TMVA::Experimental::RBDT<> &interpreter();
+
         unsigned int nvars_;
         TMVA::Experimental::RBDT<> model_;
         std::vector<TMVA::Experimental::RBDT<>> interpreters_;
+        bool is_cached_ = false;
+        std::unordered_map<ULong64_t, ROOT::VecOps::RVec<float>> cache_;
+};
+
+
+// RDataFrame action buffering the variables of the events of each slot, evaluating them once batch_size events are
+// buffered, and at the end of the event loop, and storing the scores by entry number in the helper
+class tmva_helper_xgb_cache : public ROOT::Detail::RDF::RActionImpl<tmva_helper_xgb_cache> {
+    public:
+        using Result_t = ULong64_t;  // number of events evaluated
+        tmva_helper_xgb_cache(tmva_helper_xgb &helper, const unsigned int batch_size, const unsigned int nslots);
+        tmva_helper_xgb_cache(tmva_helper_xgb_cache &&) = default;
+        std::shared_ptr<Result_t> GetResultPtr() const { return result_; }
+        void Initialize() {}
+        void InitTask(TTreeReader *, unsigned int) {}
+        void Exec(unsigned int slot, ULong64_t entry, const ROOT::VecOps::RVec<float> &vars);
+        void Finalize();
+        std::string GetActionName() { return "TMVAHelperXGBCache"; }
+
+    private:
+        void flush(unsigned int slot);
+
+        tmva_helper_xgb *helper_;
+        unsigned int batch_size_;
+        std::shared_ptr<Result_t> result_;
+        std::vector<ROOT::VecOps::RVec<float>> rows_;
+        std::vector<std::vector<ULong64_t>> entries_;
+        std::vector<std::unordered_map<ULong64_t, ROOT::VecOps::RVec<float>>> scores_;
+};
+
+
+// scores of the entries cached by tmva_helper_xgb::cache_batch, to be defined from the rdfentry_ column
+class tmva_helper_xgb_cached {
+    public:
+        explicit tmva_helper_xgb_cached(const tmva_helper_xgb &helper) : helper_(&helper) {}
+        ROOT::VecOps::RVec<float> operator()(ULong64_t entry) const { return helper_->cached(entry); }
+
+    private:
+        const tmva_helper_xgb *helper_;
 };
 
 
@@ -24,7 +24,7 @@ class TMVAHelperXGB():
         self.tmva_helper = ROOT.tmva_helper_xgb(self.model_input, self.model_name, self.nvars, self.nthreads)
         self.var_col = f"tmva_vars_{self.model_name}"
 
-    def run_inference(self, df, col_name = "mva_score"):
+    def check_variables(self, df):
 
         # check if columns exist in the dataframe
         cols = df.GetColumnNames()
@@ -32,8 +32,31 @@ class TMVAHelperXGB():
             if not var in cols:
                 raise Exception(f"Variable {var} not defined in dataframe.")
 
-        vars_str = ', (float)'.join(self.variables)
-        df = df.Define(self.var_col, f"ROOT::VecOps::RVec<float>{{{vars_str}}}")
+    def define_variables(self, df):
+
+        self.check_variables(df)
+
+        if not self.var_col in df.GetColumnNames():
+            vars_str = ', (float)'.join(self.variables)
+            df = df.Define(self.var_col, f"ROOT::VecOps::RVec<float>{{{vars_str}}}")
+        return df
+
+    def run_inference(self, df, col_name = "mva_score"):
+
+        df = self.define_variables(df)
         df = df.Define(col_name, self.tmva_helper, [self.var_col])
         return df
 
+    def run_inference_batch(self, df, col_name = "mva_score", batch_size = 1000):
+
+        # same column as run_inference, all the scores of the model for each
+        # event, usable in filters and (weighted) fills: the events are
+        # evaluated batch_size at a time per slot in an event loop run now
+        # over the entries of the dataframe, the scores being then read back
+        # by entry number
+        df = self.define_variables(df)
+        nevents = self.tmva_helper.cache_batch(ROOT.RDF.AsRNode(df), self.var_col, batch_size)
+        print(f"----> INFO: {nevents.GetValue()} events evaluated in batches of {batch_size} events")
+        self.cached = ROOT.tmva_helper_xgb_cached(self.tmva_helper)
+        df = df.Define(col_name, self.cached, ["rdfentry_"])
+        return df
@@ -1,4 +1,5 @@
 #include "TMVAHelper/TMVAHelper.h"
+#include "TROOT.h"
 
 
 tmva_helper_xgb::tmva_helper_xgb(const std::string &filename, const std::string &name, const unsigned &nvars, const unsigned int nslots) :
@@ -11,13 +12,88 @@ tmva_helper_xgb::tmva_helper_xgb(const std::string &filename, const std::string
     }
 }
 
-ROOT::VecOps::RVec<float> tmva_helper_xgb::operator()(const ROOT::VecOps::RVec<float> vars) {
+ROOT::VecOps::RVec<float> tmva_helper_xgb::operator()(const ROOT::VecOps::RVec<float> &vars) {
+    return interpreter().Compute(vars);
+}
+
+ROOT::VecOps::RVec<float> tmva_helper_xgb::compute_batch(const ROOT::VecOps::RVec<float> &rows, const unsigned int nrows) {
+    if (rows.size() != nrows * nvars_) {
+        throw std::runtime_error("Batch of " + std::to_string(rows.size()) + " values does not match " +
+                                 std::to_string(nrows) + " rows of " + std::to_string(nvars_) + " variables");
+    }
+    if (nrows == 0) {
+        return {};
+    }
+    // view the row-major buffer as a (nrows, nvars) tensor, without copying it
+    const TMVA::Experimental::RTensor<float> x(const_cast<float *>(rows.data()), {nrows, nvars_});
+    const auto y = interpreter().Compute(x);
+    return ROOT::VecOps::RVec<float>(y.GetData(), y.GetData() + y.GetSize());
+}
+
+ROOT::RDF::RResultPtr<ULong64_t> tmva_helper_xgb::cache_batch(ROOT::RDF::RNode df, const std::string &column, const unsigned int batch_size) {
+    // the event loop runs with one slot per thread of the pool, or a single one without implicit multi-threading
+    const unsigned int nslots = std::max(ROOT::GetThreadPoolSize(), 1U);
+    return df.Book<ULong64_t, ROOT::VecOps::RVec<float>>(tmva_helper_xgb_cache(*this, batch_size, nslots), {"rdfentry_", column});
+}
+
+ROOT::VecOps::RVec<float> tmva_helper_xgb::cached(ULong64_t entry) const {
+    if (!is_cached_) {
+        throw std::runtime_error("No scores cached, run cache_batch first");
+    }
+    const auto it = cache_.find(entry);
+    if (it == cache_.end()) {
+        throw std::runtime_error("No scores cached for entry " + std::to_string(entry));
+    }
+    return it->second;
+}
+
+TMVA::Experimental::RBDT<> &tmva_helper_xgb::interpreter() {
     auto const tbb_slot = std::max(tbb::this_task_arena::current_thread_index(), 0);
     if (tbb_slot >= interpreters_.size()) {
         throw std::runtime_error("Not enough interpreters allocated for number of tbb threads");
     }
-    auto &interpreter_data = interpreters_[tbb_slot];
-    return interpreter_data.Compute(vars);
+    return interpreters_[tbb_slot];
 }
 
 tmva_helper_xgb::~tmva_helper_xgb() {}
+
+
+tmva_helper_xgb_cache::tmva_helper_xgb_cache(tmva_helper_xgb &helper, const unsigned int batch_size, const unsigned int nslots) :
+    helper_(&helper), batch_size_(std::max(batch_size, 1U)), result_(std::make_shared<Result_t>(0)),
+    rows_(nslots), entries_(nslots), scores_(nslots) {}
+
+void tmva_helper_xgb_cache::Exec(unsigned int slot, ULong64_t entry, const ROOT::VecOps::RVec<float> &vars) {
+    auto &rows = rows_[slot];
+    rows.insert(rows.end(), vars.begin(), vars.end());
+    entries_[slot].push_back(entry);
+    if (entries_[slot].size() >= batch_size_) {
+        flush(slot);
+    }
+}
+
+void tmva_helper_xgb_cache::Finalize() {
+    helper_->cache_.clear();
+    for (unsigned int islot = 0; islot < rows_.size(); ++islot) {
+        flush(islot);
+        helper_->cache_.merge(scores_[islot]);
+    }
+    *result_ = helper_->cache_.size();
+    helper_->is_cached_ = true;
+}
+
+void tmva_helper_xgb_cache::flush(unsigned int slot) {
+    const auto &entries = entries_[slot];
+    const unsigned int nrows = entries.size();
+    if (nrows == 0) {
+        return;
+    }
+    const auto scores = helper_->compute_batch(rows_[slot], nrows);
+    // scatter the scores, all the outputs of the model, back to the events
+    const unsigned int nscores = scores.size() / nrows;
+    for (unsigned int irow = 0; irow < nrows; ++irow) {
+        scores_[slot][entries[irow]] = ROOT::VecOps::RVec<float>(scores.begin() + irow * nscores,
+                                                                 scores.begin() + (irow + 1) * nscores);
+    }
+    rows_[slot].clear();
+    entries_[slot].clear();
+}
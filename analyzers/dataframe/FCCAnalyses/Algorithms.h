@@ -111,6 +111,28 @@ namespace Algorithms{
     inline void copy(float (&vecOut)[4], float vecIn[4]);
   };
 
+  /// Calculates the sphericity axis from the eigen-decomposition of the momentum tensor (no minimizer).
+  /// Returns {S, x, 0, y, 0, z, 0}, laid out as minimize_sphericity: [0] is the sphericity S,
+  /// but (x, y, z) is the unit sphericity axis, while minimize_sphericity returns the unnormalized fit parameters, of which only the direction is meaningful.
+  /// The orientation of the axis is arbitrary in both. Errors are set to 0. Returns all -1 for zero total momentum
+  struct calculate_sphericity {
+    calculate_sphericity(){}
+    ROOT::VecOps::RVec<float> operator()(const ROOT::VecOps::RVec<float>& px,
+                                         const ROOT::VecOps::RVec<float>& py,
+                                         const ROOT::VecOps::RVec<float>& pz);
+  };
+
+  /// Calculates the thrust axis exactly by sweeping the planes containing each particle, O(N^2 log N) instead of O(N^3).
+  /// Returns {T, x, 0, y, 0, z, 0}, laid out as minimize_thrust: [0] is the thrust T >= 0 (minimize_thrust also returns +T, as it negates the minimum of thrustFit),
+  /// but (x, y, z) is the unit thrust axis, while minimize_thrust returns the unnormalized fit parameters, of which only the direction is meaningful.
+  /// The orientation of the axis is arbitrary in both. Errors are set to 0. Returns all -1 for fewer than two particles or zero total momentum
+  struct calculate_thrust_sweep {
+    calculate_thrust_sweep(){}
+    ROOT::VecOps::RVec<float> operator()(const ROOT::VecOps::RVec<float>& px,
+                                         const ROOT::VecOps::RVec<float>& py,
+                                         const ROOT::VecOps::RVec<float>& pz);
+  };
+
   /// Get the weighted charge in a given hemisphere (defined by it's angle wrt to axis). For definition see eq1 https://arxiv.org/pdf/1209.2421.pdf
   struct getAxisCharge {
   public:
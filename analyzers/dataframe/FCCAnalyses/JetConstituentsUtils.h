@@ -248,6 +248,41 @@ namespace FCCAnalyses {
     rv::RVec<FCCAnalysesJetConstituentsData> get_phirel_cluster(const rv::RVec<fastjet::PseudoJet>& jets,
                                                               const rv::RVec<FCCAnalysesJetConstituents>& jcs);
 
+    /// Features of all the constituents of all the jets of an event, filled in a single pass by get_features_cluster
+    /// Values are stored feature-major: feature f of the k-th constituent of the event is values[f * n + k], with n the
+    /// total number of constituents, and the constituents of jet i are the indices [jets_begin[i], jets_begin[i + 1])
+    struct FCCAnalysesJetConstituentsFeatures {
+      rv::RVec<int> jets_begin;  ///< index of the first constituent of each jet, followed by the number of constituents
+      rv::RVec<float> values;    ///< get_features_names().size() x n features values
+    };
+
+    /// Names of the features filled by get_features_cluster, in their storage order
+    const std::vector<std::string>& get_features_names();
+    /// Position of a feature in the storage order of get_features_cluster, -1 if it is not provided
+    int get_feature_index(const std::string& name);
+
+    /// Compute all the jet constituents features used for flavour tagging (identification, kinematics, track
+    /// parameters and their covariance, impact parameters, dN/dx and time-of-flight mass) in a single pass over the
+    /// constituents, computing the helix parameters of each track only once
+    /// \note unlike get_mtof, exactly one time-of-flight mass is stored per constituent (0 if neither a neutral hadron
+    ///       cluster nor a track is attached)
+    FCCAnalysesJetConstituentsFeatures get_features_cluster(const rv::RVec<fastjet::PseudoJet>& jets,
+                                                            const rv::RVec<FCCAnalysesJetConstituents>& jcs,
+                                                            const rv::RVec<edm4hep::TrackState>& tracks,
+                                                            const TLorentzVector& V, // primary vertex
+                                                            const float Bz,
+                                                            const rv::RVec<edm4hep::Quantity>& dNdx,
+                                                            const rv::RVec<edm4hep::TrackData>& trackdata,
+                                                            const rv::RVec<float>& track_L,
+                                                            const rv::RVec<edm4hep::TrackerHitData>& trackerhits,
+                                                            const rv::RVec<edm4hep::ClusterData>& gammadata,
+                                                            const rv::RVec<edm4hep::ClusterData>& nhdata,
+                                                            const rv::RVec<edm4hep::CalorimeterHitData>& calohits);
+
+    /// Retrieve one feature of all the jets constituents, as views on the features tensor (valid as long as it is)
+    rv::RVec<FCCAnalysesJetConstituentsData> get_feature(const FCCAnalysesJetConstituentsFeatures& features,
+                                                         const std::string& name);
+
     //residues
     rv::RVec<TLorentzVector> compute_tlv_jets(const rv::RVec<fastjet::PseudoJet>& jets);
     rv::RVec<TLorentzVector> sum_tlv_constituents(const rv::RVec<FCCAnalysesJetConstituents>& jets);
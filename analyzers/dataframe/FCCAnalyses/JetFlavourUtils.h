@@ -1,7 +1,12 @@
 #ifndef FCCAnalyses_JetFlavourUtils_h
 #define FCCAnalyses_JetFlavourUtils_h
 
+#include <ROOT/RDataFrame.hxx>
 #include <ROOT/RVec.hxx>
+#include "FCCAnalyses/JetConstituentsUtils.h"
+
+#include <map>
+#include <unordered_map>
 
 namespace FCCAnalyses {
   namespace JetFlavourUtils {
@@ -13,13 +18,72 @@ namespace FCCAnalyses {
     /// \note This helper should not be used directly in RDataFrame examples
     rv::RVec<rv::RVec<float> > compute_weights(unsigned int slot, const rv::RVec<Variables>&);
 
+    /// Transform a collection of {var1 -> {jet1 -> {constit1, constit2, ...}, jet2 -> {...}, ...}, var2 -> {...}}
+    /// into a collection of {jet -> {var1 -> {constit1, constit2, ...}, var2 -> {...}, ...}}
+    /// \note This helper should not be used directly in RDataFrame examples
+    rv::RVec<Variables> transpose_variables(const rv::RVec<Variables>&);
+
     /// Setup the ONNXRuntime instance using Weaver-provided parameters
-    void setup_weaver(const std::string&, const std::string&, const rv::RVec<std::string>&, unsigned int nSlots);
+    /// \param[in] batchSize maximum number of jets evaluated in one inference call by each of the weavers created,
+    ///                      0 for all the jets of an event (get_weights) or of a batch (cache_weights)
+    void setup_weaver(const std::string&, const std::string&, const rv::RVec<std::string>&, unsigned int nSlots,
+                      unsigned int batchSize = 0);
     /// Compute all weights given an unspecified collection of input variables
     template <typename... Args>
     ROOT::VecOps::RVec<ROOT::VecOps::RVec<float> > get_weights(unsigned int slot, Args&&... args) {
       return compute_weights(slot, std::vector<Variables>{std::forward<Args>(args)...});
     }
+    /// Compute all weights from the jet constituents features filled by JetConstituentsUtils::get_features_cluster,
+    /// passing views on the features tensor to the inference instead of copies of the per-variable collections
+    rv::RVec<rv::RVec<float> > get_weights_from_features(unsigned int slot,
+                                                         const JetConstituentsUtils::FCCAnalysesJetConstituentsFeatures&);
+    /// Constituents variables of each jet, in the ordering expected by the model, given an unspecified collection of
+    /// input variables
+    template <typename... Args>
+    rv::RVec<Variables> get_jets_variables(Args&&... args) {
+      return transpose_variables(std::vector<Variables>{std::forward<Args>(args)...});
+    }
+    /// Constituents variables of each jet, in the ordering expected by the model, copied from the jet constituents
+    /// features filled by JetConstituentsUtils::get_features_cluster
+    rv::RVec<Variables> get_jets_variables_from_features(const JetConstituentsUtils::FCCAnalysesJetConstituentsFeatures&);
+
+    /// RDataFrame action scoring the jets of many events in each ONNX session call: the jets of the events processed
+    /// by a slot are buffered, grouped into jets which can be evaluated together (WeaverInterface::batchKey) and
+    /// scored batchSize jets at a time, the remaining ones at the end of the event loop. The weights are stored by
+    /// entry number, to be read with get_cached_weights in a later event loop over the same entries
+    class WeightsCache : public ROOT::Detail::RDF::RActionImpl<WeightsCache> {
+    public:
+      using Result_t = ULong64_t;  ///< number of jets scored
+      WeightsCache(unsigned int nSlots, size_t batchSize);
+      WeightsCache(WeightsCache&&) = default;
+      std::shared_ptr<Result_t> GetResultPtr() const { return result_; }
+      void Initialize() {}
+      void InitTask(TTreeReader*, unsigned int) {}
+      void Exec(unsigned int slot, ULong64_t entry, const rv::RVec<Variables>& jets);
+      void Finalize();
+      std::string GetActionName() { return "JetFlavourWeightsCache"; }
+
+    private:
+      struct PendingJet {
+        ULong64_t entry;
+        size_t index;  ///< index of the jet in its event
+        Variables vars;
+      };
+      void flush(unsigned int slot, std::vector<PendingJet>& jets);
+
+      size_t batch_size_;
+      std::shared_ptr<Result_t> result_;
+      std::vector<std::map<std::vector<size_t>, std::vector<PendingJet> > > pending_;  ///< per slot and batch key
+      std::vector<std::unordered_map<ULong64_t, rv::RVec<rv::RVec<float> > > > weights_;  ///< per slot and entry
+      std::vector<Result_t> num_jets_;
+    };
+    /// Book the scoring of the jets of all the entries of the dataframe, batched across events, given the column
+    /// with the constituents variables of each jet (get_jets_variables or get_jets_variables_from_features)
+    ROOT::RDF::RResultPtr<ULong64_t> cache_weights(ROOT::RDF::RNode df, const std::string& jets_column,
+                                                   unsigned int batchSize);
+    /// Weights of all jets of an entry, computed by the last event loop running cache_weights
+    rv::RVec<rv::RVec<float> > get_cached_weights(ULong64_t entry);
+
     /// Get one specific weight previously computed
     rv::RVec<float> get_weight(const rv::RVec<rv::RVec<float> >&, int);
   }  // namespace JetFlavourUtils
@@ -31,6 +31,9 @@
 
 #pragma link C++ class ROOT::VecOps::RVec<FCCAnalyses::VertexingUtils::FCCAnalysesVertex>+;
 #pragma link C++ class ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalyses::VertexingUtils::FCCAnalysesVertex>>+;
+#pragma link C++ class FCCAnalyses::VertexingUtils::FCCAnalysesVertexColl+;
+#pragma link C++ class FCCAnalyses::MCParticle::MCDecayGraph+;
+#pragma link C++ class FCCAnalyses::JetConstituentsUtils::FCCAnalysesJetConstituentsFeatures+;
 #pragma link C++ class ROOT::VecOps::RVec<ROOT::VecOps::RVec<TVector3>>+;
 #pragma link C++ class ROOT::VecOps::RVec<ROOT::VecOps::RVec<TLorentzVector>>+;
 
@@ -3,6 +3,7 @@
 #define  MCPARTICLE_ANALYZERS_H
 
 #include <cmath>
+#include <cstdint>
 #include <vector>
 
 #include "TLorentzVector.h"
@@ -239,6 +240,56 @@ namespace MCParticle{
                                              const ROOT::VecOps::RVec<int> &ind);
 
 
+  /** Parent/daughter graph of the MC particles of an event, to be built once per event with get_decay_graph.
+   *  The parents (daughters) of particle i are parents[parents_begin[i] .. parents_begin[i+1]) (same for daughters),
+   *  ancestors holds for each particle a bitset (nwords 64-bit words) of all the particles it descends from.
+   */
+  struct MCDecayGraph {
+    int n = 0;
+    int nwords = 0;
+    ROOT::VecOps::RVec<int> pdg;
+    ROOT::VecOps::RVec<int> genStatus;
+    ROOT::VecOps::RVec<int> parents_begin;
+    ROOT::VecOps::RVec<int> parents;
+    ROOT::VecOps::RVec<int> daughters_begin;
+    ROOT::VecOps::RVec<int> daughters;
+    std::vector<std::uint64_t> ancestors;
+  };
+
+  /// build the decay graph, parents_ind (daughters_ind) is the block with the indices of the parents (daughters), Particle#0.index (Particle#1.index)
+  MCDecayGraph get_decay_graph(const ROOT::VecOps::RVec<edm4hep::MCParticleData> &in,
+                               const ROOT::VecOps::RVec<int> &parents_ind,
+                               const ROOT::VecOps::RVec<int> &daughters_ind);
+
+  /// true if particle i comes (directly or not) from the decay of particle ancestor
+  bool is_descendant(int i, int ancestor, const MCDecayGraph &graph);
+
+  /// index of the closest ancestor of particle i with the given PDG id (or its charge conjugate if chargeConjugate), -1 if none.
+  /// The closest ancestor is the one none of the other matching ancestors comes from, the first one in the collection
+  /// if there are several of them (from different parents)
+  int get_first_ancestor(int i, int pdg, const MCDecayGraph &graph, bool chargeConjugate = true);
+
+  /// same as get_first_ancestor, for a list of particles
+  ROOT::VecOps::RVec<int> get_first_ancestors(const ROOT::VecOps::RVec<int> &indices, int pdg, const MCDecayGraph &graph, bool chargeConjugate = true);
+
+  /// same as get_list_of_stable_particles_from_decay above, using the decay graph
+  std::vector<int> get_list_of_stable_particles_from_decay( int i, const MCDecayGraph &graph) ;
+
+  /// same as get_list_of_particles_from_decay above, using the decay graph
+  std::vector<int> get_list_of_particles_from_decay( int i, const MCDecayGraph &graph) ;
+
+  /// same as get_indices_MotherByIndex above, using the decay graph
+  ROOT::VecOps::RVec<int>  get_indices_MotherByIndex( int imother,
+						      const std::vector<int> &m_pdg_daughters,
+						      bool m_stableDaughters,
+						      bool m_chargeConjugateDaughters,
+						      bool m_inclusiveDecay,
+						      const MCDecayGraph &graph);
+
+  /// same as get_lepton_origin above, using the decay graph
+  int get_lepton_origin(int idx, const MCDecayGraph &graph);
+
+
 }//end NS MCParticle
 
 }//end NS FCCAnalyses
@@ -20,6 +20,14 @@ namespace SmearObjects {
 /// parameters, in Delphes convention
 TVectorD TrackParamFromMC_DelphesConv(edm4hep::MCParticleData aMCParticle);
 
+/// for each track of the full collection, returns the index of the MC particle
+/// associated to the first reco particle using it (-1 if none). Built once per
+/// event instead of searching the reco particles for every track
+ROOT::VecOps::RVec<int> getTrack2MC_indices(
+    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>
+        &allRecoParticles,
+    int ntracks, const ROOT::VecOps::RVec<int> &RP2MC_indices);
+
 /// generates new track states, by rescaling the covariance matrix of the tracks
 struct SmearedTracks {
   bool m_debug;
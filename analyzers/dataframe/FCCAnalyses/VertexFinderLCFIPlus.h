@@ -26,12 +26,12 @@ namespace VertexFinderLCFIPlus{
    *  non-primary separated from all tracks using isInPrimary (bool) vector
    *  currently not separating SVs by jet
    */
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>> get_SV_jets( ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recoparticles,
-											 ROOT::VecOps::RVec<edm4hep::TrackState> thetracks,
-											 VertexingUtils::FCCAnalysesVertex PV,
-											 ROOT::VecOps::RVec<bool> isInPrimary,
-											 ROOT::VecOps::RVec<fastjet::PseudoJet> jets,
-											 std::vector<std::vector<int>> jet_consti,
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>> get_SV_jets( const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recoparticles,
+											 const ROOT::VecOps::RVec<edm4hep::TrackState>& thetracks,
+											 const VertexingUtils::FCCAnalysesVertex& PV,
+											 const ROOT::VecOps::RVec<bool>& isInPrimary,
+											 const ROOT::VecOps::RVec<fastjet::PseudoJet>& jets,
+											 const std::vector<std::vector<int>>& jet_consti,
 											 bool V0_rej=true,
 											 double chi2_cut=9., double invM_cut=10., double chi2Tr_cut=5. ) ;
   
@@ -39,44 +39,59 @@ namespace VertexFinderLCFIPlus{
    *  SV finding done before jet clustering
    *  non-primary separated from all tracks using isInPrimary (bool) vector
    */
-  ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> get_SV_event( ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recoparticles,
-								      ROOT::VecOps::RVec<edm4hep::TrackState> thetracks,
-								      VertexingUtils::FCCAnalysesVertex PV,
-								      ROOT::VecOps::RVec<bool> isInPrimary,
+  ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> get_SV_event( const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recoparticles,
+								      const ROOT::VecOps::RVec<edm4hep::TrackState>& thetracks,
+								      const VertexingUtils::FCCAnalysesVertex& PV,
+								      const ROOT::VecOps::RVec<bool>& isInPrimary,
 								      bool V0_rej=true,
 								      double chi2_cut=9., double invM_cut=10., double chi2Tr_cut=5. ) ;
 
   /** returns SVs reconstructed from non-primary tracks of the event
    *  SV finding done before jet clustering
    */
-  ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> get_SV_event( ROOT::VecOps::RVec<edm4hep::TrackState> np_tracks,
-                                                                      ROOT::VecOps::RVec<edm4hep::TrackState> thetracks,
-								      VertexingUtils::FCCAnalysesVertex PV,
+  ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> get_SV_event( const ROOT::VecOps::RVec<edm4hep::TrackState>& np_tracks,
+                                                                      const ROOT::VecOps::RVec<edm4hep::TrackState>& thetracks,
+								      const VertexingUtils::FCCAnalysesVertex& PV,
 								      bool V0_rej=true,
 								      double chi2_cut=9., double invM_cut=10., double chi2Tr_cut=5. ) ;
   
   /** returns indices of the best pair of tracks from a vector of (non-primary) tracks 
    *  default chi2 threshold is 9 and default invariant mass threshold is 10GeV
    */
-  ROOT::VecOps::RVec<int> VertexSeed_best( ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-					   VertexingUtils::FCCAnalysesVertex PV,
+  ROOT::VecOps::RVec<int> VertexSeed_best( const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+					   const VertexingUtils::FCCAnalysesVertex& PV,
 					   double chi2_cut=9., double invM_cut=10.) ;
 
+  /** fits every pair of tracks once and returns the chi2 of the pairs passing the seed constraints
+   *  flattened nTr x nTr matrix (only i<j filled), -1 for the pairs failing the constraints
+   *  default chi2 threshold is 9 and default invariant mass threshold is 10GeV
+   */
+  ROOT::VecOps::RVec<double> VertexSeed_pairs( const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+					       const VertexingUtils::FCCAnalysesVertex& PV,
+					       double chi2_cut=9., double invM_cut=10.) ;
+
+  /** returns positions (in i_tracks) of the best pair among the remaining tracks
+   *  uses the pair chi2 matrix from VertexSeed_pairs, i_tracks are the indices of the remaining tracks in it
+   */
+  ROOT::VecOps::RVec<int> VertexSeed_best( const ROOT::VecOps::RVec<double>& pair_chi2,
+					   int nTr,
+					   const ROOT::VecOps::RVec<int>& i_tracks) ;
+
   /** adds index of the best track (from the remaining tracks) to the (seed) vtx 
    *  default chi2 threshold is 9 and default invariant mass threshold is 10GeV
    *  default threshold for track's chi2 contribution is 5 (?)
    */
-  ROOT::VecOps::RVec<int> addTrack_best( ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-  					 ROOT::VecOps::RVec<int> vtx_tr,
-  					 VertexingUtils::FCCAnalysesVertex PV,
+  ROOT::VecOps::RVec<int> addTrack_best( const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+  					 const ROOT::VecOps::RVec<int>& vtx_tr,
+  					 const VertexingUtils::FCCAnalysesVertex& PV,
   					 double chi2_cut=9., double invM_cut=10., double chi2Tr_cut=5.) ;
 
   /** V0 rejection (tight)
    *  takes all (non-primary tracks) & removes tracks coming from V0s if user chooses
    *  by default V0 rejection is done
    */
-  ROOT::VecOps::RVec<edm4hep::TrackState> V0rejection_tight( ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-							     VertexingUtils::FCCAnalysesVertex PV,
+  ROOT::VecOps::RVec<edm4hep::TrackState> V0rejection_tight( const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+							     const VertexingUtils::FCCAnalysesVertex& PV,
 							     bool V0_rej=true ) ;
 
   /** find SVs from a set of tracks
@@ -84,7 +99,7 @@ namespace VertexFinderLCFIPlus{
    */
   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> findSVfromTracks( ROOT::VecOps::RVec<edm4hep::TrackState> tracks_fin,
                                                                           const ROOT::VecOps::RVec<edm4hep::TrackState>& alltracks,
-									  VertexingUtils::FCCAnalysesVertex PV,
+									  const VertexingUtils::FCCAnalysesVertex& PV,
 									  double chi2_cut=9., double invM_cut=10., double chi2Tr_cut=5.) ;
 
   /** check constraints of vertex candidates
@@ -92,9 +107,9 @@ namespace VertexFinderLCFIPlus{
    *  default constraint check is that for finding vertex seed
    *  seed=true -> constraints for seed; seed=false -> constraints for adding tracks
    */
-  bool check_constraints( VertexingUtils::FCCAnalysesVertex vtx,
-			  ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-			  VertexingUtils::FCCAnalysesVertex PV,
+  bool check_constraints( const VertexingUtils::FCCAnalysesVertex& vtx,
+			  const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+			  const VertexingUtils::FCCAnalysesVertex& PV,
 			  bool seed=true,
 			  double chi2_cut=9., double invM_cut=10., double chi2Tr_cut=5.) ;
   
@@ -104,8 +119,8 @@ namespace VertexFinderLCFIPlus{
    *  if(!tight) -> loose constraints
    *  by default loose constraints
    */
-  ROOT::VecOps::RVec<bool> isV0( ROOT::VecOps::RVec<edm4hep::TrackState> np_tracks,
-				 VertexingUtils::FCCAnalysesVertex PV,
+  ROOT::VecOps::RVec<bool> isV0( const ROOT::VecOps::RVec<edm4hep::TrackState>& np_tracks,
+				 const VertexingUtils::FCCAnalysesVertex& PV,
 				 bool tight = false ) ;
 
   ///
@@ -113,16 +128,16 @@ namespace VertexFinderLCFIPlus{
   /** returns V0s reconstructed from a set of tracks (as an FCCAnalysesV0 object)
    *  constraint thresholds can be chosen out of two sets
    */
-  VertexingUtils::FCCAnalysesV0 get_V0s( ROOT::VecOps::RVec<edm4hep::TrackState> np_tracks,
-					 VertexingUtils::FCCAnalysesVertex PV,
+  VertexingUtils::FCCAnalysesV0 get_V0s( const ROOT::VecOps::RVec<edm4hep::TrackState>& np_tracks,
+					 const VertexingUtils::FCCAnalysesVertex& PV,
 					 bool tight,
 					 double chi2_cut=9. ) ;
 
   /** returns V0s reconstructed from a set of tracks (as an FCCAnalysesV0 object)
    *  constraint thresholds can be set manually
    */
-  VertexingUtils::FCCAnalysesV0 get_V0s( ROOT::VecOps::RVec<edm4hep::TrackState> np_tracks,
-					 VertexingUtils::FCCAnalysesVertex PV,
+  VertexingUtils::FCCAnalysesV0 get_V0s( const ROOT::VecOps::RVec<edm4hep::TrackState>& np_tracks,
+					 const VertexingUtils::FCCAnalysesVertex& PV,
 					 double Ks_invM_low=0.493, double Ks_invM_high=0.503, double Ks_dis=0.5, double Ks_cosAng=0.999,
 					 double Lambda_invM_low=1.111, double Lambda_invM_high=1.121, double Lambda_dis=0.5, double Lambda_cosAng=0.99995,
 					 double Gamma_invM_low=0., double Gamma_invM_high=0.005, double Gamma_dis=9, double Gamma_cosAng=0.99995,
@@ -131,12 +146,12 @@ namespace VertexFinderLCFIPlus{
   /** returns V0s reconstructed in each jet of the event (as an FCCAnalysesV0 object)
    *  need to perform jet clustering before calling this function
    */
-  VertexingUtils::FCCAnalysesV0 get_V0s_jet( ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recoparticles,
-					     ROOT::VecOps::RVec<edm4hep::TrackState> thetracks,
-					     ROOT::VecOps::RVec<bool> isInPrimary,
-					     ROOT::VecOps::RVec<fastjet::PseudoJet> jets,
-					     std::vector<std::vector<int>> jet_consti,
-					     VertexingUtils::FCCAnalysesVertex PV,
+  VertexingUtils::FCCAnalysesV0 get_V0s_jet( const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recoparticles,
+					     const ROOT::VecOps::RVec<edm4hep::TrackState>& thetracks,
+					     const ROOT::VecOps::RVec<bool>& isInPrimary,
+					     const ROOT::VecOps::RVec<fastjet::PseudoJet>& jets,
+					     const std::vector<std::vector<int>>& jet_consti,
+					     const VertexingUtils::FCCAnalysesVertex& PV,
 					     bool tight = true,
 					     double chi2_cut=9. );
 
@@ -151,8 +166,8 @@ namespace VertexFinderLCFIPlus{
    *  skip the candidate with output size 0 - doesn't pass the chi2 cut
    */
   ROOT::VecOps::RVec<double> get_V0candidate( VertexingUtils::FCCAnalysesVertex &V0_vtx,
-					      ROOT::VecOps::RVec<edm4hep::TrackState> tr_pair,
-					      VertexingUtils::FCCAnalysesVertex PV,
+					      const ROOT::VecOps::RVec<edm4hep::TrackState>& tr_pair,
+					      const VertexingUtils::FCCAnalysesVertex& PV,
 					      bool chi2,
 					      double chi2_cut=9. );
 
@@ -62,6 +62,30 @@ namespace VertexingUtils{
     ROOT::VecOps::RVec<int> gmother_ind;
   };
 
+  /** Columnar (structure of arrays) version of a collection of FCCAnalysesVertex
+   *  one entry per vertex in the per-vertex arrays, covMatrix holds 6 entries per vertex (edm4hep lower-triangle)
+   *  the tracks of vertex i are the entries [tracks_begin[i], tracks_end[i]) of the per-track arrays
+   */
+  struct FCCAnalysesVertexColl{
+    ROOT::VecOps::RVec<int> primary;
+    ROOT::VecOps::RVec<int> ntracks;
+    ROOT::VecOps::RVec<int> mc_ind;
+    ROOT::VecOps::RVec<float> x;
+    ROOT::VecOps::RVec<float> y;
+    ROOT::VecOps::RVec<float> z;
+    ROOT::VecOps::RVec<float> chi2;
+    ROOT::VecOps::RVec<float> covMatrix;
+    ROOT::VecOps::RVec<int> tracks_begin;
+    ROOT::VecOps::RVec<int> tracks_end;
+    // per-track arrays
+    ROOT::VecOps::RVec<int> reco_ind;
+    ROOT::VecOps::RVec<float> reco_chi2;
+    ROOT::VecOps::RVec<float> final_track_phases;
+    ROOT::VecOps::RVec<float> track_px;   // updated track momentum at vertex
+    ROOT::VecOps::RVec<float> track_py;
+    ROOT::VecOps::RVec<float> track_pz;
+  };
+
   /// Selection of particles based on the d0 / z0 significances of the associated track
   struct selTracks {
     selTracks( float arg_d0sig_min, float arg_d0sig_max, float arg_z0sig_min, float arg_z0sig_max)  ;
@@ -69,46 +93,80 @@ namespace VertexingUtils{
     float m_d0sig_max = 3;
     float m_z0sig_min = 0;
     float m_z0sig_max = 3;
-    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>  operator() ( ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-									 ROOT::VecOps::RVec<edm4hep::TrackState> tracks  ) ;
+    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>  operator() ( const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+									 const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks  ) ;
   };
 
   /// Selection of primary particles :
-  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> SelPrimaryTracks( ROOT::VecOps::RVec<int> recind,
-									   ROOT::VecOps::RVec<int> mcind,
-									   ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> reco,
-									   ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
+  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> SelPrimaryTracks( const ROOT::VecOps::RVec<int>& recind,
+									   const ROOT::VecOps::RVec<int>& mcind,
+									   const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& reco,
+									   const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
 									   TVector3 MC_EventPrimaryVertex) ;
 
   /// Retrieve the number of reconstructed vertices from the collection of vertex object
-  int get_Nvertex( ROOT::VecOps::RVec<FCCAnalysesVertex> TheVertexColl );
+  int get_Nvertex( const ROOT::VecOps::RVec<FCCAnalysesVertex>& TheVertexColl );
 
   /// Retrieve a single FCCAnalyses vertex from the collection of vertex object
-  FCCAnalysesVertex get_FCCAnalysesVertex(ROOT::VecOps::RVec<FCCAnalysesVertex> TheVertexColl, int index );
+  FCCAnalysesVertex get_FCCAnalysesVertex(const ROOT::VecOps::RVec<FCCAnalysesVertex>& TheVertexColl, int index );
 
   /// Retrieve the edm4hep::VertexData from the vertex object
-  edm4hep::VertexData get_VertexData( FCCAnalysesVertex TheVertex ) ;
+  edm4hep::VertexData get_VertexData( const FCCAnalysesVertex& TheVertex ) ;
 
   /// Retrieve a vector of edm4hep::VertexData from the collection of vertex object
-  ROOT::VecOps::RVec<edm4hep::VertexData> get_VertexData( ROOT::VecOps::RVec<FCCAnalysesVertex> TheVertexColl ) ;
+  ROOT::VecOps::RVec<edm4hep::VertexData> get_VertexData( const ROOT::VecOps::RVec<FCCAnalysesVertex>& TheVertexColl ) ;
 
   /// Retrieve a edm4hep::VertexData from the collection of vertex object at a given index
-  edm4hep::VertexData get_VertexData( ROOT::VecOps::RVec<FCCAnalysesVertex> TheVertexColl, int index);
+  edm4hep::VertexData get_VertexData( const ROOT::VecOps::RVec<FCCAnalysesVertex>& TheVertexColl, int index);
 
   /// Retrieve the number of tracks from FCCAnalysesVertex
-  int get_VertexNtrk( FCCAnalysesVertex TheVertex ) ;
+  int get_VertexNtrk( const FCCAnalysesVertex& TheVertex ) ;
 
-  ROOT::VecOps::RVec<int> get_VertexNtrk( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices ) ;
+  ROOT::VecOps::RVec<int> get_VertexNtrk( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices ) ;
   
    /// Retrieve the tracks indices from FCCAnalysesVertex
-  ROOT::VecOps::RVec<int> get_VertexRecoInd( FCCAnalysesVertex TheVertex ) ;
+  ROOT::VecOps::RVec<int> get_VertexRecoInd( const FCCAnalysesVertex& TheVertex ) ;
 
   /// Retrieve the indices of the tracks fitted to that vertex, but now in the collection of RecoParticles
-  ROOT::VecOps::RVec<int> get_VertexRecoParticlesInd( FCCAnalysesVertex TheVertex, 
+  ROOT::VecOps::RVec<int> get_VertexRecoParticlesInd( const FCCAnalysesVertex& TheVertex, 
 						      const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& reco );
- 
+
+  ///////////////////////////////////////////////////
+  /// columnar vertex collection
+
+  /** build the columnar collection from a vector of vertex objects, to be done once per event right after the vertex finder
+   *  the accessors below then return views on its arrays, and these (plain RVec) columns can be written out by a Snapshot
+   */
+  FCCAnalysesVertexColl get_VertexColl( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices );
+
+  /// number of vertices in the columnar collection
+  int get_VertexColl_n( const FCCAnalysesVertexColl& coll );
+
+  /** views (no copy) on the per-vertex arrays
+   *  they point to the memory of the collection and are only valid as long as it lives, i.e. during the event
+   */
+  ROOT::VecOps::RVec<float> get_VertexColl_x( const FCCAnalysesVertexColl& coll );
+  ROOT::VecOps::RVec<float> get_VertexColl_y( const FCCAnalysesVertexColl& coll );
+  ROOT::VecOps::RVec<float> get_VertexColl_z( const FCCAnalysesVertexColl& coll );
+  ROOT::VecOps::RVec<float> get_VertexColl_chi2( const FCCAnalysesVertexColl& coll );
+  ROOT::VecOps::RVec<int> get_VertexColl_isPV( const FCCAnalysesVertexColl& coll );
+  ROOT::VecOps::RVec<int> get_VertexColl_ntracks( const FCCAnalysesVertexColl& coll );
+  ROOT::VecOps::RVec<int> get_VertexColl_indMC( const FCCAnalysesVertexColl& coll );
+
+  /// view on the track indices (in the collection of all tracks) of the vertex at a given index
+  ROOT::VecOps::RVec<int> get_VertexColl_recoInd( const FCCAnalysesVertexColl& coll, int index );
+
+  /// error on the vertex position, comp = 0 (x), 1 (y), 2 (z)
+  ROOT::VecOps::RVec<float> get_VertexColl_posErr( const FCCAnalysesVertexColl& coll, int comp );
+
+  /** distance of all vertices to the primary one (0 for the PV)
+   *  comp = 0 (x), 1 (y), 2 (z) gives the PV - vertex component, anything else the 3D distance,
+   *  same as myUtils::get_Vertex_d2PV
+   */
+  ROOT::VecOps::RVec<float> get_VertexColl_d2PV( const FCCAnalysesVertexColl& coll, int comp );
+
   /// Return the number of tracks in a given track collection
-  int get_nTracks(ROOT::VecOps::RVec<edm4hep::TrackState> tracks);
+  int get_nTracks(const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks);
 
   /// compare two track states
   bool compare_Tracks( const edm4hep::TrackState& tr1, const edm4hep::TrackState& tr2 ) ;
@@ -119,42 +177,42 @@ namespace VertexingUtils{
   /** returns a vector of all vertices (PV and SVs), e.g to use in myUtils::get_Vertex_d2PV
    *  first entry: PV, all subsequent entries: SVs
    */
-  ROOT::VecOps::RVec<FCCAnalysesVertex> get_all_vertices( FCCAnalysesVertex PV,
-							  ROOT::VecOps::RVec<FCCAnalysesVertex> SV ); 
+  ROOT::VecOps::RVec<FCCAnalysesVertex> get_all_vertices( const FCCAnalysesVertex& PV,
+							  const ROOT::VecOps::RVec<FCCAnalysesVertex>& SV ); 
 
-  ROOT::VecOps::RVec<FCCAnalysesVertex> get_all_vertices( FCCAnalysesVertex PV,
-							  ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> SV ); 
+  ROOT::VecOps::RVec<FCCAnalysesVertex> get_all_vertices( const FCCAnalysesVertex& PV,
+							  const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& SV ); 
 
   /** returns the invariant mass of a two-track vertex
    *  CAUTION: m1 -> mass of first track, m2 -> mass of second track
    *  by default both pions
    */
-  double get_invM_pairs( FCCAnalysesVertex vertex,
+  double get_invM_pairs( const FCCAnalysesVertex& vertex,
 			 double m1 = 0.13957039,
 			 double m2 = 0.13957039) ;
 
-  ROOT::VecOps::RVec<double> get_invM_pairs( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
+  ROOT::VecOps::RVec<double> get_invM_pairs( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices,
 					     double m1 = 0.13957039,
 					     double m2 = 0.13957039 ) ;  
 
   /** returns the invariant mass of a vertex
    *  assuming all tracks to be pions
    */
-  double get_invM( FCCAnalysesVertex vertex ) ;
+  double get_invM( const FCCAnalysesVertex& vertex ) ;
 
   /** returns the invariant mass of a vector of vertices
    *  assuming all tracks to be pions
    */
-  ROOT::VecOps::RVec<double> get_invM( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices ) ;
+  ROOT::VecOps::RVec<double> get_invM( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices ) ;
 
   /** returns the cos of the angle b/n V0 candidate's (or any vtx's) momentum & PV to V0 (vtx) displacement vector */
-  double get_PV2V0angle( FCCAnalysesVertex V0,
-			 FCCAnalysesVertex PV) ;
+  double get_PV2V0angle( const FCCAnalysesVertex& V0,
+			 const FCCAnalysesVertex& PV) ;
 
   /** returns cos of the angle b/n track (that form the vtx) momentum sum & PV to vtx displacement vector */
-  double get_PV2vtx_angle( ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-			   FCCAnalysesVertex vtx,
-			   FCCAnalysesVertex PV ) ;
+  double get_PV2vtx_angle( const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+			   const FCCAnalysesVertex& vtx,
+			   const FCCAnalysesVertex& PV ) ;
 
   /** returns a track's energy
    *  assuming the track to be a pion
@@ -164,89 +222,89 @@ namespace VertexingUtils{
   ///////////////////////////////////////////////////
   /// V0 Reconstruction
   /// Return the number of reconstructed V0s
-  int get_n_SV( FCCAnalysesV0 SV );
+  int get_n_SV( const FCCAnalysesV0& SV );
 
   /// Return the vertex position of all reconstructed V0s (in mm)
-  ROOT::VecOps::RVec<TVector3> get_position_SV( FCCAnalysesV0 SV );
+  ROOT::VecOps::RVec<TVector3> get_position_SV( const FCCAnalysesV0& SV );
 
   /// Return the PDG IDs of all reconstructed V0s
-  ROOT::VecOps::RVec<int> get_pdg_V0( FCCAnalysesV0 V0 );
+  ROOT::VecOps::RVec<int> get_pdg_V0( const FCCAnalysesV0& V0 );
 
   /// Return the invariant masses of all reconstructed V0s
-  ROOT::VecOps::RVec<double> get_invM_V0( FCCAnalysesV0 V0 );
+  ROOT::VecOps::RVec<double> get_invM_V0( const FCCAnalysesV0& V0 );
 
   /// Return the momentum of all reconstructed V0s
-  ROOT::VecOps::RVec<TVector3> get_p_SV( FCCAnalysesV0 SV );
+  ROOT::VecOps::RVec<TVector3> get_p_SV( const FCCAnalysesV0& SV );
 
   /// Return chi2 of all reconstructed V0s
-  ROOT::VecOps::RVec<double> get_chi2_SV( FCCAnalysesV0 SV );
+  ROOT::VecOps::RVec<double> get_chi2_SV( const FCCAnalysesV0& SV );
 
   ///////////////////////////////////////////////////
 
   /// Passing a vector of FCCAnalysesVertex instead of FCCAnalysesV0
   /// Return the number of reconstructed SVs
-  int get_n_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices );
+  int get_n_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices );
 
   /// Return the momentum of all reconstructed vertices (or V0.vtx)
-  ROOT::VecOps::RVec<TVector3> get_p_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices );
+  ROOT::VecOps::RVec<TVector3> get_p_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices );
 
   /// Return the vertex position of all reconstructed SVs (in mm)
-  ROOT::VecOps::RVec<TVector3> get_position_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices );
+  ROOT::VecOps::RVec<TVector3> get_position_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices );
 
   /// Return the momentum magnitude of all reconstructed vertices (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_pMag_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices );
+  ROOT::VecOps::RVec<double> get_pMag_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices );
 
   /// Return chi2 of all reconstructed vertices (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_chi2_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices );
+  ROOT::VecOps::RVec<double> get_chi2_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices );
 
   /// Return normalised chi2 of all reconstructed vertices (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_norm_chi2_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices );
+  ROOT::VecOps::RVec<double> get_norm_chi2_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices );
 
   /// Return no of DOF of all reconstructed vertices (or V0.vtx)
-  ROOT::VecOps::RVec<int> get_nDOF_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices );
+  ROOT::VecOps::RVec<int> get_nDOF_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices );
 
   /// Return polar angle (theta) of all reconstructed vertices (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_theta_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices );
+  ROOT::VecOps::RVec<double> get_theta_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices );
 
   /// Return azimuthal angle (phi) of all reconstructed vertices (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_phi_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices );
+  ROOT::VecOps::RVec<double> get_phi_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices );
 
   /// Return polar angle (theta) of all reconstructed vertices wrt jets (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_relTheta_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
-					      ROOT::VecOps::RVec<int> nSV_jet,
-					      ROOT::VecOps::RVec<fastjet::PseudoJet> jets );
+  ROOT::VecOps::RVec<double> get_relTheta_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices,
+					      const ROOT::VecOps::RVec<int>& nSV_jet,
+					      const ROOT::VecOps::RVec<fastjet::PseudoJet>& jets );
 
   /// Return azimuthal angle (phi) of all reconstructed vertices wrt jets (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_relPhi_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
-					    ROOT::VecOps::RVec<int> nSV_jet,
-					    ROOT::VecOps::RVec<fastjet::PseudoJet> jets );
+  ROOT::VecOps::RVec<double> get_relPhi_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices,
+					    const ROOT::VecOps::RVec<int>& nSV_jet,
+					    const ROOT::VecOps::RVec<fastjet::PseudoJet>& jets );
   
   /// Return the pointing angle of all reconstructed vertices (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_pointingangle_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
-						   FCCAnalysesVertex PV );
+  ROOT::VecOps::RVec<double> get_pointingangle_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices,
+						   const FCCAnalysesVertex& PV );
 
   /// Return the distances of all reconstructed vertices from PV in xy plane [mm] (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_dxy_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
-					 FCCAnalysesVertex PV );
+  ROOT::VecOps::RVec<double> get_dxy_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices,
+					 const FCCAnalysesVertex& PV );
 
   /// Return the distances of all reconstructed vertices from PV in 3D [mm] (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_d3d_SV( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
-					 FCCAnalysesVertex PV );
+  ROOT::VecOps::RVec<double> get_d3d_SV( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices,
+					 const FCCAnalysesVertex& PV );
 
   /// Return the distances of all reconstructed verteces from given TVector3d object in 3D [mm] (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_d3d_SV_obj( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
+  ROOT::VecOps::RVec<double> get_d3d_SV_obj( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices,
 					     TVector3 location );
 
   /// Return the distances of all reconstructed verteces from given edm4hep::Vector3d object in 3D [mm] (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_d3d_SV_obj( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
+  ROOT::VecOps::RVec<double> get_d3d_SV_obj( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices,
 					     edm4hep::Vector3d location );
 
   /// Return the distance in R of all reconstructed verteces from given TVector3d object in 3D [mm] (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_dR_SV_obj( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
+  ROOT::VecOps::RVec<double> get_dR_SV_obj( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices,
 					    TVector3 location );
 
   /// Return the distances in R of all reconstructed verteces from given edm4hep::Vector3d object in 3D [mm] (or V0.vtx)
-  ROOT::VecOps::RVec<double> get_dR_SV_obj( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
+  ROOT::VecOps::RVec<double> get_dR_SV_obj( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices,
 					    edm4hep::Vector3d location );
 
   ///////////////////////////////////////////////////
@@ -254,46 +312,46 @@ namespace VertexingUtils{
   /// For get_SV_jets ///
   
   /// Return the number of reconstructed SVs
-  ROOT::VecOps::RVec<FCCAnalysesVertex> get_all_SVs( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices );
+  ROOT::VecOps::RVec<FCCAnalysesVertex> get_all_SVs( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices );
 
   /// Return the total number of reconstructed SVs
-  int get_n_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices );
+  int get_n_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices );
 
   /// Return the number of reconstructed SVs per jet
-  ROOT::VecOps::RVec<int> get_n_SV_jets( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices );
+  ROOT::VecOps::RVec<int> get_n_SV_jets( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices );
 
   /// Return the tracks separated by jets
-  std::vector<std::vector<edm4hep::TrackState>> get_tracksInJets( ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recoparticles,
-								  ROOT::VecOps::RVec<edm4hep::TrackState> thetracks,
-								  ROOT::VecOps::RVec<fastjet::PseudoJet> jets,
-								  std::vector<std::vector<int>> jet_consti );
+  std::vector<std::vector<edm4hep::TrackState>> get_tracksInJets( const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recoparticles,
+								  const ROOT::VecOps::RVec<edm4hep::TrackState>& thetracks,
+								  const ROOT::VecOps::RVec<fastjet::PseudoJet>& jets,
+								  const std::vector<std::vector<int>>& jet_consti );
 
   /// Return V0s separated by jets
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> get_svInJets( ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
-									  ROOT::VecOps::RVec<int> nSV_jet );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> get_svInJets( const ROOT::VecOps::RVec<FCCAnalysesVertex>& vertices,
+									  const ROOT::VecOps::RVec<int>& nSV_jet );
 
   // --- for get_SV_jets --- //
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_invM( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<TVector3>> get_p_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_pMag_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> get_VertexNtrk( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_chi2_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_norm_chi2_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> get_nDOF_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_theta_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_phi_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_relTheta_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices, ROOT::VecOps::RVec<fastjet::PseudoJet> jets );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_relPhi_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices, ROOT::VecOps::RVec<fastjet::PseudoJet> jets );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_pointingangle_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices, FCCAnalysesVertex PV );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_dxy_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices, FCCAnalysesVertex PV );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_d3d_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices, FCCAnalysesVertex PV );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> get_pdg_V0( ROOT::VecOps::RVec<int> pdg, ROOT::VecOps::RVec<int> nSV_jet );
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_invM_V0( ROOT::VecOps::RVec<double> invM, ROOT::VecOps::RVec<int> nSV_jet );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_invM( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<TVector3>> get_p_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_pMag_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> get_VertexNtrk( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_chi2_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_norm_chi2_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> get_nDOF_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_theta_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_phi_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_relTheta_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices, const ROOT::VecOps::RVec<fastjet::PseudoJet>& jets );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_relPhi_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices, const ROOT::VecOps::RVec<fastjet::PseudoJet>& jets );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_pointingangle_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices, const FCCAnalysesVertex& PV );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_dxy_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices, const FCCAnalysesVertex& PV );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_d3d_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices, const FCCAnalysesVertex& PV );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> get_pdg_V0( const ROOT::VecOps::RVec<int>& pdg, const ROOT::VecOps::RVec<int>& nSV_jet );
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_invM_V0( const ROOT::VecOps::RVec<double>& invM, const ROOT::VecOps::RVec<int>& nSV_jet );
   /// Return the vertex position of all reconstructed SVs (in mm)
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<TVector3>> get_position_SV( ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices ); 
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<TVector3>> get_position_SV( const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>& vertices ); 
   // --- for get_SV_jets --- //
 
-  float get_trackMom( edm4hep::TrackState & atrack );
+  float get_trackMom( const edm4hep::TrackState& atrack );
 
 
 // --- Conversion methods between the Delphes and edm4hep conventions
@@ -309,8 +367,8 @@ namespace VertexingUtils{
 
 
  /// --- Internal methods needed by the code of  Franco B:
-  TVectorD get_trackParam( edm4hep::TrackState & atrack, bool Units_mm = false) ;
-  TMatrixDSym get_trackCov( edm4hep::TrackState &  atrack, bool Units_mm = false) ;
+  TVectorD get_trackParam( const edm4hep::TrackState& atrack, bool Units_mm = false) ;
+  TMatrixDSym get_trackCov( const edm4hep::TrackState& atrack, bool Units_mm = false) ;
 
   TVectorD ParToACTS(TVectorD Par);
   TMatrixDSym CovToACTS(TMatrixDSym Cov,TVectorD Par);
@@ -33,8 +33,8 @@ namespace myUtils{
   struct filter_PV{
     filter_PV(bool arg_pv);
     bool m_pv=true;
-    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> operator()(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> in,
-								      ROOT::VecOps::RVec<int> index);
+    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> operator()(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& in,
+								      const ROOT::VecOps::RVec<int>& index);
   };
 
   struct build_D0 {
@@ -42,11 +42,11 @@ namespace myUtils{
     float m_mass=0.05;
     float m_p=1.;
     bool m_filterPV=true;
-    ROOT::VecOps::RVec<FCCAnalysesComposite> operator() (ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-							 ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-							 ROOT::VecOps::RVec<int> pions,
-							 ROOT::VecOps::RVec<int> kaons,
-							 ROOT::VecOps::RVec<int> pvindex);
+    ROOT::VecOps::RVec<FCCAnalysesComposite> operator() (const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+							 const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+							 const ROOT::VecOps::RVec<int>& pions,
+							 const ROOT::VecOps::RVec<int>& kaons,
+							 const ROOT::VecOps::RVec<int>& pvindex);
   };
 
 
@@ -58,8 +58,8 @@ namespace myUtils{
     float m_p=1.;
     float m_angle=1.;
     bool m_rho = true;
-    ROOT::VecOps::RVec<FCCAnalysesComposite2> operator() (ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop);
+    ROOT::VecOps::RVec<FCCAnalysesComposite2> operator() (const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							  const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop);
   };
 
 
@@ -67,180 +67,180 @@ namespace myUtils{
   struct sel_PV {
     sel_PV(bool arg_closest);
     bool m_closest;
-    VertexingUtils::FCCAnalysesVertex operator()(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> pv);
+    VertexingUtils::FCCAnalysesVertex operator()(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& pv);
   };
 
 
   struct sel_PID {
     sel_PID(int arg_PDG);
     int m_PDG=211;
-    ROOT::VecOps::RVec<int> operator() (ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop);
+    ROOT::VecOps::RVec<int> operator() (const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop);
   };
 
 
-  ROOT::VecOps::RVec<edm4hep::TrackState> get_pseudotrack(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop);
+  ROOT::VecOps::RVec<edm4hep::TrackState> get_pseudotrack(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							  const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop);
 
 
-  ROOT::VecOps::RVec<FCCAnalysesComposite2> build_tau23pi(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop);
+  ROOT::VecOps::RVec<FCCAnalysesComposite2> build_tau23pi(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							  const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop);
 
-  ROOT::VecOps::RVec<FCCAnalysesComposite2> build_B2Kstee(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop);
+  ROOT::VecOps::RVec<FCCAnalysesComposite2> build_B2Kstee(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							  const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop);
 
-  ROOT::VecOps::RVec<FCCAnalysesComposite2> build_B2Kstmumu(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop);
+  ROOT::VecOps::RVec<FCCAnalysesComposite2> build_B2Kstmumu(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop);
 
-  ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bd2KstNuNu(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							     ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop);
+  ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bd2KstNuNu(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							     const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop);
 
-  ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bs2PhiNuNu(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							     ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop);
+  ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bs2PhiNuNu(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							     const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop);
 
-  ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bd2MuMu(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop);
+  ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bd2MuMu(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							  const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop);
 
 
-  ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> get_MCVertexObject(ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-									     ROOT::VecOps::RVec<int> ind);
+  ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> get_MCVertexObject(const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+									     const ROOT::VecOps::RVec<int>& ind);
 
   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>
-  merge_VertexObjet(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> in);
+  merge_VertexObjet(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& in);
 
-  ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> get_VertexObject(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> mcver,
-									 ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> reco,
-									 ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-									 ROOT::VecOps::RVec<int> recin,
-									 ROOT::VecOps::RVec<int> mcin);
+  ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> get_VertexObject(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& mcver,
+									 const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& reco,
+									 const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+									 const ROOT::VecOps::RVec<int>& recin,
+									 const ROOT::VecOps::RVec<int>& mcin);
 
-  ROOT::VecOps::RVec<float> get_Vertex_mass(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-					    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> reco);
+  ROOT::VecOps::RVec<float> get_Vertex_mass(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+					    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& reco);
 
-  ROOT::VecOps::RVec<float> get_Vertex_x(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<float> get_Vertex_x(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<float> get_Vertex_y(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<float> get_Vertex_y(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<float> get_Vertex_z(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<float> get_Vertex_z(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<float> get_Vertex_xErr(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<float> get_Vertex_xErr(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<float> get_Vertex_yErr(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<float> get_Vertex_yErr(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<float> get_Vertex_zErr(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<float> get_Vertex_zErr(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<float> get_Vertex_chi2(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<float> get_Vertex_chi2(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<int> get_Vertex_isPV(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<int> get_Vertex_isPV(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<int> get_Vertex_ntracks(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<int> get_Vertex_ntracks(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<float> get_Vertex_d2PV(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
+  ROOT::VecOps::RVec<float> get_Vertex_d2PV(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
 					    int comp);
 
-  ROOT::VecOps::RVec<float> get_Vertex_d2PVError(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
+  ROOT::VecOps::RVec<float> get_Vertex_d2PVError(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
 						 int comp);
 
-  ROOT::VecOps::RVec<int> get_Vertex_indMC(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-					   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> mcver);
+  ROOT::VecOps::RVec<int> get_Vertex_indMC(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+					   const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& mcver);
 
-  ROOT::VecOps::RVec<int> get_Vertex_indMC(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<int> get_Vertex_indMC(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<float> get_Vertex_d2MC(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-					    ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> mcver,
-					    ROOT::VecOps::RVec<int> mcind,
+  ROOT::VecOps::RVec<float> get_Vertex_d2MC(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+					    const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& mcver,
+					    const ROOT::VecOps::RVec<int>& mcind,
 					    int comp);
 
-  std::vector<std::vector<int>> get_Vertex_ind(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  std::vector<std::vector<int>> get_Vertex_ind(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
   float get_d0(TVector3 x, TVector3 p);
   float get_z0(TVector3 x, TVector3 p);
 
 
-  ROOT::VecOps::RVec<TVector3> get_MCVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex);
+  ROOT::VecOps::RVec<TVector3> get_MCVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex);
 
-  ROOT::VecOps::RVec<float> get_MCVertex_x(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex);
+  ROOT::VecOps::RVec<float> get_MCVertex_x(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex);
 
-  ROOT::VecOps::RVec<float> get_MCVertex_y(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex);
+  ROOT::VecOps::RVec<float> get_MCVertex_y(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex);
 
-  ROOT::VecOps::RVec<float> get_MCVertex_z(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex);
+  ROOT::VecOps::RVec<float> get_MCVertex_z(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex);
 
-  ROOT::VecOps::RVec<int> get_NTracksMCVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex);
+  ROOT::VecOps::RVec<int> get_NTracksMCVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex);
 
-  std::vector< std::vector<int> > get_MCindMCVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex);
+  std::vector< std::vector<int> > get_MCindMCVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex);
 
-  std::vector<std::vector<int>> get_MCpdgMCVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex,
-						  ROOT::VecOps::RVec<edm4hep::MCParticleData> mc);
+  std::vector<std::vector<int>> get_MCpdgMCVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex,
+						  const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc);
 
-  std::vector<std::vector<int>> get_MCpdgMotherMCVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex,
-							ROOT::VecOps::RVec<edm4hep::MCParticleData> mc);
+  std::vector<std::vector<int>> get_MCpdgMotherMCVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex,
+							const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc);
 
-  std::vector<std::vector<int>> get_MCpdgGMotherMCVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex,
-							 ROOT::VecOps::RVec<edm4hep::MCParticleData> mc);
+  std::vector<std::vector<int>> get_MCpdgGMotherMCVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex,
+							 const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc);
 
-  ROOT::VecOps::RVec<int> get_MCMother1(ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-					ROOT::VecOps::RVec<int> ind);
+  ROOT::VecOps::RVec<int> get_MCMother1(const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+					const ROOT::VecOps::RVec<int>& ind);
 
-  ROOT::VecOps::RVec<int> get_MCMother2(ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-					ROOT::VecOps::RVec<int> ind);
+  ROOT::VecOps::RVec<int> get_MCMother2(const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+					const ROOT::VecOps::RVec<int>& ind);
 
-  ROOT::VecOps::RVec<int> get_MCDaughter1(ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-					  ROOT::VecOps::RVec<int> ind);
+  ROOT::VecOps::RVec<int> get_MCDaughter1(const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+					  const ROOT::VecOps::RVec<int>& ind);
 
-  ROOT::VecOps::RVec<int> get_MCDaughter2(ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-					  ROOT::VecOps::RVec<int> ind);
+  ROOT::VecOps::RVec<int> get_MCDaughter2(const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+					  const ROOT::VecOps::RVec<int>& ind);
 
-  ROOT::VecOps::RVec<int> get_MCMother2(ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-					ROOT::VecOps::RVec<int> ind);
+  ROOT::VecOps::RVec<int> get_MCMother2(const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+					const ROOT::VecOps::RVec<int>& ind);
 
 
-  ROOT::VecOps::RVec<FCCAnalysesComposite> add_truthmatched(ROOT::VecOps::RVec<FCCAnalysesComposite> comp,
-							    ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-							    ROOT::VecOps::RVec<int> rp2mc,
-							    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-							    ROOT::VecOps::RVec<int> ind);
+  ROOT::VecOps::RVec<FCCAnalysesComposite> add_truthmatched(const ROOT::VecOps::RVec<FCCAnalysesComposite>& comp,
+							    const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+							    const ROOT::VecOps::RVec<int>& rp2mc,
+							    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+							    const ROOT::VecOps::RVec<int>& ind);
 
-  ROOT::VecOps::RVec<FCCAnalysesComposite2> add_truthmatched2(ROOT::VecOps::RVec<FCCAnalysesComposite2> comp,
-							      ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-							      ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							      ROOT::VecOps::RVec<int> rp2mc,
-							      ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-							      ROOT::VecOps::RVec<int> ind);
+  ROOT::VecOps::RVec<FCCAnalysesComposite2> add_truthmatched2(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& comp,
+							      const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+							      const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							      const ROOT::VecOps::RVec<int>& rp2mc,
+							      const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+							      const ROOT::VecOps::RVec<int>& ind);
 
 
-  ROOT::VecOps::RVec<int> get_trueVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex,
-					 ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-					 ROOT::VecOps::RVec<int> ind,
+  ROOT::VecOps::RVec<int> get_trueVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex,
+					 const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+					 const ROOT::VecOps::RVec<int>& ind,
 					 int mother,
 					 int grandmother);
 
 
-  bool isPV(edm4hep::ReconstructedParticleData recop,
-	    ROOT::VecOps::RVec<int> pvindex);
+  bool isPV(const edm4hep::ReconstructedParticleData& recop,
+	    const ROOT::VecOps::RVec<int>& pvindex);
 
   ROOT::VecOps::RVec<int> getMC_daughter(int daughterindex,
-					 ROOT::VecOps::RVec<edm4hep::MCParticleData> in,
-					 ROOT::VecOps::RVec<int> ind);
+					 const ROOT::VecOps::RVec<edm4hep::MCParticleData>& in,
+					 const ROOT::VecOps::RVec<int>& ind);
 
   ROOT::VecOps::RVec<int> getMC_parent(int parentindex,
-				       ROOT::VecOps::RVec<edm4hep::MCParticleData> in,
-				       ROOT::VecOps::RVec<int> ind);
+				       const ROOT::VecOps::RVec<edm4hep::MCParticleData>& in,
+				       const ROOT::VecOps::RVec<int>& ind);
 
   int getMC_parent(int parentindex,
-		   edm4hep::MCParticleData in,
-		   ROOT::VecOps::RVec<int> ind);
+		   const edm4hep::MCParticleData& in,
+		   const ROOT::VecOps::RVec<int>& ind);
 
-  ROOT::VecOps::RVec<float> get_flightDistanceVertex(ROOT::VecOps::RVec<FCCAnalysesComposite> in,
-						     VertexingUtils::FCCAnalysesVertex pv);
+  ROOT::VecOps::RVec<float> get_flightDistanceVertex(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in,
+						     const VertexingUtils::FCCAnalysesVertex& pv);
 
-  ROOT::VecOps::RVec<float> get_flightDistanceVertex(ROOT::VecOps::RVec<FCCAnalysesComposite> in,
-						     edm4hep::VertexData pv);
+  ROOT::VecOps::RVec<float> get_flightDistanceVertex(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in,
+						     const edm4hep::VertexData& pv);
 
-  float get_distanceVertex(edm4hep::VertexData v1,
-			   edm4hep::VertexData v2,
+  float get_distanceVertex(const edm4hep::VertexData& v1,
+			   const edm4hep::VertexData& v2,
 			   int comp);
 
-  float get_distanceErrorVertex(edm4hep::VertexData v1,
-				edm4hep::VertexData v2,
+  float get_distanceErrorVertex(const edm4hep::VertexData& v1,
+				const edm4hep::VertexData& v2,
 				int comp);
 
   float get_distance(TVector3 v1,
@@ -252,160 +252,160 @@ namespace myUtils{
 
 
 
-  ROOT::VecOps::RVec<int> get_compmc(ROOT::VecOps::RVec<FCCAnalysesComposite> in);
+  ROOT::VecOps::RVec<int> get_compmc(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in);
 
-  ROOT::VecOps::RVec<TLorentzVector> getFCCAnalysesComposite_particle(ROOT::VecOps::RVec<FCCAnalysesComposite> in);
+  ROOT::VecOps::RVec<TLorentzVector> getFCCAnalysesComposite_particle(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in);
 
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> getFCCAnalysesComposite_index(ROOT::VecOps::RVec<FCCAnalysesComposite> in);
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> getFCCAnalysesComposite_index(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in);
 
-  ROOT::VecOps::RVec<edm4hep::VertexData> getFCCAnalysesComposite_vertex(ROOT::VecOps::RVec<FCCAnalysesComposite> in);
+  ROOT::VecOps::RVec<edm4hep::VertexData> getFCCAnalysesComposite_vertex(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in);
 
-  int getFCCAnalysesComposite_N(ROOT::VecOps::RVec<FCCAnalysesComposite> in);
+  int getFCCAnalysesComposite_N(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in);
 
-  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(ROOT::VecOps::RVec<FCCAnalysesComposite> in);
+  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in);
 
 
-  int getFCCAnalysesComposite_N(ROOT::VecOps::RVec<FCCAnalysesComposite2> in);
+  int getFCCAnalysesComposite_N(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in);
 
-  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(ROOT::VecOps::RVec<FCCAnalysesComposite2> in);
+  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in);
 
-  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-							 ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+							 const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-						    ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-						    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
+  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+						    const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+						    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
 						    int index);
 
-  ROOT::VecOps::RVec<int> getFCCAnalysesComposite_type(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-						    ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-						    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
+  ROOT::VecOps::RVec<int> getFCCAnalysesComposite_type(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+						    const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+						    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
 						    int index);
 
-  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_p(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
+  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_p(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
 						      int type);
 
-  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_B(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-						      ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-						      ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop);
+  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_B(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+						      const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+						      const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop);
 
-  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_p(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-						      ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-						      ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
+  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_p(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+						      const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+						      const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
 						      int index,
 						      int type);
 
-  ROOT::VecOps::RVec<int> getFCCAnalysesComposite_charge(ROOT::VecOps::RVec<FCCAnalysesComposite2> in);
+  ROOT::VecOps::RVec<int> getFCCAnalysesComposite_charge(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in);
 
-  ROOT::VecOps::RVec<int> getFCCAnalysesComposite_vertex(ROOT::VecOps::RVec<FCCAnalysesComposite2> in);
+  ROOT::VecOps::RVec<int> getFCCAnalysesComposite_vertex(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in);
 
-  ROOT::VecOps::RVec<int> getFCCAnalysesComposite_mcvertex(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-							   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<int> getFCCAnalysesComposite_mcvertex(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+							   const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<int> getFCCAnalysesComposite_q(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-						    ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-						    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
+  ROOT::VecOps::RVec<int> getFCCAnalysesComposite_q(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+						    const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+						    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
 						    int index);
 
 
-  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_d0(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-						       ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
+  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_d0(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+						       const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
 						       int index);
 
-  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_z0(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-						       ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
+  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_z0(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+						       const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
 						       int index);
 
-  ROOT::VecOps::RVec<edm4hep::TrackState> getFCCAnalysesComposite_track(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-									ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<edm4hep::TrackState> getFCCAnalysesComposite_track(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+									const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  ROOT::VecOps::RVec<float> get_trackd0(ROOT::VecOps::RVec<edm4hep::TrackState> in);
-  ROOT::VecOps::RVec<float> get_trackz0(ROOT::VecOps::RVec<edm4hep::TrackState> in);
+  ROOT::VecOps::RVec<float> get_trackd0(const ROOT::VecOps::RVec<edm4hep::TrackState>& in);
+  ROOT::VecOps::RVec<float> get_trackz0(const ROOT::VecOps::RVec<edm4hep::TrackState>& in);
 
-  ROOT::VecOps::RVec<int> getFCCAnalysesComposite_truthMatch(ROOT::VecOps::RVec<FCCAnalysesComposite2> in);
+  ROOT::VecOps::RVec<int> getFCCAnalysesComposite_truthMatch(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in);
 
 
-  ROOT::VecOps::RVec<FCCAnalysesComposite> build_Bu2D0Pi(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-							 ROOT::VecOps::RVec<FCCAnalysesComposite> d0,
-							 ROOT::VecOps::RVec<int> pions);
+  ROOT::VecOps::RVec<FCCAnalysesComposite> build_Bu2D0Pi(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+							 const ROOT::VecOps::RVec<FCCAnalysesComposite>& d0,
+							 const ROOT::VecOps::RVec<int>& pions);
 
 
-  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> PID(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-							     ROOT::VecOps::RVec<int> recind,
-							     ROOT::VecOps::RVec<int> mcind,
-							     ROOT::VecOps::RVec<edm4hep::MCParticleData> mc);
+  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> PID(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+							     const ROOT::VecOps::RVec<int>& recind,
+							     const ROOT::VecOps::RVec<int>& mcind,
+							     const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc);
 
-  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> get_RP_atVertex(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-									 ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> get_RP_atVertex(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+									 const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
 
 
-  float build_invmass(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-		      ROOT::VecOps::RVec<int> index);
+  float build_invmass(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+		      const ROOT::VecOps::RVec<int>& index);
 
-  TLorentzVector build_tlv(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-			   ROOT::VecOps::RVec<int> index);
+  TLorentzVector build_tlv(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+			   const ROOT::VecOps::RVec<int>& index);
 
-  ROOT::VecOps::RVec<float> get_Vertex_thrusthemis_angle(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							 ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-							 ROOT::VecOps::RVec<float> thrust);
+  ROOT::VecOps::RVec<float> get_Vertex_thrusthemis_angle(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							 const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+							 const ROOT::VecOps::RVec<float>& thrust);
 
-  ROOT::VecOps::RVec<float> get_DVertex_thrusthemis_angle(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-							  ROOT::VecOps::RVec<float> thrust);
+  ROOT::VecOps::RVec<float> get_DVertex_thrusthemis_angle(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							  const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+							  const ROOT::VecOps::RVec<float>& thrust);
 
-  ROOT::VecOps::RVec<int> get_Vertex_thrusthemis_emin(ROOT::VecOps::RVec<float> angle,
+  ROOT::VecOps::RVec<int> get_Vertex_thrusthemis_emin(const ROOT::VecOps::RVec<float>& angle,
 						      float eneg,
 						      float epos);
 
   ///index ==1 -> positive angle == minimum energy
   ///index ==0 -> negative angle == maximum energy
-  ROOT::VecOps::RVec<int> get_Vertex_thrusthemis(ROOT::VecOps::RVec<float> angle,
+  ROOT::VecOps::RVec<int> get_Vertex_thrusthemis(const ROOT::VecOps::RVec<float>& angle,
 						 int index);
 
 
-  ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> build_rho(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-										       ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-										       ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop);
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> build_rho(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+										       const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+										       const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop);
 
-  ROOT::VecOps::RVec<float> get_mass(ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> in,
+  ROOT::VecOps::RVec<float> get_mass(const ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>>& in,
 				     int index);
 
-  ROOT::VecOps::RVec<float> get_px(ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> in,
+  ROOT::VecOps::RVec<float> get_px(const ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>>& in,
 				   int index);
 
-  ROOT::VecOps::RVec<float> get_py(ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> in,
+  ROOT::VecOps::RVec<float> get_py(const ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>>& in,
 				   int index);
 
-  ROOT::VecOps::RVec<float> get_pz(ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> in,
+  ROOT::VecOps::RVec<float> get_pz(const ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>>& in,
 				   int index);
 
   /// return the momenta of the input ReconstructedParticles
-  float get_p(edm4hep::ReconstructedParticleData in);
+  float get_p(const edm4hep::ReconstructedParticleData& in);
 
-  ROOT::VecOps::RVec<edm4hep::TrackState> get_truetrack(ROOT::VecOps::RVec<int> in,
-							ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex,
-							ROOT::VecOps::RVec<edm4hep::MCParticleData> mc);
+  ROOT::VecOps::RVec<edm4hep::TrackState> get_truetrack(const ROOT::VecOps::RVec<int>& in,
+							const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex,
+							const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc);
 
-  int get_PV_ntracks(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
-  int hasPV(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex);
+  int get_PV_ntracks(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
+  int hasPV(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex);
 
-  float get_dPV2DV_min(ROOT::VecOps::RVec<float> in);
-  float get_dPV2DV_max(ROOT::VecOps::RVec<float> in);
-  float get_dPV2DV_ave(ROOT::VecOps::RVec<float> in);
+  float get_dPV2DV_min(const ROOT::VecOps::RVec<float>& in);
+  float get_dPV2DV_max(const ROOT::VecOps::RVec<float>& in);
+  float get_dPV2DV_ave(const ROOT::VecOps::RVec<float>& in);
 
-  int get_Npos(ROOT::VecOps::RVec<float> in);
-  int get_Nneg(ROOT::VecOps::RVec<float> in);
+  int get_Npos(const ROOT::VecOps::RVec<float>& in);
+  int get_Nneg(const ROOT::VecOps::RVec<float>& in);
 
-  ROOT::VecOps::RVec<edm4hep::MCParticleData> build_truerho(ROOT::VecOps::RVec<int> vertexind,
-							    ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex,
-							    ROOT::VecOps::RVec<edm4hep::MCParticleData> mc);
+  ROOT::VecOps::RVec<edm4hep::MCParticleData> build_truerho(const ROOT::VecOps::RVec<int>& vertexind,
+							    const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex,
+							    const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc);
 
 
-  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_anglethrust(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-								ROOT::VecOps::RVec<float> thrust);
+  ROOT::VecOps::RVec<float> getFCCAnalysesComposite_anglethrust(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+								const ROOT::VecOps::RVec<float>& thrust);
 
-  int has_anglethrust_emin(ROOT::VecOps::RVec<float> angle);
+  int has_anglethrust_emin(const ROOT::VecOps::RVec<float>& angle);
 
 }//end NS myUtils
 
@@ -6,6 +6,9 @@
 #include "Math/Factory.h"
 #include "Math/Functor.h"
 #include <algorithm>
+#include <array>
+#include <cmath>
+#include <functional>
 #include <iostream>
 #include <numeric>
 
@@ -309,6 +312,257 @@ inline void Algorithms::calculate_thrust::copy(float (&vecOut)[4], float vecIn[4
 }
 
 
+ROOT::VecOps::RVec<float> calculate_sphericity::operator()(
+    const ROOT::VecOps::RVec<float>& px,
+    const ROOT::VecOps::RVec<float>& py,
+    const ROOT::VecOps::RVec<float>& pz) {
+
+  if (px.size() != py.size() || px.size() != pz.size()) {
+    throw std::domain_error("calculate_sphericity: Input vector sizes are not equal.");
+  }
+
+  // Layout as in minimize_sphericity: value, x, x error, y, y error, z, z error,
+  // but with unit axis and errors set to 0
+  ROOT::VecOps::RVec<float> result(7, -1.);
+
+  // Momentum tensor S_ab = sum(p_a p_b) / sum(|p|^2)
+  double s[3][3] = {{0., 0., 0.}, {0., 0., 0.}, {0., 0., 0.}};
+  double norm = 0.;
+  for (size_t i = 0; i < px.size(); ++i) {
+    const double p[3] = {px[i], py[i], pz[i]};
+    for (size_t a = 0; a < 3; ++a) {
+      for (size_t b = a; b < 3; ++b) {
+        s[a][b] += p[a] * p[b];
+      }
+    }
+    norm += p[0]*p[0] + p[1]*p[1] + p[2]*p[2];
+  }
+  if (norm <= 0.) {
+    return result;
+  }
+  for (size_t a = 0; a < 3; ++a) {
+    for (size_t b = a; b < 3; ++b) {
+      s[a][b] /= norm;
+      s[b][a] = s[a][b];
+    }
+  }
+
+  // Eigenvalues of the symmetric 3x3 tensor, in decreasing order (closed form)
+  double lambda[3];
+  const double p1 = s[0][1]*s[0][1] + s[0][2]*s[0][2] + s[1][2]*s[1][2];
+  if (p1 == 0.) {
+    lambda[0] = s[0][0];
+    lambda[1] = s[1][1];
+    lambda[2] = s[2][2];
+    std::sort(lambda, lambda + 3, std::greater<double>());
+  } else {
+    const double q = (s[0][0] + s[1][1] + s[2][2]) / 3.;
+    const double p2 = (s[0][0] - q)*(s[0][0] - q) + (s[1][1] - q)*(s[1][1] - q) +
+                      (s[2][2] - q)*(s[2][2] - q) + 2.*p1;
+    const double p = std::sqrt(p2 / 6.);
+    // B = (S - q I) / p, its eigenvalues are 2 cos(phi + 2 k pi / 3)
+    double b[3][3];
+    for (size_t a = 0; a < 3; ++a) {
+      for (size_t c = 0; c < 3; ++c) {
+        b[a][c] = (s[a][c] - (a == c ? q : 0.)) / p;
+      }
+    }
+    double r = (b[0][0]*(b[1][1]*b[2][2] - b[1][2]*b[2][1]) -
+                b[0][1]*(b[1][0]*b[2][2] - b[1][2]*b[2][0]) +
+                b[0][2]*(b[1][0]*b[2][1] - b[1][1]*b[2][0])) / 2.;
+    r = std::clamp(r, -1., 1.);
+    const double phi = std::acos(r) / 3.;
+    lambda[0] = q + 2.*p*std::cos(phi);
+    lambda[2] = q + 2.*p*std::cos(phi + 2.*M_PI/3.);
+    lambda[1] = 3.*q - lambda[0] - lambda[2];
+  }
+
+  // Sphericity axis: eigenvector of the largest eigenvalue, orthogonal to the
+  // rows of S - lambda_1 I, i.e. along the largest cross product of two rows
+  double m[3][3];
+  for (size_t a = 0; a < 3; ++a) {
+    for (size_t c = 0; c < 3; ++c) {
+      m[a][c] = s[a][c] - (a == c ? lambda[0] : 0.);
+    }
+  }
+  double axis[3] = {0., 0., 0.};
+  double axisMag2 = 0.;
+  const size_t rows[3][2] = {{0, 1}, {0, 2}, {1, 2}};
+  for (const auto& row : rows) {
+    const double* r1 = m[row[0]];
+    const double* r2 = m[row[1]];
+    const double c[3] = {r1[1]*r2[2] - r1[2]*r2[1],
+                         r1[2]*r2[0] - r1[0]*r2[2],
+                         r1[0]*r2[1] - r1[1]*r2[0]};
+    const double cMag2 = c[0]*c[0] + c[1]*c[1] + c[2]*c[2];
+    if (cMag2 > axisMag2) {
+      axisMag2 = cMag2;
+      std::copy(c, c + 3, axis);
+    }
+  }
+  if (axisMag2 < 1e-24) {
+    // Largest eigenvalue degenerate: any direction orthogonal to the remaining
+    // row of S - lambda_1 I (or any direction for an isotropic event)
+    const double* r1 = m[0];
+    for (size_t a = 1; a < 3; ++a) {
+      if (m[a][0]*m[a][0] + m[a][1]*m[a][1] + m[a][2]*m[a][2] >
+          r1[0]*r1[0] + r1[1]*r1[1] + r1[2]*r1[2]) {
+        r1 = m[a];
+      }
+    }
+    const double e[3] = {std::abs(r1[0]) < std::abs(r1[1]) ? 1. : 0.,
+                         std::abs(r1[0]) < std::abs(r1[1]) ? 0. : 1.,
+                         0.};
+    axis[0] = r1[1]*e[2] - r1[2]*e[1];
+    axis[1] = r1[2]*e[0] - r1[0]*e[2];
+    axis[2] = r1[0]*e[1] - r1[1]*e[0];
+    axisMag2 = axis[0]*axis[0] + axis[1]*axis[1] + axis[2]*axis[2];
+    if (axisMag2 == 0.) {
+      axis[2] = 1.;
+      axisMag2 = 1.;
+    }
+  }
+  const double axisMag = std::sqrt(axisMag2);
+
+  result[0] = 1.5 * (lambda[1] + lambda[2]);
+  result[1] = axis[0] / axisMag;
+  result[2] = 0.;
+  result[3] = axis[1] / axisMag;
+  result[4] = 0.;
+  result[5] = axis[2] / axisMag;
+  result[6] = 0.;
+
+  return result;
+}
+
+
+ROOT::VecOps::RVec<float> calculate_thrust_sweep::operator()(
+    const ROOT::VecOps::RVec<float>& px,
+    const ROOT::VecOps::RVec<float>& py,
+    const ROOT::VecOps::RVec<float>& pz) {
+
+  if (px.size() != py.size() || px.size() != pz.size()) {
+    throw std::domain_error("calculate_thrust_sweep: Input vector sizes are not equal.");
+  }
+
+  // Layout as in minimize_thrust: value, x, x error, y, y error, z, z error,
+  // but with unit axis and errors set to 0
+  ROOT::VecOps::RVec<float> result(7, -1.);
+
+  const size_t nParticles = px.size();
+  if (nParticles < 2) {
+    return result;
+  }
+
+  std::vector<std::array<double, 3>> p(nParticles);
+  double pSum = 0.;
+  for (size_t i = 0; i < nParticles; ++i) {
+    p[i] = {px[i], py[i], pz[i]};
+    pSum += std::sqrt(px[i]*px[i] + py[i]*py[i] + pz[i]*pz[i]);
+  }
+
+  // As in calculate_thrust, the thrust axis is the largest sum of the momenta
+  // with the signs given by a plane containing two particles i and j (all four
+  // signs tried for i and j). For a given i, the planes containing p_i are
+  // swept by rotating their normal n(t) = cos(t) u + sin(t) v around p_i:
+  // particle j changes side at the two angles where the plane contains p_j,
+  // so the signed sum is updated in O(1) from one plane to the next.
+  double pMax[3] = {0., 0., 0.};
+  double pMaxMag2 = 0.;
+  std::vector<std::pair<double, size_t>> crossings;
+  crossings.reserve(2 * nParticles);
+  std::vector<double> sign(nParticles);
+  for (size_t i = 0; i < nParticles; ++i) {
+    const auto& pi = p[i];
+    const double piMag = std::sqrt(pi[0]*pi[0] + pi[1]*pi[1] + pi[2]*pi[2]);
+    if (piMag == 0.) {
+      continue;
+    }
+
+    // Orthonormal basis (u, v) of the plane orthogonal to p_i
+    const double w[3] = {pi[0] / piMag, pi[1] / piMag, pi[2] / piMag};
+    const double e[3] = {std::abs(w[0]) < 0.9 ? 1. : 0., std::abs(w[0]) < 0.9 ? 0. : 1., 0.};
+    double u[3] = {w[1]*e[2] - w[2]*e[1], w[2]*e[0] - w[0]*e[2], w[0]*e[1] - w[1]*e[0]};
+    const double uMag = std::sqrt(u[0]*u[0] + u[1]*u[1] + u[2]*u[2]);
+    u[0] /= uMag; u[1] /= uMag; u[2] /= uMag;
+    const double v[3] = {w[1]*u[2] - w[2]*u[1], w[2]*u[0] - w[0]*u[2], w[0]*u[1] - w[1]*u[0]};
+
+    // n(t).p_j = r_j cos(t - phi_j) changes sign at t = phi_j -+ pi/2
+    crossings.clear();
+    for (size_t j = 0; j < nParticles; ++j) {
+      if (j == i) {
+        continue;
+      }
+      const double phi = std::atan2(p[j][0]*v[0] + p[j][1]*v[1] + p[j][2]*v[2],
+                                    p[j][0]*u[0] + p[j][1]*u[1] + p[j][2]*u[2]);
+      for (const double t : {phi - M_PI/2., phi + M_PI/2.}) {
+        crossings.emplace_back(t < 0. ? t + 2.*M_PI : (t >= 2.*M_PI ? t - 2.*M_PI : t), j);
+      }
+    }
+    std::sort(crossings.begin(), crossings.end());
+
+    // Signed sum of the other particles for a plane between the last and the
+    // first crossing
+    const double t0 = 0.5 * (crossings.back().first - 2.*M_PI + crossings.front().first);
+    const double n0[3] = {std::cos(t0)*u[0] + std::sin(t0)*v[0],
+                          std::cos(t0)*u[1] + std::sin(t0)*v[1],
+                          std::cos(t0)*u[2] + std::sin(t0)*v[2]};
+    double pPart[3] = {0., 0., 0.};
+    for (size_t k = 0; k < nParticles; ++k) {
+      if (k == i) {
+        continue;
+      }
+      sign[k] = n0[0]*p[k][0] + n0[1]*p[k][1] + n0[2]*p[k][2] > 0. ? 1. : -1.;
+      for (size_t a = 0; a < 3; ++a) {
+        pPart[a] += sign[k] * p[k][a];
+      }
+    }
+
+    for (const auto& crossing : crossings) {
+      const size_t j = crossing.second;
+      const auto& pj = p[j];
+      // Sum of the particles on either side of the plane containing p_i and p_j
+      double pRest[3];
+      for (size_t a = 0; a < 3; ++a) {
+        pRest[a] = pPart[a] - sign[j] * pj[a];
+      }
+      for (const double si : {1., -1.}) {
+        for (const double sj : {1., -1.}) {
+          const double pFull[3] = {pRest[0] + si*pi[0] + sj*pj[0],
+                                   pRest[1] + si*pi[1] + sj*pj[1],
+                                   pRest[2] + si*pi[2] + sj*pj[2]};
+          const double pFullMag2 = pFull[0]*pFull[0] + pFull[1]*pFull[1] + pFull[2]*pFull[2];
+          if (pFullMag2 > pMaxMag2) {
+            pMaxMag2 = pFullMag2;
+            std::copy(pFull, pFull + 3, pMax);
+          }
+        }
+      }
+      // Particle j moves to the other side
+      sign[j] = -sign[j];
+      for (size_t a = 0; a < 3; ++a) {
+        pPart[a] = pRest[a] + sign[j] * pj[a];
+      }
+    }
+  }
+
+  if (pMaxMag2 <= 0. || pSum <= 0.) {
+    return result;
+  }
+
+  const double pMaxMag = std::sqrt(pMaxMag2);
+  result[0] = pMaxMag / pSum;
+  result[1] = pMax[0] / pMaxMag;
+  result[2] = 0.;
+  result[3] = pMax[1] / pMaxMag;
+  result[4] = 0.;
+  result[5] = pMax[2] / pMaxMag;
+  result[6] = 0.;
+
+  return result;
+}
+
+
 getAxisCharge::getAxisCharge(bool arg_pos,
 	                           float arg_power){
   _pos = arg_pos;
@@ -4,6 +4,7 @@
 #include "edm4hep/MCParticleData.h"
 
 #include <math.h>
+#include <stdexcept>
 
 #include "DD4hep/Detector.h"
 
@@ -13,12 +14,38 @@ namespace CaloNtupleizer{
 
 dd4hep::DDSegmentation::BitFieldCoder* m_decoder;
 
+// cell ID fields, resolved once in loadGeometry instead of being looked up by
+// name for every hit (nullptr if the readout does not have the field)
+const dd4hep::DDSegmentation::BitFieldElement* m_layerField = nullptr;
+const dd4hep::DDSegmentation::BitFieldElement* m_etaField = nullptr;
+const dd4hep::DDSegmentation::BitFieldElement* m_phiField = nullptr;
+const dd4hep::DDSegmentation::BitFieldElement* m_cryoField = nullptr;
+
+const dd4hep::DDSegmentation::BitFieldElement* findField(const std::string& name){
+  for (const auto & field: m_decoder->fields()){
+    if (field.name() == name) return &field;
+  }
+  return nullptr;
+}
+
+const dd4hep::DDSegmentation::BitFieldElement& getField(const dd4hep::DDSegmentation::BitFieldElement* field,
+                                                         const std::string& name){
+  if (field == nullptr){
+    throw std::runtime_error("CaloNtupleizer: no field '" + name + "' in the readout, was loadGeometry called?");
+  }
+  return *field;
+}
+
 void loadGeometry(std::string xmlGeometryPath, std::string readoutName){
   dd4hep::Detector* dd4hepgeo = &(dd4hep::Detector::getInstance());
   dd4hepgeo->fromCompact(xmlGeometryPath);
   dd4hepgeo->volumeManager();
   dd4hepgeo->apply("DD4hepVolumeManager", 0, 0);
   m_decoder = dd4hepgeo->readout(readoutName).idSpec().decoder();
+  m_layerField = findField("layer");
+  m_etaField = findField("eta");
+  m_phiField = findField("phi");
+  m_cryoField = findField("cryo");
 }
 
 
@@ -26,9 +53,10 @@ sel_layers::sel_layers(int arg_min, int arg_max) : _min(arg_min), _max(arg_max)
 ROOT::VecOps::RVec<edm4hep::CalorimeterHitData>  sel_layers::operator() (const ROOT::VecOps::RVec<edm4hep::CalorimeterHitData>& in) {
 
   ROOT::VecOps::RVec<edm4hep::CalorimeterHitData> res;
+  const auto & layerField = getField(m_layerField, "layer");
   for (auto & p: in){
     dd4hep::DDSegmentation::CellID cellId = p.cellID;
-    int layer = m_decoder->get(cellId, "layer");
+    int layer = layerField.value(cellId);
     if (layer>_min && layer<_max)res.emplace_back(p);
   }
   return res;
@@ -167,9 +195,11 @@ ROOT::VecOps::RVec<float> getCaloHit_phi (const ROOT::VecOps::RVec<edm4hep::Calo
 
 ROOT::VecOps::RVec<int> getCaloHit_phiBin (const ROOT::VecOps::RVec<edm4hep::CalorimeterHitData>& in){
   ROOT::VecOps::RVec<int> result;
+  result.reserve(in.size());
+  const auto & field = getField(m_phiField, "phi");
   for (auto & p: in){
     dd4hep::DDSegmentation::CellID cellId = p.cellID;
-    result.push_back(m_decoder->get(cellId, "phi"));
+    result.push_back(field.value(cellId));
   }
   return result;
 }
@@ -196,9 +226,11 @@ ROOT::VecOps::RVec<float> getCaloHit_eta (const ROOT::VecOps::RVec<edm4hep::Calo
 
 ROOT::VecOps::RVec<int> getCaloHit_etaBin (const ROOT::VecOps::RVec<edm4hep::CalorimeterHitData>& in){
   ROOT::VecOps::RVec<int> result;
+  result.reserve(in.size());
+  const auto & field = getField(m_etaField, "eta");
   for (auto & p: in){
     dd4hep::DDSegmentation::CellID cellId = p.cellID;
-    result.push_back(m_decoder->get(cellId, "eta"));
+    result.push_back(field.value(cellId));
   }
   return result;
 }
@@ -213,9 +245,26 @@ ROOT::VecOps::RVec<float> getCaloHit_energy (const ROOT::VecOps::RVec<edm4hep::C
 
 ROOT::VecOps::RVec<int> getCaloHit_layer (const ROOT::VecOps::RVec<edm4hep::CalorimeterHitData>& in){
   ROOT::VecOps::RVec<int> result;
+  result.reserve(in.size());
+  const auto & field = getField(m_layerField, "layer");
+  for (auto & p: in){
+    dd4hep::DDSegmentation::CellID cellId = p.cellID;
+    result.push_back(field.value(cellId));
+  }
+  return result;
+}
+
+ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> getCaloHit_layerEtaPhiBins (const ROOT::VecOps::RVec<edm4hep::CalorimeterHitData>& in){
+  const auto & layerField = getField(m_layerField, "layer");
+  const auto & etaField = getField(m_etaField, "eta");
+  const auto & phiField = getField(m_phiField, "phi");
+  ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> result(3);
+  for (auto & column: result) column.reserve(in.size());
   for (auto & p: in){
     dd4hep::DDSegmentation::CellID cellId = p.cellID;
-    result.push_back(m_decoder->get(cellId, "layer"));
+    result[0].push_back(layerField.value(cellId));
+    result[1].push_back(etaField.value(cellId));
+    result[2].push_back(phiField.value(cellId));
   }
   return result;
 }
@@ -323,16 +372,16 @@ ROOT::VecOps::RVec<std::vector<float>>
 getCaloCluster_energyInLayers (const ROOT::VecOps::RVec<edm4hep::ClusterData>& in,
                                const ROOT::VecOps::RVec<edm4hep::CalorimeterHitData>& cells,
                                const int nLayers) {
-  static const int layer_idx = m_decoder->index("layer");
-  static const int cryo_idx = m_decoder->index("cryo");
+  const auto & layerField = getField(m_layerField, "layer");
+  const auto & cryoField = getField(m_cryoField, "cryo");
   ROOT::VecOps::RVec<std::vector<float>> result;
   result.reserve(in.size());
 
   for (const auto & c: in) {
     std::vector<float> energies(nLayers, 0);
     for (auto i = c.hits_begin; i < c.hits_end; i++) {
-      int layer = m_decoder->get(cells[i].cellID, layer_idx);
-      int cryoID = m_decoder->get(cells[i].cellID, cryo_idx);
+      int layer = layerField.value(cells[i].cellID);
+      int cryoID = cryoField.value(cells[i].cellID);
       if(cryoID == 0) {
         energies[layer] += cells[i].energy;
       }
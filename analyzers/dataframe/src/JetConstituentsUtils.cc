@@ -16,6 +16,9 @@
 #include "fastjet/PseudoJet.hh"
 #include "fastjet/Selector.hh"
 
+#include <algorithm>
+#include <stdexcept>
+
 /* *************************
 //COMMENTS
 1. Neutral particles (Clusters??)
@@ -1219,6 +1222,263 @@ namespace FCCAnalyses
       return out;
     }
 
+    // fused features extraction
+    namespace
+    {
+      /// Storage order of the features in FCCAnalysesJetConstituentsFeatures, aligned with get_features_names
+      enum Feature
+      {
+        kIsMu, kIsEl, kIsChargedHad, kIsGamma, kIsNeutralHad,
+        kE, kP, kTheta, kPhi, kCharge, kType, kErel, kErelLog, kThetarel, kPhirel,
+        kDndx, kMtof,
+        kDxy, kDz, kPhi0, kC, kCt,
+        kDptdpt, kDxydxy, kDzdz, kDphidphi, kDetadeta, kDxydz, kDphidxy, kPhidz, kPhictgtheta, kDxyctgtheta,
+        kDlambdadz, kCctgtheta, kPhic, kDxyc, kCdz,
+        kBtagSip2dVal, kBtagSip2dSig, kBtagSip3dVal, kBtagSip3dSig, kBtagJetDistVal, kBtagJetDistSig,
+        kNumFeatures
+      };
+    }
+
+    const std::vector<std::string> &get_features_names()
+    {
+      static const std::vector<std::string> names = {
+          "pfcand_isMu", "pfcand_isEl", "pfcand_isChargedHad", "pfcand_isGamma", "pfcand_isNeutralHad",
+          "pfcand_e", "pfcand_p", "pfcand_theta", "pfcand_phi", "pfcand_charge", "pfcand_type",
+          "pfcand_erel", "pfcand_erel_log", "pfcand_thetarel", "pfcand_phirel",
+          "pfcand_dndx", "pfcand_mtof",
+          "pfcand_dxy", "pfcand_dz", "pfcand_phi0", "pfcand_C", "pfcand_ct",
+          "pfcand_dptdpt", "pfcand_dxydxy", "pfcand_dzdz", "pfcand_dphidphi", "pfcand_detadeta",
+          "pfcand_dxydz", "pfcand_dphidxy", "pfcand_phidz", "pfcand_phictgtheta", "pfcand_dxyctgtheta",
+          "pfcand_dlambdadz", "pfcand_cctgtheta", "pfcand_phic", "pfcand_dxyc", "pfcand_cdz",
+          "pfcand_btagSip2dVal", "pfcand_btagSip2dSig", "pfcand_btagSip3dVal", "pfcand_btagSip3dSig",
+          "pfcand_btagJetDistVal", "pfcand_btagJetDistSig"};
+      return names;
+    }
+
+    int get_feature_index(const std::string &name)
+    {
+      const auto &names = get_features_names();
+      auto it = std::find(names.begin(), names.end(), name);
+      if (it == names.end())
+        return -1;
+      return it - names.begin();
+    }
+
+    FCCAnalysesJetConstituentsFeatures get_features_cluster(const rv::RVec<fastjet::PseudoJet> &jets,
+                                                            const rv::RVec<FCCAnalysesJetConstituents> &jcs,
+                                                            const rv::RVec<edm4hep::TrackState> &tracks,
+                                                            const TLorentzVector &V, // primary vertex posotion and time in mm
+                                                            const float Bz,
+                                                            const rv::RVec<edm4hep::Quantity> &dNdx,       // ETrackFlow_2
+                                                            const rv::RVec<edm4hep::TrackData> &trackdata, // Eflowtrack
+                                                            const rv::RVec<float> &track_L,
+                                                            const rv::RVec<edm4hep::TrackerHitData> &trackerhits,
+                                                            const rv::RVec<edm4hep::ClusterData> &gammadata,
+                                                            const rv::RVec<edm4hep::ClusterData> &nhdata,
+                                                            const rv::RVec<edm4hep::CalorimeterHitData> &calohits)
+    {
+      const double cSpeed = 2.99792458e8 * 1.0e-9;
+      const double cSpeed_C = 2.99792458e8 * 1.0e3 * 1.0e-15;
+
+      FCCAnalysesJetConstituentsFeatures out;
+      out.jets_begin.reserve(jcs.size() + 1);
+      int n = 0;
+      for (const auto &jc : jcs)
+      {
+        out.jets_begin.push_back(n);
+        n += jc.size();
+      }
+      out.jets_begin.push_back(n);
+      out.values.resize(kNumFeatures * n);
+
+      int k = 0; // index of the constituent in the event
+      auto set = [&out, &n, &k](Feature feature, float value)
+      { out.values[feature * n + k] = value; };
+      auto get = [&out, &n, &k](Feature feature)
+      { return out.values[feature * n + k]; };
+
+      for (size_t i = 0; i < jcs.size(); ++i)
+      {
+        const auto &jet = jets.at(i);
+        const double e_jet = jet.E();
+        const float e_jet_log = jet.E();
+        TLorentzVector tlv_jet;
+        tlv_jet.SetXYZM(jet.px(), jet.py(), jet.pz(), jet.m());
+        const float theta_jet = tlv_jet.Theta();
+        const float phi_jet = tlv_jet.Phi();
+        const TVector2 p2_jet(jet.px(), jet.py());
+        const TVector3 p_jet(jet.px(), jet.py(), jet.pz());
+
+        for (const auto &ct : jcs[i])
+        {
+          const TVector3 p(ct.momentum.x, ct.momentum.y, ct.momentum.z);
+
+          // identification
+          const bool is_charged_had = std::abs(ct.charge) > 0 and std::abs(ct.mass - 0.13957) < 1.e-03;
+          set(kIsMu, std::abs(ct.charge) > 0 and std::abs(ct.mass - 0.105658) < 1.e-03);
+          set(kIsEl, std::abs(ct.charge) > 0 and std::abs(ct.mass - 0.000510999) < 1.e-05);
+          set(kIsChargedHad, is_charged_had);
+          set(kIsGamma, ct.type == 22);
+          set(kIsNeutralHad, ct.type == 130);
+
+          // kinematics
+          set(kE, ct.energy);
+          set(kP, p.Mag());
+          set(kTheta, p.Theta());
+          set(kPhi, p.Phi());
+          set(kCharge, ct.charge);
+          set(kType, ct.type);
+          set(kErel, (e_jet > 0.) ? ct.energy / e_jet : 1.);
+          set(kErelLog, std::log10(float((e_jet_log > 0.) ? ct.energy / e_jet_log : 1.)));
+          TVector3 v_const = p;
+          v_const.RotateZ(-phi_jet);
+          v_const.RotateY(-theta_jet);
+          set(kThetarel, v_const.Theta());
+          set(kPhirel, v_const.Phi());
+
+          // PID
+          if (ct.tracks_begin < trackdata.size() && is_charged_had)
+            set(kDndx, dNdx.at(trackdata.at(ct.tracks_begin).dxQuantities_begin).value / 1000.);
+          else
+            set(kDndx, 0.);
+
+          float mtof = 0.;
+          if (ct.clusters_begin < nhdata.size() + gammadata.size() && ct.type == 130)
+          {
+            // this assumes that in converter photons are filled first and nh after
+            const auto &hit = calohits.at(nhdata.at(ct.clusters_begin - gammadata.size()).hits_begin);
+            float X = hit.position.x, Y = hit.position.y, Z = hit.position.z;
+            float L = std::sqrt((X - V.X()) * (X - V.X()) + (Y - V.Y()) * (Y - V.Y()) + (Z - V.Z()) * (Z - V.Z())) * 0.001;
+            float beta = L / (hit.time * 2.99792458e+8);
+            mtof = (beta < 1. && beta > 0.) ? ct.energy * std::sqrt(1 - beta * beta) : 9.;
+          }
+          if (ct.tracks_begin < trackdata.size())
+          {
+            if (std::abs(ct.charge) > 0 and std::abs(ct.mass - 0.000510999) < 1.e-05)
+              mtof = 0.000510999;
+            else if (std::abs(ct.charge) > 0 and std::abs(ct.mass - 0.105658) < 1.e-03)
+              mtof = 0.105658;
+            else
+            {
+              // time given by primary vertex
+              float Tin = V.T() * 1e-3 / 2.99792458e+8;
+              float Tout = trackerhits.at(trackdata.at(ct.tracks_begin).trackerHits_end - 1).time;
+              float L = track_L.at(ct.tracks_begin) * 0.001;
+              float beta = L / ((Tout - Tin) * 2.99792458e+8);
+              float p_ct = std::sqrt(ct.momentum.x * ct.momentum.x + ct.momentum.y * ct.momentum.y + ct.momentum.z * ct.momentum.z);
+              mtof = (beta < 1. && beta > 0.) ? p_ct * std::sqrt(1 / (beta * beta) - 1) : 0.13957039;
+            }
+          }
+          set(kMtof, mtof);
+
+          // track parameters wrt the primary vertex, see ReconstructedParticle2Track::XPtoPar_*
+          if (ct.tracks_begin < tracks.size())
+          {
+            const auto &track = tracks.at(ct.tracks_begin);
+            TVector3 X(-track.D0 * TMath::Sin(track.phi), track.D0 * TMath::Cos(track.phi), track.Z0);
+            TVector3 x = X - V.Vect();
+            double a = -ct.charge * Bz * cSpeed;
+            double pt = p.Pt();
+            double r2 = x(0) * x(0) + x(1) * x(1);
+            double cross = x(0) * p(1) - x(1) * p(0);
+            double T2 = pt * pt - 2 * a * cross + a * a * r2;
+            double T = TMath::Sqrt(T2);
+            double D;
+            if (pt < 10.0)
+              D = (T - pt) / a;
+            else
+              D = (-2 * cross + a * r2) / (T + pt);
+            set(kDxy, T2 > 0 ? D : -9.);
+
+            double C = a / (2 * pt);
+            double B = C * TMath::Sqrt(TMath::Max(r2 - D * D, 0.0) / (1 + 2 * C * D));
+            if (TMath::Abs(B) > 1.)
+              B = TMath::Sign(1, B);
+            double st = TMath::ASin(B) / C;
+            double ctg = p(2) / pt;
+            double dot = x(0) * p(0) + x(1) * p(1);
+            set(kDz, dot > 0.0 ? x(2) - ctg * st : x(2) + ctg * st);
+            set(kPhi0, TMath::ATan2((p(1) - a * x(0)) / T, (p(0) + a * x(1)) / T));
+            set(kC, std::copysign(1.0, ct.charge) * Bz * cSpeed_C / (2 * pt));
+            set(kCt, ctg);
+
+            set(kDptdpt, track.covMatrix[5]);
+            set(kDxydxy, track.covMatrix[0]);
+            set(kDzdz, track.covMatrix[9]);
+            set(kDphidphi, track.covMatrix[2]);
+            set(kDetadeta, track.covMatrix[14]);
+            set(kDxydz, track.covMatrix[6]);
+            set(kDphidxy, track.covMatrix[1]);
+            set(kPhidz, track.covMatrix[7]);
+            set(kPhictgtheta, track.covMatrix[11]);
+            set(kDxyctgtheta, track.covMatrix[10]);
+            set(kDlambdadz, track.covMatrix[13]);
+            set(kCctgtheta, track.covMatrix[12]);
+            set(kPhic, track.covMatrix[4]);
+            set(kDxyc, track.covMatrix[3]);
+            set(kCdz, track.covMatrix[8]);
+          }
+          else
+          {
+            for (auto feature : {kDxy, kDz, kPhi0, kC, kCt, kDptdpt, kDxydxy, kDzdz, kDphidphi, kDetadeta, kDxydz,
+                                 kDphidxy, kPhidz, kPhictgtheta, kDxyctgtheta, kDlambdadz, kCctgtheta, kPhic, kDxyc, kCdz})
+              set(feature, -9.);
+          }
+
+          // impact parameters, from the values stored above as in the get_*_clusterV/get_*Sig functions
+          const float D0 = get(kDxy), Z0 = get(kDz), phi0 = get(kPhi0);
+          const float err2_D0 = get(kDxydxy), err2_Z0 = get(kDzdz);
+          if (D0 != -9)
+          {
+            TVector2 d0(-D0 * TMath::Sin(phi0), D0 * TMath::Cos(phi0));
+            TVector3 d(-D0 * TMath::Sin(phi0), D0 * TMath::Cos(phi0), Z0);
+            TVector3 n_ct = p.Cross(p_jet).Unit();
+            set(kBtagSip2dVal, TMath::Sign(1, d0 * p2_jet) * fabs(D0));
+            set(kBtagSip3dVal, TMath::Sign(1, d * p_jet) * fabs(sqrt(D0 * D0 + Z0 * Z0)));
+            set(kBtagJetDistVal, n_ct.Dot(d));
+          }
+          else
+          {
+            set(kBtagSip2dVal, -9.);
+            set(kBtagSip3dVal, -9.);
+            set(kBtagJetDistVal, -9.);
+          }
+          if (err2_D0 > 0)
+          {
+            float err3d = std::sqrt(err2_D0 + err2_Z0);
+            set(kBtagSip2dSig, get(kBtagSip2dVal) / std::sqrt(err2_D0));
+            set(kBtagSip3dSig, get(kBtagSip3dVal) / sqrt(err2_D0 + err2_Z0));
+            set(kBtagJetDistSig, get(kBtagJetDistVal) / err3d);
+          }
+          else
+          {
+            set(kBtagSip2dSig, -9.);
+            set(kBtagSip3dSig, -9.);
+            set(kBtagJetDistSig, -9.);
+          }
+          ++k;
+        }
+      }
+      return out;
+    }
+
+    rv::RVec<FCCAnalysesJetConstituentsData> get_feature(const FCCAnalysesJetConstituentsFeatures &features,
+                                                         const std::string &name)
+    {
+      const int feature = get_feature_index(name);
+      if (feature < 0)
+        throw std::invalid_argument("Unknown jet constituents feature: " + name);
+      rv::RVec<FCCAnalysesJetConstituentsData> out;
+      if (features.jets_begin.empty())
+        return out;
+      const size_t n = features.jets_begin.back();
+      float *data = const_cast<float *>(features.values.data()) + feature * n;
+      out.reserve(features.jets_begin.size() - 1);
+      for (size_t i = 0; i + 1 < features.jets_begin.size(); ++i)
+        out.emplace_back(data + features.jets_begin[i], features.jets_begin[i + 1] - features.jets_begin[i]);
+      return out;
+    }
+
     // compute residues
     rv::RVec<TLorentzVector> compute_tlv_jets(const rv::RVec<fastjet::PseudoJet> &jets)
     {
@@ -1,35 +1,73 @@
 #include "FCCAnalyses/JetFlavourUtils.h"
 #include "ONNXRuntime/WeaverInterface.h"
 
+#include <algorithm>
 #include <memory>
+#include <stdexcept>
 
 namespace FCCAnalyses {
   std::vector<WeaverInterface *> gWeavers;
   bool isSetup = false;
+  std::vector<std::string> gVariables;
+  std::vector<int> gFeatures;  // position of each variable in the jet constituents features tensor
+  bool isCached = false;
+  std::unordered_map<ULong64_t, ROOT::VecOps::RVec<ROOT::VecOps::RVec<float> > > gCachedWeights;  // per entry
 
   namespace JetFlavourUtils {
+    namespace {
+      /// Run the inference for all jets of an event, batched by the weaver of this slot, given a callable returning
+      /// the constituents variables of the i-th jet
+      template <typename F>
+      rv::RVec<rv::RVec<float> > run_jets(unsigned int slot, size_t num_jets, F&& jet_sc_vars) {
+        rv::RVec<Variables> jets;
+        jets.reserve(num_jets);
+        for (size_t i = 0; i < num_jets; ++i)
+          jets.emplace_back(jet_sc_vars(i));
+        return gWeavers.at(slot)->run_batch(jets);
+      }
+
+      void check_features() {
+        for (size_t k = 0; k < gFeatures.size(); ++k)
+          if (gFeatures.at(k) < 0)
+            throw std::runtime_error("Variable '" + gVariables.at(k) +
+                                     "' is not provided by the jet constituents features tensor.");
+      }
+
+      /// Views on the {var -> {constit1, constit2, ...}} blocks of the i-th jet, in the ordering expected by the model
+      Variables jet_features(const JetConstituentsUtils::FCCAnalysesJetConstituentsFeatures& features, size_t i) {
+        const size_t num_constits = features.jets_begin.back();
+        float* values = const_cast<float*>(features.values.data());
+        const size_t first = features.jets_begin.at(i), size = features.jets_begin.at(i + 1) - first;
+        Variables jet_sc_vars;
+        jet_sc_vars.reserve(gFeatures.size());
+        for (auto feature : gFeatures)
+          jet_sc_vars.emplace_back(values + feature * num_constits + first, size);
+        return jet_sc_vars;
+      }
+    }  // namespace
+
     void setup_weaver(const std::string& onnx_filename,
                       const std::string& json_filename,
                       const rv::RVec<std::string>& vars,
-                      const unsigned int nSlots) {
+                      const unsigned int nSlots,
+                      const unsigned int batchSize) {
       for(unsigned int i=0; i<nSlots; i++) {
-        WeaverInterface *gWeaver = new WeaverInterface(onnx_filename, json_filename, vars);
+        WeaverInterface *gWeaver = new WeaverInterface(onnx_filename, json_filename, vars, batchSize);
         gWeavers.push_back(gWeaver);
       }
+      gVariables.assign(vars.begin(), vars.end());
+      gFeatures.clear();
+      for (const auto& var : vars)
+        gFeatures.emplace_back(JetConstituentsUtils::get_feature_index(var));
       isSetup = true;
     }
 
-    rv::RVec<rv::RVec<float> > compute_weights(unsigned int slot, const rv::RVec<Variables>& vars) {
-      if (!isSetup)
-        throw std::runtime_error("Weaver interface is not initialised!");
-      rv::RVec<rv::RVec<float> > out;
+    rv::RVec<Variables> transpose_variables(const rv::RVec<Variables>& vars) {
+      rv::RVec<Variables> jets_sc_vars;
       if (vars.empty())  // no variables registered
-        return out;
+        return jets_sc_vars;
       size_t num_jets = vars.at(0).size();
-      if (num_jets == 0)  // no jets to categorise
-        return out;
-      // transform a collection of {var1 -> {jet1 -> {constit1, constit2, ...}, jet2 -> {...}, ...}, var2 -> {...}}
-      //      into a collection of {jet -> {var1 -> {constit1, constit2, ...}, var2 -> {...}, ...}}
+      jets_sc_vars.reserve(num_jets);
       for (size_t i = 0; i < num_jets; ++i) {
         Variables jet_sc_vars;
         size_t num_constits = vars.at(0).at(i).size();
@@ -39,9 +77,109 @@ namespace FCCAnalyses {
             constit_vars.push_back((float)vars.at(k).at(i).at(j));
           jet_sc_vars.push_back(constit_vars);
         }
-        out.emplace_back(gWeavers.at(slot)->run(jet_sc_vars));
+        jets_sc_vars.emplace_back(std::move(jet_sc_vars));
       }
-      return out;
+      return jets_sc_vars;
+    }
+
+    rv::RVec<rv::RVec<float> > compute_weights(unsigned int slot, const rv::RVec<Variables>& vars) {
+      if (!isSetup)
+        throw std::runtime_error("Weaver interface is not initialised!");
+      auto jets_sc_vars = transpose_variables(vars);
+      if (jets_sc_vars.empty())  // no jets to categorise
+        return rv::RVec<rv::RVec<float> >();
+      return gWeavers.at(slot)->run_batch(jets_sc_vars);
+    }
+
+    rv::RVec<rv::RVec<float> > get_weights_from_features(
+        unsigned int slot, const JetConstituentsUtils::FCCAnalysesJetConstituentsFeatures& features) {
+      if (!isSetup)
+        throw std::runtime_error("Weaver interface is not initialised!");
+      check_features();
+      const size_t num_jets = features.jets_begin.empty() ? 0 : features.jets_begin.size() - 1;
+      if (num_jets == 0)  // no jets to categorise
+        return rv::RVec<rv::RVec<float> >();
+      return run_jets(slot, num_jets, [&features](size_t i) { return jet_features(features, i); });
+    }
+
+    rv::RVec<Variables> get_jets_variables_from_features(
+        const JetConstituentsUtils::FCCAnalysesJetConstituentsFeatures& features) {
+      if (!isSetup)
+        throw std::runtime_error("Weaver interface is not initialised!");
+      check_features();
+      rv::RVec<Variables> jets_sc_vars;
+      const size_t num_jets = features.jets_begin.empty() ? 0 : features.jets_begin.size() - 1;
+      jets_sc_vars.reserve(num_jets);
+      for (size_t i = 0; i < num_jets; ++i) {
+        Variables jet_sc_vars;
+        for (const auto& view : jet_features(features, i))  // copies, to outlive the features tensor
+          jet_sc_vars.emplace_back(view.begin(), view.end());
+        jets_sc_vars.emplace_back(std::move(jet_sc_vars));
+      }
+      return jets_sc_vars;
+    }
+
+    WeightsCache::WeightsCache(unsigned int nSlots, size_t batchSize)
+        : batch_size_(std::max(batchSize, size_t(1))),
+          result_(std::make_shared<Result_t>(0)),
+          pending_(nSlots),
+          weights_(nSlots),
+          num_jets_(nSlots, 0) {}
+
+    void WeightsCache::Exec(unsigned int slot, ULong64_t entry, const rv::RVec<Variables>& jets) {
+      if (jets.empty())
+        return;
+      weights_[slot][entry].resize(jets.size());
+      const auto& weaver = gWeavers.at(slot);
+      for (size_t i = 0; i < jets.size(); ++i) {
+        auto& pending = pending_[slot][weaver->batchKey(jets[i])];
+        pending.push_back(PendingJet{entry, i, jets[i]});
+        if (pending.size() >= batch_size_)
+          flush(slot, pending);
+      }
+    }
+
+    void WeightsCache::flush(unsigned int slot, std::vector<PendingJet>& jets) {
+      if (jets.empty())
+        return;
+      rv::RVec<Variables> batch;
+      batch.reserve(jets.size());
+      for (auto& jet : jets)
+        batch.emplace_back(std::move(jet.vars));
+      auto scores = gWeavers.at(slot)->run_batch(batch);
+      // scatter the scores back to the events
+      for (size_t j = 0; j < jets.size(); ++j)
+        weights_[slot].at(jets[j].entry)[jets[j].index] = std::move(scores[j]);
+      num_jets_[slot] += jets.size();
+      jets.clear();
+    }
+
+    void WeightsCache::Finalize() {
+      gCachedWeights.clear();
+      for (size_t slot = 0; slot < pending_.size(); ++slot) {
+        for (auto& [key, jets] : pending_[slot])
+          flush(slot, jets);
+        gCachedWeights.merge(weights_[slot]);
+        *result_ += num_jets_[slot];
+      }
+      isCached = true;
+    }
+
+    ROOT::RDF::RResultPtr<ULong64_t> cache_weights(ROOT::RDF::RNode df, const std::string& jets_column,
+                                                   unsigned int batchSize) {
+      if (!isSetup)
+        throw std::runtime_error("Weaver interface is not initialised!");
+      return df.Book<ULong64_t, rv::RVec<Variables> >(WeightsCache(gWeavers.size(), batchSize),
+                                                      {"rdfentry_", jets_column});
+    }
+
+    rv::RVec<rv::RVec<float> > get_cached_weights(ULong64_t entry) {
+      if (!isCached)
+        throw std::runtime_error("Jet flavour weights were not cached, run cache_weights first!");
+      const auto it = gCachedWeights.find(entry);
+      if (it == gCachedWeights.end())  // no jets to categorise
+        return rv::RVec<rv::RVec<float> >();
+      return it->second;
     }
 
     rv::RVec<float> get_weight(const rv::RVec<rv::RVec<float> >& jets_weights, int weight) {
@@ -562,35 +562,22 @@ std::vector<int> list_of_particles_from_decay(int i, ROOT::VecOps::RVec<edm4hep:
 
 // ----------------------------------------------------------------------------------------------------------------------------------
 
-ROOT::VecOps::RVec<int>  get_indices_MotherByIndex ( int imother,
-						     std::vector<int> m_pdg_daughters,
-						     bool m_stableDaughters,
-						     bool m_chargeConjugateDaughters,
-						     bool m_inclusiveDecay,
-						     ROOT::VecOps::RVec<edm4hep::MCParticleData> in,
-						     ROOT::VecOps::RVec<int> ind) {
-
-   // Look for a specific decay specified by the mother index in the Particle block,
-   // and by the PDG_ids of the daughters
-   // If m_inclusiveDecay is true, then at least this list of daughters must be included in the decay
-   // Returns a vector with the indices, in the Particle block, of the mother and of
-   // the daughters - in the order defined by std::vector<int> pdg_daughters.
-
+// matches the decay products of imother to the requested daughters, see get_indices_MotherByIndex
+// pdg(i) gives the PDG id of particle i
+template <typename PDGOf>
+static ROOT::VecOps::RVec<int> match_decay_products( int imother,
+                                                     const std::vector<int> &products,
+                                                     const std::vector<int> &m_pdg_daughters,
+                                                     bool m_chargeConjugateDaughters,
+                                                     bool m_inclusiveDecay,
+                                                     PDGOf pdg ) {
 
   ROOT::VecOps::RVec<int>  result;
 
-  std::vector<int> products ;
-  if ( m_stableDaughters ) {
-    products = get_list_of_stable_particles_from_decay( imother, in, ind ) ;
-  }
-  else {
-    products = get_list_of_particles_from_decay( imother, in, ind ) ;
-  }
-
   std::vector<int> found;
   for (auto & pdg_d: m_pdg_daughters ) {
     for (auto & idx_d: products) {
-      if ( (m_chargeConjugateDaughters && abs(in[idx_d].PDG) == abs(pdg_d)) || in[idx_d].PDG == pdg_d) {
+      if ( (m_chargeConjugateDaughters && abs(pdg(idx_d)) == abs(pdg_d)) || pdg(idx_d) == pdg_d) {
 	// careful, there can be several particles with the same PDG !
 	if (std::find(found.begin(), found.end(), idx_d) == found.end())  {  // idx_d has NOT already been "used"
 	  found.push_back( idx_d );
@@ -609,7 +596,33 @@ ROOT::VecOps::RVec<int>  get_indices_MotherByIndex ( int imother,
     }
 
   return result;
+}
+
+ROOT::VecOps::RVec<int>  get_indices_MotherByIndex ( int imother,
+						     std::vector<int> m_pdg_daughters,
+						     bool m_stableDaughters,
+						     bool m_chargeConjugateDaughters,
+						     bool m_inclusiveDecay,
+						     ROOT::VecOps::RVec<edm4hep::MCParticleData> in,
+						     ROOT::VecOps::RVec<int> ind) {
 
+   // Look for a specific decay specified by the mother index in the Particle block,
+   // and by the PDG_ids of the daughters
+   // If m_inclusiveDecay is true, then at least this list of daughters must be included in the decay
+   // Returns a vector with the indices, in the Particle block, of the mother and of
+   // the daughters - in the order defined by std::vector<int> pdg_daughters.
+
+
+  std::vector<int> products ;
+  if ( m_stableDaughters ) {
+    products = get_list_of_stable_particles_from_decay( imother, in, ind ) ;
+  }
+  else {
+    products = get_list_of_particles_from_decay( imother, in, ind ) ;
+  }
+
+  return match_decay_products( imother, products, m_pdg_daughters, m_chargeConjugateDaughters, m_inclusiveDecay,
+                               [&in](int i) { return in[i].PDG; } );
 }
 
 ROOT::VecOps::RVec<int>  get_indices_ExclusiveDecay_MotherByIndex( int imother,
@@ -775,6 +788,225 @@ ROOT::VecOps::RVec<int> get_leptons_origin(const ROOT::VecOps::RVec<edm4hep::MCP
   return result;
 }
 
+// --------------------------------------------------------------------------------------------------
+
+MCDecayGraph get_decay_graph(const ROOT::VecOps::RVec<edm4hep::MCParticleData> &in,
+                             const ROOT::VecOps::RVec<int> &parents_ind,
+                             const ROOT::VecOps::RVec<int> &daughters_ind) {
+
+  MCDecayGraph graph;
+  const int n = in.size();
+  graph.n = n;
+  graph.nwords = (n + 63) / 64;
+  graph.pdg.reserve(n);
+  graph.genStatus.reserve(n);
+  graph.parents_begin.reserve(n + 1);
+  graph.daughters_begin.reserve(n + 1);
+  graph.parents.reserve(parents_ind.size());
+  graph.daughters.reserve(daughters_ind.size());
+
+  // adjacency arrays, dropping the indices that do not point into the collection
+  for (int i = 0; i < n; ++i) {
+    auto & p = in[i];
+    graph.pdg.push_back(p.PDG);
+    graph.genStatus.push_back(p.generatorStatus);
+    graph.parents_begin.push_back(graph.parents.size());
+    for (unsigned j = p.parents_begin; j < p.parents_end && j < parents_ind.size(); ++j) {
+      int k = parents_ind[j];
+      if (k >= 0 && k < n) graph.parents.push_back(k);
+    }
+    graph.daughters_begin.push_back(graph.daughters.size());
+    for (unsigned j = p.daughters_begin; j < p.daughters_end && j < daughters_ind.size(); ++j) {
+      int k = daughters_ind[j];
+      if (k >= 0 && k < n) graph.daughters.push_back(k);
+    }
+  }
+  graph.parents_begin.push_back(graph.parents.size());
+  graph.daughters_begin.push_back(graph.daughters.size());
+
+  // ancestry bitsets: the ancestors of a particle are its parents and their ancestors,
+  // so the parents are completed first (depth-first walk up the parents, without recursion)
+  const int nw = graph.nwords;
+  graph.ancestors.assign((std::size_t)n * nw, 0);
+  std::vector<char> state(n, 0);   // 0: not visited, 1: being processed, 2: done
+  std::vector<std::pair<int, int>> stack;   // particle, next parent to look at
+  for (int i = 0; i < n; ++i) {
+    if (state[i] != 0) continue;
+    state[i] = 1;
+    stack.emplace_back(i, graph.parents_begin[i]);
+    while (!stack.empty()) {
+      const int node = stack.back().first;
+      const int next = stack.back().second;
+      if (next < graph.parents_begin[node + 1]) {
+        stack.back().second++;
+        const int parent = graph.parents[next];
+        // a parent being processed means a loop in the record: that link is ignored
+        if (state[parent] == 0) {
+          state[parent] = 1;
+          stack.emplace_back(parent, graph.parents_begin[parent]);
+        }
+        continue;
+      }
+      std::uint64_t *row = graph.ancestors.data() + (std::size_t)node * nw;
+      for (int j = graph.parents_begin[node]; j < graph.parents_begin[node + 1]; ++j) {
+        const int parent = graph.parents[j];
+        if (state[parent] != 2) continue;
+        const std::uint64_t *prow = graph.ancestors.data() + (std::size_t)parent * nw;
+        for (int w = 0; w < nw; ++w) row[w] |= prow[w];
+        row[parent / 64] |= std::uint64_t(1) << (parent % 64);
+      }
+      state[node] = 2;
+      stack.pop_back();
+    }
+  }
+
+  return graph;
+}
+
+
+bool is_descendant(int i, int ancestor, const MCDecayGraph &graph) {
+  if ( i < 0 || i >= graph.n || ancestor < 0 || ancestor >= graph.n ) return false;
+  const std::uint64_t word = graph.ancestors[(std::size_t)i * graph.nwords + ancestor / 64];
+  return (word >> (ancestor % 64)) & 1;
+}
+
+
+int get_first_ancestor(int i, int pdg, const MCDecayGraph &graph, bool chargeConjugate) {
+
+  // ancestors with the requested PDG id, read from the ancestry bitset of the particle
+  if ( i < 0 || i >= graph.n ) return -1;
+  const std::uint64_t *row = graph.ancestors.data() + (std::size_t)i * graph.nwords;
+  std::vector<int> candidates;
+  for (int w = 0; w < graph.nwords; ++w) {
+    if (row[w] == 0) continue;
+    for (int b = 0; b < 64; ++b) {
+      if ( !((row[w] >> b) & 1) ) continue;
+      const int ancestor = 64 * w + b;
+      const int pdg_ancestor = graph.pdg[ancestor];
+      if ( pdg_ancestor == pdg || (chargeConjugate && std::abs(pdg_ancestor) == std::abs(pdg)) ) candidates.push_back(ancestor);
+    }
+  }
+  // the closest one is the candidate none of the others comes from
+  for (auto & candidate : candidates) {
+    bool closest = true;
+    for (auto & other : candidates) {
+      if ( other != candidate && is_descendant(other, candidate, graph) ) {
+        closest = false;
+        break;
+      }
+    }
+    if (closest) return candidate;
+  }
+  return -1;
+}
+
+
+ROOT::VecOps::RVec<int> get_first_ancestors(const ROOT::VecOps::RVec<int> &indices, int pdg, const MCDecayGraph &graph, bool chargeConjugate) {
+  ROOT::VecOps::RVec<int> result;
+  result.reserve(indices.size());
+  for (auto & i : indices) {
+    result.push_back( get_first_ancestor(i, pdg, graph, chargeConjugate) );
+  }
+  return result;
+}
+
+
+std::vector<int> get_list_of_stable_particles_from_decay( int i, const MCDecayGraph &graph) {
+
+  // same order as the recursive version: the daughters are expanded one after the other
+  std::vector<int> res;
+  if ( i < 0 || i >= graph.n ) return res;
+
+  std::vector<int> stack = {i};
+  while (!stack.empty()) {
+    const int node = stack.back();
+    stack.pop_back();
+    const int db = graph.daughters_begin[node];
+    const int de = graph.daughters_begin[node + 1];
+    if ( db == de ) {   // particle is stable
+      res.push_back( node );
+      continue;
+    }
+    for (int j = de - 1; j >= db; --j) {
+      const int idaughter = graph.daughters[j];
+      // protection against loops in the record
+      if ( idaughter == node || is_descendant(node, idaughter, graph) ) continue;
+      stack.push_back( idaughter );
+    }
+  }
+  return res;
+}
+
+
+std::vector<int> get_list_of_particles_from_decay( int i, const MCDecayGraph &graph) {
+  std::vector<int> res;
+  if ( i < 0 || i >= graph.n ) return res;
+  res.assign( graph.daughters.begin() + graph.daughters_begin[i],
+              graph.daughters.begin() + graph.daughters_begin[i + 1] );
+  return res;
+}
+
+
+ROOT::VecOps::RVec<int>  get_indices_MotherByIndex( int imother,
+						    const std::vector<int> &m_pdg_daughters,
+						    bool m_stableDaughters,
+						    bool m_chargeConjugateDaughters,
+						    bool m_inclusiveDecay,
+						    const MCDecayGraph &graph) {
+
+  std::vector<int> products ;
+  if ( m_stableDaughters ) {
+    products = get_list_of_stable_particles_from_decay( imother, graph ) ;
+  }
+  else {
+    products = get_list_of_particles_from_decay( imother, graph ) ;
+  }
+
+  return match_decay_products( imother, products, m_pdg_daughters, m_chargeConjugateDaughters, m_inclusiveDecay,
+                               [&graph](int i) { return graph.pdg[i]; } );
+}
+
+
+int get_lepton_origin(int idx, const MCDecayGraph &graph) {
+
+  if ( idx < 0 || idx >= graph.n ) return -1;
+  int pdg = std::abs( graph.pdg[idx] ) ;
+  if ( pdg != 11 && pdg != 13 && pdg  != 15 ) return -1;
+
+  int result  = 0;
+  for (int j = graph.parents_begin[idx]; j < graph.parents_begin[idx + 1]; ++j) {
+    int index = graph.parents[j];
+    int pdg_parent = graph.pdg[index];
+
+    // W, Z, virtual photon or tau
+    if ( abs( pdg_parent ) == 23 || abs( pdg_parent ) == 24 || abs( pdg_parent ) == 22 || abs( pdg_parent ) == 15 ) {
+      result = pdg_parent ;
+      break;
+    }
+
+    if ( abs( pdg_parent ) == 11 ) {    // beam particle ?
+      bool from_first = graph.parents_begin[index] != graph.parents_begin[index + 1] &&
+                        graph.parents[graph.parents_begin[index]] == 0;
+      if ( graph.genStatus[index] == 4 || from_first ) {
+        result = 0;
+        break;
+      }
+    }
+
+    if ( pdg == 11 && abs( pdg_parent ) == 13 ) {	// mu -> e
+      result  = pdg_parent;
+      break;
+    }
+
+    if ( abs( pdg_parent ) == pdg  ) {
+      return get_lepton_origin( index, graph );
+    }
+    // This must come from a hadron decay
+    result = pdg_parent;
+  }
+  return result;
+}
+
 }//end NS MCParticle
 
 }//end NS FCCAnalyses
@@ -61,26 +61,28 @@ ROOT::VecOps::RVec<edm4hep::TrackState> SmearedTracks::operator()(
 
   edm4hep::TrackState dummy;
 
-  TVectorD zero(5);
-  for (int k = 0; k < 5; k++) {
-    zero(k) = 0.;
-  }
+  // the MC particle associated to each track, found once for all the tracks
+  ROOT::VecOps::RVec<int> track2MC =
+      getTrack2MC_indices(allRecoParticles, ntracks, RP2MC_indices);
+
+  // scale factors from the edm4hep to the Delphes convention (units = m), as
+  // in VertexingUtils::Edm4hep2Delphes_TrackParam
+  double conv = 1e-3;
+  const double scale[5] = {conv, 1., -0.5 / conv, conv, 1.};
+
+  // 5-parameter state and covariance matrix, kept on the stack
+  double mcParam[5];
+  double smearedParam[5];
+  double cov[5][5];
+  double L[5][5];
+  double sigma[5];
+  double r[5];
 
   for (int itrack = 0; itrack < ntracks; itrack++) {
-    edm4hep::TrackState track = alltracks[itrack];
+    const edm4hep::TrackState &track = alltracks[itrack];
     edm4hep::TrackState smeared_track = track;
 
-    // find the corresponding MC particle
-    int MCindex = -1;
-    for (int ireco = 0; ireco < allRecoParticles.size(); ireco++) {
-      edm4hep::ReconstructedParticleData rp = allRecoParticles[ireco];
-      int track_index = rp.tracks_begin;
-      if (track_index == itrack) {
-        MCindex = RP2MC_indices[ireco];
-        break;
-      }
-    } // end loop on RPs
-
+    int MCindex = track2MC[itrack];
     if (MCindex < 0 ||
         MCindex >=
             mcParticles
@@ -90,59 +92,89 @@ ROOT::VecOps::RVec<edm4hep::TrackState> SmearedTracks::operator()(
       continue;
     }
 
-    edm4hep::MCParticleData MCpart = mcParticles[MCindex];
-
     // the MC-truth track parameters, in Delphes's comvention
-    TVectorD mcTrackParam = TrackParamFromMC_DelphesConv(MCpart);
-    // and in edm4hep convention
-    TVectorD mcTrackParam_edm4hep =
-        VertexingUtils::Delphes2Edm4hep_TrackParam(mcTrackParam, false);
-
-    // the covariance matrix of the track, in Delphes's convention
-    TMatrixDSym Cov = VertexingUtils::get_trackCov(track);
-
-    // if the covMat of the track is pathological (numerical precision issue,
-    // fraction of tracks = 5e-6): return original track
-    if (Cov.Determinant() <= 0) {
-      result[itrack] = smeared_track;
-      continue;
+    TVectorD mcTrackParam = TrackParamFromMC_DelphesConv(mcParticles[MCindex]);
+    for (int j = 0; j < 5; j++) {
+      mcParam[j] = mcTrackParam[j];
     }
 
-    // scale the covariance matrix
+    // the covariance matrix of the track, in Delphes's convention, scaled by
+    // the user
     for (int j = 0; j < 5; j++) {
-      for (int k = 0; k < 5; k++) {
-        Cov[j][k] = Cov[j][k] * (m_smear_parameters[j] * m_smear_parameters[k]);
+      for (int k = 0; k <= j; k++) {
+        cov[j][k] = track.covMatrix[j * (j + 1) / 2 + k] * scale[j] * scale[k];
+        cov[j][k] =
+            cov[j][k] * (m_smear_parameters[j] * m_smear_parameters[k]);
+        cov[k][j] = cov[j][k];
       }
     }
-    // if (m_debug) {
-    // Cov.Print();
-    //}
-
-    // generate a new track state (in Delphes's convention)
-    TVectorD smeared_param_delphes =
-        CovSmear(mcTrackParam, Cov, &m_random, m_debug);
 
-    if (smeared_param_delphes == zero) { // Cholesky decomposition failed
+    // Choleski decomposition of the covariance matrix normalised to unit
+    // diagonal (as in CovSmear). If the covMat of the track is pathological
+    // (numerical precision issue, fraction of tracks = 5e-6): return original
+    // track
+    bool posDef = true;
+    for (int j = 0; j < 5 && posDef; j++) {
+      if (cov[j][j] <= 0.) {
+        posDef = false;
+        break;
+      }
+      sigma[j] = std::sqrt(cov[j][j]);
+    }
+    for (int j = 0; j < 5 && posDef; j++) {
+      for (int k = 0; k <= j; k++) {
+        double sum = cov[j][k] / (sigma[j] * sigma[k]);
+        for (int l = 0; l < k; l++) {
+          sum -= L[j][l] * L[k][l];
+        }
+        if (k < j) {
+          L[j][k] = sum / L[k][k];
+        } else if (sum > 0.) {
+          L[j][j] = std::sqrt(sum);
+        } else {
+          posDef = false;
+          break;
+        }
+      }
+    }
+    if (!posDef) {
       result[itrack] = smeared_track;
       continue;
     }
 
-    // back to the edm4hep conventions..
-    TVectorD smeared_param = VertexingUtils::Delphes2Edm4hep_TrackParam(
-        smeared_param_delphes, false);
+    // generate a new track state (in Delphes's convention) and go back to the
+    // edm4hep conventions..
+    for (int j = 0; j < 5; j++) {
+      r[j] = m_random.Gaus(0.0, 1.0); // Array of normal random numbers
+    }
+    if (m_debug) {
+      std::cout << " random nb " << m_random.Gaus(0.0, 1.0) << std::endl;
+    }
+    for (int j = 0; j < 5; j++) {
+      double corr = 0.;
+      for (int k = 0; k <= j; k++) {
+        corr += L[j][k] * r[k];
+      }
+      smearedParam[j] = (mcParam[j] + sigma[j] * corr) / scale[j];
+    }
 
-    smeared_track.D0 = smeared_param[0];
-    smeared_track.phi = smeared_param[1];
-    smeared_track.omega = smeared_param[2];
-    smeared_track.Z0 = smeared_param[3];
-    smeared_track.tanLambda = smeared_param[4];
+    smeared_track.D0 = smearedParam[0];
+    smeared_track.phi = smearedParam[1];
+    smeared_track.omega = smearedParam[2];
+    smeared_track.Z0 = smearedParam[3];
+    smeared_track.tanLambda = smearedParam[4];
 
     // transform rescaled cov matrix from Delphes convention to EDM4hep
     // convention
-    std::array<float, 21> covMatrix_edm4hep =
-        VertexingUtils::Delphes2Edm4hep_TrackCovMatrix(Cov, false);
-
-    smeared_track.covMatrix = covMatrix_edm4hep;
+    for (int j = 0; j < 5; j++) {
+      for (int k = 0; k <= j; k++) {
+        smeared_track.covMatrix[j * (j + 1) / 2 + k] =
+            cov[j][k] / (scale[j] * scale[k]);
+      }
+    }
+    for (int i = 15; i < 21; i++) {
+      smeared_track.covMatrix[i] = 0.;
+    }
 
     if (m_debug) {
       std::cout << std::endl
@@ -153,10 +185,10 @@ ROOT::VecOps::RVec<edm4hep::TrackState> SmearedTracks::operator()(
                 << smeared_track.phi << " " << smeared_track.omega << " "
                 << smeared_track.Z0 << " " << smeared_track.tanLambda
                 << std::endl;
-      std::cout << "MC particle " << mcTrackParam_edm4hep[0] << " "
-                << mcTrackParam_edm4hep[1] << " " << mcTrackParam_edm4hep[2]
-                << " " << mcTrackParam_edm4hep[3] << " "
-                << mcTrackParam_edm4hep[4] << std::endl;
+      std::cout << "MC particle " << mcParam[0] / scale[0] << " "
+                << mcParam[1] / scale[1] << " " << mcParam[2] / scale[2]
+                << " " << mcParam[3] / scale[3] << " "
+                << mcParam[4] / scale[4] << std::endl;
       for (int j = 0; j < 15; j++)
         std::cout << "smeared cov matrix(" << j
                   << "): " << smeared_track.covMatrix[j] << ", scale factor: "
@@ -172,6 +204,32 @@ ROOT::VecOps::RVec<edm4hep::TrackState> SmearedTracks::operator()(
 
 // -------------------------------------------------------------------------------------------
 
+ROOT::VecOps::RVec<int> getTrack2MC_indices(
+    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>
+        &allRecoParticles,
+    int ntracks, const ROOT::VecOps::RVec<int> &RP2MC_indices) {
+
+  // the first reco particle pointing to a track gives its MC particle, as the
+  // linear search over the reco particles did
+  ROOT::VecOps::RVec<int> track2RP(ntracks, -1);
+  for (int ireco = 0; ireco < allRecoParticles.size(); ireco++) {
+    int track_index = allRecoParticles[ireco].tracks_begin;
+    if (track_index < 0 || track_index >= ntracks)
+      continue;
+    if (track2RP[track_index] < 0)
+      track2RP[track_index] = ireco;
+  }
+
+  ROOT::VecOps::RVec<int> result(ntracks, -1);
+  for (int itrack = 0; itrack < ntracks; itrack++) {
+    if (track2RP[itrack] >= 0)
+      result[itrack] = RP2MC_indices[track2RP[itrack]];
+  }
+  return result;
+}
+
+// -------------------------------------------------------------------------------------------
+
 //   to validate the SmearedTracks method.. : retrieve the TrackStates of the MC
 //   particles
 
@@ -187,20 +245,12 @@ ROOT::VecOps::RVec<edm4hep::TrackState> mcTrackParameters(
 
   edm4hep::TrackState dummy;
 
-  for (int itrack = 0; itrack < ntracks; itrack++) {
-    edm4hep::TrackState track = alltracks[itrack];
-
-    // find the corresponding MC particle
-    int MCindex = -1;
-    for (int ireco = 0; ireco < allRecoParticles.size(); ireco++) {
-      edm4hep::ReconstructedParticleData rp = allRecoParticles[ireco];
-      int track_index = rp.tracks_begin;
-      if (track_index == itrack) {
-        MCindex = RP2MC_indices[ireco];
-        break;
-      }
-    } // end loop on RPs
+  // the MC particle associated to each track
+  ROOT::VecOps::RVec<int> track2MC =
+      getTrack2MC_indices(allRecoParticles, ntracks, RP2MC_indices);
 
+  for (int itrack = 0; itrack < ntracks; itrack++) {
+    int MCindex = track2MC[itrack];
     if (MCindex < 0 || MCindex >= mcParticles.size()) {
       result.push_back(dummy);
       continue;
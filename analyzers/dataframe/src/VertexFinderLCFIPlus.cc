@@ -15,12 +15,12 @@ const double m_p  = 0.93827208; // p+- mass [GeV]
 const double m_e  = 0.00051099; // e+- mass [GeV]
 //
 
-ROOT::VecOps::RVec<ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>> get_SV_jets(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recoparticles,
-										      ROOT::VecOps::RVec<edm4hep::TrackState> thetracks,
-										      VertexingUtils::FCCAnalysesVertex PV,
-										      ROOT::VecOps::RVec<bool> isInPrimary,
-										      ROOT::VecOps::RVec<fastjet::PseudoJet> jets,
-										      std::vector<std::vector<int>> jet_consti,
+ROOT::VecOps::RVec<ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>> get_SV_jets(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recoparticles,
+										      const ROOT::VecOps::RVec<edm4hep::TrackState>& thetracks,
+										      const VertexingUtils::FCCAnalysesVertex& PV,
+										      const ROOT::VecOps::RVec<bool>& isInPrimary,
+										      const ROOT::VecOps::RVec<fastjet::PseudoJet>& jets,
+										      const std::vector<std::vector<int>>& jet_consti,
 										      bool V0_rej,
 										      double chi2_cut, double invM_cut, double chi2Tr_cut) {
 
@@ -77,10 +77,10 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>> get_SV
   return result;
 }
 
-ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> get_SV_event(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recoparticles,
-								   ROOT::VecOps::RVec<edm4hep::TrackState> thetracks,
-								   VertexingUtils::FCCAnalysesVertex PV,
-								   ROOT::VecOps::RVec<bool> isInPrimary,
+ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> get_SV_event(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recoparticles,
+								   const ROOT::VecOps::RVec<edm4hep::TrackState>& thetracks,
+								   const VertexingUtils::FCCAnalysesVertex& PV,
+								   const ROOT::VecOps::RVec<bool>& isInPrimary,
 								   bool V0_rej,
 								   double chi2_cut, double invM_cut, double chi2Tr_cut) {
     
@@ -123,9 +123,9 @@ ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> get_SV_event(ROOT::VecOps:
   return result;
 }
 
-ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> get_SV_event(ROOT::VecOps::RVec<edm4hep::TrackState> np_tracks,
-                                                                   ROOT::VecOps::RVec<edm4hep::TrackState> thetracks,
-								   VertexingUtils::FCCAnalysesVertex PV,
+ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> get_SV_event(const ROOT::VecOps::RVec<edm4hep::TrackState>& np_tracks,
+                                                                   const ROOT::VecOps::RVec<edm4hep::TrackState>& thetracks,
+								   const VertexingUtils::FCCAnalysesVertex& PV,
 								   bool V0_rej,
 								   double chi2_cut, double invM_cut, double chi2Tr_cut) {
   
@@ -151,8 +151,8 @@ ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> get_SV_event(ROOT::VecOps:
 
 //** internal functions for SV finder **//
 
-ROOT::VecOps::RVec<int> VertexSeed_best(ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-					VertexingUtils::FCCAnalysesVertex PV,
+ROOT::VecOps::RVec<int> VertexSeed_best(const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+					const VertexingUtils::FCCAnalysesVertex& PV,
 					double chi2_cut, double invM_cut) {
 
   // gives indices of the best pair of tracks
@@ -202,9 +202,82 @@ ROOT::VecOps::RVec<int> VertexSeed_best(ROOT::VecOps::RVec<edm4hep::TrackState>
   return result;
 }
 
-ROOT::VecOps::RVec<int> addTrack_best(ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-				      ROOT::VecOps::RVec<int> vtx_tr,
-				      VertexingUtils::FCCAnalysesVertex PV,
+ROOT::VecOps::RVec<double> VertexSeed_pairs(const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+					   const VertexingUtils::FCCAnalysesVertex& PV,
+					   double chi2_cut, double invM_cut) {
+
+  // fits each pair of tracks once, stores chi2 of the pairs passing the seed constraints
+  // (-1 for the others) so that the seeds can be found again without refitting
+
+  int nTr = tracks.size();
+  ROOT::VecOps::RVec<double> result(nTr*nTr, -1.);
+  if(nTr<2) return result;
+
+  // push empty tracks to make a size=2 vector
+  ROOT::VecOps::RVec<edm4hep::TrackState> tr_pair;
+  edm4hep::TrackState tr_i, tr_j;
+  tr_pair.push_back(tr_i);
+  tr_pair.push_back(tr_j);
+  VertexingUtils::FCCAnalysesVertex vtx_seed;
+
+  for(unsigned int i=0; i<nTr-1; i++) {
+    tr_pair[0] = tracks[i];
+
+    for(unsigned int j=i+1; j<nTr; j++) {
+      tr_pair[1] = tracks[j];
+
+      // V0 rejection (loose)
+      ROOT::VecOps::RVec<bool> isInV0 = isV0(tr_pair, PV, false);
+      if(isInV0[0] && isInV0[1]) continue;
+
+      vtx_seed = VertexFitterSimple::VertexFitter_Tk(2, tr_pair);
+
+      // Constraints check
+      bool pass = check_constraints(vtx_seed, tr_pair, PV, true, chi2_cut, invM_cut);
+      if(!pass) continue;
+
+      result[i*nTr+j] = vtx_seed.vertex.chi2; // normalised but nDOF=1 for nTr=2
+    }
+  }
+
+  return result;
+}
+
+ROOT::VecOps::RVec<int> VertexSeed_best(const ROOT::VecOps::RVec<double>& pair_chi2,
+					int nTr,
+					const ROOT::VecOps::RVec<int>& i_tracks) {
+
+  // gives positions (in i_tracks) of the best pair of the remaining tracks
+  // same selection as VertexSeed_best on the remaining tracks, using cached pair fits
+
+  ROOT::VecOps::RVec<int> result;
+  int isel = 0;
+  int jsel = 1;
+
+  int nRem = i_tracks.size();
+  double chi2_min = 99;
+
+  for(int i=0; i<nRem-1; i++) {
+    for(int j=i+1; j<nRem; j++) {
+      double chi2_seed = pair_chi2[i_tracks[i]*nTr+i_tracks[j]];
+      if(chi2_seed < 0) continue; // pair failed the seed constraints
+      if(chi2_seed < chi2_min) {
+	isel = i; jsel = j;
+	chi2_min = chi2_seed;
+      }
+    }
+  }
+
+  if(chi2_min != 99){
+    result.push_back(isel);
+    result.push_back(jsel);
+  }
+  return result;
+}
+
+ROOT::VecOps::RVec<int> addTrack_best(const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+				      const ROOT::VecOps::RVec<int>& vtx_tr,
+				      const VertexingUtils::FCCAnalysesVertex& PV,
 				      double chi2_cut, double invM_cut, double chi2Tr_cut) {
   // adds index of the best track to the (seed) vtx
   
@@ -254,8 +327,8 @@ ROOT::VecOps::RVec<int> addTrack_best(ROOT::VecOps::RVec<edm4hep::TrackState> tr
   return result;
 }
 
-ROOT::VecOps::RVec<edm4hep::TrackState> V0rejection_tight(ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-							  VertexingUtils::FCCAnalysesVertex PV,
+ROOT::VecOps::RVec<edm4hep::TrackState> V0rejection_tight(const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+							  const VertexingUtils::FCCAnalysesVertex& PV,
 							  bool V0_rej) {
   // perform V0 rejection with tight constraints if user chooses
   ROOT::VecOps::RVec<edm4hep::TrackState> result;
@@ -273,15 +346,23 @@ ROOT::VecOps::RVec<edm4hep::TrackState> V0rejection_tight(ROOT::VecOps::RVec<edm
 
 ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> findSVfromTracks(ROOT::VecOps::RVec<edm4hep::TrackState> tracks_fin,
                                                                        const ROOT::VecOps::RVec<edm4hep::TrackState>&  alltracks,
-								       VertexingUtils::FCCAnalysesVertex PV,
+								       const VertexingUtils::FCCAnalysesVertex& PV,
 								       double chi2_cut, double invM_cut, double chi2Tr_cut) {
 
   // find SVs (only if there are 2 or more tracks)
   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> result;
 
+  // fit all track pairs once; later seeds only skip pairs with already used tracks
+  int nTr = tracks_fin.size();
+  ROOT::VecOps::RVec<double> pair_chi2;
+  if(nTr > 1) pair_chi2 = VertexSeed_pairs(tracks_fin, PV, chi2_cut, invM_cut);
+  // index of each remaining track in the initial tracks_fin
+  ROOT::VecOps::RVec<int> i_fin;
+  for(int i=0; i<nTr; i++) i_fin.push_back(i);
+
   while(tracks_fin.size() > 1) {
     // find vertex seed
-    ROOT::VecOps::RVec<int> vtx_seed = VertexSeed_best(tracks_fin, PV, chi2_cut, invM_cut);
+    ROOT::VecOps::RVec<int> vtx_seed = VertexSeed_best(pair_chi2, nTr, i_fin);
     
     if(debug_me){
       std::cout << "tracks_fin.size(): " << tracks_fin.size() << std::endl;
@@ -312,9 +393,14 @@ ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> findSVfromTracks(ROOT::Vec
     result.push_back(sec_vtx);
     //
     ROOT::VecOps::RVec<edm4hep::TrackState> temp = tracks_fin;
+    ROOT::VecOps::RVec<int> i_temp = i_fin;
     tracks_fin.clear();
+    i_fin.clear();
     for(unsigned int t=0; t<temp.size(); t++) {
-      if(std::find(vtx_fin.begin(), vtx_fin.end(), t) == vtx_fin.end()) tracks_fin.push_back(temp[t]);
+      if(std::find(vtx_fin.begin(), vtx_fin.end(), t) == vtx_fin.end()) {
+	tracks_fin.push_back(temp[t]);
+	i_fin.push_back(i_temp[t]);
+      }
     }    // all this cause don't know how to remove multiple elements at once
 
     if(debug_me) std::cout<<result.size()<<" SV found"<<std::endl;
@@ -324,9 +410,9 @@ ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> findSVfromTracks(ROOT::Vec
   return result;
 }
 
-bool check_constraints(VertexingUtils::FCCAnalysesVertex vtx,
-		       ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-		       VertexingUtils::FCCAnalysesVertex PV,
+bool check_constraints(const VertexingUtils::FCCAnalysesVertex& vtx,
+		       const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+		       const VertexingUtils::FCCAnalysesVertex& PV,
 		       bool seed,
 		       double chi2_cut, double invM_cut, double chi2Tr_cut) {
   // if all constraints pass -> true
@@ -365,8 +451,8 @@ bool check_constraints(VertexingUtils::FCCAnalysesVertex vtx,
   return result;
 }
 
-ROOT::VecOps::RVec<bool> isV0(ROOT::VecOps::RVec<edm4hep::TrackState> np_tracks,
-			      VertexingUtils::FCCAnalysesVertex PV,
+ROOT::VecOps::RVec<bool> isV0(const ROOT::VecOps::RVec<edm4hep::TrackState>& np_tracks,
+			      const VertexingUtils::FCCAnalysesVertex& PV,
 			      bool tight) {
   // V0 rejection
   //
@@ -440,8 +526,8 @@ ROOT::VecOps::RVec<bool> isV0(ROOT::VecOps::RVec<edm4hep::TrackState> np_tracks,
 //** V0 Reconstruction **//
 ///////////////////////////
 
-VertexingUtils::FCCAnalysesV0 get_V0s(ROOT::VecOps::RVec<edm4hep::TrackState> np_tracks,
-				      VertexingUtils::FCCAnalysesVertex PV,
+VertexingUtils::FCCAnalysesV0 get_V0s(const ROOT::VecOps::RVec<edm4hep::TrackState>& np_tracks,
+				      const VertexingUtils::FCCAnalysesVertex& PV,
 				      bool tight,
 				      double chi2_cut) {
   // V0 reconstruction
@@ -537,8 +623,8 @@ VertexingUtils::FCCAnalysesV0 get_V0s(ROOT::VecOps::RVec<edm4hep::TrackState> np
   return result;
 }
 
-VertexingUtils::FCCAnalysesV0 get_V0s(ROOT::VecOps::RVec<edm4hep::TrackState> np_tracks,
-				      VertexingUtils::FCCAnalysesVertex PV,
+VertexingUtils::FCCAnalysesV0 get_V0s(const ROOT::VecOps::RVec<edm4hep::TrackState>& np_tracks,
+				      const VertexingUtils::FCCAnalysesVertex& PV,
 				      double Ks_invM_low, double Ks_invM_high, double Ks_dis, double Ks_cosAng,
 				      double Lambda_invM_low, double Lambda_invM_high, double Lambda_dis, double Lambda_cosAng,
 				      double Gamma_invM_low, double Gamma_invM_high, double Gamma_dis, double Gamma_cosAng,
@@ -635,12 +721,12 @@ VertexingUtils::FCCAnalysesV0 get_V0s(ROOT::VecOps::RVec<edm4hep::TrackState> np
   return result;
 }
 
-VertexingUtils::FCCAnalysesV0 get_V0s_jet(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recoparticles,
-					  ROOT::VecOps::RVec<edm4hep::TrackState> thetracks,
-					  ROOT::VecOps::RVec<bool> isInPrimary,
-					  ROOT::VecOps::RVec<fastjet::PseudoJet> jets,
-					  std::vector<std::vector<int>> jet_consti,
-					  VertexingUtils::FCCAnalysesVertex PV,
+VertexingUtils::FCCAnalysesV0 get_V0s_jet(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recoparticles,
+					  const ROOT::VecOps::RVec<edm4hep::TrackState>& thetracks,
+					  const ROOT::VecOps::RVec<bool>& isInPrimary,
+					  const ROOT::VecOps::RVec<fastjet::PseudoJet>& jets,
+					  const std::vector<std::vector<int>>& jet_consti,
+					  const VertexingUtils::FCCAnalysesVertex& PV,
 					  bool tight,
 					  double chi2_cut) {
   // V0 reconstruction after jet clustering
@@ -780,8 +866,8 @@ VertexingUtils::FCCAnalysesV0 get_V0s_jet(ROOT::VecOps::RVec<edm4hep::Reconstruc
 
 //
 ROOT::VecOps::RVec<double> get_V0candidate(VertexingUtils::FCCAnalysesVertex &V0_vtx,
-					   ROOT::VecOps::RVec<edm4hep::TrackState> tr_pair,
-					   VertexingUtils::FCCAnalysesVertex PV,
+					   const ROOT::VecOps::RVec<edm4hep::TrackState>& tr_pair,
+					   const VertexingUtils::FCCAnalysesVertex& PV,
 					   bool chi2,
 					   double chi2_cut)
 {
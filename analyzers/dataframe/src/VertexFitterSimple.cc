@@ -35,6 +35,36 @@ void resume_stdout(int fd) {
 
 // -----------------------------------------------------------------------------
 
+/// Storage for the track parameters and covariance matrices handed over to
+/// VertexFit. One per thread, i.e. per RDataFrame slot, reused from one fit to
+/// the next so that only the first fits with a given number of tracks allocate.
+struct VertexFitWorkspace {
+  std::vector<TVectorD> par;
+  std::vector<TMatrixDSym> cov;
+  std::vector<TVectorD *> parPtr;
+  std::vector<TMatrixDSym *> covPtr;
+
+  void reserve(int Ntr) {
+    if (par.size() >= Ntr)
+      return;
+    while (par.size() < Ntr) {
+      par.emplace_back(5);
+      cov.emplace_back(5);
+    }
+    // the elements may have moved
+    parPtr.clear();
+    covPtr.clear();
+    for (int i = 0; i < par.size(); i++) {
+      parPtr.push_back(&par[i]);
+      covPtr.push_back(&cov[i]);
+    }
+  }
+};
+
+static thread_local VertexFitWorkspace fitWorkspace;
+
+// -----------------------------------------------------------------------------
+
 VertexingUtils::FCCAnalysesVertex VertexFitter(
     int Primary,
     ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recoparticles,
@@ -122,10 +152,10 @@ VertexFitter_Tk(int Primary, ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
   // of the tracks that are used to fit this vertex
   if (alltracks.size() > 0) {
     for (int i = 0; i < tracks.size(); i++) { // the fitted tracks
-      edm4hep::TrackState tr1 = tracks[i];
+      const edm4hep::TrackState &tr1 = tracks[i];
       for (int j = 0; j < alltracks.size();
            j++) { // the collection of all tracks
-        edm4hep::TrackState tr2 = alltracks[j];
+        const edm4hep::TrackState &tr2 = alltracks[j];
         if (VertexingUtils::compare_Tracks(tr1, tr2)) {
           reco_ind.push_back(j);
           break;
@@ -148,17 +178,31 @@ VertexFitter_Tk(int Primary, ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
     return TheVertex; // can not reconstruct a vertex with only one track...
   }
 
-  TVectorD **trkPar = new TVectorD *[Ntr];
-  TMatrixDSym **trkCov = new TMatrixDSym *[Ntr];
-
   bool Units_mm = true;
 
+  // track parameters and covariance matrices in the Delphes convention, as
+  // given by VertexingUtils::get_trackParam and get_trackCov, written in place
+  // into the reusable workspace (VertexFit keeps its own copies)
+  const double scale[5] = {1., 1., -0.5, 1., 1.};
+  fitWorkspace.reserve(Ntr);
+  TVectorD **trkPar = fitWorkspace.parPtr.data();
+  TMatrixDSym **trkCov = fitWorkspace.covPtr.data();
+
   for (Int_t i = 0; i < Ntr; i++) {
-    edm4hep::TrackState t = tracks[i];
-    TVectorD par = VertexingUtils::get_trackParam(t, Units_mm);
-    trkPar[i] = new TVectorD(par);
-    TMatrixDSym Cov = VertexingUtils::get_trackCov(t, Units_mm);
-    trkCov[i] = new TMatrixDSym(Cov);
+    const edm4hep::TrackState &t = tracks[i];
+    TVectorD &par = *trkPar[i];
+    par[0] = t.D0 * scale[0];
+    par[1] = t.phi * scale[1];
+    par[2] = t.omega * scale[2];
+    par[3] = t.Z0 * scale[3];
+    par[4] = t.tanLambda * scale[4];
+    TMatrixDSym &Cov = *trkCov[i];
+    for (int j = 0; j < 5; j++) {
+      for (int k = 0; k <= j; k++) {
+        Cov[j][k] = t.covMatrix[j * (j + 1) / 2 + k] * scale[j] * scale[k];
+        Cov[k][j] = Cov[j][k];
+      }
+    }
   }
 
   VertexFit theVertexFit(Ntr, trkPar, trkCov);
@@ -234,14 +278,6 @@ VertexFitter_Tk(int Primary, ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
   TheVertex.final_track_phases = final_track_phases;
   TheVertex.reco_chi2 = reco_chi2;
 
-  // memory cleanup
-  for (Int_t i = 0; i < Ntr; i++) {
-    delete trkPar[i];
-    delete trkCov[i];
-  }
-  delete[] trkPar;
-  delete[] trkCov;
-
   resume_stdout(fd);
 
   return TheVertex;
@@ -28,8 +28,8 @@ selTracks::selTracks(float arg_d0sig_min, float arg_d0sig_max,
     : m_d0sig_min(arg_d0sig_min), m_d0sig_max(arg_d0sig_max),
       m_z0sig_min(arg_z0sig_min), m_z0sig_max(arg_z0sig_max){};
 ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> selTracks::operator()(
-    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-    ROOT::VecOps::RVec<edm4hep::TrackState> tracks) {
+    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> &recop,
+    const ROOT::VecOps::RVec<edm4hep::TrackState> &tracks) {
 
   ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> result;
   result.reserve(recop.size());
@@ -56,11 +56,11 @@ ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> selTracks::operator()(
 // Selection of primary particles based on the matching of RecoParticles
 // to MC particles
 //
-ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>
-SelPrimaryTracks(ROOT::VecOps::RVec<int> recind, ROOT::VecOps::RVec<int> mcind,
-                 ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> reco,
-                 ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-                 TVector3 MC_EventPrimaryVertex) {
+ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> SelPrimaryTracks(
+    const ROOT::VecOps::RVec<int> &recind, const ROOT::VecOps::RVec<int> &mcind,
+    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> &reco,
+    const ROOT::VecOps::RVec<edm4hep::MCParticleData> &mc,
+    TVector3 MC_EventPrimaryVertex) {
 
   ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> result;
   result.reserve(reco.size());
@@ -85,7 +85,7 @@ SelPrimaryTracks(ROOT::VecOps::RVec<int> recind, ROOT::VecOps::RVec<int> mcind,
   return result;
 }
 
-int get_nTracks(ROOT::VecOps::RVec<edm4hep::TrackState> tracks) {
+int get_nTracks(const ROOT::VecOps::RVec<edm4hep::TrackState> &tracks) {
   int nt = tracks.size();
   return nt;
 }
@@ -253,7 +253,7 @@ std::array<float, 21> Delphes2Edm4hep_TrackCovMatrix(const TMatrixDSym &cov,
   return covMatrix;
 }
 
-TVectorD get_trackParam(edm4hep::TrackState &atrack, bool Units_mm) {
+TVectorD get_trackParam(const edm4hep::TrackState &atrack, bool Units_mm) {
   double d0 = atrack.D0;
   double phi0 = atrack.phi;
   double omega = atrack.omega;
@@ -270,7 +270,7 @@ TVectorD get_trackParam(edm4hep::TrackState &atrack, bool Units_mm) {
   return res;
 }
 
-TMatrixDSym get_trackCov(edm4hep::TrackState &atrack, bool Units_mm) {
+TMatrixDSym get_trackCov(const edm4hep::TrackState &atrack, bool Units_mm) {
   auto covMatrix = atrack.covMatrix;
 
   TMatrixDSym covM = Edm4hep2Delphes_TrackCovMatrix(covMatrix, Units_mm);
@@ -280,7 +280,7 @@ TMatrixDSym get_trackCov(edm4hep::TrackState &atrack, bool Units_mm) {
 
 // ----------------------------------------------------------------------------------------
 
-float get_trackMom(edm4hep::TrackState &atrack) {
+float get_trackMom(const edm4hep::TrackState &atrack) {
   double fB = 2; // 2 Tesla
 
   float C = -0.5 * 1e3 * atrack.omega;
@@ -293,25 +293,24 @@ float get_trackMom(edm4hep::TrackState &atrack) {
   return result;
 }
 
-FCCAnalysesVertex
-get_FCCAnalysesVertex(ROOT::VecOps::RVec<FCCAnalysesVertex> TheVertexColl,
-                      int index) {
+FCCAnalysesVertex get_FCCAnalysesVertex(
+    const ROOT::VecOps::RVec<FCCAnalysesVertex> &TheVertexColl, int index) {
   FCCAnalysesVertex result;
   if (index < TheVertexColl.size())
     result = TheVertexColl.at(index);
   return result;
 }
 
-int get_Nvertex(ROOT::VecOps::RVec<FCCAnalysesVertex> TheVertexColl) {
+int get_Nvertex(const ROOT::VecOps::RVec<FCCAnalysesVertex> &TheVertexColl) {
   return TheVertexColl.size();
 }
 
-edm4hep::VertexData get_VertexData(FCCAnalysesVertex TheVertex) {
+edm4hep::VertexData get_VertexData(const FCCAnalysesVertex &TheVertex) {
   return TheVertex.vertex;
 }
 
 ROOT::VecOps::RVec<edm4hep::VertexData>
-get_VertexData(ROOT::VecOps::RVec<FCCAnalysesVertex> TheVertexColl) {
+get_VertexData(const ROOT::VecOps::RVec<FCCAnalysesVertex> &TheVertexColl) {
   ROOT::VecOps::RVec<edm4hep::VertexData> result;
   for (unsigned int i = 0; i < TheVertexColl.size(); i++) {
     result.push_back(TheVertexColl.at(i).vertex);
@@ -320,17 +319,20 @@ get_VertexData(ROOT::VecOps::RVec<FCCAnalysesVertex> TheVertexColl) {
 }
 
 edm4hep::VertexData
-get_VertexData(ROOT::VecOps::RVec<FCCAnalysesVertex> TheVertexColl, int index) {
+get_VertexData(const ROOT::VecOps::RVec<FCCAnalysesVertex> &TheVertexColl,
+               int index) {
   edm4hep::VertexData result;
   if (index < TheVertexColl.size())
     result = TheVertexColl.at(index).vertex;
   return result;
 }
 
-int get_VertexNtrk(FCCAnalysesVertex TheVertex) { return TheVertex.ntracks; }
+int get_VertexNtrk(const FCCAnalysesVertex &TheVertex) {
+  return TheVertex.ntracks;
+}
 
 ROOT::VecOps::RVec<int>
-get_VertexNtrk(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
+get_VertexNtrk(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices) {
   ROOT::VecOps::RVec<int> result;
   for (auto &TheVertex : vertices) {
     result.push_back(TheVertex.ntracks);
@@ -338,12 +340,12 @@ get_VertexNtrk(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
   return result;
 }
 
-ROOT::VecOps::RVec<int> get_VertexRecoInd(FCCAnalysesVertex TheVertex) {
+ROOT::VecOps::RVec<int> get_VertexRecoInd(const FCCAnalysesVertex &TheVertex) {
   return TheVertex.reco_ind;
 }
 
 ROOT::VecOps::RVec<int> get_VertexRecoParticlesInd(
-    FCCAnalysesVertex TheVertex,
+    const FCCAnalysesVertex &TheVertex,
     const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> &reco) {
 
   ROOT::VecOps::RVec<int> result;
@@ -363,6 +365,168 @@ ROOT::VecOps::RVec<int> get_VertexRecoParticlesInd(
   return result;
 }
 
+FCCAnalysesVertexColl
+get_VertexColl(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices) {
+  FCCAnalysesVertexColl coll;
+  const std::size_t nv = vertices.size();
+  std::size_t ntr = 0;
+  for (auto &TheVertex : vertices)
+    ntr += TheVertex.reco_ind.size();
+
+  coll.primary.reserve(nv);
+  coll.ntracks.reserve(nv);
+  coll.mc_ind.reserve(nv);
+  coll.x.reserve(nv);
+  coll.y.reserve(nv);
+  coll.z.reserve(nv);
+  coll.chi2.reserve(nv);
+  coll.covMatrix.reserve(6 * nv);
+  coll.tracks_begin.reserve(nv);
+  coll.tracks_end.reserve(nv);
+  coll.reco_ind.reserve(ntr);
+  coll.reco_chi2.reserve(ntr);
+  coll.final_track_phases.reserve(ntr);
+  coll.track_px.reserve(ntr);
+  coll.track_py.reserve(ntr);
+  coll.track_pz.reserve(ntr);
+
+  for (auto &TheVertex : vertices) {
+    coll.primary.push_back(TheVertex.vertex.primary);
+    coll.ntracks.push_back(TheVertex.ntracks);
+    coll.mc_ind.push_back(TheVertex.mc_ind);
+    coll.x.push_back(TheVertex.vertex.position.x);
+    coll.y.push_back(TheVertex.vertex.position.y);
+    coll.z.push_back(TheVertex.vertex.position.z);
+    coll.chi2.push_back(TheVertex.vertex.chi2);
+    for (int i = 0; i < 6; i++)
+      coll.covMatrix.push_back(TheVertex.vertex.covMatrix[i]);
+
+    coll.tracks_begin.push_back(coll.reco_ind.size());
+    for (unsigned int i = 0; i < TheVertex.reco_ind.size(); i++) {
+      coll.reco_ind.push_back(TheVertex.reco_ind[i]);
+      // the fitter fills these for each track, the MC vertex objects do not
+      coll.reco_chi2.push_back(
+          i < TheVertex.reco_chi2.size() ? TheVertex.reco_chi2[i] : -1.);
+      coll.final_track_phases.push_back(i < TheVertex.final_track_phases.size()
+                                            ? TheVertex.final_track_phases[i]
+                                            : 0.);
+      if (i < TheVertex.updated_track_momentum_at_vertex.size()) {
+        const TVector3 &p = TheVertex.updated_track_momentum_at_vertex[i];
+        coll.track_px.push_back(p.X());
+        coll.track_py.push_back(p.Y());
+        coll.track_pz.push_back(p.Z());
+      } else {
+        coll.track_px.push_back(0.);
+        coll.track_py.push_back(0.);
+        coll.track_pz.push_back(0.);
+      }
+    }
+    coll.tracks_end.push_back(coll.reco_ind.size());
+  }
+  return coll;
+}
+
+int get_VertexColl_n(const FCCAnalysesVertexColl &coll) {
+  return coll.x.size();
+}
+
+// non-owning RVec adopting the memory of a column of the collection
+template <typename T>
+static ROOT::VecOps::RVec<T> view(const ROOT::VecOps::RVec<T> &column,
+                                  std::size_t begin, std::size_t end) {
+  return ROOT::VecOps::RVec<T>(const_cast<T *>(column.data()) + begin,
+                               end - begin);
+}
+
+template <typename T>
+static ROOT::VecOps::RVec<T> view(const ROOT::VecOps::RVec<T> &column) {
+  return view(column, 0, column.size());
+}
+
+ROOT::VecOps::RVec<float> get_VertexColl_x(const FCCAnalysesVertexColl &coll) {
+  return view(coll.x);
+}
+
+ROOT::VecOps::RVec<float> get_VertexColl_y(const FCCAnalysesVertexColl &coll) {
+  return view(coll.y);
+}
+
+ROOT::VecOps::RVec<float> get_VertexColl_z(const FCCAnalysesVertexColl &coll) {
+  return view(coll.z);
+}
+
+ROOT::VecOps::RVec<float>
+get_VertexColl_chi2(const FCCAnalysesVertexColl &coll) {
+  return view(coll.chi2);
+}
+
+ROOT::VecOps::RVec<int> get_VertexColl_isPV(const FCCAnalysesVertexColl &coll) {
+  return view(coll.primary);
+}
+
+ROOT::VecOps::RVec<int>
+get_VertexColl_ntracks(const FCCAnalysesVertexColl &coll) {
+  return view(coll.ntracks);
+}
+
+ROOT::VecOps::RVec<int>
+get_VertexColl_indMC(const FCCAnalysesVertexColl &coll) {
+  return view(coll.mc_ind);
+}
+
+ROOT::VecOps::RVec<int>
+get_VertexColl_recoInd(const FCCAnalysesVertexColl &coll, int index) {
+  if (index < 0 || index >= (int)coll.tracks_begin.size())
+    return ROOT::VecOps::RVec<int>();
+  return view(coll.reco_ind, coll.tracks_begin[index], coll.tracks_end[index]);
+}
+
+ROOT::VecOps::RVec<float>
+get_VertexColl_posErr(const FCCAnalysesVertexColl &coll, int comp) {
+  // diagonal elements of the lower-triangle covariance matrix
+  const int diag[3] = {0, 2, 5};
+  const std::size_t nv = coll.x.size();
+  ROOT::VecOps::RVec<float> result(nv);
+  if (comp < 0 || comp > 2)
+    return result;
+  for (std::size_t i = 0; i < nv; i++)
+    result[i] = std::sqrt(coll.covMatrix[6 * i + diag[comp]]);
+  return result;
+}
+
+ROOT::VecOps::RVec<float> get_VertexColl_d2PV(const FCCAnalysesVertexColl &coll,
+                                              int comp) {
+  const std::size_t nv = coll.x.size();
+  // same convention as myUtils::get_Vertex_d2PV: last primary vertex found,
+  // origin if there is none
+  float pv_x = 0., pv_y = 0., pv_z = 0.;
+  for (std::size_t i = 0; i < nv; i++) {
+    if (coll.primary[i] > 0) {
+      pv_x = coll.x[i];
+      pv_y = coll.y[i];
+      pv_z = coll.z[i];
+    }
+  }
+
+  ROOT::VecOps::RVec<float> result(nv);
+  for (std::size_t i = 0; i < nv; i++) {
+    const float dx = pv_x - coll.x[i];
+    const float dy = pv_y - coll.y[i];
+    const float dz = pv_z - coll.z[i];
+    if (coll.primary[i] > 0)
+      result[i] = 0.;
+    else if (comp == 0)
+      result[i] = dx;
+    else if (comp == 1)
+      result[i] = dy;
+    else if (comp == 2)
+      result[i] = dz;
+    else
+      result[i] = std::sqrt(dx * dx + dy * dy + dz * dz);
+  }
+  return result;
+}
+
 TVectorD ParToACTS(TVectorD Par) {
 
   TVectorD pACTS(6); // Return vector
@@ -414,8 +578,8 @@ TMatrixDSym CovToACTS(TMatrixDSym Cov, TVectorD Par) {
 
 // get all reconstructed vertices in a single vector
 ROOT::VecOps::RVec<FCCAnalysesVertex>
-get_all_vertices(FCCAnalysesVertex PV,
-                 ROOT::VecOps::RVec<FCCAnalysesVertex> SV) {
+get_all_vertices(const FCCAnalysesVertex &PV,
+                 const ROOT::VecOps::RVec<FCCAnalysesVertex> &SV) {
   // Returns a vector of all vertices (PV and SVs)
   ROOT::VecOps::RVec<FCCAnalysesVertex> result;
   result.push_back(PV);
@@ -425,9 +589,9 @@ get_all_vertices(FCCAnalysesVertex PV,
   return result;
 }
 //
-ROOT::VecOps::RVec<FCCAnalysesVertex>
-get_all_vertices(FCCAnalysesVertex PV,
-                 ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> SV) {
+ROOT::VecOps::RVec<FCCAnalysesVertex> get_all_vertices(
+    const FCCAnalysesVertex &PV,
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &SV) {
   // Returns a vector of all vertices (PV and SVs)
   ROOT::VecOps::RVec<FCCAnalysesVertex> result;
   result.push_back(PV);
@@ -441,7 +605,7 @@ get_all_vertices(FCCAnalysesVertex PV,
 //
 // get all SVs in a single vector
 ROOT::VecOps::RVec<FCCAnalysesVertex> get_all_SVs(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
   // Returns a vector of all SVs
   ROOT::VecOps::RVec<FCCAnalysesVertex> result;
   for (auto i_SV : vertices) {
@@ -455,7 +619,7 @@ ROOT::VecOps::RVec<FCCAnalysesVertex> get_all_SVs(
 // internal fns for SV finder
 
 // invariant mass of a two track vertex
-double get_invM_pairs(FCCAnalysesVertex vertex, double m1, double m2) {
+double get_invM_pairs(const FCCAnalysesVertex &vertex, double m1, double m2) {
   // CAUTION: m1 -> first track; m2 -> second track
 
   double result;
@@ -478,7 +642,7 @@ double get_invM_pairs(FCCAnalysesVertex vertex, double m1, double m2) {
 }
 
 ROOT::VecOps::RVec<double>
-get_invM_pairs(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices, double m1,
+get_invM_pairs(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices, double m1,
                double m2) {
   // CAUTION: m1 -> first track; m2 -> second track
 
@@ -506,7 +670,7 @@ get_invM_pairs(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices, double m1,
 }
 
 // invariant mass of a vertex (assuming all tracks to be pions)
-double get_invM(FCCAnalysesVertex vertex) {
+double get_invM(const FCCAnalysesVertex &vertex) {
 
   double result;
 
@@ -527,7 +691,7 @@ double get_invM(FCCAnalysesVertex vertex) {
 }
 
 ROOT::VecOps::RVec<double>
-get_invM(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
+get_invM(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices) {
 
   ROOT::VecOps::RVec<double> result;
   for (auto &vertex : vertices) {
@@ -553,7 +717,8 @@ get_invM(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
 
 // cos(angle) b/n V0 candidate's (or any vtx) momentum & PV to V0 displacement
 // vector
-double get_PV2V0angle(FCCAnalysesVertex V0, FCCAnalysesVertex PV) {
+double get_PV2V0angle(const FCCAnalysesVertex &V0,
+                      const FCCAnalysesVertex &PV) {
   double result;
 
   ROOT::VecOps::RVec<TVector3> p_tracks = V0.updated_track_momentum_at_vertex;
@@ -576,8 +741,9 @@ double get_PV2V0angle(FCCAnalysesVertex V0, FCCAnalysesVertex PV) {
 }
 
 // cos(angle) b/n track momentum sum & PV to vtx displacement vector
-double get_PV2vtx_angle(ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-                        FCCAnalysesVertex vtx, FCCAnalysesVertex PV) {
+double get_PV2vtx_angle(const ROOT::VecOps::RVec<edm4hep::TrackState> &tracks,
+                        const FCCAnalysesVertex &vtx,
+                        const FCCAnalysesVertex &PV) {
   double result;
 
   TVector3 p_sum;
@@ -619,13 +785,13 @@ double get_trackE(edm4hep::TrackState track) {
 ////////////////////////////////////////////////
 
 // no of reconstructed V0s
-int get_n_SV(FCCAnalysesV0 SV) {
+int get_n_SV(const FCCAnalysesV0 &SV) {
   int result = SV.vtx.size();
   return result;
 }
 
 // vector of position of all reconstructed V0 (in mm)
-ROOT::VecOps::RVec<TVector3> get_position_SV(FCCAnalysesV0 SV) {
+ROOT::VecOps::RVec<TVector3> get_position_SV(const FCCAnalysesV0 &SV) {
   ROOT::VecOps::RVec<TVector3> result;
   for (FCCAnalysesVertex ivtx : SV.vtx) {
     TVector3 xyz(ivtx.vertex.position[0], ivtx.vertex.position[1],
@@ -636,20 +802,20 @@ ROOT::VecOps::RVec<TVector3> get_position_SV(FCCAnalysesV0 SV) {
 }
 
 // vector of PDG IDs of all reconstructed V0
-ROOT::VecOps::RVec<int> get_pdg_V0(FCCAnalysesV0 V0) {
+ROOT::VecOps::RVec<int> get_pdg_V0(const FCCAnalysesV0 &V0) {
   ROOT::VecOps::RVec<int> result = V0.pdgAbs;
   return result;
 }
 
 // vector of invariant masses of all reconstructed V0
-ROOT::VecOps::RVec<double> get_invM_V0(FCCAnalysesV0 V0) {
+ROOT::VecOps::RVec<double> get_invM_V0(const FCCAnalysesV0 &V0) {
   ROOT::VecOps::RVec<double> result = V0.invM;
   return result;
 }
 
 //
 // vector of momenta of all reconstructed V0
-ROOT::VecOps::RVec<TVector3> get_p_SV(FCCAnalysesV0 SV) {
+ROOT::VecOps::RVec<TVector3> get_p_SV(const FCCAnalysesV0 &SV) {
   ROOT::VecOps::RVec<TVector3> result;
 
   for (FCCAnalysesVertex ivtx : SV.vtx) {
@@ -666,7 +832,7 @@ ROOT::VecOps::RVec<TVector3> get_p_SV(FCCAnalysesV0 SV) {
 }
 
 // vector of chi2 of all reconstructed V0s
-ROOT::VecOps::RVec<double> get_chi2_SV(FCCAnalysesV0 SV) {
+ROOT::VecOps::RVec<double> get_chi2_SV(const FCCAnalysesV0 &SV) {
   ROOT::VecOps::RVec<double> result;
 
   for (FCCAnalysesVertex ivtx : SV.vtx) {
@@ -679,14 +845,14 @@ ROOT::VecOps::RVec<double> get_chi2_SV(FCCAnalysesV0 SV) {
 // passing a vector of FCCAnalysesVertex instead of new structs
 
 // no of reconstructed SVs
-int get_n_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
+int get_n_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices) {
   int result = vertices.size();
   return result;
 }
 
 // vector of momenta of all reconstructed vertices (SV.vtx or V0.vtx)
 ROOT::VecOps::RVec<TVector3>
-get_p_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
+get_p_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices) {
   ROOT::VecOps::RVec<TVector3> result;
 
   for (auto &ivtx : vertices) {
@@ -704,7 +870,7 @@ get_p_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
 
 // vector of position of all reconstructed SV (in mm)
 ROOT::VecOps::RVec<TVector3>
-get_position_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
+get_position_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices) {
   ROOT::VecOps::RVec<TVector3> result;
   for (FCCAnalysesVertex ivtx : vertices) {
     TVector3 xyz(ivtx.vertex.position[0], ivtx.vertex.position[1],
@@ -716,7 +882,7 @@ get_position_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
 
 // vector of momentum magnitude of all reconstructed vertices (SV.vtx or V0.vtx)
 ROOT::VecOps::RVec<double>
-get_pMag_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
+get_pMag_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices) {
   ROOT::VecOps::RVec<double> result;
 
   for (auto &ivtx : vertices) {
@@ -734,7 +900,7 @@ get_pMag_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
 
 // vector of chi2 of all reconstructed vertices (SV.vtx or V0.vtx)
 ROOT::VecOps::RVec<double>
-get_chi2_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
+get_chi2_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices) {
   ROOT::VecOps::RVec<double> result;
 
   for (auto &ivtx : vertices) {
@@ -746,7 +912,7 @@ get_chi2_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
 
 // vector of chi2 (normalised) of all reconstructed vertices (SV.vtx or V0.vtx)
 ROOT::VecOps::RVec<double>
-get_norm_chi2_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
+get_norm_chi2_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices) {
   ROOT::VecOps::RVec<double> result;
 
   for (auto &ivtx : vertices)
@@ -756,7 +922,7 @@ get_norm_chi2_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
 
 // vector of nDOF of all reconstructed vertices (SV.vtx or V0.vtx)
 ROOT::VecOps::RVec<int>
-get_nDOF_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
+get_nDOF_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices) {
   ROOT::VecOps::RVec<int> result;
 
   for (auto &ivtx : vertices)
@@ -767,7 +933,7 @@ get_nDOF_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
 // vector of polar angle (theta) of all reconstructed vertices (SV.vtx or
 // V0.vtx)
 ROOT::VecOps::RVec<double>
-get_theta_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
+get_theta_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices) {
   ROOT::VecOps::RVec<double> result;
 
   for (auto &ivtx : vertices) {
@@ -781,7 +947,7 @@ get_theta_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
 // vector of azimuth angle (phi) of all reconstructed vertices (SV.vtx or
 // V0.vtx)
 ROOT::VecOps::RVec<double>
-get_phi_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
+get_phi_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices) {
   ROOT::VecOps::RVec<double> result;
 
   for (auto &ivtx : vertices) {
@@ -794,8 +960,8 @@ get_phi_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices) {
 
 // vector of (cos of) angles b/n vtx momenta & PV to vtx displacement vectors
 ROOT::VecOps::RVec<double>
-get_pointingangle_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
-                     FCCAnalysesVertex PV) {
+get_pointingangle_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices,
+                     const FCCAnalysesVertex &PV) {
   ROOT::VecOps::RVec<double> result;
 
   for (auto &ivtx : vertices) {
@@ -825,8 +991,8 @@ get_pointingangle_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
 
 // vector of distances of all reconstructed SV from PV (in mm in xy plane)
 ROOT::VecOps::RVec<double>
-get_dxy_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
-           FCCAnalysesVertex PV) {
+get_dxy_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices,
+           const FCCAnalysesVertex &PV) {
   ROOT::VecOps::RVec<double> result;
   TVector3 x_PV(PV.vertex.position[0], PV.vertex.position[1],
                 PV.vertex.position[2]);
@@ -842,8 +1008,8 @@ get_dxy_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
 
 // vector of distances of all reconstructed SV from PV (in mm in 3D)
 ROOT::VecOps::RVec<double>
-get_d3d_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
-           FCCAnalysesVertex PV) {
+get_d3d_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices,
+           const FCCAnalysesVertex &PV) {
   ROOT::VecOps::RVec<double> result;
   TVector3 x_PV(PV.vertex.position[0], PV.vertex.position[1],
                 PV.vertex.position[2]);
@@ -860,7 +1026,7 @@ get_d3d_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
 // vector of distances of all reconstructed SV from given TVector3d (in mm in
 // 3D)
 ROOT::VecOps::RVec<double>
-get_d3d_SV_obj(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
+get_d3d_SV_obj(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices,
                TVector3 object) {
   ROOT::VecOps::RVec<double> result;
   for (auto &ivtx : vertices) {
@@ -876,7 +1042,7 @@ get_d3d_SV_obj(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
 // vector of distances of all reconstructed SV from given edm4hep::Vector3d (in
 // mm in 3D)
 ROOT::VecOps::RVec<double>
-get_d3d_SV_obj(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
+get_d3d_SV_obj(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices,
                edm4hep::Vector3d object) {
   ROOT::VecOps::RVec<double> result;
   for (auto &ivtx : vertices) {
@@ -894,7 +1060,8 @@ get_d3d_SV_obj(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
 // vector of decay position distances of all reconstructed SV from given
 // TVector3d (in mm in 3D)
 ROOT::VecOps::RVec<double>
-get_dR_SV_obj(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices, TVector3 object) {
+get_dR_SV_obj(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices,
+              TVector3 object) {
   ROOT::VecOps::RVec<double> result;
   for (auto &ivtx : vertices) {
     TVector3 x_vtx(ivtx.vertex.position[0], ivtx.vertex.position[1],
@@ -911,7 +1078,7 @@ get_dR_SV_obj(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices, TVector3 object) {
 // vector of decay position distances of all reconstructed SV from given
 // edm4hep::Vector3d (in mm in 3D)
 ROOT::VecOps::RVec<double>
-get_dR_SV_obj(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
+get_dR_SV_obj(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices,
               edm4hep::Vector3d object) {
   ROOT::VecOps::RVec<double> result;
   for (auto &ivtx : vertices) {
@@ -927,9 +1094,9 @@ get_dR_SV_obj(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
 // vector of polar angle (theta) of all reconstructed vertices wrt jet axis
 // (SV.vtx or V0.vtx)
 ROOT::VecOps::RVec<double>
-get_relTheta_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
-                ROOT::VecOps::RVec<int> nSV_jet,
-                ROOT::VecOps::RVec<fastjet::PseudoJet> jets) {
+get_relTheta_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices,
+                const ROOT::VecOps::RVec<int> &nSV_jet,
+                const ROOT::VecOps::RVec<fastjet::PseudoJet> &jets) {
   ROOT::VecOps::RVec<double> result;
 
   unsigned int j = 0;
@@ -954,9 +1121,9 @@ get_relTheta_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
 // vector of azimuthal angle (phi) of all reconstructed vertices wrt jet axis
 // (SV.vtx or V0.vtx)
 ROOT::VecOps::RVec<double>
-get_relPhi_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
-              ROOT::VecOps::RVec<int> nSV_jet,
-              ROOT::VecOps::RVec<fastjet::PseudoJet> jets) {
+get_relPhi_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices,
+              const ROOT::VecOps::RVec<int> &nSV_jet,
+              const ROOT::VecOps::RVec<fastjet::PseudoJet> &jets) {
   ROOT::VecOps::RVec<double> result;
 
   unsigned int j = 0;
@@ -982,7 +1149,7 @@ get_relPhi_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
 
 // no of reconstructed SVs
 int get_n_SV(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
   int result = 0;
   if (vertices.size() != 0) {
     for (auto SV_jets : vertices)
@@ -993,7 +1160,7 @@ int get_n_SV(
 
 // Return the number of reconstructed SVs
 ROOT::VecOps::RVec<int> get_n_SV_jets(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
   ROOT::VecOps::RVec<int> result;
   if (vertices.size() != 0) {
     for (auto SV_jets : vertices)
@@ -1005,8 +1172,8 @@ ROOT::VecOps::RVec<int> get_n_SV_jets(
 //
 // separate V0s by jets
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>>
-get_svInJets(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
-             ROOT::VecOps::RVec<int> nSV_jet) {
+get_svInJets(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices,
+             const ROOT::VecOps::RVec<int> &nSV_jet) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> result;
   ROOT::VecOps::RVec<FCCAnalysesVertex> i_result;
 
@@ -1025,10 +1192,10 @@ get_svInJets(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
 
 // separate tracks by jet
 std::vector<std::vector<edm4hep::TrackState>> get_tracksInJets(
-    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recoparticles,
-    ROOT::VecOps::RVec<edm4hep::TrackState> thetracks,
-    ROOT::VecOps::RVec<fastjet::PseudoJet> jets,
-    std::vector<std::vector<int>> jet_consti) {
+    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> &recoparticles,
+    const ROOT::VecOps::RVec<edm4hep::TrackState> &thetracks,
+    const ROOT::VecOps::RVec<fastjet::PseudoJet> &jets,
+    const std::vector<std::vector<int>> &jet_consti) {
   std::vector<std::vector<edm4hep::TrackState>> result;
   std::vector<edm4hep::TrackState> iJet_tracks;
 
@@ -1053,7 +1220,7 @@ std::vector<std::vector<edm4hep::TrackState>> get_tracksInJets(
 // vector of polar angle (theta) of reconstructed vertices of a jet wrt that jet
 // axis [only for vertices from 1 jet]
 ROOT::VecOps::RVec<double>
-get_relTheta_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
+get_relTheta_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices,
                 fastjet::PseudoJet jet) {
   ROOT::VecOps::RVec<double> result;
 
@@ -1070,7 +1237,7 @@ get_relTheta_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
 // vector of azimuthal angle (phi) of all reconstructed vertices wrt jet axis
 // [only for vertices from 1 jet]
 ROOT::VecOps::RVec<double>
-get_relPhi_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
+get_relPhi_SV(const ROOT::VecOps::RVec<FCCAnalysesVertex> &vertices,
               fastjet::PseudoJet jet) {
   ROOT::VecOps::RVec<double> result;
 
@@ -1088,8 +1255,8 @@ get_relPhi_SV(ROOT::VecOps::RVec<FCCAnalysesVertex> vertices,
 /////// vec of vec functions (for get_SV_jets) /////////
 
 // SV invariant mass
-ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>>
-get_invM(ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_invM(
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
 
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> result;
   ROOT::VecOps::RVec<double> i_result;
@@ -1118,8 +1285,8 @@ get_invM(ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
 }
 
 // SV momentum
-ROOT::VecOps::RVec<ROOT::VecOps::RVec<TVector3>>
-get_p_SV(ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+ROOT::VecOps::RVec<ROOT::VecOps::RVec<TVector3>> get_p_SV(
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<TVector3>> result;
   ROOT::VecOps::RVec<TVector3> i_result;
 
@@ -1144,7 +1311,7 @@ get_p_SV(ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
 
 // SV momentum magnitude
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_pMag_SV(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> result;
   ROOT::VecOps::RVec<double> i_result;
 
@@ -1169,7 +1336,7 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_pMag_SV(
 
 // SV daughters multiplicity
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> get_VertexNtrk(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> result;
   ROOT::VecOps::RVec<int> i_result;
   for (unsigned int i = 0; i < vertices.size(); i++) {
@@ -1186,7 +1353,7 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> get_VertexNtrk(
 
 // SV chi2
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_chi2_SV(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> result;
   ROOT::VecOps::RVec<double> i_result;
 
@@ -1205,7 +1372,7 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_chi2_SV(
 
 // SV normalised chi2
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_norm_chi2_SV(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> result;
   ROOT::VecOps::RVec<double> i_result;
 
@@ -1222,7 +1389,7 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_norm_chi2_SV(
 
 // SV no of DOF
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> get_nDOF_SV(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> result;
   ROOT::VecOps::RVec<int> i_result;
 
@@ -1239,7 +1406,7 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> get_nDOF_SV(
 
 // SV theta
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_theta_SV(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> result;
   ROOT::VecOps::RVec<double> i_result;
 
@@ -1258,8 +1425,8 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_theta_SV(
 }
 
 // SV phi
-ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>>
-get_phi_SV(ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_phi_SV(
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> result;
   ROOT::VecOps::RVec<double> i_result;
 
@@ -1279,8 +1446,8 @@ get_phi_SV(ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
 
 // SV relative theta
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_relTheta_SV(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices,
-    ROOT::VecOps::RVec<fastjet::PseudoJet> jets) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices,
+    const ROOT::VecOps::RVec<fastjet::PseudoJet> &jets) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> result;
   ROOT::VecOps::RVec<double> i_result;
 
@@ -1302,8 +1469,8 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_relTheta_SV(
 
 // SV relative phi
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_relPhi_SV(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices,
-    ROOT::VecOps::RVec<fastjet::PseudoJet> jets) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices,
+    const ROOT::VecOps::RVec<fastjet::PseudoJet> &jets) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> result;
   ROOT::VecOps::RVec<double> i_result;
 
@@ -1326,8 +1493,8 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_relPhi_SV(
 
 // SV pointing angle wrt PV
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_pointingangle_SV(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices,
-    FCCAnalysesVertex PV) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices,
+    const FCCAnalysesVertex &PV) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> result;
   ROOT::VecOps::RVec<double> i_result;
 
@@ -1363,9 +1530,9 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_pointingangle_SV(
 }
 
 // SV distance from PV in xy
-ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>>
-get_dxy_SV(ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices,
-           FCCAnalysesVertex PV) {
+ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_dxy_SV(
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices,
+    const FCCAnalysesVertex &PV) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> result;
   ROOT::VecOps::RVec<double> i_result;
   TVector3 x_PV(PV.vertex.position[0], PV.vertex.position[1],
@@ -1388,9 +1555,9 @@ get_dxy_SV(ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices,
 }
 
 // SV distance from PV in 3D
-ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>>
-get_d3d_SV(ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices,
-           FCCAnalysesVertex PV) {
+ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> get_d3d_SV(
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices,
+    const FCCAnalysesVertex &PV) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> result;
   ROOT::VecOps::RVec<double> i_result;
   TVector3 x_PV(PV.vertex.position[0], PV.vertex.position[1],
@@ -1414,7 +1581,7 @@ get_d3d_SV(ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices,
 
 // SV position in 3D
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<TVector3>> get_position_SV(
-    ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> vertices) {
+    const ROOT::VecOps::RVec<ROOT::VecOps::RVec<FCCAnalysesVertex>> &vertices) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<TVector3>> result;
   ROOT::VecOps::RVec<TVector3> i_result;
 
@@ -1435,7 +1602,8 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<TVector3>> get_position_SV(
 
 // V0 pdg
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>>
-get_pdg_V0(ROOT::VecOps::RVec<int> pdg, ROOT::VecOps::RVec<int> nSV_jet) {
+get_pdg_V0(const ROOT::VecOps::RVec<int> &pdg,
+           const ROOT::VecOps::RVec<int> &nSV_jet) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> result;
   ROOT::VecOps::RVec<int> i_result;
 
@@ -1454,7 +1622,8 @@ get_pdg_V0(ROOT::VecOps::RVec<int> pdg, ROOT::VecOps::RVec<int> nSV_jet) {
 
 // V0 invariant mass
 ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>>
-get_invM_V0(ROOT::VecOps::RVec<double> invM, ROOT::VecOps::RVec<int> nSV_jet) {
+get_invM_V0(const ROOT::VecOps::RVec<double> &invM,
+            const ROOT::VecOps::RVec<int> &nSV_jet) {
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<double>> result;
   ROOT::VecOps::RVec<double> i_result;
 
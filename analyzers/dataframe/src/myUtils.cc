@@ -24,20 +24,20 @@ float get_z0(TVector3 x, TVector3 p){
 }
 
 
-int get_Npos(ROOT::VecOps::RVec<float> in){
+int get_Npos(const ROOT::VecOps::RVec<float>& in){
   int result=0;
   for(auto &p:in)
     if (p>0.)result+=1;
   return result;
 }
-int get_Nneg(ROOT::VecOps::RVec<float> in){
+int get_Nneg(const ROOT::VecOps::RVec<float>& in){
   int result=0;
   for(auto &p:in)
     if (p<0.)result+=1;
   return result;
 }
 
-float get_dPV2DV_min(ROOT::VecOps::RVec<float> in){
+float get_dPV2DV_min(const ROOT::VecOps::RVec<float>& in){
   float result = 9999999.;
   for (auto &p:in){
     if (p<result && p>0)result=p;
@@ -45,7 +45,7 @@ float get_dPV2DV_min(ROOT::VecOps::RVec<float> in){
   return result;
 }
 
-float get_dPV2DV_max(ROOT::VecOps::RVec<float> in){
+float get_dPV2DV_max(const ROOT::VecOps::RVec<float>& in){
   float result = -99999;
   for (auto &p:in){
     if (p>result)result=p;
@@ -53,7 +53,7 @@ float get_dPV2DV_max(ROOT::VecOps::RVec<float> in){
   return result;
 }
 
-float get_dPV2DV_ave(ROOT::VecOps::RVec<float> in){
+float get_dPV2DV_ave(const ROOT::VecOps::RVec<float>& in){
   float result=0.;
   for (auto &p:in){
     result+=p;
@@ -62,7 +62,7 @@ float get_dPV2DV_ave(ROOT::VecOps::RVec<float> in){
   return result;
 }
 
-int get_PV_ntracks(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+int get_PV_ntracks(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
   int result=0;
   for (auto &p:vertex){
     if (p.vertex.primary==1) {
@@ -73,7 +73,7 @@ int get_PV_ntracks(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex)
   return result;
 }
 
-int hasPV(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+int hasPV(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
   int result=0;
   for (auto &p:vertex){
     if (p.vertex.primary==1) {
@@ -84,8 +84,8 @@ int hasPV(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_Vertex_mass(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-						   ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> reco){
+ROOT::VecOps::RVec<float> get_Vertex_mass(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+						   const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& reco){
 
   ROOT::VecOps::RVec<float> result;
   for (auto &p:vertex){
@@ -96,70 +96,70 @@ ROOT::VecOps::RVec<float> get_Vertex_mass(ROOT::VecOps::RVec<VertexingUtils::FCC
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_Vertex_x(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<float> get_Vertex_x(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
     ROOT::VecOps::RVec<float> result;
   for (auto &p:vertex)
     result.push_back(p.vertex.position.x);
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_Vertex_y(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<float> get_Vertex_y(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
     ROOT::VecOps::RVec<float> result;
   for (auto &p:vertex)
     result.push_back(p.vertex.position.y);
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_Vertex_z(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<float> get_Vertex_z(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
   ROOT::VecOps::RVec<float> result;
   for (auto &p:vertex)
     result.push_back(p.vertex.position.z);
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_Vertex_xErr(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<float> get_Vertex_xErr(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
     ROOT::VecOps::RVec<float> result;
   for (auto &p:vertex)
     result.push_back(sqrt(p.vertex.covMatrix[0]));
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_Vertex_yErr(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<float> get_Vertex_yErr(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
     ROOT::VecOps::RVec<float> result;
   for (auto &p:vertex)
     result.push_back(sqrt(p.vertex.covMatrix[2]));
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_Vertex_zErr(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<float> get_Vertex_zErr(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
     ROOT::VecOps::RVec<float> result;
   for (auto &p:vertex)
     result.push_back(sqrt(p.vertex.covMatrix[5]));
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_Vertex_chi2(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<float> get_Vertex_chi2(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
   ROOT::VecOps::RVec<float> result;
   for (auto &p:vertex)
     result.push_back(p.vertex.chi2);
   return result;
 }
 
-ROOT::VecOps::RVec<int> get_Vertex_isPV(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<int> get_Vertex_isPV(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
   ROOT::VecOps::RVec<int> result;
   for (auto &p:vertex)
     result.push_back(p.vertex.primary);
   return result;
 }
 
-ROOT::VecOps::RVec<int> get_Vertex_ntracks(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<int> get_Vertex_ntracks(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
   ROOT::VecOps::RVec<int> result;
   for (auto &p:vertex)
     result.push_back(p.ntracks);
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_Vertex_d2PV(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
+ROOT::VecOps::RVec<float> get_Vertex_d2PV(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
 						   int comp){
   ROOT::VecOps::RVec<float> result;
   VertexingUtils::FCCAnalysesVertex PV;
@@ -174,7 +174,7 @@ ROOT::VecOps::RVec<float> get_Vertex_d2PV(ROOT::VecOps::RVec<VertexingUtils::FCC
 }
 
 
-ROOT::VecOps::RVec<float> get_Vertex_d2PVError(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
+ROOT::VecOps::RVec<float> get_Vertex_d2PVError(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
 							int comp){
   ROOT::VecOps::RVec<float> result;
   VertexingUtils::FCCAnalysesVertex PV;
@@ -189,9 +189,9 @@ ROOT::VecOps::RVec<float> get_Vertex_d2PVError(ROOT::VecOps::RVec<VertexingUtils
 }
 
 
-ROOT::VecOps::RVec<float> get_Vertex_d2MC(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-						   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> mcver,
-						   ROOT::VecOps::RVec<int> mcind,
+ROOT::VecOps::RVec<float> get_Vertex_d2MC(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+						   const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& mcver,
+						   const ROOT::VecOps::RVec<int>& mcind,
 						   int comp){
   ROOT::VecOps::RVec<float> result;
 
@@ -204,15 +204,15 @@ ROOT::VecOps::RVec<float> get_Vertex_d2MC(ROOT::VecOps::RVec<VertexingUtils::FCC
   return result;
 }
 
-ROOT::VecOps::RVec<int> get_Vertex_indMC(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<int> get_Vertex_indMC(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
   ROOT::VecOps::RVec<int> result;
   for (size_t i = 0; i < vertex.size(); ++i)
     result.push_back(vertex.at(i).mc_ind);
   return result;
 }
 
-ROOT::VecOps::RVec<int> get_Vertex_indMC(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-						  ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> mcver){
+ROOT::VecOps::RVec<int> get_Vertex_indMC(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+						  const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& mcver){
 
   ROOT::VecOps::RVec<int> result;
   for (auto &p:vertex){
@@ -241,11 +241,11 @@ ROOT::VecOps::RVec<int> get_Vertex_indMC(ROOT::VecOps::RVec<VertexingUtils::FCCA
 
 
 ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>
-get_VertexObject(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> mcver,
-			  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> reco,
-			  ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-			  ROOT::VecOps::RVec<int> recin,
-			  ROOT::VecOps::RVec<int> mcin){
+get_VertexObject(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& mcver,
+			  const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& reco,
+			  const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+			  const ROOT::VecOps::RVec<int>& recin,
+			  const ROOT::VecOps::RVec<int>& mcin){
 
   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> result;
 
@@ -284,7 +284,7 @@ get_VertexObject(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> mcver,
 
 int globalmm=0;
 ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>
-merge_VertexObjet(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> in){
+merge_VertexObjet(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& in){
   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> result;
   std::cout<<"============================"<<std::endl;
   for (size_t i = 0; i < in.size()-1; ++i){
@@ -307,7 +307,7 @@ merge_VertexObjet(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> in){
 }
 
 
-std::vector<std::vector<int>> get_Vertex_ind(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+std::vector<std::vector<int>> get_Vertex_ind(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
   std::vector<std::vector<int>> result;
   for (auto &p:vertex){
     std::vector<int> tmp;
@@ -318,40 +318,40 @@ std::vector<std::vector<int>> get_Vertex_ind(ROOT::VecOps::RVec<VertexingUtils::
 }
 
 
-ROOT::VecOps::RVec<TVector3> get_MCVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex){
+ROOT::VecOps::RVec<TVector3> get_MCVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex){
   ROOT::VecOps::RVec<TVector3> result;
   for (auto &p:vertex)
     result.push_back(p.vertex);
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_MCVertex_x(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex){
+ROOT::VecOps::RVec<float> get_MCVertex_x(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex){
   ROOT::VecOps::RVec<float> result;
   for (auto &p:vertex)
     result.push_back(p.vertex[0]);
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_MCVertex_y(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex){
+ROOT::VecOps::RVec<float> get_MCVertex_y(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex){
   ROOT::VecOps::RVec<float> result;
   for (auto &p:vertex)
     result.push_back(p.vertex[1]);
   return result;
 }
-ROOT::VecOps::RVec<float> get_MCVertex_z(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex){
+ROOT::VecOps::RVec<float> get_MCVertex_z(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex){
   ROOT::VecOps::RVec<float> result;
   for (auto &p:vertex)
     result.push_back(p.vertex[2]);
   return result;
 }
-ROOT::VecOps::RVec<int> get_NTracksMCVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex){
+ROOT::VecOps::RVec<int> get_NTracksMCVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex){
   ROOT::VecOps::RVec<int> result;
   for (auto &p:vertex)
     result.push_back(p.mc_ind.size());
   return result;
 }
 
-std::vector<std::vector<int>> get_MCindMCVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex){
+std::vector<std::vector<int>> get_MCindMCVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex){
   std::vector<std::vector<int>> result;
   for (auto &p:vertex){
     std::vector<int> tmp;
@@ -361,8 +361,8 @@ std::vector<std::vector<int>> get_MCindMCVertex(ROOT::VecOps::RVec<VertexingUtil
   return result;
 }
 
-std::vector<std::vector<int>> get_MCpdgMCVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex,
-							 ROOT::VecOps::RVec<edm4hep::MCParticleData> mc){
+std::vector<std::vector<int>> get_MCpdgMCVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex,
+							 const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc){
   std::vector<std::vector<int>> result;
   for (auto &p:vertex){
     std::vector<int> tmp;
@@ -373,8 +373,8 @@ std::vector<std::vector<int>> get_MCpdgMCVertex(ROOT::VecOps::RVec<VertexingUtil
   return result;
 }
 
-std::vector<std::vector<int>> get_MCpdgMotherMCVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex,
-							       ROOT::VecOps::RVec<edm4hep::MCParticleData> mc){
+std::vector<std::vector<int>> get_MCpdgMotherMCVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex,
+							       const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc){
   std::vector<std::vector<int>> result;
   for (auto &p:vertex){
     std::vector<int> tmp;
@@ -384,8 +384,8 @@ std::vector<std::vector<int>> get_MCpdgMotherMCVertex(ROOT::VecOps::RVec<Vertexi
   return result;
 }
 
-std::vector<std::vector<int>> get_MCpdgGMotherMCVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex,
-								ROOT::VecOps::RVec<edm4hep::MCParticleData> mc){
+std::vector<std::vector<int>> get_MCpdgGMotherMCVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex,
+								const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc){
   std::vector<std::vector<int>> result;
   for (auto &p:vertex){
     std::vector<int> tmp;
@@ -396,8 +396,8 @@ std::vector<std::vector<int>> get_MCpdgGMotherMCVertex(ROOT::VecOps::RVec<Vertex
 }
 
 
-ROOT::VecOps::RVec<int> get_MCMother1(ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-					       ROOT::VecOps::RVec<int> ind){
+ROOT::VecOps::RVec<int> get_MCMother1(const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+					       const ROOT::VecOps::RVec<int>& ind){
 
   ROOT::VecOps::RVec<int> result;
     for (size_t i = 0; i < mc.size(); ++i){
@@ -407,8 +407,8 @@ ROOT::VecOps::RVec<int> get_MCMother1(ROOT::VecOps::RVec<edm4hep::MCParticleData
   return result;
 }
 
-ROOT::VecOps::RVec<int> get_MCMother2(ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-					       ROOT::VecOps::RVec<int> ind){
+ROOT::VecOps::RVec<int> get_MCMother2(const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+					       const ROOT::VecOps::RVec<int>& ind){
 
   ROOT::VecOps::RVec<int> result;
   for (size_t i = 0; i < mc.size(); ++i){
@@ -418,8 +418,8 @@ ROOT::VecOps::RVec<int> get_MCMother2(ROOT::VecOps::RVec<edm4hep::MCParticleData
   return result;
 }
 
-ROOT::VecOps::RVec<int> get_MCDaughter1(ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-					       ROOT::VecOps::RVec<int> ind){
+ROOT::VecOps::RVec<int> get_MCDaughter1(const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+					       const ROOT::VecOps::RVec<int>& ind){
 
   ROOT::VecOps::RVec<int> result;
     for (size_t i = 0; i < mc.size(); ++i){
@@ -429,8 +429,8 @@ ROOT::VecOps::RVec<int> get_MCDaughter1(ROOT::VecOps::RVec<edm4hep::MCParticleDa
   return result;
 }
 
-ROOT::VecOps::RVec<int> get_MCDaughter2(ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-						 ROOT::VecOps::RVec<int> ind){
+ROOT::VecOps::RVec<int> get_MCDaughter2(const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+						 const ROOT::VecOps::RVec<int>& ind){
 
   ROOT::VecOps::RVec<int> result;
   for (size_t i = 0; i < mc.size(); ++i){
@@ -441,8 +441,8 @@ ROOT::VecOps::RVec<int> get_MCDaughter2(ROOT::VecOps::RVec<edm4hep::MCParticleDa
 }
 
 
-ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> get_MCVertexObject(ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-										    ROOT::VecOps::RVec<int> ind){
+ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> get_MCVertexObject(const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+										    const ROOT::VecOps::RVec<int>& ind){
   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> result;
   ROOT::VecOps::RVec<TVector3> tmpvec;
   ROOT::VecOps::RVec<int> tmpvecint;
@@ -583,7 +583,7 @@ float get_distance(TVector3 v1, TVector3 v2){
 	       pow( v1[2] - v2[2], 2));
 }
 
-float get_distanceVertex(edm4hep::VertexData v1, edm4hep::VertexData v2, int comp){
+float get_distanceVertex(const edm4hep::VertexData& v1, const edm4hep::VertexData& v2, int comp){
 
   float result;
   if      (comp==0) result = v1.position.x - v2.position.x;
@@ -598,7 +598,7 @@ float get_distanceVertex(edm4hep::VertexData v1, edm4hep::VertexData v2, int com
 }
 
 
-float get_distanceErrorVertex(edm4hep::VertexData v1, edm4hep::VertexData v2, int comp){
+float get_distanceErrorVertex(const edm4hep::VertexData& v1, const edm4hep::VertexData& v2, int comp){
 
   std::array<float,6> v1_covMatrix = v1.covMatrix;
   std::array<float,6> v2_covMatrix = v2.covMatrix;
@@ -705,7 +705,7 @@ float get_distanceErrorVertex(edm4hep::VertexData v1, edm4hep::VertexData v2, in
 
 sel_PV::sel_PV(bool arg_closest):m_closest(arg_closest){};
 VertexingUtils::FCCAnalysesVertex
-sel_PV::operator()(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> pv){
+sel_PV::operator()(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& pv){
 
   VertexingUtils::FCCAnalysesVertex result;
 
@@ -720,7 +720,7 @@ sel_PV::operator()(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> pv){
 
 
 
-ROOT::VecOps::RVec<float> get_flightDistanceVertex(ROOT::VecOps::RVec<FCCAnalysesComposite> in, edm4hep::VertexData pv){
+ROOT::VecOps::RVec<float> get_flightDistanceVertex(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in, const edm4hep::VertexData& pv){
   ROOT::VecOps::RVec<float> result;
 
   for (auto &sv: in){
@@ -732,8 +732,8 @@ ROOT::VecOps::RVec<float> get_flightDistanceVertex(ROOT::VecOps::RVec<FCCAnalyse
 }
 
 
-ROOT::VecOps::RVec<float> get_flightDistanceVertex(ROOT::VecOps::RVec<FCCAnalysesComposite> in,
-							    VertexingUtils::FCCAnalysesVertex pv){
+ROOT::VecOps::RVec<float> get_flightDistanceVertex(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in,
+							    const VertexingUtils::FCCAnalysesVertex& pv){
 
   ROOT::VecOps::RVec<float> result;
   edm4hep::VertexData thePV = pv.vertex;
@@ -744,8 +744,8 @@ ROOT::VecOps::RVec<float> get_flightDistanceVertex(ROOT::VecOps::RVec<FCCAnalyse
 
 
 ROOT::VecOps::RVec<int> getMC_daughter(int daughterindex,
-						ROOT::VecOps::RVec<edm4hep::MCParticleData> in,
-						ROOT::VecOps::RVec<int> ind){
+						const ROOT::VecOps::RVec<edm4hep::MCParticleData>& in,
+						const ROOT::VecOps::RVec<int>& ind){
   ROOT::VecOps::RVec<int> result;
   for (size_t i = 0; i < in.size(); ++i) {
     if (daughterindex+1>in.at(i).daughters_end-in.at(i).daughters_begin) {
@@ -759,8 +759,8 @@ ROOT::VecOps::RVec<int> getMC_daughter(int daughterindex,
 }
 
 ROOT::VecOps::RVec<int> getMC_parent(int parentindex,
-					      ROOT::VecOps::RVec<edm4hep::MCParticleData> in,
-					      ROOT::VecOps::RVec<int> ind){
+					      const ROOT::VecOps::RVec<edm4hep::MCParticleData>& in,
+					      const ROOT::VecOps::RVec<int>& ind){
   ROOT::VecOps::RVec<int> result;
   for (size_t i = 0; i < in.size(); ++i) {
     if (parentindex+1>in.at(i).parents_end-in.at(i).parents_begin) {
@@ -774,8 +774,8 @@ ROOT::VecOps::RVec<int> getMC_parent(int parentindex,
 }
 
 int getMC_parent(int parentindex,
-			  edm4hep::MCParticleData in,
-			  ROOT::VecOps::RVec<int> ind){
+			  const edm4hep::MCParticleData& in,
+			  const ROOT::VecOps::RVec<int>& ind){
   int result;
   if (parentindex+1>in.parents_end-in.parents_begin)
     result = -999;
@@ -785,12 +785,12 @@ int getMC_parent(int parentindex,
 }
 
 
-ROOT::VecOps::RVec<FCCAnalysesComposite> add_truthmatched(ROOT::VecOps::RVec<FCCAnalysesComposite> comp,
-								   ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
+ROOT::VecOps::RVec<FCCAnalysesComposite> add_truthmatched(const ROOT::VecOps::RVec<FCCAnalysesComposite>& comp,
+								   const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
 								   //ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> rp2mc){
-								   ROOT::VecOps::RVec<int> rp2mc,
-								   ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-								   ROOT::VecOps::RVec<int> ind){
+								   const ROOT::VecOps::RVec<int>& rp2mc,
+								   const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+								   const ROOT::VecOps::RVec<int>& ind){
 
 
 
@@ -849,9 +849,9 @@ ROOT::VecOps::RVec<FCCAnalysesComposite> add_truthmatched(ROOT::VecOps::RVec<FCC
 
 
 
-ROOT::VecOps::RVec<int> get_trueVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex,
-						ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-						ROOT::VecOps::RVec<int> ind,
+ROOT::VecOps::RVec<int> get_trueVertex(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex,
+						const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+						const ROOT::VecOps::RVec<int>& ind,
 						int mother,
 						int grandmother){
 
@@ -881,12 +881,12 @@ ROOT::VecOps::RVec<int> get_trueVertex(ROOT::VecOps::RVec<VertexingUtils::FCCAna
   return result;
 }
 
-ROOT::VecOps::RVec<FCCAnalysesComposite2> add_truthmatched2(ROOT::VecOps::RVec<FCCAnalysesComposite2> comp,
-								     ROOT::VecOps::RVec<edm4hep::MCParticleData> mc,
-								     ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-								     ROOT::VecOps::RVec<int> rp2mc,
-								     ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-								     ROOT::VecOps::RVec<int> ind){
+ROOT::VecOps::RVec<FCCAnalysesComposite2> add_truthmatched2(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& comp,
+								     const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc,
+								     const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+								     const ROOT::VecOps::RVec<int>& rp2mc,
+								     const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+								     const ROOT::VecOps::RVec<int>& ind){
 
 
   for (size_t i = 0; i < comp.size(); ++i) {
@@ -920,7 +920,7 @@ ROOT::VecOps::RVec<FCCAnalysesComposite2> add_truthmatched2(ROOT::VecOps::RVec<F
   return comp;
 }
 
-ROOT::VecOps::RVec<int> get_compmc(ROOT::VecOps::RVec<FCCAnalysesComposite> in){
+ROOT::VecOps::RVec<int> get_compmc(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in){
 
   ROOT::VecOps::RVec<int> result;
   for (size_t i = 0; i < in.size(); ++i)result.push_back(in.at(i).mc_index);
@@ -957,9 +957,9 @@ ROOT::VecOps::RVec<int> get_compmc(ROOT::VecOps::RVec<FCCAnalysesComposite> in){
 
 }*/
 
-ROOT::VecOps::RVec<FCCAnalysesComposite> build_Bu2D0Pi(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-								ROOT::VecOps::RVec<FCCAnalysesComposite> d0,
-								ROOT::VecOps::RVec<int> pions){
+ROOT::VecOps::RVec<FCCAnalysesComposite> build_Bu2D0Pi(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+								const ROOT::VecOps::RVec<FCCAnalysesComposite>& d0,
+								const ROOT::VecOps::RVec<int>& pions){
 
   ROOT::VecOps::RVec<FCCAnalysesComposite> result;
   for (size_t i = 0; i < d0.size(); ++i) {
@@ -1000,8 +1000,8 @@ ROOT::VecOps::RVec<FCCAnalysesComposite> build_Bu2D0Pi(ROOT::VecOps::RVec<edm4he
 
 filter_PV::filter_PV(bool arg_pv):m_pv(arg_pv){};
 ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>
-filter_PV::operator()(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> in,
-			       ROOT::VecOps::RVec<int> index){
+filter_PV::operator()(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& in,
+			       const ROOT::VecOps::RVec<int>& index){
 
   ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> result;
 
@@ -1017,11 +1017,11 @@ filter_PV::operator()(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> in,
 }
 
 
-int getFCCAnalysesComposite_N(ROOT::VecOps::RVec<FCCAnalysesComposite> in){
+int getFCCAnalysesComposite_N(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in){
   return in.size();
 }
 
-ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(ROOT::VecOps::RVec<FCCAnalysesComposite> in){
+ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in){
   ROOT::VecOps::RVec<float> result;
   for (auto & p: in) {
     result.push_back(p.particle.M());
@@ -1029,11 +1029,11 @@ ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(ROOT::VecOps::RVec<FCCAna
   return result;
 }
 
-int getFCCAnalysesComposite_N(ROOT::VecOps::RVec<FCCAnalysesComposite2> in){
+int getFCCAnalysesComposite_N(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in){
   return in.size();
 }
 
-ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(ROOT::VecOps::RVec<FCCAnalysesComposite2> in){
+ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in){
   ROOT::VecOps::RVec<float> result;
   for (auto & p: in) {
     result.push_back(p.particle.M());
@@ -1041,8 +1041,8 @@ ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(ROOT::VecOps::RVec<FCCAna
   return result;
 }
 
-ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-								ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+								const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
   ROOT::VecOps::RVec<float> result;
   for (auto & p: in) {
     ROOT::VecOps::RVec< TVector3 >  updated_track_momentum_at_vertex = vertex.at(p.vertex).updated_track_momentum_at_vertex;
@@ -1061,9 +1061,9 @@ ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(ROOT::VecOps::RVec<FCCAna
   return result;
 }
 
-ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-							   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							   ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
+ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+							   const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							   const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
 							   int index){
 
 
@@ -1076,9 +1076,9 @@ ROOT::VecOps::RVec<float> getFCCAnalysesComposite_mass(ROOT::VecOps::RVec<FCCAna
   return result;
 }
 
-ROOT::VecOps::RVec<int> getFCCAnalysesComposite_type(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-							   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							   ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
+ROOT::VecOps::RVec<int> getFCCAnalysesComposite_type(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+							   const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							   const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
 							   int index){
 
 
@@ -1093,7 +1093,7 @@ ROOT::VecOps::RVec<int> getFCCAnalysesComposite_type(ROOT::VecOps::RVec<FCCAnaly
 
 
 
-ROOT::VecOps::RVec<int> getFCCAnalysesComposite_vertex(ROOT::VecOps::RVec<FCCAnalysesComposite2> in){
+ROOT::VecOps::RVec<int> getFCCAnalysesComposite_vertex(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in){
   ROOT::VecOps::RVec<int> result;
   for (auto & p: in) {
     result.push_back(p.vertex);
@@ -1101,8 +1101,8 @@ ROOT::VecOps::RVec<int> getFCCAnalysesComposite_vertex(ROOT::VecOps::RVec<FCCAna
   return result;
 }
 
-ROOT::VecOps::RVec<int> getFCCAnalysesComposite_mcvertex(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-								  ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<int> getFCCAnalysesComposite_mcvertex(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+								  const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
   ROOT::VecOps::RVec<int> result;
   for (auto & p: in) {
     result.push_back(vertex.at(p.vertex).mc_ind);
@@ -1111,9 +1111,9 @@ ROOT::VecOps::RVec<int> getFCCAnalysesComposite_mcvertex(ROOT::VecOps::RVec<FCCA
 }
 
 
-ROOT::VecOps::RVec<float> getFCCAnalysesComposite_B(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-							     ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							     ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop){
+ROOT::VecOps::RVec<float> getFCCAnalysesComposite_B(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+							     const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							     const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop){
 
   ROOT::VecOps::RVec<float> result;
   for (auto & p: in) {
@@ -1134,7 +1134,7 @@ ROOT::VecOps::RVec<float> getFCCAnalysesComposite_B(ROOT::VecOps::RVec<FCCAnalys
 }
 
 
-ROOT::VecOps::RVec<float> getFCCAnalysesComposite_p(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
+ROOT::VecOps::RVec<float> getFCCAnalysesComposite_p(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
 							     int i){
   ROOT::VecOps::RVec<float> result;
   for (auto & p: in) {
@@ -1149,9 +1149,9 @@ ROOT::VecOps::RVec<float> getFCCAnalysesComposite_p(ROOT::VecOps::RVec<FCCAnalys
 }
 
 
-ROOT::VecOps::RVec<float> getFCCAnalysesComposite_p(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-							     ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							     ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
+ROOT::VecOps::RVec<float> getFCCAnalysesComposite_p(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+							     const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							     const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
 							     int index,
 							     int type){
 
@@ -1172,9 +1172,9 @@ ROOT::VecOps::RVec<float> getFCCAnalysesComposite_p(ROOT::VecOps::RVec<FCCAnalys
 }
 
 
-ROOT::VecOps::RVec<int> getFCCAnalysesComposite_q(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-							   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-							   ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
+ROOT::VecOps::RVec<int> getFCCAnalysesComposite_q(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+							   const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+							   const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
 							   int index){
 
 
@@ -1188,9 +1188,9 @@ ROOT::VecOps::RVec<int> getFCCAnalysesComposite_q(ROOT::VecOps::RVec<FCCAnalyses
 }
 
 
-ROOT::VecOps::RVec<edm4hep::TrackState> get_truetrack(ROOT::VecOps::RVec<int> in,
-							       ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex,
-							       ROOT::VecOps::RVec<edm4hep::MCParticleData> mc){
+ROOT::VecOps::RVec<edm4hep::TrackState> get_truetrack(const ROOT::VecOps::RVec<int>& in,
+							       const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex,
+							       const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc){
 
   ROOT::VecOps::RVec<edm4hep::TrackState> result;
   float charge=0;
@@ -1240,8 +1240,8 @@ ROOT::VecOps::RVec<edm4hep::TrackState> get_truetrack(ROOT::VecOps::RVec<int> in
 }
 
 
-ROOT::VecOps::RVec<edm4hep::TrackState> get_pseudotrack(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-								 ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop){
+ROOT::VecOps::RVec<edm4hep::TrackState> get_pseudotrack(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+								 const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop){
   ROOT::VecOps::RVec<edm4hep::TrackState> result;
   float norm = 1e-3;   // to convert from mm to meters
   for (auto & p: vertex){
@@ -1301,8 +1301,8 @@ ROOT::VecOps::RVec<edm4hep::TrackState> get_pseudotrack(ROOT::VecOps::RVec<Verte
 }
 
 
-ROOT::VecOps::RVec<edm4hep::TrackState> getFCCAnalysesComposite_track(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-									       ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<edm4hep::TrackState> getFCCAnalysesComposite_track(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+									       const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
   ROOT::VecOps::RVec<edm4hep::TrackState> result;
   float norm = 1e-3;   // to convert from mm to meters
   for (auto & p: in){
@@ -1340,20 +1340,20 @@ ROOT::VecOps::RVec<edm4hep::TrackState> getFCCAnalysesComposite_track(ROOT::VecO
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_trackd0(ROOT::VecOps::RVec<edm4hep::TrackState> in){
+ROOT::VecOps::RVec<float> get_trackd0(const ROOT::VecOps::RVec<edm4hep::TrackState>& in){
   ROOT::VecOps::RVec<float> result;
   for (auto & p: in) result.push_back(p.D0);
   return result;
 }
-ROOT::VecOps::RVec<float> get_trackz0(ROOT::VecOps::RVec<edm4hep::TrackState> in){
+ROOT::VecOps::RVec<float> get_trackz0(const ROOT::VecOps::RVec<edm4hep::TrackState>& in){
   ROOT::VecOps::RVec<float> result;
   for (auto & p: in) result.push_back(p.Z0);
   return result;
 }
 
 
-ROOT::VecOps::RVec<float> getFCCAnalysesComposite_d0(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-							      ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
+ROOT::VecOps::RVec<float> getFCCAnalysesComposite_d0(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+							      const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
 							      int index){
   ROOT::VecOps::RVec<float> result;
   for (auto & p: in) {
@@ -1363,8 +1363,8 @@ ROOT::VecOps::RVec<float> getFCCAnalysesComposite_d0(ROOT::VecOps::RVec<FCCAnaly
   return result;
 }
 
-ROOT::VecOps::RVec<float> getFCCAnalysesComposite_z0(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-							      ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
+ROOT::VecOps::RVec<float> getFCCAnalysesComposite_z0(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+							      const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
 							      int index){
   ROOT::VecOps::RVec<float> result;
   for (auto & p: in) {
@@ -1374,7 +1374,7 @@ ROOT::VecOps::RVec<float> getFCCAnalysesComposite_z0(ROOT::VecOps::RVec<FCCAnaly
   return result;
 }
 
-ROOT::VecOps::RVec<int> getFCCAnalysesComposite_charge(ROOT::VecOps::RVec<FCCAnalysesComposite2> in){
+ROOT::VecOps::RVec<int> getFCCAnalysesComposite_charge(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in){
   ROOT::VecOps::RVec<int> result;
   for (auto & p: in) {
     result.push_back(p.charge);
@@ -1382,7 +1382,7 @@ ROOT::VecOps::RVec<int> getFCCAnalysesComposite_charge(ROOT::VecOps::RVec<FCCAna
   return result;
 }
 
-ROOT::VecOps::RVec<int> getFCCAnalysesComposite_truthMatch(ROOT::VecOps::RVec<FCCAnalysesComposite2> in){
+ROOT::VecOps::RVec<int> getFCCAnalysesComposite_truthMatch(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in){
   ROOT::VecOps::RVec<int> result;
   for (auto & p: in) {
     result.push_back(p.mc_index);
@@ -1390,7 +1390,7 @@ ROOT::VecOps::RVec<int> getFCCAnalysesComposite_truthMatch(ROOT::VecOps::RVec<FC
   return result;
 }
 
-ROOT::VecOps::RVec<TLorentzVector> getFCCAnalysesComposite_particle(ROOT::VecOps::RVec<FCCAnalysesComposite> in){
+ROOT::VecOps::RVec<TLorentzVector> getFCCAnalysesComposite_particle(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in){
   ROOT::VecOps::RVec<TLorentzVector> result;
   for (auto & p: in) {
     result.push_back(p.particle);
@@ -1399,7 +1399,7 @@ ROOT::VecOps::RVec<TLorentzVector> getFCCAnalysesComposite_particle(ROOT::VecOps
 }
 
 
-ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> getFCCAnalysesComposite_index(ROOT::VecOps::RVec<FCCAnalysesComposite> in){
+ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> getFCCAnalysesComposite_index(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in){
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> result;
   for (auto & p: in) {
     result.push_back(p.index);
@@ -1407,7 +1407,7 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<int>> getFCCAnalysesComposite_index(ROOT::
   return result;
 }
 
-ROOT::VecOps::RVec<edm4hep::VertexData> getFCCAnalysesComposite_vertex(ROOT::VecOps::RVec<FCCAnalysesComposite> in){
+ROOT::VecOps::RVec<edm4hep::VertexData> getFCCAnalysesComposite_vertex(const ROOT::VecOps::RVec<FCCAnalysesComposite>& in){
   ROOT::VecOps::RVec<edm4hep::VertexData> result;
   for (auto & p: in) {
     result.push_back(p.vertex);
@@ -1415,7 +1415,7 @@ ROOT::VecOps::RVec<edm4hep::VertexData> getFCCAnalysesComposite_vertex(ROOT::Vec
   return result;
 }
 
-bool isPV(edm4hep::ReconstructedParticleData recop, ROOT::VecOps::RVec<int> pvindex){
+bool isPV(const edm4hep::ReconstructedParticleData& recop, const ROOT::VecOps::RVec<int>& pvindex){
 
   for (size_t i = 0; i < pvindex.size(); ++i) {
     if (recop.tracks_begin==pvindex.at(i))return true;
@@ -1427,11 +1427,11 @@ bool isPV(edm4hep::ReconstructedParticleData recop, ROOT::VecOps::RVec<int> pvin
 
 build_D0::build_D0(float arg_mass, float arg_p, bool arg_filterPV): m_mass(arg_mass),m_p(arg_p),m_filterPV(arg_filterPV){};
 ROOT::VecOps::RVec<FCCAnalysesComposite>
-build_D0::operator() (ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-			       ROOT::VecOps::RVec<edm4hep::TrackState> tracks,
-			       ROOT::VecOps::RVec<int> pions,
-			       ROOT::VecOps::RVec<int> kaons,
-			       ROOT::VecOps::RVec<int> pvindex){
+build_D0::operator() (const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+			       const ROOT::VecOps::RVec<edm4hep::TrackState>& tracks,
+			       const ROOT::VecOps::RVec<int>& pions,
+			       const ROOT::VecOps::RVec<int>& kaons,
+			       const ROOT::VecOps::RVec<int>& pvindex){
 
   ROOT::VecOps::RVec<FCCAnalysesComposite> result;
 
@@ -1483,7 +1483,7 @@ build_D0::operator() (ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> rec
 
   sel_PID::sel_PID( int arg_PDG): m_PDG(arg_PDG){} ;
 ROOT::VecOps::RVec<int>
-sel_PID::operator()(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop){
+sel_PID::operator()(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop){
   ROOT::VecOps::RVec<int> result;
   for (size_t i = 0; i < recop.size(); ++i) {
     if (recop.at(i).type==m_PDG)
@@ -1494,10 +1494,10 @@ sel_PID::operator()(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop
 
 
 ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>
-PID(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-	     ROOT::VecOps::RVec<int> recind,
-	     ROOT::VecOps::RVec<int> mcind,
-	     ROOT::VecOps::RVec<edm4hep::MCParticleData> mc){
+PID(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+	     const ROOT::VecOps::RVec<int>& recind,
+	     const ROOT::VecOps::RVec<int>& mcind,
+	     const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc){
 
   for (size_t i = 0; i < recind.size(); ++i) {
 
@@ -1552,8 +1552,8 @@ PID(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
 
 
 
-ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> get_RP_atVertex(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-										ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex){
+ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> get_RP_atVertex(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+										const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex){
 
   for (auto &p:vertex){
     ROOT::VecOps::RVec<int> reco_ind = p.reco_ind;
@@ -1576,7 +1576,7 @@ ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> get_RP_atVertex(ROOT::Vec
 
 
 
-float build_invmass(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop, ROOT::VecOps::RVec<int> index){
+float build_invmass(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop, const ROOT::VecOps::RVec<int>& index){
   float result=0;
   TLorentzVector tlv;
   for (size_t i=0;i<index.size();i++){
@@ -1586,7 +1586,7 @@ float build_invmass(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop
   return tlv.M();
 }
 
-TLorentzVector build_tlv(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop, ROOT::VecOps::RVec<int> index){
+TLorentzVector build_tlv(const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop, const ROOT::VecOps::RVec<int>& index){
   float result=0;
   TLorentzVector tlv;
   for (size_t i=0;i<index.size();i++){
@@ -1597,8 +1597,8 @@ TLorentzVector build_tlv(ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>
 }
 
 
-ROOT::VecOps::RVec<FCCAnalysesComposite2> build_tau23pi(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-								 ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop){
+ROOT::VecOps::RVec<FCCAnalysesComposite2> build_tau23pi(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+								 const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop){
 
   ROOT::VecOps::RVec<FCCAnalysesComposite2> result;
 
@@ -1631,8 +1631,8 @@ ROOT::VecOps::RVec<FCCAnalysesComposite2> build_tau23pi(ROOT::VecOps::RVec<Verte
 }
 
 
-ROOT::VecOps::RVec<FCCAnalysesComposite2> build_B2Kstee(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-								 ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop){
+ROOT::VecOps::RVec<FCCAnalysesComposite2> build_B2Kstee(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+								 const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop){
 
   ROOT::VecOps::RVec<FCCAnalysesComposite2> result;
 
@@ -1690,8 +1690,8 @@ ROOT::VecOps::RVec<FCCAnalysesComposite2> build_B2Kstee(ROOT::VecOps::RVec<Verte
   return result;
 }
 
-ROOT::VecOps::RVec<FCCAnalysesComposite2> build_B2Kstmumu(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-								   ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop){
+ROOT::VecOps::RVec<FCCAnalysesComposite2> build_B2Kstmumu(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+								   const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop){
 
   ROOT::VecOps::RVec<FCCAnalysesComposite2> result;
 
@@ -1751,8 +1751,8 @@ ROOT::VecOps::RVec<FCCAnalysesComposite2> build_B2Kstmumu(ROOT::VecOps::RVec<Ver
   return result;
 }
 
-ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bd2KstNuNu(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-								    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop){
+ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bd2KstNuNu(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+								    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop){
 
   ROOT::VecOps::RVec<FCCAnalysesComposite2> result;
   int counter=0;
@@ -1797,8 +1797,8 @@ ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bd2KstNuNu(ROOT::VecOps::RVec<Ve
 }
 
 
-ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bs2PhiNuNu(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-								    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop){
+ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bs2PhiNuNu(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+								    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop){
 
   ROOT::VecOps::RVec<FCCAnalysesComposite2> result;
   //loop over the reconstructed vertex collection
@@ -1834,8 +1834,8 @@ ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bs2PhiNuNu(ROOT::VecOps::RVec<Ve
 }
 
 
-ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bd2MuMu(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-								 ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop){
+ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bd2MuMu(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+								 const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop){
 
   ROOT::VecOps::RVec<FCCAnalysesComposite2> result;
   //loop over the reconstructed vertex collection
@@ -1872,8 +1872,8 @@ ROOT::VecOps::RVec<FCCAnalysesComposite2> build_Bd2MuMu(ROOT::VecOps::RVec<Verte
 
 build_tau23pi::build_tau23pi(float arg_masslow, float arg_masshigh, float arg_p, float arg_angle, bool arg_rho):m_masslow(arg_masslow),m_masshigh(arg_masshigh),m_p(arg_p),m_angle(arg_angle),m_rho(arg_rho){};
 ROOT::VecOps::RVec<FCCAnalysesComposite2>
-build_tau23pi::operator() (ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-				    ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop){
+build_tau23pi::operator() (const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+				    const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop){
 
   ROOT::VecOps::RVec<FCCAnalysesComposite2> result;
   //std::cout <<"n reco V " << vertex.size()<<std::endl;
@@ -1940,9 +1940,9 @@ build_tau23pi::operator() (ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>
 
 
 
-ROOT::VecOps::RVec<float> get_Vertex_thrusthemis_angle(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-								ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-								ROOT::VecOps::RVec<float> thrust){
+ROOT::VecOps::RVec<float> get_Vertex_thrusthemis_angle(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+								const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+								const ROOT::VecOps::RVec<float>& thrust){
   ROOT::VecOps::RVec<float> result;
 
   for (auto &p:vertex){
@@ -1959,9 +1959,9 @@ ROOT::VecOps::RVec<float> get_Vertex_thrusthemis_angle(ROOT::VecOps::RVec<Vertex
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_DVertex_thrusthemis_angle(ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-								ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop,
-								ROOT::VecOps::RVec<float> thrust){
+ROOT::VecOps::RVec<float> get_DVertex_thrusthemis_angle(const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+								const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop,
+								const ROOT::VecOps::RVec<float>& thrust){
   ROOT::VecOps::RVec<float> result;
 
   for (auto &p:vertex){
@@ -1980,7 +1980,7 @@ ROOT::VecOps::RVec<float> get_DVertex_thrusthemis_angle(ROOT::VecOps::RVec<Verte
 }
 
 
-ROOT::VecOps::RVec<int> get_Vertex_thrusthemis(ROOT::VecOps::RVec<float> angle,
+ROOT::VecOps::RVec<int> get_Vertex_thrusthemis(const ROOT::VecOps::RVec<float>& angle,
 							int index){
   ROOT::VecOps::RVec<int> result;
   for (auto &p:angle){
@@ -2000,7 +2000,7 @@ ROOT::VecOps::RVec<int> get_Vertex_thrusthemis(ROOT::VecOps::RVec<float> angle,
   return result;
 }
 
-ROOT::VecOps::RVec<int> get_Vertex_thrusthemis_emin(ROOT::VecOps::RVec<float> angle,
+ROOT::VecOps::RVec<int> get_Vertex_thrusthemis_emin(const ROOT::VecOps::RVec<float>& angle,
 							     float eneg,
 							     float epos){
   ROOT::VecOps::RVec<int> result;
@@ -2014,9 +2014,9 @@ ROOT::VecOps::RVec<int> get_Vertex_thrusthemis_emin(ROOT::VecOps::RVec<float> an
 
 }
 
-ROOT::VecOps::RVec<edm4hep::MCParticleData> build_truerho(ROOT::VecOps::RVec<int> vertexind,
-								   ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC> vertex,
-								   ROOT::VecOps::RVec<edm4hep::MCParticleData> mc){
+ROOT::VecOps::RVec<edm4hep::MCParticleData> build_truerho(const ROOT::VecOps::RVec<int>& vertexind,
+								   const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertexMC>& vertex,
+								   const ROOT::VecOps::RVec<edm4hep::MCParticleData>& mc){
 
   ROOT::VecOps::RVec<edm4hep::MCParticleData> result;
   int index= vertexind.at(0);
@@ -2069,9 +2069,9 @@ ROOT::VecOps::RVec<edm4hep::MCParticleData> build_truerho(ROOT::VecOps::RVec<int
   return result;
 }
 
-ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> build_rho(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-											      ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex> vertex,
-											      ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop){
+ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> build_rho(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+											      const ROOT::VecOps::RVec<VertexingUtils::FCCAnalysesVertex>& vertex,
+											      const ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>& recop){
 
   ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> result;
 
@@ -2131,7 +2131,7 @@ ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> build
 }
 
 
-ROOT::VecOps::RVec<float> get_mass(ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> in,
+ROOT::VecOps::RVec<float> get_mass(const ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>>& in,
 					    int index){
 
   ROOT::VecOps::RVec<float> result;
@@ -2142,7 +2142,7 @@ ROOT::VecOps::RVec<float> get_mass(ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_px(ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> in,
+ROOT::VecOps::RVec<float> get_px(const ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>>& in,
 					  int index){
 
   ROOT::VecOps::RVec<float> result;
@@ -2152,7 +2152,7 @@ ROOT::VecOps::RVec<float> get_px(ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::
   return result;
 }
 
-ROOT::VecOps::RVec<float> get_py(ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> in,
+ROOT::VecOps::RVec<float> get_py(const ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>>& in,
 					  int index){
 
   ROOT::VecOps::RVec<float> result;
@@ -2163,7 +2163,7 @@ ROOT::VecOps::RVec<float> get_py(ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::
 }
 
 
-ROOT::VecOps::RVec<float> get_pz(ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>> in,
+ROOT::VecOps::RVec<float> get_pz(const ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData>>& in,
 					  int index){
 
   ROOT::VecOps::RVec<float> result;
@@ -2174,15 +2174,15 @@ ROOT::VecOps::RVec<float> get_pz(ROOT::VecOps::RVec<ROOT::VecOps::RVec<edm4hep::
 }
 
 
-float get_p(edm4hep::ReconstructedParticleData in) {
+float get_p(const edm4hep::ReconstructedParticleData& in) {
   TLorentzVector tlv;
   tlv.SetXYZM(in.momentum.x, in.momentum.y, in.momentum.z, in.mass);
   return tlv.P();
 }
 
 
-ROOT::VecOps::RVec<float> getFCCAnalysesComposite_anglethrust(ROOT::VecOps::RVec<FCCAnalysesComposite2> in,
-								       ROOT::VecOps::RVec<float> thrust){
+ROOT::VecOps::RVec<float> getFCCAnalysesComposite_anglethrust(const ROOT::VecOps::RVec<FCCAnalysesComposite2>& in,
+								       const ROOT::VecOps::RVec<float>& thrust){
   ROOT::VecOps::RVec<float> result;
   TVector3 thrustvec(thrust.at(1),thrust.at(3),thrust.at(5));
   for (auto &p:in){
@@ -2193,7 +2193,7 @@ ROOT::VecOps::RVec<float> getFCCAnalysesComposite_anglethrust(ROOT::VecOps::RVec
 }
 
 
-int has_anglethrust_emin(ROOT::VecOps::RVec<float> angle){
+int has_anglethrust_emin(const ROOT::VecOps::RVec<float>& angle){
   for (auto &p:angle)
     if (cos(p)>0.)return 1;
   return -1;
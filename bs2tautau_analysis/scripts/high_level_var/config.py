@@ -21,6 +21,10 @@ folder_dict = {
 
 label_to_color = {value[0]:value[1] for key, value in folder_dict.items()}
 
+#The "label" column stores a small integer per event, the index of the process in label_list (lookup table)
+label_list = [value[0] for value in folder_dict.values()]
+folder_to_id = {folder: i for i, folder in enumerate(folder_dict)}
+
 #If we want to analyze all the (10) chunks, the following line should help
 chunks = [f"chunk_{i}.root" for i in range(10)]
 
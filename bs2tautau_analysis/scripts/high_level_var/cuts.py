@@ -1,9 +1,10 @@
 import os
 import awkward as ak
 import numpy as np
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from config import folder_dict, branchList
+from config import folder_dict, branchList, label_list
 
 #Define some CUTS. You can add some more in case it is needed
 cuts = {
@@ -53,41 +54,74 @@ def apply_single_cut(merged, cuts):
     return filtered_simple_cut
 
 
-def cumulative_efficiencies(merged, cut_group):
-    efficiencies_by_process = {}
-    all_cuts = cut_group #cut_group is a list of dictionaries
+def evaluate_conditions(merged, cut_groups):
+    #Every distinct condition (cut_name, cut_func) is evaluated only once over all the events.
+    #Returns the row of every condition and the boolean matrix (n_conditions x n_events)
+    condition_rows = {}
+    for cut_group in cut_groups.values():
+        for cond_dict in cut_group:
+            for cut_name, cut_func in cond_dict.items():
+                condition_rows.setdefault((cut_name, cut_func), len(condition_rows))
 
-    processes = np.unique(merged["label"].to_list())
+    condition_matrix = np.empty((len(condition_rows), len(merged["label"])), dtype=bool)
+    for (cut_name, cut_func), row in condition_rows.items():
+        condition_matrix[row] = cut_func(ak.to_numpy(merged[cut_name]))
 
-    for process in processes:
-        mask_process = merged["label"] == process
-        total_events = ak.sum(mask_process)  #Number or events for a specific branch
-        #print(f"Total events in {process}: {total_events}")
+    return condition_rows, condition_matrix
 
-        #Filtered data for the process only
-        events_proc = {key: merged[key][mask_process] for key in merged}
 
-        passed_events = events_proc
-        efficiencies = {}
+def cutflow_counts(merged, cut_groups):
+    #Events per process before the cuts and after every cut step of every group: (total_events, {group_name: passed_events})
+    #passed_events has one row per cut step and one column per process id, so the counts of several chunks can be summed up
+    label_ids = ak.to_numpy(merged["label"])
+    total_events = np.bincount(label_ids, minlength=len(label_list))
+
+    condition_rows, condition_matrix = evaluate_conditions(merged, cut_groups)
+
+    passed_by_group = {}
+    for group_name, cut_group in cut_groups.items():
+        passed_events = np.zeros((len(cut_group), len(label_list)))
+        passed = np.ones(len(label_ids), dtype=bool)
 
         #It applies cuts one by one: cut1; cut1 + cut2; cut1+ cut2+ cut3
-        for i, cond_dict in enumerate(all_cuts, start=1):
-            # Each cond_dict has one cut: {cut_name: cut_func}
+        for i, cond_dict in enumerate(cut_group):
             for cut_name, cut_func in cond_dict.items():
-                cut_mask = cut_func(passed_events[cut_name])
-                passed_events = {key: passed_events[key][cut_mask] for key in passed_events}
-                #Apply the cut at the respective branch
+                passed &= condition_matrix[condition_rows[(cut_name, cut_func)]]
 
-            first_key = next(iter(passed_events))
-            efficiency = len(passed_events[first_key])/total_events if total_events > 0 else 0
-            efficiencies[f"{i} cut(s)"] = efficiency
+            passed_events[i] = np.bincount(label_ids, weights=passed, minlength=len(label_list))
+
+        passed_by_group[group_name] = passed_events
+
+    return total_events, passed_by_group
+
+
+def efficiencies_from_counts(total_events, passed_by_group):
+    #Cumulative efficiencies from the output of cutflow_counts: {group_name: {process: {cut_step: eff}}}
+    processes = np.nonzero(total_events)[0]
+
+    efficiencies_by_group = {}
+    for group_name, passed_events in passed_by_group.items():
+        efficiencies_by_process = {label_list[process_id]: {} for process_id in processes}
+        for i, passed_step in enumerate(passed_events, start=1):
+            for process_id in processes:
+                efficiencies_by_process[label_list[process_id]][f"{i} cut(s)"] = passed_step[process_id] / total_events[process_id]
+
+        efficiencies_by_group[group_name] = efficiencies_by_process
 
-        efficiencies_by_process[process] = efficiencies
-        #print(efficiencies_by_process)
-        
     print("\nAll efficiencies were succesfully calculated :D")
 
-    return efficiencies_by_process
+    return efficiencies_by_group
+
+
+def cutflow_efficiencies(merged, cut_groups):
+    #Cumulative efficiencies for all the cut groups and processes in one pass: {group_name: {process: {cut_step: eff}}}
+    #Cuts are combined with bitwise ANDs on the condition matrix and counted per process, no filtered copies are made
+    return efficiencies_from_counts(*cutflow_counts(merged, cut_groups))
+
+
+def cumulative_efficiencies(merged, cut_group):
+    #cut_group is a list of dictionaries
+    return cutflow_efficiencies(merged, {"cut_group": cut_group})["cut_group"]
 
 
 
@@ -106,27 +140,105 @@ def apply_cuts(merged, cuts):
     return filtered
 
 
-def save_filtered_data(filtered, cuts, filtered_path):
-    #Save "filtered" in folder "filter_stage1_data"
+class CutflowAccumulator:
+    """
+    Accumulates the event counts of the data chunk by chunk, so that the counts, the cut reports and the
+    cutflow efficiencies are available without keeping the whole dataset in memory.
+
+    cuts: Dictionary of cuts applied to the filtered data
+    cut_groups: Cut groups of the cutflow efficiencies
+    """
 
+    def __init__(self, cuts, cut_groups):
+        self.cuts = cuts
+        self.cut_groups = cut_groups
+        self.total_events = np.zeros(len(label_list), dtype=np.int64)
+        self.filtered_events = np.zeros(len(label_list), dtype=np.int64)
+        self.passed_by_group = {group_name: np.zeros((len(cut_group), len(label_list)))
+                                for group_name, cut_group in cut_groups.items()}
+
+    def add(self, data):
+        #Counts the events of the chunk and returns the chunk filtered by the cuts
+        total_events, passed_by_group = cutflow_counts(data, self.cut_groups)
+        self.total_events += total_events
+        for group_name, passed_events in passed_by_group.items():
+            self.passed_by_group[group_name] += passed_events
+
+        filtered = apply_cuts(data, self.cuts)
+        self.filtered_events += np.bincount(ak.to_numpy(filtered["label"]), minlength=len(label_list))
+        return filtered
+
+    def pre_cut_counts(self):
+        return {label_list[i]: int(count) for i, count in enumerate(self.total_events) if count > 0}
+
+    def post_cut_counts(self):
+        return {label_list[i]: int(count) for i, count in enumerate(self.filtered_events) if count > 0}
+
+    def efficiencies(self):
+        return efficiencies_from_counts(self.total_events, self.passed_by_group)
+
+
+def filtered_parquet_path(cuts, filtered_path):
     os.makedirs(filtered_path, exist_ok=True)
     cuts_names = "_".join(cuts.keys())
     file_cuts = f"filtered_{cuts_names}.parquet" 
-    parquet_path = os.path.join(filtered_path, file_cuts)
+    return os.path.join(filtered_path, file_cuts)
+
 
-    #Save as Parquet file
-    array_dict = {}
+def to_arrow_table(filtered):
+    #Awkward arrays go straight to Arrow, jagged branches are kept as list columns
+    columns = {}
     for key in filtered:
-        try:
-            array_dict[key] = ak.to_numpy(filtered[key])
-        except Exception:
-            array_dict[key] = ak.to_list(filtered[key])
+        if key == "label":
+            #Stored as dictionary encoded column: integer codes + lookup table
+            columns[key] = pa.DictionaryArray.from_arrays(ak.to_numpy(filtered[key]), pa.array(label_list))
+        else:
+            columns[key] = ak.to_arrow(filtered[key], extensionarray=False)
+    return pa.table(columns)
 
-    df_filtered = pd.DataFrame(array_dict)
-    df_filtered.to_parquet(parquet_path, index=False)
 
-    print (f"\n filtered dataset saved to {parquet_path}")
-    return parquet_path
+class FilteredDataWriter:
+    """
+    Streams filtered data into a single Parquet file, chunk by chunk, so that the whole
+    dataset never has to be held in memory at once. Every written chunk ends up in its own row group(s).
+
+    cuts: Dictionary of cuts applied, used for the file name
+    filtered_path: Directory where the Parquet file is going to be saved
+    row_group_size: Maximal number of events per row group
+    """
+
+    def __init__(self, cuts, filtered_path, row_group_size=100000):
+        self.parquet_path = filtered_parquet_path(cuts, filtered_path)
+        self.row_group_size = row_group_size
+        self.writer = None
+        self.n_events = 0
+
+    def write(self, filtered):
+        table = to_arrow_table(filtered)
+        if self.writer is None:
+            #Schema is taken from the first chunk
+            self.writer = pq.ParquetWriter(self.parquet_path, table.schema)
+        self.writer.write_table(table.cast(self.writer.schema), row_group_size=self.row_group_size)
+        self.n_events += table.num_rows
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        print(f"\n filtered dataset ({self.n_events} events) saved to {self.parquet_path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def save_filtered_data(filtered, cuts, filtered_path):
+    #Save "filtered" in folder "filter_stage1_data"
+    with FilteredDataWriter(cuts, filtered_path) as writer:
+        writer.write(filtered)
+    return writer.parquet_path
 
 """
 How to open this Parquet file and convert to a Pandas DataFrame:
@@ -137,30 +249,27 @@ print(df.head())
 
 
 
-def print_efficiencies(pre_cut_counts, filtered):
-    unique_labels = np.unique(filtered["label"].to_list())
-    
+def print_efficiencies(pre_cut_counts, post_cut_counts):
+    #post_cut_counts: Events per process after the cuts, e.g. count_per_process(filtered["label"])
     print("\nAfter cuts:")
-    print(f"Total events: {len(filtered['label'])}")
+    print(f"Total events: {sum(post_cut_counts.values())}")
     
     #We have to check how much statistics we have in the plots (in other words how many events per process are we considering)
 
-    for label in unique_labels:
-        mask = filtered["label"] == label
-        count_after = ak.sum(mask)
+    for label, count_after in post_cut_counts.items():
         count_before = pre_cut_counts[label]
         percent = 100 * count_after / count_before if count_before > 0 else 0 
         print(f"Process: {label}; total number of events: {count_after}({percent:.2f}%)")
 
 
-def write_cut_reports(cuts, pre_cut_counts, filtered, report_dir, base_name ="cut_report"):
+def write_cut_reports(cuts, pre_cut_counts, post_cut_counts, report_dir, base_name ="cut_report"):
     """
     This block/definition writes a report as a txt file. It gives information about the applied cuts,
     event counts (before and after) and efficiencies
 
     cuts: Dictionary of cuts applied (with lambda x function)
     pre_cut_counts: It counts the total events before any cut was applied (label: count)
-    merged: This is the whole information/data where the cuts are being applied
+    post_cut_counts: It counts the events after the cuts were applied (label: count)
     report_dir: This is the directory where the reports are going to be saved
     base_name: base filename for the report (cut_report)
     """
@@ -173,12 +282,9 @@ def write_cut_reports(cuts, pre_cut_counts, filtered, report_dir, base_name ="cu
     filename = f"{base_name}_{cuts_names}.txt"
     filepath = os.path.join(report_dir, filename) 
 
-    #Counts the number of events after the cut was performed
+    #Processes without events left after the cuts are reported with 0
     unique_labels = list(pre_cut_counts.keys())
-    post_cut_counts = {}
-    for label in unique_labels:
-        mask = filtered["label"] == label
-        post_cut_counts[label] = ak.sum(mask)
+    post_cut_counts = {label: post_cut_counts.get(label, 0) for label in unique_labels}
 
     #Write the txt file
     with open(filepath, "w") as f:
@@ -2,10 +2,11 @@ import os
 import awkward as ak
 import numpy as np
 import uproot
-import ROOT
 import glob
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from config import folder_dict, chunks, tree_name, branchList
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from config import folder_dict, chunks, tree_name, branchList, label_list, folder_to_id
 
 def count_original_events(base_path, tree_name = "events"):
     event_counts = {}
@@ -37,38 +38,54 @@ def load_and_extract(folder, chunk, tree_name=tree_name):
     path_saved_files = f"/ceph/asifuentes/FCCee/bs2tautau/fcc_stage1_output/analysis_test/"  
     complete_path = os.path.join(path_saved_files, folder, chunk)
 
-    dataframe = ROOT.RDataFrame(tree_name, complete_path)
+    #Read all the branches in one pass, directly into awkward arrays (no copies)
+    with uproot.open(complete_path) as file:
+        tree = file[tree_name]
+        branches = []
+        for branch in branchList:
+            if branch in tree:
+                branches.append(branch)
+            else:
+                print(f"Branch {branch} not found in {complete_path}")
+        arrays = tree.arrays(branches, library="ak")
 
-    data = {}
-    for branch, properties in branchList.items():
-        branch_data = dataframe.AsNumpy([branch])
-        if branch_data:
-            data[branch] = ak.from_iter(branch_data[branch])
-        else:
-            print(f"Branch {branch} not found in {complete_path}")
+    data = {branch: arrays[branch] for branch in branches}
 
-    label = folder_dict.get(folder, ["unknown", "#000000"])[0]
     if data:
         first_branch = next(iter(data))
-        data["label"] = ak.Array([label] * len(data[first_branch]))
+        data["label"] = ak.from_numpy(np.full(len(data[first_branch]), folder_to_id[folder], dtype=np.int8))
     return data
 
 
-def load_all_data(folder_dict, chunks, tree_name):
-    tasks = [(folder, chunk) for folder in folder_dict for chunk in chunks]
+def load_all_data(folder_dict, chunks, tree_name, on_chunk=None, keep_data=True):
+    #on_chunk (optional) is called with the data of every chunk, in the order of the folders and chunks
+    #With keep_data=False the chunks are not collected, only a few per worker are loaded ahead and held in memory
+    tasks = iter([(folder, chunk) for folder in folder_dict for chunk in chunks])
     all_data = []
+    n_workers = os.cpu_count()
 
-    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
-        futures = {executor.submit(load_and_extract, folder, chunk): (folder, chunk) for folder, chunk in tasks}
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        pending = deque()
+        for folder, chunk in itertools.islice(tasks, 2 * n_workers):
+            pending.append((folder, chunk, executor.submit(load_and_extract, folder, chunk)))
+
+        while pending:
+            folder, chunk, future = pending.popleft()
+            for next_folder, next_chunk in itertools.islice(tasks, 1):
+                pending.append((next_folder, next_chunk, executor.submit(load_and_extract, next_folder, next_chunk)))
 
-        for future in as_completed(futures):
-            folder, chunk = futures[future]
             try:
                 result = future.result()
-                if result:
-                    all_data.append(result)
             except Exception as e:
                 print(f"Error loading {folder}/{chunk}: {e}")
+                continue
+            if not result:
+                continue
+
+            if keep_data:
+                all_data.append(result)
+            if on_chunk is not None:
+                on_chunk(result)
     return all_data
 
 
@@ -76,14 +93,19 @@ def merge_data(all_data):
     return {key: ak.concatenate([d[key] for d in all_data]) for key in list(all_data[0].keys())}
 
 
+def count_per_process(label_ids):
+    #Number of events per process (label: count), only for the processes present
+    counts = np.bincount(ak.to_numpy(label_ids), minlength=len(label_list))
+    return {label_list[i]: int(count) for i, count in enumerate(counts) if count > 0}
+
+
+def print_event_counts(pre_cut_counts):
+    for label, count in pre_cut_counts.items():
+        print(f"Process {label}: total number of events: {count}")
+    print(f"Total events: {sum(pre_cut_counts.values())}")
+
+
 def count_events(merged_data):
-    from collections import defaultdict
-    pre_cut_counts = defaultdict(int)
-
-    unique_labels = np.unique(merged_data["label"].to_list())
-    for label in unique_labels:
-        mask = merged_data["label"] == label
-        pre_cut_counts[label] = ak.sum(mask)
-        print(f"Process {label}: total number of events: {pre_cut_counts[label]}")
-    print(f"Total events: {len(merged_data['label'])}")
+    pre_cut_counts = count_per_process(merged_data["label"])
+    print_event_counts(pre_cut_counts)
     return pre_cut_counts
@@ -1,16 +1,18 @@
 import os
 import numpy as np
+import awkward as ak
 import matplotlib.pyplot as plt
 
 # Import config variables
-from config import folder_dict, branchList, label_to_color
+from config import folder_dict, branchList, label_to_color, label_list
 from cuts import cuts, cut_groups, calculate_simple_efficiency, apply_single_cut, cumulative_efficiencies
 
 def plot_variable(varname, filtered, pre_cut_counts, post_cut_counts, log_y, suffix):
     """
     Plot one variable comparing signal and background from merged data dictionary.
     """
-    unique_labels = np.unique(filtered["label"].to_list())
+    label_ids = ak.to_numpy(filtered["label"])
+    unique_ids = np.unique(label_ids)
 
     # Path to save the figure
     cuts_names = "_".join(cuts.keys())
@@ -25,7 +27,8 @@ def plot_variable(varname, filtered, pre_cut_counts, post_cut_counts, log_y, suf
 
     plt.figure(figsize=(8, 5))
 
-    for process_label in unique_labels:
+    for process_id in unique_ids:
+        process_label = label_list[process_id]
         try:
             folder_key = next(key for key, (label, _) in folder_dict.items() if label == process_label)
         except StopIteration:
@@ -33,7 +36,7 @@ def plot_variable(varname, filtered, pre_cut_counts, post_cut_counts, log_y, suf
             continue
         color = folder_dict[folder_key][1]
 
-        mask = filtered["label"] == process_label
+        mask = label_ids == process_id
         x_data = np.array(filtered[varname][mask])
         n_events = len(x_data)
         if n_events == 0:
@@ -72,9 +72,10 @@ class analysis():
                 dict_outputBranchName_function["%s_eta"%cellBranchName] = "CaloNtupleizer::getCaloHit_eta(%s)"%cellBranchName
                 dict_outputBranchName_function["%s_energy"%cellBranchName] = "CaloNtupleizer::getCaloHit_energy(%s)"%cellBranchName
                 if args.useGeometry:
-                    dict_outputBranchName_function["%s_phiBin"%cellBranchName] = "CaloNtupleizer::getCaloHit_phiBin(%s)"%cellBranchName
-                    dict_outputBranchName_function["%s_layer"%cellBranchName] = "CaloNtupleizer::getCaloHit_layer(%s)"%cellBranchName
-                    dict_outputBranchName_function["%s_etaBin"%cellBranchName] = "CaloNtupleizer::getCaloHit_etaBin(%s)"%cellBranchName
+                    dict_outputBranchName_function["%s_bins_transient"%cellBranchName] = "CaloNtupleizer::getCaloHit_layerEtaPhiBins(%s)"%cellBranchName
+                    dict_outputBranchName_function["%s_phiBin"%cellBranchName] = "%s_bins_transient[2]"%cellBranchName
+                    dict_outputBranchName_function["%s_layer"%cellBranchName] = "%s_bins_transient[0]"%cellBranchName
+                    dict_outputBranchName_function["%s_etaBin"%cellBranchName] = "%s_bins_transient[1]"%cellBranchName
 
         # clusters
         if args.storeClusterBranches:
@@ -100,9 +101,10 @@ class analysis():
                 dict_outputBranchName_function["%s_eta"%clusterCellsBranchName] = "CaloNtupleizer::getCaloHit_eta(%s)"%clusterCellsBranchName
                 dict_outputBranchName_function["%s_energy"%clusterCellsBranchName] = "CaloNtupleizer::getCaloHit_energy(%s)"%clusterCellsBranchName
                 if args.useGeometry:
-                    dict_outputBranchName_function["%s_phiBin"%clusterCellsBranchName] = "CaloNtupleizer::getCaloHit_phiBin(%s)"%clusterCellsBranchName
-                    dict_outputBranchName_function["%s_layer"%clusterCellsBranchName] = "CaloNtupleizer::getCaloHit_layer(%s)"%clusterCellsBranchName
-                    dict_outputBranchName_function["%s_etaBin"%clusterCellsBranchName] = "CaloNtupleizer::getCaloHit_etaBin(%s)"%clusterCellsBranchName
+                    dict_outputBranchName_function["%s_bins_transient"%clusterCellsBranchName] = "CaloNtupleizer::getCaloHit_layerEtaPhiBins(%s)"%clusterCellsBranchName
+                    dict_outputBranchName_function["%s_phiBin"%clusterCellsBranchName] = "%s_bins_transient[2]"%clusterCellsBranchName
+                    dict_outputBranchName_function["%s_layer"%clusterCellsBranchName] = "%s_bins_transient[0]"%clusterCellsBranchName
+                    dict_outputBranchName_function["%s_etaBin"%clusterCellsBranchName] = "%s_bins_transient[1]"%clusterCellsBranchName
 
         # SimParticleSecondaries
         if args.storeSimParticleSecondaries:
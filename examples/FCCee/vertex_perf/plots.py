@@ -1,20 +1,24 @@
 import ROOT as r
-from math import sqrt
+import vertexing_validation
 r.gROOT.Reset()
 r.gROOT.SetBatch(True)
 r.gROOT.ForceStyle()
 r.gStyle.SetOptStat(0)
+r.EnableImplicitMT()
 
 
-f = r.TFile("/afs/cern.ch/user/h/helsens/FCCsoft/HEP-FCC/FCCAnalyses/flat_ee_Zbb_vertexPerf.root")
-f = r.TFile("/eos/experiment/fcc/ee/tmp/flat_ee_Zbb_VertexPerf.root")
-tree = f.Get("events")
+#infile = "/afs/cern.ch/user/h/helsens/FCCsoft/HEP-FCC/FCCAnalyses/flat_ee_Zbb_vertexPerf.root"
+infile = "/eos/experiment/fcc/ee/tmp/flat_ee_Zbb_VertexPerf.root"
+df = r.RDataFrame("events", infile)
+
+#all the histograms are filled in one event loop over the full sample
+hists = vertexing_validation.run(vertexing_validation.book_histograms(df))
 
 fout = r.TFile("forDonal.root","RECREATE")
 
 #--------------------------------------------#
 #--------------------------------------------#
-#     Plots that do not need event loop      #
+#   Plots of the vertex collections sizes    #
 #--------------------------------------------#
 #--------------------------------------------#
 
@@ -26,11 +30,8 @@ fout = r.TFile("forDonal.root","RECREATE")
 
 ###################################################
 #All vertex
-h_mc = r.TH1F("h_mc",";N vertex;", 20,0,20)
-tree.Draw("MC_Vertex_n>> h_mc")
-
-h_reco = r.TH1F("h_reco",";N vertex;", 20,0,20)
-tree.Draw("Vertex_n>> h_reco")
+h_mc = hists["h_mc_all"]
+h_reco = hists["h_reco"]
 
 can = r.TCanvas("can","can")
 h_reco.SetLineColor(4)
@@ -65,327 +66,142 @@ can.SaveAs("plots/png/nVertex.png")
 
 #--------------------------------------------#
 #--------------------------------------------#
-#       Plots that do need event loop        #
+#       Plots of the vertex properties       #
 #--------------------------------------------#
 #--------------------------------------------#
 
 
-h_mc   = r.TH1F("h_mc",";N vertex;", 20,0,20)
-h_recoChi2Cut = r.TH1F("h_recoChi2Cut",";N vertex;", 20,0,20)
-
-h_ntrk_mc_pv = r.TH1F("h_ntrk_mc_pv",";N tracks PV;", 30,0,30)
-h_ntrk_rc_pv = r.TH1F("h_ntrk_rc_pv",";N tracks PV;", 30,0,30)
-h_ntrk_mc_sv = r.TH1F("h_ntrk_mc_sv",";N tracks SV;", 10,0,10)
-h_ntrk_rc_sv = r.TH1F("h_ntrk_rc_sv",";N tracks SV;", 10,0,10)
-
-h_nSV_mc_2trk = r.TH1F("h_nSV_mc_2trk",";N vertex;", 10,0,10)
-h_nSV_rc_2trk = r.TH1F("h_nSV_rc_2trk",";N vertex;", 10,0,10)
-h_nSV_mc_3trk = r.TH1F("h_nSV_mc_3trk",";N vertex;", 10,0,10)
-h_nSV_rc_3trk = r.TH1F("h_nSV_rc_3trk",";N vertex;", 10,0,10)
-h_nSV_mc_4trk = r.TH1F("h_nSV_mc_4trk",";N vertex;", 10,0,10)
-h_nSV_rc_4trk = r.TH1F("h_nSV_rc_4trk",";N vertex;", 10,0,10)
-h_nSV_mc_5trk = r.TH1F("h_nSV_mc_5trk",";N vertex;", 10,0,10)
-h_nSV_rc_5trk = r.TH1F("h_nSV_rc_5trk",";N vertex;", 10,0,10)
-h_nSV_mc_6trk = r.TH1F("h_nSV_mc_6trk",";N vertex;", 10,0,10)
-h_nSV_rc_6trk = r.TH1F("h_nSV_rc_6trk",";N vertex;", 10,0,10)
-
-h_recoeff_SV_2trk = r.TH1F("h_recoeff_SV_2trk",";N tracks MC;", 10,0,10)
-h_recoeff_SV_3trk = r.TH1F("h_recoeff_SV_3trk",";N tracks MC;", 10,0,10)
-h_recoeff_SV_4trk = r.TH1F("h_recoeff_SV_4trk",";N tracks MC;", 10,0,10)
-h_recoeff_SV_5trk = r.TH1F("h_recoeff_SV_5trk",";N tracks MC;", 10,0,10)
-h_recoeff_SV_6trk = r.TH1F("h_recoeff_SV_6trk",";N tracks MC;", 10,0,10)
-
-
-h_PV2MC   = r.TH1F("h_PV2MC",";Distance to MC primary vertex #mum;", 200,0,200)
-h_PV2MC_x = r.TH1F("h_PV2MC_x",";Distance to MC primary vertex x #mum;", 200,-100, 100)
-h_PV2MC_y = r.TH1F("h_PV2MC_y",";Distance to MC primary vertex y #mum;", 200,-100, 100)
-h_PV2MC_z = r.TH1F("h_PV2MC_z",";Distance to MC primary vertex z #mum;", 200,-100, 100)
-
-h_PV2MC_x_pull = r.TH1F("h_PV2MC_x_pull",";Primary Vertex pull x;", 200,-10, 10)
-h_PV2MC_y_pull = r.TH1F("h_PV2MC_y_pull",";Primary Vertex pull y;", 200,-10, 10)
-h_PV2MC_z_pull = r.TH1F("h_PV2MC_z_pull",";Primary Vertex pull z;", 200,-10, 10)
-
-h_SV2MC_x_pull_2trk = r.TH1F("h_PV2MC_x_pull_2trk",";Secondary Vertex pull x (N tracks = 2);", 200,-10, 10)
-h_SV2MC_y_pull_2trk = r.TH1F("h_PV2MC_y_pull_2trk",";Secondary Vertex pull y (N tracks = 2);", 200,-10, 10)
-h_SV2MC_z_pull_2trk = r.TH1F("h_PV2MC_z_pull_2trk",";Secondary Vertex pull z (N tracks = 2);", 200,-10, 10)
-
-h_SV2MC_x_pull_3trk = r.TH1F("h_PV2MC_x_pull_3trk",";Secondary Vertex pull x (N tracks = 3);", 200,-10, 10)
-h_SV2MC_y_pull_3trk = r.TH1F("h_PV2MC_y_pull_3trk",";Secondary Vertex pull y (N tracks = 3);", 200,-10, 10)
-h_SV2MC_z_pull_3trk = r.TH1F("h_PV2MC_z_pull_3trk",";Secondary Vertex pull z (N tracks = 3);", 200,-10, 10)
-
-h_SV2MC_x_pull_4trk = r.TH1F("h_PV2MC_x_pull_4trk",";Secondary Vertex pull x (N tracks = 4);", 200,-10, 10)
-h_SV2MC_y_pull_4trk = r.TH1F("h_PV2MC_y_pull_4trk",";Secondary Vertex pull y (N tracks = 4);", 200,-10, 10)
-h_SV2MC_z_pull_4trk = r.TH1F("h_PV2MC_z_pull_4trk",";Secondary Vertex pull z (N tracks = 4);", 200,-10, 10)
-
-h_SV2MC_x_pull_5trk = r.TH1F("h_PV2MC_x_pull_5trk",";Secondary Vertex pull x (N tracks = 5);", 200,-10, 10)
-h_SV2MC_y_pull_5trk = r.TH1F("h_PV2MC_y_pull_5trk",";Secondary Vertex pull y (N tracks = 5);", 200,-10, 10)
-h_SV2MC_z_pull_5trk = r.TH1F("h_PV2MC_z_pull_5trk",";Secondary Vertex pull z (N tracks = 5);", 200,-10, 10)
-
-h_SV2MC_x_pull_6trk = r.TH1F("h_PV2MC_x_pull_6trk",";Secondary Vertex pull x (N tracks = 6);", 200,-10, 10)
-h_SV2MC_y_pull_6trk = r.TH1F("h_PV2MC_y_pull_6trk",";Secondary Vertex pull y (N tracks = 6);", 200,-10, 10)
-h_SV2MC_z_pull_6trk = r.TH1F("h_PV2MC_z_pull_6trk",";Secondary Vertex pull z (N tracks = 6);", 200,-10, 10)
-
-h_SV2MC_2trk  = r.TH1F("h_SV2MC_2trk",";Distance to MC secondary vertex #mum;", 200,0,200)
-h_SV2MC_3trk  = r.TH1F("h_SV2MC_3trk",";Distance to MC secondary vertex #mum;", 200,0,200)
-h_SV2MC_4trk  = r.TH1F("h_SV2MC_4trk",";Distance to MC secondary vertex #mum;", 200,0,200)
-h_SV2MC_5trk  = r.TH1F("h_SV2MC_5trk",";Distance to MC secondary vertex #mum;", 200,0,200)
-h_SV2MC_6trk  = r.TH1F("h_SV2MC_6trk",";Distance to MC secondary vertex #mum;", 200,0,200)
-
-h_SV2MC_x_2trk  = r.TH1F("h_SV2MC_x_2trk",";Distance to MC secondary vertex x #mum;", 200,-100,100)
-h_SV2MC_x_3trk  = r.TH1F("h_SV2MC_x_3trk",";Distance to MC secondary vertex x #mum;", 200,-100,100)
-h_SV2MC_x_4trk  = r.TH1F("h_SV2MC_x_4trk",";Distance to MC secondary vertex x #mum;", 200,-100,100)
-h_SV2MC_x_5trk  = r.TH1F("h_SV2MC_x_5trk",";Distance to MC secondary vertex x #mum;", 200,-100,100)
-h_SV2MC_x_6trk  = r.TH1F("h_SV2MC_x_6trk",";Distance to MC secondary vertex x #mum;", 200,-100,100)
-
-h_SV2MC_y_2trk  = r.TH1F("h_SV2MC_y_2trk",";Distance to MC secondary vertex y #mum;", 200,-100,100)
-h_SV2MC_y_3trk  = r.TH1F("h_SV2MC_y_3trk",";Distance to MC secondary vertex y #mum;", 200,-100,100)
-h_SV2MC_y_4trk  = r.TH1F("h_SV2MC_y_4trk",";Distance to MC secondary vertex y #mum;", 200,-100,100)
-h_SV2MC_y_5trk  = r.TH1F("h_SV2MC_y_5trk",";Distance to MC secondary vertex y #mum;", 200,-100,100)
-h_SV2MC_y_6trk  = r.TH1F("h_SV2MC_y_6trk",";Distance to MC secondary vertex y #mum;", 200,-100,100)
-
-h_SV2MC_z_2trk  = r.TH1F("h_SV2MC_z_2trk",";Distance to MC secondary vertex z #mum;", 200,-100,100)
-h_SV2MC_z_3trk  = r.TH1F("h_SV2MC_z_3trk",";Distance to MC secondary vertex z #mum;", 200,-100,100)
-h_SV2MC_z_4trk  = r.TH1F("h_SV2MC_z_4trk",";Distance to MC secondary vertex z #mum;", 200,-100,100)
-h_SV2MC_z_5trk  = r.TH1F("h_SV2MC_z_5trk",";Distance to MC secondary vertex z #mum;", 200,-100,100)
-h_SV2MC_z_6trk  = r.TH1F("h_SV2MC_z_6trk",";Distance to MC secondary vertex z #mum;", 200,-100,100)
-
-
-h_FD2PV_2trk = r.TH1F("h_FD2PV_2trk",";Flight distance from PV 2 tracks mm;", 200,0,10)
-h_FD2PV_3trk = r.TH1F("h_FD2PV_3trk",";Flight distance from PV 3 tracks mm;", 200,0,10)
-h_FD2PV_4trk = r.TH1F("h_FD2PV_4trk",";Flight distance from PV 4 tracks mm;", 200,0,10)
-h_FD2PV_5trk = r.TH1F("h_FD2PV_5trk",";Flight distance from PV 5 tracks mm;", 200,0,10)
-h_FD2PV_6trk = r.TH1F("h_FD2PV_6trk",";Flight distance from PV 6 tracks mm;", 200,0,10)
-
-h_FD2PV_x_2trk = r.TH1F("h_FD2PV_x_2trk",";Flight distance x from PV 2 tracks mm;", 200,-10,10)
-h_FD2PV_x_3trk = r.TH1F("h_FD2PV_x_3trk",";Flight distance x from PV 3 tracks mm;", 200,-10,10)
-h_FD2PV_x_4trk = r.TH1F("h_FD2PV_x_4trk",";Flight distance x from PV 4 tracks mm;", 200,-10,10)
-h_FD2PV_x_5trk = r.TH1F("h_FD2PV_x_5trk",";Flight distance x from PV 5 tracks mm;", 200,-10,10)
-h_FD2PV_x_6trk = r.TH1F("h_FD2PV_x_6trk",";Flight distance x from PV 6 tracks mm;", 200,-10,10)
-
-h_FD2PV_y_2trk = r.TH1F("h_FD2PV_y_2trk",";Flight distance y from PV 2 tracks mm;", 200,-10,10)
-h_FD2PV_y_3trk = r.TH1F("h_FD2PV_y_3trk",";Flight distance y from PV 3 tracks mm;", 200,-10,10)
-h_FD2PV_y_4trk = r.TH1F("h_FD2PV_y_4trk",";Flight distance y from PV 4 tracks mm;", 200,-10,10)
-h_FD2PV_y_5trk = r.TH1F("h_FD2PV_y_5trk",";Flight distance y from PV 5 tracks mm;", 200,-10,10)
-h_FD2PV_y_6trk = r.TH1F("h_FD2PV_y_6trk",";Flight distance y from PV 6 tracks mm;", 200,-10,10)
-
-h_FD2PV_z_2trk = r.TH1F("h_FD2PV_z_2trk",";Flight distance z from PV 2 tracks mm;", 200,-10,10)
-h_FD2PV_z_3trk = r.TH1F("h_FD2PV_z_3trk",";Flight distance z from PV 3 tracks mm;", 200,-10,10)
-h_FD2PV_z_4trk = r.TH1F("h_FD2PV_z_4trk",";Flight distance z from PV 4 tracks mm;", 200,-10,10)
-h_FD2PV_z_5trk = r.TH1F("h_FD2PV_z_5trk",";Flight distance z from PV 5 tracks mm;", 200,-10,10)
-h_FD2PV_z_6trk = r.TH1F("h_FD2PV_z_6trk",";Flight distance z from PV 6 tracks mm;", 200,-10,10)
-
-h_FD2PV_2trk_sig = r.TH1F("h_FD2PV_2trk_sig",";Flight distance significance from PV 2 tracks;", 200,0,50)
-h_FD2PV_3trk_sig = r.TH1F("h_FD2PV_3trk_sig",";Flight distance significance from PV 3 tracks;", 200,0,50)
-h_FD2PV_4trk_sig = r.TH1F("h_FD2PV_4trk_sig",";Flight distance significance from PV 4 tracks;", 200,0,50)
-h_FD2PV_5trk_sig = r.TH1F("h_FD2PV_5trk_sig",";Flight distance significance from PV 5 tracks;", 200,0,50)
-h_FD2PV_6trk_sig = r.TH1F("h_FD2PV_6trk_sig",";Flight distance significance from PV 6 tracks;", 200,0,50)
-
-h_FD2PV_x_2trk_sig = r.TH1F("h_FD2PV_x_2trk_sig",";Flight distance significance x from PV 2 tracks;", 200,-50,50)
-h_FD2PV_x_3trk_sig = r.TH1F("h_FD2PV_x_3trk_sig",";Flight distance significance x from PV 3 tracks;", 200,-50,50)
-h_FD2PV_x_4trk_sig = r.TH1F("h_FD2PV_x_4trk_sig",";Flight distance significance x from PV 4 tracks;", 200,-50,50)
-h_FD2PV_x_5trk_sig = r.TH1F("h_FD2PV_x_5trk_sig",";Flight distance significance x from PV 5 tracks;", 200,-50,50)
-h_FD2PV_x_6trk_sig = r.TH1F("h_FD2PV_x_6trk_sig",";Flight distance significance x from PV 6 tracks;", 200,-50,50)
-
-h_FD2PV_y_2trk_sig = r.TH1F("h_FD2PV_y_2trk_sig",";Flight distance significance y from PV 2 tracks;", 200,-50,50)
-h_FD2PV_y_3trk_sig = r.TH1F("h_FD2PV_y_3trk_sig",";Flight distance significance y from PV 3 tracks;", 200,-50,50)
-h_FD2PV_y_4trk_sig = r.TH1F("h_FD2PV_y_4trk_sig",";Flight distance significance y from PV 4 tracks;", 200,-50,50)
-h_FD2PV_y_5trk_sig = r.TH1F("h_FD2PV_y_5trk_sig",";Flight distance significance y from PV 5 tracks;", 200,-50,50)
-h_FD2PV_y_6trk_sig = r.TH1F("h_FD2PV_y_6trk_sig",";Flight distance significance y from PV 6 tracks;", 200,-50,50)
-
-h_FD2PV_z_2trk_sig = r.TH1F("h_FD2PV_z_2trk_sig",";Flight distance significance z from PV 2 tracks;", 200,-50,50)
-h_FD2PV_z_3trk_sig = r.TH1F("h_FD2PV_z_3trk_sig",";Flight distance significance z from PV 3 tracks;", 200,-50,50)
-h_FD2PV_z_4trk_sig = r.TH1F("h_FD2PV_z_4trk_sig",";Flight distance significance z from PV 4 tracks;", 200,-50,50)
-h_FD2PV_z_5trk_sig = r.TH1F("h_FD2PV_z_5trk_sig",";Flight distance significance z from PV 5 tracks;", 200,-50,50)
-h_FD2PV_z_6trk_sig = r.TH1F("h_FD2PV_z_6trk_sig",";Flight distance significance z from PV 6 tracks;", 200,-50,50)
-
-
-h_dmin_DV2DV = r.TH1F("h_dmin_DV2DV",";Minimum distance between DV #mum;", 200,0,5000)
-h_dmin_PV2DV = r.TH1F("h_dmin_PV2DV",";Minimum distance between PV and DV #mum;", 200,0,10000)
-
-nentries=tree.GetEntries()
-centry=0
-for entry in tree:
-    if centry%1000==1:print('entry : ',centry,'/',nentries)
-    centry+=1
-    if centry>200000.:break
-    #MC vertex with at least 2 tracks
-    nvx=0
-    nsv2,nsv3,nsv4,nsv5,nsv6=0,0,0,0,0
-    for v in range(entry.MC_Vertex_ntrk.size()):
-        if entry.MC_Vertex_ntrk.at(v)>1: nvx+=1
-
-        if v==0: h_ntrk_mc_pv.Fill(entry.MC_Vertex_ntrk.at(v))
-        else:    h_ntrk_mc_sv.Fill(entry.MC_Vertex_ntrk.at(v))
-
-        if   v!=0 and entry.MC_Vertex_ntrk.at(v)==2: nsv2+=1
-        elif v!=0 and entry.MC_Vertex_ntrk.at(v)==3: nsv3+=1
-        elif v!=0 and entry.MC_Vertex_ntrk.at(v)==4: nsv4+=1
-        elif v!=0 and entry.MC_Vertex_ntrk.at(v)==5: nsv5+=1
-        elif v!=0 and entry.MC_Vertex_ntrk.at(v)==6: nsv6+=1
-
-    h_mc.Fill(nvx)
-
-    h_nSV_mc_2trk.Fill(nsv2)
-    h_nSV_mc_3trk.Fill(nsv3)
-    h_nSV_mc_4trk.Fill(nsv4)
-    h_nSV_mc_5trk.Fill(nsv5)
-    h_nSV_mc_6trk.Fill(nsv6)
-    
-    PV_x,PV_y,PV_z=0,0,0
-    minPV2DV=999999999999.
-    for v in range(entry.Vertex_chi2.size()):
-        if entry.Vertex_chi2.at(v)>0 and entry.Vertex_chi2.at(v)<10:
-            if entry.Vertex_isPV.at(v)>0:
-                PV_x,PV_y,PV_z=entry.Vertex_x.at(v),entry.Vertex_y.at(v),entry.Vertex_z.at(v)
-                break
-    for v in range(entry.Vertex_chi2.size()):
-        if entry.Vertex_chi2.at(v)>0 and entry.Vertex_chi2.at(v)<10 and entry.Vertex_isPV.at(v)==0:
-            distancetmp=sqrt((PV_x-entry.Vertex_x.at(v))*(PV_x-entry.Vertex_x.at(v))+
-                             (PV_y-entry.Vertex_y.at(v))*(PV_y-entry.Vertex_y.at(v))+
-                             (PV_z-entry.Vertex_z.at(v))*(PV_z-entry.Vertex_z.at(v)))
-            if distancetmp<minPV2DV: minPV2DV=distancetmp
-    if minPV2DV!=999999999999.: h_dmin_PV2DV.Fill(minPV2DV*1000.)
- 
-
-    minDV2DV=999999999999.
-    for v in range(entry.Vertex_chi2.size()):
-        if entry.Vertex_chi2.at(v)>0 and entry.Vertex_chi2.at(v)<10 and entry.Vertex_isPV.at(v)==0:
-            DV1_x,DV1_y,DV1_z=entry.Vertex_x.at(v),entry.Vertex_y.at(v),entry.Vertex_z.at(v)
-            for w in range(entry.Vertex_chi2.size()):
-                if w==v:continue
-                if entry.Vertex_chi2.at(w)>0 and entry.Vertex_chi2.at(w)<10 and entry.Vertex_isPV.at(w)==0:
-                    DV2_x,DV2_y,DV2_z=entry.Vertex_x.at(w),entry.Vertex_y.at(w),entry.Vertex_z.at(w)
-                    distancetmp=sqrt((DV1_x-DV2_x)*(DV1_x-DV2_x)+
-                                     (DV1_y-DV2_y)*(DV1_y-DV2_y)+
-                                     (DV1_z-DV2_z)*(DV1_z-DV2_z))
-                    if distancetmp<minDV2DV: minDV2DV=distancetmp
-    if minDV2DV!=999999999999.: h_dmin_DV2DV.Fill(minDV2DV*1000.)
- 
-
-   
-    #Reco vertex with chi2>0 and <10
-    nvx=0
-    nsv2,nsv3,nsv4,nsv5,nsv6=0,0,0,0,0
-    for v in range(entry.Vertex_chi2.size()):
-        if entry.Vertex_chi2.at(v)>0 and entry.Vertex_chi2.at(v)<10:
-            nvx+=1
-            if entry.Vertex_isPV.at(v)>0:
-                h_PV2MC.Fill(entry.Vertex_d2MC.at(v)*1000.)
-                h_PV2MC_x.Fill(entry.Vertex_d2MCx.at(v)*1000.)
-                h_PV2MC_y.Fill(entry.Vertex_d2MCy.at(v)*1000.)
-                h_PV2MC_z.Fill(entry.Vertex_d2MCz.at(v)*1000.)
-                h_PV2MC_x_pull.Fill(entry.Vertex_d2MCx.at(v)/entry.Vertex_xErr.at(v))
-                h_PV2MC_y_pull.Fill(entry.Vertex_d2MCy.at(v)/entry.Vertex_yErr.at(v))
-                h_PV2MC_z_pull.Fill(entry.Vertex_d2MCz.at(v)/entry.Vertex_zErr.at(v))
-            else:
-                mcind=entry.Vertex_mcind.at(v)
-                if entry.Vertex_ntrk.at(v)==2:
-                    h_SV2MC_2trk.Fill(entry.Vertex_d2MC.at(v)*1000.)
-                    h_SV2MC_x_2trk.Fill(entry.Vertex_d2MCx.at(v)*1000.)
-                    h_SV2MC_y_2trk.Fill(entry.Vertex_d2MCy.at(v)*1000.)
-                    h_SV2MC_z_2trk.Fill(entry.Vertex_d2MCz.at(v)*1000.)
-                    h_recoeff_SV_2trk.Fill(entry.MC_Vertex_ntrk.at(entry.Vertex_mcind.at(v)))
-                    h_SV2MC_x_pull_2trk.Fill(entry.Vertex_d2MCx.at(v)/entry.Vertex_xErr.at(v))
-                    h_SV2MC_y_pull_2trk.Fill(entry.Vertex_d2MCy.at(v)/entry.Vertex_yErr.at(v))
-                    h_SV2MC_z_pull_2trk.Fill(entry.Vertex_d2MCz.at(v)/entry.Vertex_zErr.at(v))
-                    h_FD2PV_2trk.Fill(entry.Vertex_d2PV.at(v))
-                    h_FD2PV_x_2trk.Fill(entry.Vertex_d2PVx.at(v))
-                    h_FD2PV_y_2trk.Fill(entry.Vertex_d2PVy.at(v))
-                    h_FD2PV_z_2trk.Fill(entry.Vertex_d2PVz.at(v))
-                    h_FD2PV_2trk_sig.Fill(entry.Vertex_d2PVSig.at(v))
-                    h_FD2PV_x_2trk_sig.Fill(entry.Vertex_d2PVxSig.at(v))
-                    h_FD2PV_y_2trk_sig.Fill(entry.Vertex_d2PVySig.at(v))
-                    h_FD2PV_z_2trk_sig.Fill(entry.Vertex_d2PVzSig.at(v))
-                elif entry.Vertex_ntrk.at(v)==3:
-                    h_SV2MC_3trk.Fill(entry.Vertex_d2MC.at(v)*1000.)
-                    h_SV2MC_x_3trk.Fill(entry.Vertex_d2MCx.at(v)*1000.)
-                    h_SV2MC_y_3trk.Fill(entry.Vertex_d2MCy.at(v)*1000.)
-                    h_SV2MC_z_3trk.Fill(entry.Vertex_d2MCz.at(v)*1000.)
-                    h_recoeff_SV_3trk.Fill(entry.MC_Vertex_ntrk.at(entry.Vertex_mcind.at(v)))
-                    h_SV2MC_x_pull_3trk.Fill(entry.Vertex_d2MCx.at(v)/entry.Vertex_xErr.at(v))
-                    h_SV2MC_y_pull_3trk.Fill(entry.Vertex_d2MCy.at(v)/entry.Vertex_yErr.at(v))
-                    h_SV2MC_z_pull_3trk.Fill(entry.Vertex_d2MCz.at(v)/entry.Vertex_zErr.at(v))
-                    h_FD2PV_3trk.Fill(entry.Vertex_d2PV.at(v))
-                    h_FD2PV_x_3trk.Fill(entry.Vertex_d2PVx.at(v))
-                    h_FD2PV_y_3trk.Fill(entry.Vertex_d2PVy.at(v))
-                    h_FD2PV_z_3trk.Fill(entry.Vertex_d2PVz.at(v))
-                    h_FD2PV_3trk_sig.Fill(entry.Vertex_d2PVSig.at(v))
-                    h_FD2PV_x_3trk_sig.Fill(entry.Vertex_d2PVxSig.at(v))
-                    h_FD2PV_y_3trk_sig.Fill(entry.Vertex_d2PVySig.at(v))
-                    h_FD2PV_z_3trk_sig.Fill(entry.Vertex_d2PVzSig.at(v))
-                elif entry.Vertex_ntrk.at(v)==4:
-                    h_SV2MC_4trk.Fill(entry.Vertex_d2MC.at(v)*1000.)
-                    h_SV2MC_x_4trk.Fill(entry.Vertex_d2MCx.at(v)*1000.)
-                    h_SV2MC_y_4trk.Fill(entry.Vertex_d2MCy.at(v)*1000.)
-                    h_SV2MC_z_4trk.Fill(entry.Vertex_d2MCz.at(v)*1000.)
-                    h_recoeff_SV_4trk.Fill(entry.MC_Vertex_ntrk.at(entry.Vertex_mcind.at(v)))
-                    h_SV2MC_x_pull_4trk.Fill(entry.Vertex_d2MCx.at(v)/entry.Vertex_xErr.at(v))
-                    h_SV2MC_y_pull_4trk.Fill(entry.Vertex_d2MCy.at(v)/entry.Vertex_yErr.at(v))
-                    h_SV2MC_z_pull_4trk.Fill(entry.Vertex_d2MCz.at(v)/entry.Vertex_zErr.at(v))
-                    h_FD2PV_4trk.Fill(entry.Vertex_d2PV.at(v))
-                    h_FD2PV_x_4trk.Fill(entry.Vertex_d2PVx.at(v))
-                    h_FD2PV_y_4trk.Fill(entry.Vertex_d2PVy.at(v))
-                    h_FD2PV_z_4trk.Fill(entry.Vertex_d2PVz.at(v))
-                    h_FD2PV_4trk_sig.Fill(entry.Vertex_d2PVSig.at(v))
-                    h_FD2PV_x_4trk_sig.Fill(entry.Vertex_d2PVxSig.at(v))
-                    h_FD2PV_y_4trk_sig.Fill(entry.Vertex_d2PVySig.at(v))
-                    h_FD2PV_z_4trk_sig.Fill(entry.Vertex_d2PVzSig.at(v))
-                elif entry.Vertex_ntrk.at(v)==5:
-                    h_SV2MC_5trk.Fill(entry.Vertex_d2MC.at(v)*1000.)
-                    h_SV2MC_x_5trk.Fill(entry.Vertex_d2MCx.at(v)*1000.)
-                    h_SV2MC_y_5trk.Fill(entry.Vertex_d2MCy.at(v)*1000.)
-                    h_SV2MC_z_5trk.Fill(entry.Vertex_d2MCz.at(v)*1000.)
-                    h_recoeff_SV_5trk.Fill(entry.MC_Vertex_ntrk.at(entry.Vertex_mcind.at(v)))
-                    h_SV2MC_x_pull_5trk.Fill(entry.Vertex_d2MCx.at(v)/entry.Vertex_xErr.at(v))
-                    h_SV2MC_y_pull_5trk.Fill(entry.Vertex_d2MCy.at(v)/entry.Vertex_yErr.at(v))
-                    h_SV2MC_z_pull_5trk.Fill(entry.Vertex_d2MCz.at(v)/entry.Vertex_zErr.at(v))
-                    h_FD2PV_5trk.Fill(entry.Vertex_d2PV.at(v))
-                    h_FD2PV_x_5trk.Fill(entry.Vertex_d2PVx.at(v))
-                    h_FD2PV_y_5trk.Fill(entry.Vertex_d2PVy.at(v))
-                    h_FD2PV_z_5trk.Fill(entry.Vertex_d2PVz.at(v))
-                    h_FD2PV_5trk_sig.Fill(entry.Vertex_d2PVSig.at(v))
-                    h_FD2PV_x_5trk_sig.Fill(entry.Vertex_d2PVxSig.at(v))
-                    h_FD2PV_y_5trk_sig.Fill(entry.Vertex_d2PVySig.at(v))
-                    h_FD2PV_z_5trk_sig.Fill(entry.Vertex_d2PVzSig.at(v))
-
-                elif entry.Vertex_ntrk.at(v)==6:
-                    h_SV2MC_6trk.Fill(entry.Vertex_d2MC.at(v)*1000.)
-                    h_SV2MC_x_6trk.Fill(entry.Vertex_d2MCx.at(v)*1000.)
-                    h_SV2MC_y_6trk.Fill(entry.Vertex_d2MCy.at(v)*1000.)
-                    h_SV2MC_z_6trk.Fill(entry.Vertex_d2MCz.at(v)*1000.)
-                    h_recoeff_SV_6trk.Fill(entry.MC_Vertex_ntrk.at(entry.Vertex_mcind.at(v)))
-                    h_SV2MC_x_pull_6trk.Fill(entry.Vertex_d2MCx.at(v)/entry.Vertex_xErr.at(v))
-                    h_SV2MC_y_pull_6trk.Fill(entry.Vertex_d2MCy.at(v)/entry.Vertex_yErr.at(v))
-                    h_SV2MC_z_pull_6trk.Fill(entry.Vertex_d2MCz.at(v)/entry.Vertex_zErr.at(v))
-                    h_FD2PV_6trk.Fill(entry.Vertex_d2PV.at(v))
-                    h_FD2PV_x_6trk.Fill(entry.Vertex_d2PVx.at(v))
-                    h_FD2PV_y_6trk.Fill(entry.Vertex_d2PVy.at(v))
-                    h_FD2PV_z_6trk.Fill(entry.Vertex_d2PVz.at(v))
-                    h_FD2PV_6trk_sig.Fill(entry.Vertex_d2PVSig.at(v))
-                    h_FD2PV_x_6trk_sig.Fill(entry.Vertex_d2PVxSig.at(v))
-                    h_FD2PV_y_6trk_sig.Fill(entry.Vertex_d2PVySig.at(v))
-                    h_FD2PV_z_6trk_sig.Fill(entry.Vertex_d2PVzSig.at(v))
-
-        if entry.Vertex_isPV.at(v)>0: h_ntrk_rc_pv.Fill(entry.Vertex_ntrk.at(v))
-        else:                         h_ntrk_rc_sv.Fill(entry.Vertex_ntrk.at(v))
-
-        if entry.Vertex_chi2.at(v)>0 and entry.Vertex_chi2.at(v)<10:
-            if   entry.Vertex_isPV.at(v)==0 and entry.Vertex_ntrk.at(v)==2: nsv2+=1
-            elif entry.Vertex_isPV.at(v)==0 and entry.Vertex_ntrk.at(v)==3: nsv3+=1
-            elif entry.Vertex_isPV.at(v)==0 and entry.Vertex_ntrk.at(v)==4: nsv4+=1
-            elif entry.Vertex_isPV.at(v)==0 and entry.Vertex_ntrk.at(v)==5: nsv5+=1
-            elif entry.Vertex_isPV.at(v)==0 and entry.Vertex_ntrk.at(v)==6: nsv6+=1
-
-    h_recoChi2Cut.Fill(nvx)
-
-    h_nSV_rc_2trk.Fill(nsv2)
-    h_nSV_rc_3trk.Fill(nsv3)
-    h_nSV_rc_4trk.Fill(nsv4)
-    h_nSV_rc_5trk.Fill(nsv5)
-    h_nSV_rc_6trk.Fill(nsv6)
-
-
-
+h_mc = hists["h_mc"]
+h_recoChi2Cut = hists["h_recoChi2Cut"]
+
+h_ntrk_mc_pv = hists["h_ntrk_mc_pv"]
+h_ntrk_rc_pv = hists["h_ntrk_rc_pv"]
+h_ntrk_mc_sv = hists["h_ntrk_mc_sv"]
+h_ntrk_rc_sv = hists["h_ntrk_rc_sv"]
+
+h_nSV_mc_2trk = hists["h_nSV_mc_2trk"]
+h_nSV_rc_2trk = hists["h_nSV_rc_2trk"]
+h_nSV_mc_3trk = hists["h_nSV_mc_3trk"]
+h_nSV_rc_3trk = hists["h_nSV_rc_3trk"]
+h_nSV_mc_4trk = hists["h_nSV_mc_4trk"]
+h_nSV_rc_4trk = hists["h_nSV_rc_4trk"]
+h_nSV_mc_5trk = hists["h_nSV_mc_5trk"]
+h_nSV_rc_5trk = hists["h_nSV_rc_5trk"]
+h_nSV_mc_6trk = hists["h_nSV_mc_6trk"]
+h_nSV_rc_6trk = hists["h_nSV_rc_6trk"]
+
+h_recoeff_SV_2trk = hists["h_recoeff_SV_2trk"]
+h_recoeff_SV_3trk = hists["h_recoeff_SV_3trk"]
+h_recoeff_SV_4trk = hists["h_recoeff_SV_4trk"]
+h_recoeff_SV_5trk = hists["h_recoeff_SV_5trk"]
+h_recoeff_SV_6trk = hists["h_recoeff_SV_6trk"]
+
+
+h_PV2MC = hists["h_PV2MC"]
+h_PV2MC_x = hists["h_PV2MC_x"]
+h_PV2MC_y = hists["h_PV2MC_y"]
+h_PV2MC_z = hists["h_PV2MC_z"]
+
+h_PV2MC_x_pull = hists["h_PV2MC_x_pull"]
+h_PV2MC_y_pull = hists["h_PV2MC_y_pull"]
+h_PV2MC_z_pull = hists["h_PV2MC_z_pull"]
+
+h_SV2MC_x_pull_2trk = hists["h_PV2MC_x_pull_2trk"]
+h_SV2MC_y_pull_2trk = hists["h_PV2MC_y_pull_2trk"]
+h_SV2MC_z_pull_2trk = hists["h_PV2MC_z_pull_2trk"]
+
+h_SV2MC_x_pull_3trk = hists["h_PV2MC_x_pull_3trk"]
+h_SV2MC_y_pull_3trk = hists["h_PV2MC_y_pull_3trk"]
+h_SV2MC_z_pull_3trk = hists["h_PV2MC_z_pull_3trk"]
+
+h_SV2MC_x_pull_4trk = hists["h_PV2MC_x_pull_4trk"]
+h_SV2MC_y_pull_4trk = hists["h_PV2MC_y_pull_4trk"]
+h_SV2MC_z_pull_4trk = hists["h_PV2MC_z_pull_4trk"]
+
+h_SV2MC_x_pull_5trk = hists["h_PV2MC_x_pull_5trk"]
+h_SV2MC_y_pull_5trk = hists["h_PV2MC_y_pull_5trk"]
+h_SV2MC_z_pull_5trk = hists["h_PV2MC_z_pull_5trk"]
+
+h_SV2MC_x_pull_6trk = hists["h_PV2MC_x_pull_6trk"]
+h_SV2MC_y_pull_6trk = hists["h_PV2MC_y_pull_6trk"]
+h_SV2MC_z_pull_6trk = hists["h_PV2MC_z_pull_6trk"]
+
+h_SV2MC_2trk = hists["h_SV2MC_2trk"]
+h_SV2MC_3trk = hists["h_SV2MC_3trk"]
+h_SV2MC_4trk = hists["h_SV2MC_4trk"]
+h_SV2MC_5trk = hists["h_SV2MC_5trk"]
+h_SV2MC_6trk = hists["h_SV2MC_6trk"]
+
+h_SV2MC_x_2trk = hists["h_SV2MC_x_2trk"]
+h_SV2MC_x_3trk = hists["h_SV2MC_x_3trk"]
+h_SV2MC_x_4trk = hists["h_SV2MC_x_4trk"]
+h_SV2MC_x_5trk = hists["h_SV2MC_x_5trk"]
+h_SV2MC_x_6trk = hists["h_SV2MC_x_6trk"]
+
+h_SV2MC_y_2trk = hists["h_SV2MC_y_2trk"]
+h_SV2MC_y_3trk = hists["h_SV2MC_y_3trk"]
+h_SV2MC_y_4trk = hists["h_SV2MC_y_4trk"]
+h_SV2MC_y_5trk = hists["h_SV2MC_y_5trk"]
+h_SV2MC_y_6trk = hists["h_SV2MC_y_6trk"]
+
+h_SV2MC_z_2trk = hists["h_SV2MC_z_2trk"]
+h_SV2MC_z_3trk = hists["h_SV2MC_z_3trk"]
+h_SV2MC_z_4trk = hists["h_SV2MC_z_4trk"]
+h_SV2MC_z_5trk = hists["h_SV2MC_z_5trk"]
+h_SV2MC_z_6trk = hists["h_SV2MC_z_6trk"]
+
+
+h_FD2PV_2trk = hists["h_FD2PV_2trk"]
+h_FD2PV_3trk = hists["h_FD2PV_3trk"]
+h_FD2PV_4trk = hists["h_FD2PV_4trk"]
+h_FD2PV_5trk = hists["h_FD2PV_5trk"]
+h_FD2PV_6trk = hists["h_FD2PV_6trk"]
+
+h_FD2PV_x_2trk = hists["h_FD2PV_x_2trk"]
+h_FD2PV_x_3trk = hists["h_FD2PV_x_3trk"]
+h_FD2PV_x_4trk = hists["h_FD2PV_x_4trk"]
+h_FD2PV_x_5trk = hists["h_FD2PV_x_5trk"]
+h_FD2PV_x_6trk = hists["h_FD2PV_x_6trk"]
+
+h_FD2PV_y_2trk = hists["h_FD2PV_y_2trk"]
+h_FD2PV_y_3trk = hists["h_FD2PV_y_3trk"]
+h_FD2PV_y_4trk = hists["h_FD2PV_y_4trk"]
+h_FD2PV_y_5trk = hists["h_FD2PV_y_5trk"]
+h_FD2PV_y_6trk = hists["h_FD2PV_y_6trk"]
+
+h_FD2PV_z_2trk = hists["h_FD2PV_z_2trk"]
+h_FD2PV_z_3trk = hists["h_FD2PV_z_3trk"]
+h_FD2PV_z_4trk = hists["h_FD2PV_z_4trk"]
+h_FD2PV_z_5trk = hists["h_FD2PV_z_5trk"]
+h_FD2PV_z_6trk = hists["h_FD2PV_z_6trk"]
+
+h_FD2PV_2trk_sig = hists["h_FD2PV_2trk_sig"]
+h_FD2PV_3trk_sig = hists["h_FD2PV_3trk_sig"]
+h_FD2PV_4trk_sig = hists["h_FD2PV_4trk_sig"]
+h_FD2PV_5trk_sig = hists["h_FD2PV_5trk_sig"]
+h_FD2PV_6trk_sig = hists["h_FD2PV_6trk_sig"]
+
+h_FD2PV_x_2trk_sig = hists["h_FD2PV_x_2trk_sig"]
+h_FD2PV_x_3trk_sig = hists["h_FD2PV_x_3trk_sig"]
+h_FD2PV_x_4trk_sig = hists["h_FD2PV_x_4trk_sig"]
+h_FD2PV_x_5trk_sig = hists["h_FD2PV_x_5trk_sig"]
+h_FD2PV_x_6trk_sig = hists["h_FD2PV_x_6trk_sig"]
+
+h_FD2PV_y_2trk_sig = hists["h_FD2PV_y_2trk_sig"]
+h_FD2PV_y_3trk_sig = hists["h_FD2PV_y_3trk_sig"]
+h_FD2PV_y_4trk_sig = hists["h_FD2PV_y_4trk_sig"]
+h_FD2PV_y_5trk_sig = hists["h_FD2PV_y_5trk_sig"]
+h_FD2PV_y_6trk_sig = hists["h_FD2PV_y_6trk_sig"]
+
+h_FD2PV_z_2trk_sig = hists["h_FD2PV_z_2trk_sig"]
+h_FD2PV_z_3trk_sig = hists["h_FD2PV_z_3trk_sig"]
+h_FD2PV_z_4trk_sig = hists["h_FD2PV_z_4trk_sig"]
+h_FD2PV_z_5trk_sig = hists["h_FD2PV_z_5trk_sig"]
+h_FD2PV_z_6trk_sig = hists["h_FD2PV_z_6trk_sig"]
+
+
+h_dmin_DV2DV = hists["h_dmin_DV2DV"]
+h_dmin_PV2DV = hists["h_dmin_PV2DV"]
 
 ###################################################
 h_reco.SetMinimum(0.)
@@ -1911,5 +1727,8 @@ can.SaveAs("plots/pdf/dmin_DV2DV.pdf")
 can.SaveAs("plots/png/dmin_DV2DV.png")
 ###################################################
 
-fout.Write()
+#the dataframe histograms are not attached to the output file
+fout.cd()
+for hist in hists.values():
+    hist.Write()
 fout.Close()
@@ -1,12 +1,11 @@
 import ROOT
 import os
 import argparse
-import numpy as np
 import glob
 import sys
-from collections import OrderedDict
-from copy import deepcopy
+from copy import copy, deepcopy
 from examples.FCCee.weaver.config import variables_pfcand, variables_jet, flavors
+from roc import RocBooker, log_thresholds
 import matplotlib.pyplot as plt
 
 plt.rcParams["mathtext.fontset"] = "stix"
@@ -16,23 +15,6 @@ plt.rcParams["axes.labelweight"] = "bold"
 plt.gcf().subplots_adjust(bottom=0.15)
 
 
-# compute binary discriminant
-ROOT.gInterpreter.Declare(
-    """
-ROOT::VecOps::RVec<float> binary_discriminant(ROOT::VecOps::RVec<float> score_s, ROOT::VecOps::RVec<float> score_b)
-{
-    ROOT::VecOps::RVec<float> out;
-    for (int i=0; i<score_s.size(); i++) {
-        float den = score_s.at(i) + score_b.at(i);
-        float d = (den > 0) ? score_s.at(i) / den : 0;
-        //std::cout<<i<<", "<<d<<std::endl;
-        out.push_back(d);
-    }
-    return out;
-}
-"""
-)
-
 # Enable multi-threading
 ROOT.ROOT.EnableImplicitMT()
 
@@ -111,24 +93,24 @@ def main():
         "param_plot": plot_param,
     }
 
-    btag_cfg = deepcopy(ctag_cfg)
+    # the samples (and their dataframes) are shared by all the configurations
+    btag_cfg = copy(ctag_cfg)
     btag_cfg["sig"] = "b"
     btag_cfg["bkg"] = ["g", "q", "c"]
 
-    stag_cfg = deepcopy(ctag_cfg)
+    stag_cfg = copy(ctag_cfg)
     stag_cfg["sig"] = "s"
     stag_cfg["bkg"] = ["g", "q", "c", "b"]
+    stag_cfg["param_plot"] = deepcopy(plot_param)
     stag_cfg["param_plot"].ranges = ((0.0, 1.0), (0.001, 1.0))
 
-    gtag_cfg = deepcopy(ctag_cfg)
+    gtag_cfg = copy(ctag_cfg)
     gtag_cfg["sig"] = "g"
     gtag_cfg["bkg"] = ["q", "s", "c", "b"]
+    gtag_cfg["param_plot"] = deepcopy(plot_param)
     gtag_cfg["param_plot"].ranges = ((0.0, 1.0), (0.001, 1.0))
 
-    roc_plot(ctag_cfg)
-    roc_plot(btag_cfg)
-    roc_plot(stag_cfg)
-    roc_plot(gtag_cfg)
+    roc_plot([ctag_cfg, btag_cfg, stag_cfg, gtag_cfg])
 
 
 # _______________________________________________________________________________
@@ -138,6 +120,7 @@ class Sample:
         self.treename = treename
         self.flavor = flavor
         self.label = label
+        self.df = ROOT.RDataFrame(self.treename, self.files)
 
 
 # _______________________________________________________________________________
@@ -158,71 +141,43 @@ class RocParam:
 
 # _______________________________________________________________________________
 class ROC:
-    def __init__(self, name, sample_s, sample_b, param, color, style):
+    def __init__(self, name, sample_s, sample_b, param, color, style, booker):
         self.name = name
         self.sample_s = sample_s
         self.sample_b = sample_b
-        self.range = param.ndec
-        self.nbins = param.nbins
+        self.thresholds = log_thresholds(param.ndec, param.nbins)
         self.color = color
         self.style = style
+        self.booker = booker
         self.x = []
         self.y = []
 
-        # self.name = "{}_{}".format(self.sample_s.flavor, self.sample_b.flavor)
         self.label = "{} vs {} ({})".format(self.sample_s.flavor, self.sample_b.flavor, self.sample_s.label.label)
-        ## initialize histo rdataframe objects
-        self.histos = []
-        df_s = ROOT.RDataFrame(self.sample_s.treename, self.sample_s.files)
-        df_b = ROOT.RDataFrame(self.sample_b.treename, self.sample_b.files)
-
-        ## dict of rdf histos vs cut values
-        self.dh_s = dfhs(
-            df_s,
-            self.sample_s.flavor,
-            self.sample_b.flavor,
-            self.range,
-            self.nbins,
-            "sig_{}".format(self.name),
-        )
-        self.dh_b = dfhs(
-            df_b,
-            self.sample_s.flavor,
-            self.sample_b.flavor,
-            self.range,
-            self.nbins,
-            "bkg_{}".format(self.name),
-        )
 
-        self.dhs = list(self.dh_s.values()) + list(self.dh_b.values())
+        print("producing roc curve: {} vs {} -- {}".format(self.sample_s.flavor, self.sample_b.flavor, self.name))
+        self.booker.add(
+            self.name,
+            self.sample_s.df,
+            self.sample_b.df,
+            "recojet_is{}".format(self.sample_s.flavor.upper()),
+            "recojet_is{}".format(self.sample_b.flavor.upper()),
+        )
 
     def get_roc(self):
         out_root = ROOT.TFile("{}.root".format(self.name), "RECREATE")
-        for cut, hist in self.dh_s.items():
-            hist.Write()
-        for cut, hist in self.dh_b.items():
+        for hist in self.booker.histograms(self.name):
             hist.Write()
+        out_root.Close()
 
-        x, y = [], []
-        cuts = list(self.dh_s.keys())
-
-        def integral(h):
-            return float(h.Integral(0, h.GetNbinsX() + 1))
-
-        sum_s = integral(self.dh_s[cuts[0]])
-        sum_b = integral(self.dh_b[cuts[0]])
-
-        if sum_s == 0 or sum_b == 0:
+        try:
+            x, y = self.booker.curve(self.name, self.thresholds)
+        except ValueError:
             sys.exit("ERROR: histograms are empty...")
 
-        for cut in cuts:
-            x.append(integral(self.dh_s[cut]) / sum_s)
-            y.append(integral(self.dh_b[cut]) / sum_b)
-
-        self.x = x
-        self.y = y
+        self.x = list(x)
+        self.y = list(y)
 
-        return x, y
+        return self.x, self.y
 
 
 # _______________________________________________________________________________
@@ -312,95 +267,42 @@ class Graph:
 
 
 # _______________________________________________________________________________
-def roc_plot(cfg):
+def roc_plot(cfgs):
 
     colors = ["black", "red", "blue", "purple", "green"]
     styles = ["-", "--", "-.", "."]
 
+    # book the curves of all the configurations to fill them in a single event loop per sample
+    booker = RocBooker()
     rocs = []
 
-    procstr = ""
-    for ip, proc in enumerate(cfg["variants"]):
-        sig_f = cfg["sig"]
-        procstr += "_{}".format(proc.name)
-        for ib, bkg_f in enumerate(cfg["bkg"]):
-            name = "{}{}_{}".format(sig_f, bkg_f, proc.name)
-            rocs.append(
-                ROC(
-                    name,
-                    cfg["samples"][proc][sig_f],
-                    cfg["samples"][proc][bkg_f],
-                    cfg["param_roc"],
-                    colors[ib],
-                    styles[ip],
+    for cfg in cfgs:
+        rocs.append([])
+        for ip, proc in enumerate(cfg["variants"]):
+            sig_f = cfg["sig"]
+            for ib, bkg_f in enumerate(cfg["bkg"]):
+                name = "{}{}_{}".format(sig_f, bkg_f, proc.name)
+                rocs[-1].append(
+                    ROC(
+                        name,
+                        cfg["samples"][proc][sig_f],
+                        cfg["samples"][proc][bkg_f],
+                        cfg["param_roc"],
+                        colors[ib],
+                        styles[ip],
+                        booker,
+                    )
                 )
-            )
-
-    dh_list = []
-    for roc in rocs:
-        dh_list += roc.dhs
-
-    ROOT.RDF.RunGraphs(dh_list)
 
-    for roc in rocs:
-        roc.get_roc()
+    booker.run()
 
-    plot_name = "{}tagging{}".format(cfg["sig"], procstr)
-    plot = Graph(rocs, cfg["param_plot"], "plots/{}.png".format(plot_name))
+    for cfg, cfg_rocs in zip(cfgs, rocs):
+        for roc in cfg_rocs:
+            roc.get_roc()
 
-
-# ______________________________________________________________________________
-def dfhs(df, fs, fb, m, nbins, label):
-
-    lin_array = np.arange(0.0, m + float(m) / nbins, float(m) / nbins)
-    exp_array = np.power(10.0, lin_array)
-
-    a = -1.0 / (np.power(10.0, m) - 1)
-    b = np.power(10.0, m) / (np.power(10.0, m) - 1)
-    cutvals = a * exp_array + b
-    cutvals.sort()
-
-    score_s = "recojet_is{}".format(fs.upper())
-    score_b = "recojet_is{}".format(fb.upper())
-
-    binary_discr_var = "d_{}{}".format(fs, fb)
-    binary_discr_label = "D({},{})".format(fs, fb)
-    binary_discr_func = "binary_discriminant({}, {})".format(score_s, score_b)
-
-    # print(cutvals)
-    df_dict = OrderedDict()
-    dh_dict = OrderedDict()
-
-    print("producing roc curve: {} vs {} -- {}".format(fs, fb, label))
-    df = df.Define(binary_discr_var, binary_discr_func)
-
-    for i, cut in enumerate(cutvals):
-
-        cut_str = "{:.0f}".format(1e5 * cut)
-        if i == 0:
-            cut_str = "00000"
-
-        filter_expr = "{} > {}".format(binary_discr_var, cut)
-        fcoll_title = "{} > {:.4f}".format(binary_discr_label, cut)
-        fcoll_str = "{}_{}".format(binary_discr_var, cut_str)
-
-        # define filter from previous iteration in the loop
-        if i == 0:
-            df_dict[cut] = df.Define(fcoll_str, "{}[{}]".format(binary_discr_var, filter_expr))
-        else:
-            df_dict[cut] = df_dict[cutvals[i - 1]].Define(fcoll_str, "{}[{}]".format(binary_discr_var, filter_expr))
-
-        dh_dict[cut] = df_dict[cut].Histo1D(
-            (
-                "h_{}_{}".format(fcoll_str, label),
-                ";{};N_{{Events}}".format(binary_discr_label),
-                nbins,
-                0.0,
-                1.0,
-            ),
-            fcoll_str,
-        )
-    return dh_dict
+        procstr = "".join("_{}".format(proc.name) for proc in cfg["variants"])
+        plot_name = "{}tagging{}".format(cfg["sig"], procstr)
+        plot = Graph(cfg_rocs, cfg["param_plot"], "plots/{}.png".format(plot_name))
 
 
 # _______________________________________________________________________________________
@@ -49,6 +49,62 @@ def formatStatUncHist(hists, name, hstyle=3254):
     return hist_tot
 
 
+# _____________________________________________________________________________
+class HistCache:
+    '''
+    Cache of the input files and histograms loaded from them. Every input file
+    is opened only once and every histogram is read from it only once.
+    '''
+    def __init__(self):
+        self.files: dict[str, object] = {}
+        self.hists: dict[tuple[str, str], object] = {}
+        self.scales: dict[tuple[str, float], float] = {}
+
+    def get_file(self, infilepath: str) -> object:
+        '''
+        Get opened input file.
+        '''
+        if infilepath not in self.files:
+            self.files[infilepath] = ROOT.TFile.Open(infilepath, 'READ')
+        return self.files[infilepath]
+
+    def get_hist(self, infilepath: str, hist_name: str) -> object:
+        '''
+        Get copy of the histogram from the input file, which can be modified
+        freely.
+        '''
+        key = (infilepath, hist_name)
+        if key not in self.hists:
+            hist = copy.deepcopy(self.get_file(infilepath).Get(hist_name))
+            hist.SetDirectory(0)
+            self.hists[key] = hist
+
+        hist = copy.deepcopy(self.hists[key])
+        hist.SetDirectory(0)
+        return hist
+
+    def get_lumi_scaling(self,
+                         config: dict[str, any],
+                         infilepath: str,
+                         initial_scale: float = 1.0) -> float:
+        '''
+        Get luminosity scaling for the histograms from the input file.
+        '''
+        key = (infilepath, initial_scale)
+        if key not in self.scales:
+            self.scales[key] = determine_lumi_scaling(
+                config, self.get_file(infilepath), initial_scale)
+        return self.scales[key]
+
+    def close(self):
+        '''
+        Close all opened input files.
+        '''
+        for infile in self.files.values():
+            infile.Close()
+        self.files = {}
+
+
 # _____________________________________________________________________________
 def determine_lumi_scaling(config: dict[str, any],
                            infile: object,
@@ -99,10 +155,14 @@ def load_hists(var: str,
                label: str,
                sel: str,
                config: dict[str, any],
-               rebin: int) -> tuple[dict[str, any], dict[str: any]]:
+               rebin: int,
+               hist_cache: HistCache | None = None) -> tuple[dict[str, any],
+                                                            dict[str: any]]:
     '''
     Load all histograms needed for the plot
     '''
+    if hist_cache is None:
+        hist_cache = HistCache()
 
     try:
         signal = config['plots'][label]['signal']
@@ -124,13 +184,10 @@ def load_hists(var: str,
                 LOGGER.info('File "%s" not found!\nSkipping it...', infilepath)
                 continue
 
-            with ROOT.TFile(infilepath, 'READ') as infile:
-                hist = copy.deepcopy(infile.Get(var))
-                hist.SetDirectory(0)
-
-                scale = determine_lumi_scaling(config,
-                                               infile,
-                                               config['scale_sig'])
+            hist = hist_cache.get_hist(infilepath, var)
+            scale = hist_cache.get_lumi_scaling(config,
+                                                infilepath,
+                                                config['scale_sig'])
             hist.Scale(scale)
             hist.Rebin(rebin)
 
@@ -150,13 +207,10 @@ def load_hists(var: str,
                 LOGGER.info('File "%s" not found!\nSkipping it...', infilepath)
                 continue
 
-            with ROOT.TFile(infilepath) as infile:
-                hist = copy.deepcopy(infile.Get(var))
-                hist.SetDirectory(0)
-
-                scale = determine_lumi_scaling(config,
-                                               infile,
-                                               config['scale_bkg'])
+            hist = hist_cache.get_hist(infilepath, var)
+            scale = hist_cache.get_lumi_scaling(config,
+                                                infilepath,
+                                                config['scale_bkg'])
             hist.Scale(scale)
             hist.Rebin(rebin)
 
@@ -181,7 +235,10 @@ def load_hists(var: str,
 def mapHistosFromHistmaker(config: dict[str, any],
                            hist_name: str,
                            param,
-                           hist_cfg):
+                           hist_cfg,
+                           hist_cache: HistCache | None = None):
+    if hist_cache is None:
+        hist_cache = HistCache()
     rebin = hist_cfg['rebin'] if 'rebin' in hist_cfg else 1
     LOGGER.info('Get histograms for %s', hist_name)
     signal = param.procs['signal']
@@ -197,10 +254,7 @@ def mapHistosFromHistmaker(config: dict[str, any],
                 LOGGER.info('File "%s" not found!\nSkipping it...', fin)
                 continue
 
-            with ROOT.TFile(fin) as tf:
-                h = tf.Get(hist_name)
-                hh = copy.deepcopy(h)
-                hh.SetDirectory(0)
+            hh = hist_cache.get_hist(fin, hist_name)
             LOGGER.info('ScaleSig: %g', scaleSig)
             hh.Scale(param.intLumi*scaleSig)
             hh.Rebin(rebin)
@@ -219,10 +273,7 @@ def mapHistosFromHistmaker(config: dict[str, any],
                 LOGGER.info('File "%s" not found!\nSkipping it...', fin)
                 continue
 
-            with ROOT.TFile(fin) as tf:
-                h = tf.Get(hist_name)
-                hh = copy.deepcopy(h)
-                hh.SetDirectory(0)
+            hh = hist_cache.get_hist(fin, hist_name)
             hh.Scale(param.intLumi)
             hh.Rebin(rebin)
             if len(hbackgrounds[b]) == 0:
@@ -407,13 +458,15 @@ def runPlotsHistmaker(config: dict[str, any],
                       args,
                       hist_name: str,
                       param,
-                      hist_cfg):
+                      hist_cfg,
+                      hist_cache: HistCache | None = None):
 
     output = hist_cfg['output']
     hsignal, hbackgrounds = mapHistosFromHistmaker(config,
                                                    hist_name,
                                                    param,
-                                                   hist_cfg)
+                                                   hist_cfg,
+                                                   hist_cache)
 
     if hasattr(param, "splitLeg"):
         splitLeg = param.splitLeg
@@ -1019,11 +1072,16 @@ def run(args):
             config['int_lumi_label'] = \
                 f'L = {config["int_lumi"]:.2g} pb^{{-1}}'
 
+    # Input files are opened only once for all the plots
+    hist_cache = HistCache()
+
     # Handle plots for the Histmaker analyses and exit
     if config['ana_type'] == 'histmaker':
         LOGGER.info('Plotting histograms from histmaker step...')
         for hist_name, hist_cfg in script_module.hists.items():
-            runPlotsHistmaker(config, args, hist_name, script_module, hist_cfg)
+            runPlotsHistmaker(config, args, hist_name, script_module, hist_cfg,
+                              hist_cache)
+        hist_cache.close()
         sys.exit()
 
     counter = 0
@@ -1044,7 +1102,8 @@ def run(args):
                                                    label,
                                                    sel,
                                                    config,
-                                                   rebin=rebin_tmp)
+                                                   rebin=rebin_tmp,
+                                                   hist_cache=hist_cache)
                 runPlots(config,
                          args,
                          var + "_" + label,
@@ -1063,6 +1122,7 @@ def run(args):
                              hbackgrounds,
                              script_module.extralabel[sel])
         counter += 1
+    hist_cache.close()
 
 
 def do_plots(parser):
@@ -108,12 +108,20 @@ def setup_run_parser(parser):
              'outputList')
     parser.add_argument('--nevents', type=int, default=-1,
                         help='specify max number of events to process')
+    parser.add_argument('--entry-range', type=int, nargs=2, default=None,
+                        metavar=('BEGIN', 'END'),
+                        help='process only entries in the range [BEGIN, END) '
+                        'of the input files taken together')
     parser.add_argument('--test', action='store_true', default=False,
                         help='run over the test input file')
     parser.add_argument('--bench', action='store_true', default=False,
                         help='output benchmark results to a JSON file')
     parser.add_argument('--ncpus', type=int, default=-1,
                         help='set number of threads')
+    parser.add_argument('--local-workers', type=int, default=1,
+                        help='number of chunks processed in parallel when '
+                        'running locally, available threads are split '
+                        'between them (analyses of style "RDFanalysis" only)')
     parser.add_argument('-g', '--graph', action='store_true', default=False,
                         help='generate computational graph of the analysis')
     parser.add_argument('--graph-path', type=str, default='',
@@ -136,6 +144,11 @@ def setup_run_parser_final(parser):
     parser.add_argument('--graph-path', type=str, default='',
                         help='analysis graph save path, should end with '
                         '\'.dot\' or \'.png\'')
+    parser.add_argument('--verify-outputs', action='store_true',
+                        default=False,
+                        help='count the events saved in the output TTrees by '
+                        'reading the files again, instead of taking them '
+                        'from the TTree headers')
 
 
 def setup_run_parser_plots(parser):
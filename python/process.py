@@ -7,7 +7,10 @@ import sys
 import json
 import glob
 import logging
+import tempfile
 import urllib.request
+from typing import Any
+from concurrent.futures import ProcessPoolExecutor
 import yaml  # type: ignore
 import ROOT  # type: ignore
 
@@ -30,6 +33,161 @@ def get_entries(inpath: str) -> int:
     return nevents
 
 
+def get_file_info(inpath: str) -> tuple[int, int]:
+    '''
+    Get number of entries in the TTree named "events" and number of events
+    processed in the previous stage (0 if not available), opening the file
+    only once.
+    '''
+    infile = ROOT.TFile.Open(inpath, 'READ')
+    if not infile or infile.IsZombie():
+        LOGGER.error('Input file:\n%s\ncan\'t be opened!\nAborting...',
+                     inpath)
+        sys.exit(3)
+
+    try:
+        events_processed = infile.Get('eventsProcessed').GetVal()
+    except AttributeError:
+        events_processed = 0
+
+    try:
+        nevents = infile.Get('events').GetEntries()
+    except AttributeError:
+        LOGGER.error('Input file:\n%s\nis missing "events" TTree!\n'
+                     'Aborting...', inpath)
+        infile.Close()
+        sys.exit(3)
+    infile.Close()
+
+    return nevents, events_processed
+
+
+def get_file_index_path() -> str:
+    '''
+    Get location of the on-disk file index. Can be overridden with the
+    FCCANALYSES_FILE_INDEX environment variable.
+    '''
+    index_path = os.getenv('FCCANALYSES_FILE_INDEX')
+    if index_path:
+        return index_path
+
+    cache_dir = os.getenv('XDG_CACHE_HOME',
+                          os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache_dir, 'fccanalyses', 'file_index.json')
+
+
+def load_file_index(index_path: str) -> dict[str, dict[str, Any]]:
+    '''
+    Load the file index, return empty index if it does not exist or can't be
+    read.
+    '''
+    if not os.path.isfile(index_path):
+        return {}
+
+    try:
+        with open(index_path, 'r', encoding='utf-8') as infile:
+            return json.load(infile)
+    except (OSError, json.decoder.JSONDecodeError):
+        LOGGER.debug('File index %s can\'t be read, ignoring it.',
+                     index_path)
+    return {}
+
+
+def save_file_index(index_path: str, index: dict[str, dict[str, Any]]):
+    '''
+    Save the file index atomically, so that concurrent runs never see
+    partially written index.
+    '''
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(index_path),
+                                        suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as outfile:
+            json.dump(index, outfile)
+        os.replace(tmp_path, index_path)
+    except OSError as exc:
+        LOGGER.debug('File index %s can\'t be saved:\n%s',
+                     index_path, exc)
+
+
+def get_file_stat(inpath: str) -> tuple[int, float] | None:
+    '''
+    Get size and modification time of a local file, None for remote files.
+    '''
+    if '://' in inpath:
+        return None
+    try:
+        stat = os.stat(inpath)
+    except OSError:
+        return None
+
+    return stat.st_size, stat.st_mtime
+
+
+def scan_files(file_list: list[str],
+               n_workers: int | None = None) -> list[tuple[int, int]]:
+    '''
+    Get number of entries in the "events" TTree and number of events
+    processed in the previous stage for every file in the list.
+
+    Files are opened in parallel in separate processes, as PyROOT holds the
+    GIL during the ROOT calls, and the results for local files are stored in
+    an on-disk index keyed by path, size and modification time, so unchanged
+    files are not opened again in subsequent runs.
+    '''
+    index_path = get_file_index_path()
+    index = load_file_index(index_path)
+
+    results: list[tuple[int, int] | None] = [None] * len(file_list)
+    to_scan: list[int] = []
+    file_stats: dict[int, tuple[int, float]] = {}
+    for i, inpath in enumerate(file_list):
+        file_stat = get_file_stat(inpath)
+        if file_stat is None:
+            to_scan.append(i)
+            continue
+        file_stats[i] = file_stat
+
+        entry = index.get(os.path.abspath(inpath))
+        if entry is not None and \
+                entry['size'] == file_stat[0] and \
+                entry['mtime'] == file_stat[1]:
+            results[i] = (entry['entries'], entry['events_processed'])
+        else:
+            to_scan.append(i)
+
+    LOGGER.debug('File index: %i file(s) found, %i file(s) to be scanned.',
+                 len(file_list) - len(to_scan), len(to_scan))
+
+    if to_scan:
+        n_workers = min(n_workers or os.cpu_count() or 1, len(to_scan))
+        if n_workers > 1:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                scanned = list(executor.map(
+                    get_file_info, [file_list[i] for i in to_scan],
+                    chunksize=max(1, len(to_scan) // (4 * n_workers))))
+        else:
+            scanned = [get_file_info(file_list[i]) for i in to_scan]
+        for i, file_info in zip(to_scan, scanned):
+            results[i] = file_info
+
+        if any(i in file_stats for i in to_scan):
+            # Re-read the index in case other run updated it in the meantime
+            index = load_file_index(index_path)
+            for i in to_scan:
+                if i not in file_stats:
+                    continue
+                index[os.path.abspath(file_list[i])] = {
+                    'size': file_stats[i][0],
+                    'mtime': file_stats[i][1],
+                    'entries': results[i][0],
+                    'events_processed': results[i][1]
+                }
+            save_file_index(index_path, index)
+
+    return results
+
+
 def get_process_info(
         process_name: str,
         prod_tag: str,
@@ -63,7 +221,6 @@ def get_process_info_files(process: str, input_dir: str) -> tuple[list[str],
     Get list of files and events from the specified location
     '''
     filelist = []
-    eventlist = []
     filetest = f'{input_dir}/{process}.root'
     dirtest = f'{input_dir}/{process}'
 
@@ -81,13 +238,11 @@ def get_process_info_files(process: str, input_dir: str) -> tuple[list[str],
 
     if os.path.isfile(filetest):
         filelist.append(filetest)
-        eventlist.append(get_entries(filetest))
 
     if os.path.isdir(dirtest):
-        flist = glob.glob(dirtest+"/*.root")
-        for f in flist:
-            filelist.append(f)
-            eventlist.append(get_entries(f))
+        filelist += glob.glob(dirtest+"/*.root")
+
+    eventlist = [nevents for nevents, _ in scan_files(filelist)]
 
     return filelist, eventlist
 
@@ -1,10 +1,17 @@
 # generated with `stubgen process.py`
 
 import logging
+from typing import Any
 
 LOGGER: logging.Logger
 
 def get_entries(inpath: str) -> int: ...
+def get_file_info(inpath: str) -> tuple[int, int]: ...
+def get_file_index_path() -> str: ...
+def load_file_index(index_path: str) -> dict[str, dict[str, Any]]: ...
+def save_file_index(index_path: str, index: dict[str, dict[str, Any]]): ...
+def get_file_stat(inpath: str) -> tuple[int, float] | None: ...
+def scan_files(file_list: list[str], n_workers: int | None = ...) -> list[tuple[int, int]]: ...
 def get_process_info(process_name: str, prod_tag: str, input_dir: str, process_input_dir: Union[str, None] = ...) -> tuple[list[str], list[int]]: ...
 def get_process_info_files(process: str, input_dir: str) -> tuple[list[str], list[int]]: ...
 def get_process_info_yaml(process_name: str, prod_tag: str) -> tuple[list[str], list[int]]: ...
@@ -0,0 +1,150 @@
+'''
+Receiver operating characteristic (ROC) curves from RDataFrame.
+
+The binary discriminant D of each curve is filled once per sample into a
+histogram finely binned in -log10(1 - D), so that the thresholds close to 1
+of background efficiencies spanning several decades are resolved as well.
+Every efficiency point is derived from its cumulative sum, so that all the
+curves booked with a RocBooker are computed in a single event loop per
+sample.
+'''
+
+import logging
+import numpy as np
+import ROOT  # type: ignore
+
+
+ROOT.gROOT.SetBatch(True)
+
+LOGGER: logging.Logger = logging.getLogger('FCCAnalyses.roc')
+
+
+# _____________________________________________________________________________
+def log_thresholds(ndecades: int, npoints: int) -> np.ndarray:
+    '''
+    Discriminant thresholds in [0, 1], denser towards 1 so that the
+    background efficiency is sampled evenly over ndecades on a log scale.
+    '''
+    lin_array = np.linspace(0., ndecades, npoints + 1)
+    exp_array = np.power(10., lin_array)
+
+    a = -1. / (np.power(10., ndecades) - 1)
+    b = np.power(10., ndecades) / (np.power(10., ndecades) - 1)
+    thresholds = a * exp_array + b
+    thresholds.sort()
+
+    return thresholds
+
+
+# _____________________________________________________________________________
+def log_distance(discr) -> np.ndarray:
+    '''
+    Distance of the discriminant values to 1 on a log scale, -log10(1 - discr),
+    infinite for discr = 1.
+    '''
+    with np.errstate(divide='ignore'):
+        return -np.log10(1. - np.asarray(discr, dtype=float))
+
+
+# _____________________________________________________________________________
+def define_binary_discriminant(dframe, name: str, score_s: str, score_b: str):
+    '''
+    Define the binary discriminant score_s / (score_s + score_b), set to 0 if
+    both scores vanish.
+    '''
+    return dframe.Define(
+        name,
+        f'ROOT::VecOps::Where({score_s} + {score_b} > 0, '
+        f'{score_s} / ({score_s} + {score_b}), 0.f)')
+
+
+# _____________________________________________________________________________
+def efficiencies(hist, thresholds) -> np.ndarray:
+    '''
+    Fraction of the histogram entries above each of the thresholds, given on
+    the axis of the histogram, known to the bin width of the histogram.
+    Thresholds above the upper edge all take the entries of the overflow bin.
+    '''
+    nbins: int = hist.GetNbinsX()
+    # contents of the underflow, regular and overflow bins
+    counts = np.array([hist.GetBinContent(i) for i in range(nbins + 2)])
+    above = np.cumsum(counts[::-1])[::-1]
+    if above[0] <= 0.:
+        raise ValueError(f'Histogram "{hist.GetName()}" is empty!')
+
+    edges = np.array([hist.GetXaxis().GetBinLowEdge(i)
+                      for i in range(1, nbins + 2)])
+    first_bins = np.minimum(
+        np.searchsorted(edges, thresholds, side='left') + 1, nbins + 1)
+
+    return above[first_bins] / above[0]
+
+
+# _____________________________________________________________________________
+class RocBooker:
+    '''
+    Book the discriminant histograms of several ROC curves.
+
+    Samples are identified by their dataframe, the discriminant of each curve
+    is defined once per sample and all the histograms are filled when calling
+    run(). The histograms cover ndecades of 1 - D with nbins bins.
+    '''
+    def __init__(self, nbins: int = 10000, ndecades: int = 10):
+        self.nbins: int = nbins
+        self.ndecades: int = ndecades
+        self.hists: dict = {}
+        self.curves: dict[str, tuple] = {}
+        self.dframes: dict = {}
+
+    def _book(self, dframe, score_s: str, score_b: str):
+        discr = f'roc_d_{score_s}_{score_b}'
+        key = (id(dframe), discr)
+        if key not in self.hists:
+            # chain the discriminants of a sample on the same dataframe
+            _, node = self.dframes.get(id(dframe), (dframe, dframe))
+            node = define_binary_discriminant(node, discr, score_s, score_b) \
+                .Define(f'{discr}_log', f'-ROOT::VecOps::log10(1. - {discr})')
+            self.dframes[id(dframe)] = (dframe, node)
+            self.hists[key] = node.Histo1D(
+                (f'h_{discr}_{len(self.hists)}',
+                 f';-log_{{10}}(1 - D({score_s}, {score_b}));N_{{Entries}}',
+                 self.nbins, 0., float(self.ndecades)),
+                f'{discr}_log')
+        return self.hists[key]
+
+    def add(self, name: str, dframe_s, dframe_b,
+            score_s: str, score_b: str) -> None:
+        '''
+        Book the ROC curve of the signal score against the background score,
+        with the signal and background samples given by their dataframes.
+        '''
+        if name in self.curves:
+            raise ValueError(f'ROC curve "{name}" already booked!')
+        LOGGER.debug('Booking ROC curve %s: %s vs %s', name, score_s, score_b)
+        self.curves[name] = (self._book(dframe_s, score_s, score_b),
+                             self._book(dframe_b, score_s, score_b))
+
+    def run(self) -> None:
+        '''
+        Fill all the booked histograms, with one event loop per sample.
+        '''
+        LOGGER.info('Filling %i discriminant histograms for %i ROC curves...',
+                    len(self.hists), len(self.curves))
+        ROOT.RDF.RunGraphs(list(self.hists.values()))
+
+    def histograms(self, name: str) -> tuple:
+        '''
+        Signal and background discriminant histograms of a ROC curve.
+        '''
+        hist_s, hist_b = self.curves[name]
+        return hist_s.GetValue(), hist_b.GetValue()
+
+    def curve(self, name: str, thresholds) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Signal and background efficiencies of a ROC curve at each of the
+        discriminant thresholds.
+        '''
+        hist_s, hist_b = self.histograms(name)
+        log_thr = log_distance(thresholds)
+        return efficiencies(hist_s, log_thr), \
+            efficiencies(hist_b, log_thr)
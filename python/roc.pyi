@@ -0,0 +1,23 @@
+# generated with `stubgen roc.py`
+
+import logging
+import numpy as np
+
+LOGGER: logging.Logger
+
+def log_thresholds(ndecades: int, npoints: int) -> np.ndarray: ...
+def log_distance(discr) -> np.ndarray: ...
+def define_binary_discriminant(dframe, name: str, score_s: str, score_b: str): ...
+def efficiencies(hist, thresholds) -> np.ndarray: ...
+
+class RocBooker:
+    nbins: int
+    ndecades: int
+    hists: dict
+    curves: dict[str, tuple]
+    dframes: dict
+    def __init__(self, nbins: int = 10000, ndecades: int = 10) -> None: ...
+    def add(self, name: str, dframe_s, dframe_b, score_s: str, score_b: str) -> None: ...
+    def run(self) -> None: ...
+    def histograms(self, name: str) -> tuple: ...
+    def curve(self, name: str, thresholds) -> tuple[np.ndarray, np.ndarray]: ...
@@ -11,11 +11,12 @@ import logging
 import subprocess
 import importlib.util
 import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import numpy as np
 
 import ROOT  # type: ignore
 from anascript import get_element, get_element_dict
-from process import get_process_info, get_process_dict
+from process import get_process_info, scan_files, get_process_dict
 from frame import generate_graph
 
 LOGGER = logging.getLogger('FCCAnalyses.run')
@@ -101,7 +102,8 @@ def create_subjob_script(local_dir: str,
                          rdf_module,
                          process_name: str,
                          chunk_num: int,
-                         chunk_list: list[list[str]],
+                         chunk_list: list[tuple[list[str],
+                                                tuple[int, int] | None]],
                          anapath: str) -> str:
     '''
     Creates sub-job script to be run.
@@ -135,11 +137,14 @@ def create_subjob_script(local_dir: str,
         output_path = os.path.join(output_dir, process_name,
                                    f'chunk_{chunk_num}.root')
 
+    chunk_files, entry_range = chunk_list[chunk_num]
     scr += local_dir
     scr += f'/bin/fccanalysis run {anapath} --batch '
     scr += f'--output {output_path} '
+    if entry_range is not None:
+        scr += f'--entry-range {entry_range[0]} {entry_range[1]} '
     scr += '--files-list'
-    for file_path in chunk_list[chunk_num]:
+    for file_path in chunk_files:
         scr += f' {file_path}'
     scr += '\n\n'
 
@@ -195,12 +200,67 @@ def get_subfile_list(in_file_list: list[str],
 
 
 # _____________________________________________________________________________
-def get_chunk_list(file_list: str, chunks: int):
+def get_chunk_list(file_list: list[str],
+                   event_list: list[int],
+                   chunks: int,
+                   entry_range: tuple[int, int] | None = None
+                   ) -> list[tuple[list[str], tuple[int, int] | None]]:
     '''
-    Get list of input file paths arranged into chunks.
+    Get list of input file paths arranged into chunks with balanced number of
+    events. A chunk boundary can fall inside of a file, in that case the chunk
+    carries global entry range over its files, otherwise the range is None.
+    Files without entries are attached to the chunk of the preceding file, so
+    that their processed events are accounted for.
+    If entry range over all the input files is provided, only the entries
+    inside of it are split between the chunks.
     '''
-    chunk_list = list(np.array_split(file_list, chunks))
-    return [chunk for chunk in chunk_list if chunk.size > 0]
+    nevents_total = sum(event_list)
+    if nevents_total <= 0:
+        if entry_range is not None:
+            if chunks == 1:
+                return [(list(file_list), tuple(entry_range))]
+            LOGGER.error('Number of events in the input files not known, '
+                         'entry range can\'t be split into chunks!\n'
+                         'Aborting...')
+            sys.exit(3)
+        LOGGER.warning('Number of events in the input files not known!\n'
+                       'Splitting input files evenly between the chunks...')
+        chunk_list = list(np.array_split(file_list, chunks))
+        return [([str(f) for f in chunk], None)
+                for chunk in chunk_list if chunk.size > 0]
+
+    range_begin, range_end = 0, nevents_total
+    if entry_range is not None:
+        range_begin = max(int(entry_range[0]), 0)
+        range_end = min(int(entry_range[1]), nevents_total)
+        if range_end <= range_begin:
+            LOGGER.error('Entry range [%i, %i) selects no events from the '
+                         'input files!\nAborting...',
+                         entry_range[0], entry_range[1])
+            sys.exit(3)
+
+    chunks = min(chunks, range_end - range_begin)
+    offsets = np.cumsum([0] + list(event_list))
+    boundaries = [range_begin + i * (range_end - range_begin) // chunks
+                  for i in range(chunks + 1)]
+
+    chunk_list = []
+    for start, stop in zip(boundaries[:-1], boundaries[1:]):
+        first = int(np.searchsorted(offsets, start, side='right')) - 1
+        last = int(np.searchsorted(offsets, stop - 1, side='right')) - 1
+        # Leading files without entries go to the first chunk, the following
+        # ones to the chunk ending with the preceding file
+        if start == 0:
+            first = 0
+        if stop == offsets[last + 1]:
+            while last + 1 < len(event_list) and event_list[last + 1] == 0:
+                last += 1
+        chunk_range = (int(start - offsets[first]), int(stop - offsets[first]))
+        if start == offsets[first] and stop == offsets[last + 1]:
+            chunk_range = None
+        chunk_list.append((list(file_list[first:last + 1]), chunk_range))
+
+    return chunk_list
 
 
 # _____________________________________________________________________________
@@ -314,7 +374,16 @@ def run_rdf(rdf_module,
     '''
     Create RDataFrame and snapshot it.
     '''
-    dframe = ROOT.RDataFrame("events", input_list)
+    if args.entry_range is not None:
+        dataset_spec = ROOT.RDF.Experimental.RDatasetSpec()
+        dataset_spec.AddSample(
+            ROOT.RDF.Experimental.RSample('events', 'events', input_list))
+        dataset_spec.WithGlobalRange(
+            ROOT.RDF.Experimental.RDatasetSpec.REntryRange(
+                args.entry_range[0], args.entry_range[1]))
+        dframe = ROOT.RDataFrame(dataset_spec)
+    else:
+        dframe = ROOT.RDataFrame("events", input_list)
 
     # limit number of events processed
     if args.nevents > 0:
@@ -467,26 +536,33 @@ def run_local(rdf_module, infile_list, args):
     nevents_orig = 0
     # The amount of events in the input file(s)
     nevents_local = 0
-    for filepath in infile_list:
-
-        filepath = apply_filepath_rewrites(filepath)
-
+    infile_list = [apply_filepath_rewrites(f) for f in infile_list]
+    for filepath, (nevents, events_processed) in zip(infile_list,
+                                                     scan_files(infile_list)):
         file_list.push_back(filepath)
         info_msg += f'- {filepath}\t\n'
-        infile = ROOT.TFile.Open(filepath, 'READ')
-        try:
-            nevents_orig += infile.Get('eventsProcessed').GetVal()
-        except AttributeError:
-            pass
+        if args.entry_range is not None:
+            # Only part of the file is processed, the original number of
+            # events is taken proportionally. The shares are differences of
+            # the cumulative boundaries, so that they add up to the total of
+            # the file over the chunks. Files without entries are assigned to
+            # a single chunk and counted in full
+            begin = max(args.entry_range[0] - nevents_local, 0)
+            end = min(args.entry_range[1] - nevents_local, nevents)
+            if nevents == 0:
+                nevents_orig += events_processed
+            elif end > begin:
+                nevents_orig += events_processed * end // nevents - \
+                    events_processed * begin // nevents
+        else:
+            nevents_orig += events_processed
+        nevents_local += nevents
 
-        try:
-            nevents_local += infile.Get("events").GetEntries()
-        except AttributeError:
-            LOGGER.error('Input file:\n%s\nis missing events TTree!\n'
-                         'Aborting...', filepath)
-            infile.Close()
-            sys.exit(3)
-        infile.Close()
+    if args.entry_range is not None:
+        info_msg += f'Entry range: [{args.entry_range[0]:,}, '
+        info_msg += f'{args.entry_range[1]:,})\n'
+        nevents_local = min(nevents_local, args.entry_range[1]) - \
+            args.entry_range[0]
 
     LOGGER.info(info_msg)
 
@@ -568,6 +644,113 @@ def run_local(rdf_module, infile_list, args):
         save_benchmark('benchmarks_bigger_better.json', bench_evt_per_sec)
 
 
+# _____________________________________________________________________________
+def run_chunk_subprocess(cmd: list[str]) -> tuple[int, float, str]:
+    '''
+    Run one chunk of the analysis in a separate process.
+    '''
+    start_time = time.time()
+    with subprocess.Popen(cmd,
+                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          universal_newlines=True) as proc:
+        (stdout, _) = proc.communicate()
+
+    return proc.returncode, time.time() - start_time, stdout
+
+
+# _____________________________________________________________________________
+def run_local_workers(rdf_module, chunk_list, output_stem: str, anapath: str,
+                      args):
+    '''
+    Run chunks of the analysis locally in a pool of worker processes.
+    '''
+    fccanalysis_path = shutil.which('fccanalysis')
+    if fccanalysis_path is None:
+        LOGGER.error('The "fccanalysis" executable can\'t be found!\n'
+                     'Was the setup.sh file sourced properly?\nAborting...')
+        sys.exit(3)
+
+    n_workers = min(args.local_workers, len(chunk_list))
+
+    # Split available threads between the workers, the number of threads is
+    # taken from the command line or from the analysis script
+    n_threads = args.ncpus
+    if not isinstance(n_threads, int) or n_threads < 1:
+        n_threads = get_element(rdf_module, "nCPUS")
+    if n_threads < 1:  # use all available threads
+        n_threads = os.cpu_count()
+    n_threads = max(1, n_threads // n_workers)
+
+    LOGGER.info('Running %i chunks over %i local workers with %i thread(s) '
+                'each...', len(chunk_list), n_workers, n_threads)
+
+    output_dir = get_element(rdf_module, "outputDir")
+    output_paths = []
+    futures = {}
+    start_time = time.time()
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        for index, (chunk, entry_range) in enumerate(chunk_list):
+            output_path = os.path.join(output_dir, output_stem,
+                                       f'chunk{index}.root')
+            output_paths.append(output_path)
+
+            cmd = [fccanalysis_path, 'run', anapath, '--batch',
+                   '--output', output_path,
+                   '--ncpus', str(n_threads)]
+            if args.nevents > 0:
+                cmd += ['--nevents', str(args.nevents)]
+            if entry_range is not None:
+                cmd += ['--entry-range', str(entry_range[0]),
+                        str(entry_range[1])]
+            cmd += args.unknown
+            cmd += ['--files-list'] + [str(f) for f in chunk]
+
+            futures[executor.submit(run_chunk_subprocess, cmd)] = index
+
+        failed_chunks = []
+        for n_done, future in enumerate(as_completed(futures), start=1):
+            index = futures[future]
+            returncode, chunk_time, stdout = future.result()
+            if returncode != 0:
+                failed_chunks.append(index)
+                LOGGER.error('Chunk %i failed with exit code %i!\n%s',
+                             index, returncode, stdout)
+                continue
+
+            LOGGER.debug('Output of chunk %i:\n%s', index, stdout)
+            LOGGER.info('Finished chunk %i (%i/%i) in %s',
+                        index, n_done, len(chunk_list),
+                        time.strftime('%H:%M:%S', time.gmtime(chunk_time)))
+    elapsed_time = time.time() - start_time
+
+    done_paths = [p for i, p in enumerate(output_paths)
+                  if i not in failed_chunks]
+    nevents_in = 0
+    nevents_out = 0
+    for nevents, events_processed in scan_files(done_paths):
+        nevents_in += events_processed
+        nevents_out += nevents
+
+    info_msg = f"{' SUMMARY ':=^80}\n"
+    info_msg += 'Elapsed time (H:M:S):    '
+    info_msg += time.strftime('%H:%M:%S', time.gmtime(elapsed_time))
+    info_msg += f'\nChunks processed:        {len(done_paths):,}'
+    info_msg += f' / {len(chunk_list):,}'
+    info_msg += '\nEvents processed/second: '
+    info_msg += f'{int(nevents_in/elapsed_time):,}'
+    info_msg += f'\nTotal events processed:  {nevents_in:,}'
+    info_msg += f'\nNo. result events:       {nevents_out:,}'
+    info_msg += '\n'
+    info_msg += 80 * '='
+    info_msg += '\n'
+    LOGGER.info(info_msg)
+
+    if failed_chunks:
+        LOGGER.error('The following chunks failed: %s\nAborting...',
+                     ', '.join(str(i) for i in sorted(failed_chunks)))
+        sys.exit(3)
+
+
 # _____________________________________________________________________________
 def run_stages(args, rdf_module, anapath):
     '''
@@ -589,6 +772,12 @@ def run_stages(args, rdf_module, anapath):
 
     # Check if test mode is specified, and if so run the analysis on it (this
     # will exit after)
+    if args.local_workers > 1 and \
+            (args.test or len(args.files_list) > 0 or
+             get_element(rdf_module, 'runBatch')):
+        LOGGER.warning('Option "--local-workers" applies only to analysis '
+                       'chunks processed locally, ignoring it...')
+
     if args.test:
         LOGGER.info('Running over test file...')
         testfile_path = get_element(rdf_module, "testFile")
@@ -645,6 +834,19 @@ def run_stages(args, rdf_module, anapath):
         chunks = 1
         if get_element_dict(process_list[process_name], 'chunks'):
             chunks = get_element_dict(process_list[process_name], 'chunks')
+        target_events = get_element_dict(process_list[process_name],
+                                         'targetEventsPerChunk')
+
+        if fraction < 1:
+            file_list = get_subfile_list(file_list, event_list, fraction)
+            event_list = event_list[:len(file_list)]
+
+        if target_events:
+            if get_element_dict(process_list[process_name], 'chunks'):
+                LOGGER.warning('Both "chunks" and "targetEventsPerChunk" are '
+                               'set for process "%s"!\nUsing '
+                               '"targetEventsPerChunk"...', process_name)
+            chunks = max(1, -(-sum(event_list) // target_events))
 
         info_msg = f'Adding process "{process_name}" with:'
         if fraction < 1:
@@ -653,17 +855,16 @@ def run_stages(args, rdf_module, anapath):
         info_msg += f'\n\t- output stem:      {output_stem}'
         if chunks > 1:
             info_msg += f'\n\t- number of chunks: {chunks}'
+        LOGGER.info(info_msg)
 
-        if fraction < 1:
-            file_list = get_subfile_list(file_list, event_list, fraction)
-
-        chunk_list = [file_list]
-        if chunks > 1:
-            chunk_list = get_chunk_list(file_list, chunks)
+        chunk_list = [(file_list, None)]
+        if chunks > 1 or args.entry_range is not None:
+            chunk_list = get_chunk_list(file_list, event_list, chunks,
+                                        args.entry_range)
         LOGGER.info('Number of the output files: %s', f'{len(chunk_list):,}')
 
         # Create directory if more than 1 chunk
-        if chunks > 1:
+        if len(chunk_list) > 1:
             output_directory = os.path.join(output_dir, output_stem)
 
             if not os.path.exists(output_directory):
@@ -682,11 +883,20 @@ def run_stages(args, rdf_module, anapath):
             # Running locally
             LOGGER.info('Running locally...')
             if len(chunk_list) == 1:
+                if args.local_workers > 1:
+                    LOGGER.warning('Process "%s" has only one chunk, '
+                                   'ignoring "--local-workers"...',
+                                   process_name)
                 args.output = f'{output_stem}.root'
-                run_local(rdf_module, chunk_list[0], args)
+                args.entry_range = chunk_list[0][1]
+                run_local(rdf_module, chunk_list[0][0], args)
+            elif args.local_workers > 1:
+                run_local_workers(rdf_module, chunk_list, output_stem,
+                                  anapath, args)
             else:
-                for index, chunk in enumerate(chunk_list):
+                for index, (chunk, entry_range) in enumerate(chunk_list):
                     args.output = f'{output_stem}/chunk{index}.root'
+                    args.entry_range = entry_range
                     run_local(rdf_module, chunk, args)
 
 
@@ -695,6 +905,12 @@ def run_histmaker(args, rdf_module, anapath):
     Run the analysis using histmaker (all stages integrated into one).
     '''
 
+    if args.local_workers > 1:
+        LOGGER.error('Running chunks in parallel with "--local-workers" is '
+                     'not supported for analyses of style "build_graph"!\n'
+                     'Aborting...')
+        sys.exit(3)
+
     # set ncpus, load header files, custom dicts, ...
     initialize(args, rdf_module, anapath)
 
@@ -752,23 +968,19 @@ def run_histmaker(args, rdf_module, anapath):
             file_list = get_subfile_list(file_list, event_list, fraction)
 
         # get the number of events processed, in a potential previous step
+        file_list = [apply_filepath_rewrites(f) for f in file_list]
+        if args.test:
+            file_list = file_list[:1]
         file_list_root = ROOT.vector('string')()
+        for file_name in file_list:
+            file_list_root.push_back(file_name)
         # amount of events processed in previous stage (= 0 if it is the first
         # stage)
         nevents_meta = 0
-        for file_name in file_list:
-            file_name = apply_filepath_rewrites(file_name)
-            file_list_root.push_back(file_name)
-            # Skip check for processed events in case of first stage
-            if get_element(rdf_module, "prodTag") is None:
-                infile = ROOT.TFile.Open(str(file_name), 'READ')
-                for key in infile.GetListOfKeys():
-                    if 'eventsProcessed' == key.GetName():
-                        nevents_meta += infile.eventsProcessed.GetVal()
-                        break
-                infile.Close()
-            if args.test:
-                break
+        # Skip check for processed events in case of first stage
+        if get_element(rdf_module, "prodTag") is None:
+            nevents_meta = sum(events_processed for _, events_processed
+                               in scan_files(file_list))
         events_processed_dict[process] = nevents_meta
         info_msg = f'Add process "{process}" with:'
         info_msg += f'\n\tfraction = {fraction}'
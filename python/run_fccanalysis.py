@@ -14,7 +14,7 @@ import numpy as np
 
 import ROOT  # type: ignore
 from anascript import get_element, get_element_dict, get_attribute
-from process import get_process_info
+from process import get_process_info, scan_files
 from frame import generate_graph
 
 LOGGER = logging.getLogger('FCCAnalyses.run')
@@ -467,26 +467,13 @@ def run_local(args, analysis, infile_list):
     nevents_orig = 0
     # The amount of events in the input file(s)
     nevents_local = 0
-    for filepath in infile_list:
-
-        filepath = apply_filepath_rewrites(filepath)
-
+    infile_list = [apply_filepath_rewrites(f) for f in infile_list]
+    for filepath, (nevents, events_processed) in zip(infile_list,
+                                                     scan_files(infile_list)):
         file_list.push_back(filepath)
         info_msg += f'- {filepath}\t\n'
-        infile = ROOT.TFile.Open(filepath, 'READ')
-        try:
-            nevents_orig += infile.Get('eventsProcessed').GetVal()
-        except AttributeError:
-            pass
-
-        try:
-            nevents_local += infile.Get("events").GetEntries()
-        except AttributeError:
-            LOGGER.error('Input file:\n%s\nis missing events TTree!\n'
-                         'Aborting...', filepath)
-            infile.Close()
-            sys.exit(3)
-        infile.Close()
+        nevents_orig += events_processed
+        nevents_local += nevents
 
     LOGGER.info(info_msg)
 
@@ -573,6 +560,18 @@ def run_fccanalysis(args, analysis_module):
     Run analysis of style "Analysis".
     '''
 
+    if args.local_workers > 1:
+        LOGGER.error('Running chunks in parallel with "--local-workers" is '
+                     'not supported for analyses of style "Analysis"!\n'
+                     'Aborting...')
+        sys.exit(3)
+
+    if args.entry_range is not None:
+        LOGGER.error('Processing an entry range with "--entry-range" is not '
+                     'supported for analyses of style "Analysis"!\n'
+                     'Aborting...')
+        sys.exit(3)
+
     # Get analysis class out of the module
     analysis_args = vars(args)
     analysis = analysis_module.Analysis(analysis_args)
@@ -15,7 +15,7 @@ import math
 import ROOT  # type: ignore
 import cppyy
 from anascript import get_element, get_attribute
-from process import get_process_dict
+from process import get_process_dict, scan_files
 from frame import generate_graph
 
 LOGGER = logging.getLogger('FCCAnalyses.run_final')
@@ -23,30 +23,6 @@ LOGGER = logging.getLogger('FCCAnalyses.run_final')
 ROOT.gROOT.SetBatch(True)
 
 
-# _____________________________________________________________________________
-def get_entries(infilepath: str) -> tuple[int, int]:
-    '''
-    Get number of original entries and number of actual entries in the file
-    '''
-    events_processed = 0
-    events_in_ttree = 0
-
-    with ROOT.TFile(infilepath, 'READ') as infile:
-        try:
-            events_processed = infile.Get('eventsProcessed').GetVal()
-        except AttributeError:
-            LOGGER.warning('Input file is missing information about '
-                           'original number of events!')
-
-        try:
-            events_in_ttree = infile.Get("events").GetEntries()
-        except AttributeError:
-            LOGGER.error('Input file is missing "events" TTree!\nAborting...')
-            sys.exit(3)
-
-    return events_processed, events_in_ttree
-
-
 # _____________________________________________________________________________
 def get_processes(rdf_module: object) -> list[str]:
     '''
@@ -261,7 +237,7 @@ def run(rdf_module, args) -> None:
     # Find processes (samples) to run over
     process_list: list[str] = get_processes(rdf_module)
 
-    # Find number of events per process
+    # Find input files per process
     for process_name in process_list:
         process_events[process_name] = 0
         events_ttree[process_name] = 0
@@ -274,8 +250,6 @@ def run(rdf_module, args) -> None:
                          infilepath)
         else:
             LOGGER.info('Open file:\n  %s', infilepath)
-            process_events[process_name], events_ttree[process_name] = \
-                get_entries(infilepath)
             file_list[process_name].push_back(infilepath)
 
         indirpath = input_dir + process_name
@@ -284,13 +258,21 @@ def run(rdf_module, args) -> None:
             flist = glob.glob(indirpath + '/chunk*.root')
             for filepath in flist:
                 info_msg += '\n\t' + filepath
-                chunk_process_events, chunk_events_ttree = \
-                    get_entries(filepath)
-                process_events[process_name] += chunk_process_events
-                events_ttree[process_name] += chunk_events_ttree
                 file_list[process_name].push_back(filepath)
             LOGGER.info(info_msg)
 
+    # Find number of events per process, all files are scanned at once
+    all_files = [(process_name, str(filepath))
+                 for process_name in process_list
+                 for filepath in file_list[process_name]]
+    for (process_name, filepath), (nevents, events_processed) in \
+            zip(all_files, scan_files([f for _, f in all_files])):
+        if events_processed == 0:
+            LOGGER.warning('Input file %s is missing information about '
+                           'original number of events!', filepath)
+        process_events[process_name] += events_processed
+        events_ttree[process_name] += nevents
+
     info_msg = 'Processed events:'
     for process_name, n_events in process_events.items():
         info_msg += f'\n\t- {process_name}: {n_events:,}'
@@ -318,9 +300,15 @@ def run(rdf_module, args) -> None:
     # Check whether to save resulting TTree(s) into a file(s)
     do_tree = get_element(rdf_module, "doTree", True)
 
-    # Main loop
+    # Book cuts, histograms and snapshots for all processes first, event loops
+    # of all processes are run together afterwards
+    all_events_counts = {}
+    count_lists = {}
+    histos_lists = {}
+    snapshot_lists = {}
+    gen_scale_factors = {}
     for process_name in process_list:
-        LOGGER.info('Running over process: %s', process_name)
+        LOGGER.info('Booking process: %s', process_name)
 
         if process_events[process_name] <= 0:
             LOGGER.error('Can\'t scale histograms, the number of processed '
@@ -335,14 +323,9 @@ def run(rdf_module, args) -> None:
             for define in define_list:
                 dframe = dframe.Define(define, define_list[define])
 
-        fout_list = []
         histos_list = []
         snapshots = []
         count_list = []
-        cuts_list = []
-        cuts_list.append(process_name)
-        eff_list = []
-        eff_list.append(process_name)
         results[process_name] = {}
 
         if do_scale:
@@ -379,6 +362,8 @@ def run(rdf_module, args) -> None:
             LOGGER.info(' - matching efficiency:' + lpn*' ' + '%.4g',
                         matching_efficiency)
             LOGGER.info('Integrated luminosity: %.4g pb-1', int_lumi)
+            gen_scale_factors[process_name] = (xsec, kfactor,
+                                               matching_efficiency, gen_sf)
 
         # Define all histos, snapshots, etc...
         LOGGER.info('Defining cuts and histograms')
@@ -435,7 +420,6 @@ def run(rdf_module, args) -> None:
                 # output file for the TTree
                 fout = os.path.join(output_dir,
                                     process_name + '_' + cut_name + '.root')
-                fout_list.append(fout)
 
                 opts = ROOT.RDF.RSnapshotOptions()
                 opts.fLazy = True
@@ -443,10 +427,30 @@ def run(rdf_module, args) -> None:
                 # run
                 snapshots.append(dframe_cut.Snapshot("events", fout, "", opts))
 
-        # Now perform the loop and evaluate everything at once.
-        LOGGER.info('Evaluating...')
-        all_events_raw = dframe.Count().GetValue()
-        LOGGER.info('Done')
+        all_events_counts[process_name] = dframe.Count()
+        count_lists[process_name] = count_list
+        histos_lists[process_name] = histos_list
+        snapshot_lists[process_name] = snapshots
+
+        if args.graph:
+            generate_graph(dframe, args)
+            args.graph = False
+
+    # Now perform the loops of all processes and evaluate everything at once.
+    LOGGER.info('Evaluating...')
+    ROOT.RDF.RunGraphs(list(all_events_counts.values()))
+    LOGGER.info('Done')
+
+    for process_name in process_list:
+        LOGGER.info('Results for process: %s', process_name)
+        count_list = count_lists[process_name]
+        histos_list = histos_lists[process_name]
+        snapshots = snapshot_lists[process_name]
+        if do_scale:
+            xsec, kfactor, matching_efficiency, gen_sf = \
+                gen_scale_factors[process_name]
+
+        all_events_raw = all_events_counts[process_name].GetValue()
 
         nevents_real += all_events_raw
         uncertainty = ROOT.Math.sqrt(all_events_raw)
@@ -501,10 +505,6 @@ def run(rdf_module, args) -> None:
 
         LOGGER.info(info_msg)
 
-        if args.graph:
-            generate_graph(dframe, args)
-            args.graph = False
-
         # And save everything
         LOGGER.info('Saving the outputs...')
         if do_scale:
@@ -557,6 +557,12 @@ def run(rdf_module, args) -> None:
                 fout = os.path.join(output_dir,
                                     process_name + '_' + cut + '.root')
                 with ROOT.TFile(fout, 'UPDATE') as outfile:
+                    # Number of events in file, taken from the TTree header
+                    try:
+                        nevt_infile = outfile.Get('events').GetEntries()
+                    except AttributeError:
+                        nevt_infile = 0
+
                     # write all metadata info to the output file
                     param = ROOT.TParameter(int)("eventsProcessed",
                                                  process_events[process_name])
@@ -590,11 +596,12 @@ def run(rdf_module, args) -> None:
 
                 # Number of events from a particular cut
                 nevt_cut = results[process_name][cut]['n_events_raw']
-                # Number of events in file
-                try:
-                    nevt_infile = snapshots[i].Count().GetValue()
-                except cppyy.gbl.std.runtime_error:
-                    nevt_infile = 0
+                # Re-read the whole output file, if requested
+                if args.verify_outputs:
+                    try:
+                        nevt_infile = snapshots[i].Count().GetValue()
+                    except cppyy.gbl.std.runtime_error:
+                        nevt_infile = 0
 
                 if nevt_cut != nevt_infile:
                     LOGGER.error('Number of events for cut "%s" in sample '
@@ -0,0 +1,183 @@
+'''
+Vertexing performance validation histograms from RDataFrame.
+
+The MC and reconstructed vertex collections produced by the vertex_perf example
+analysis are reduced event by event with RVec expressions, so that all the
+validation histograms of a sample are filled in a single (multi-threaded)
+event loop.
+'''
+
+import logging
+import ROOT  # type: ignore
+
+
+ROOT.gROOT.SetBatch(True)
+
+LOGGER: logging.Logger = logging.getLogger('FCCAnalyses.vertexing_validation')
+
+
+# _____________________________________________________________________________
+def _histo(hists: dict, dframe, name: str, title: str,
+           nbins: int, xmin: float, xmax: float, expr: str) -> None:
+    '''
+    Book one histogram of the scalar or RVec expression.
+    '''
+    if name in hists:
+        raise ValueError(f'Histogram "{name}" already booked!')
+    column = f'vtxval_{name}'
+    hists[name] = dframe.Define(column, expr).Histo1D(
+        (name, title, nbins, xmin, xmax), column)
+
+
+# _____________________________________________________________________________
+def define_vertex_selection(dframe, chi2_max: float = 10.):
+    '''
+    Define the masks of the reconstructed vertices entering the validation:
+    vertices with 0 < chi2 < chi2_max, the primary vertex and the displaced
+    vertices among them, together with the primary vertex position, set to
+    the origin if no primary vertex passes the selection.
+    '''
+    return dframe \
+        .Define('vtxval_good',
+                f'Vertex_chi2 > 0 && Vertex_chi2 < {chi2_max}') \
+        .Define('vtxval_pv', 'vtxval_good && Vertex_isPV > 0') \
+        .Define('vtxval_sv', 'vtxval_good && !(Vertex_isPV > 0)') \
+        .Define('vtxval_dv', 'vtxval_good && Vertex_isPV == 0') \
+        .Define('vtxval_pv_ind', 'ROOT::VecOps::Nonzero(vtxval_pv)') \
+        .Define('vtxval_pv_x',
+                'vtxval_pv_ind.empty() ? 0.f : Vertex_x[vtxval_pv_ind[0]]') \
+        .Define('vtxval_pv_y',
+                'vtxval_pv_ind.empty() ? 0.f : Vertex_y[vtxval_pv_ind[0]]') \
+        .Define('vtxval_pv_z',
+                'vtxval_pv_ind.empty() ? 0.f : Vertex_z[vtxval_pv_ind[0]]') \
+        .Define('vtxval_dv_x', 'Vertex_x[vtxval_dv]') \
+        .Define('vtxval_dv_y', 'Vertex_y[vtxval_dv]') \
+        .Define('vtxval_dv_z', 'Vertex_z[vtxval_dv]') \
+        .Define('vtxval_mc_sv_ntrk',
+                'MC_Vertex_ntrk[ROOT::VecOps::Enumerate(MC_Vertex_ntrk) != 0]')
+
+
+# _____________________________________________________________________________
+def book_histograms(dframe, chi2_max: float = 10.,
+                    ntrks: tuple[int, ...] = (2, 3, 4, 5, 6)) -> dict:
+    '''
+    Book the vertexing validation histograms on the dataframe.
+
+    Distances to the MC vertices are given in um, flight distances in mm.
+    Returns the histograms, still to be filled, by name.
+    '''
+    hists: dict = {}
+    dframe = define_vertex_selection(dframe, chi2_max)
+
+    # vertex multiplicities
+    _histo(hists, dframe, 'h_mc_all', ';N vertex;', 20, 0, 20, 'MC_Vertex_n')
+    _histo(hists, dframe, 'h_reco', ';N vertex;', 20, 0, 20, 'Vertex_n')
+    _histo(hists, dframe, 'h_mc', ';N vertex;', 20, 0, 20,
+           'ROOT::VecOps::Sum(MC_Vertex_ntrk > 1)')
+    _histo(hists, dframe, 'h_recoChi2Cut', ';N vertex;', 20, 0, 20,
+           'ROOT::VecOps::Sum(vtxval_good)')
+    for ntrk in ntrks:
+        _histo(hists, dframe, f'h_nSV_mc_{ntrk}trk', ';N vertex;', 10, 0, 10,
+               f'ROOT::VecOps::Sum(vtxval_mc_sv_ntrk == {ntrk})')
+        _histo(hists, dframe, f'h_nSV_rc_{ntrk}trk', ';N vertex;', 10, 0, 10,
+               f'ROOT::VecOps::Sum(Vertex_ntrk[vtxval_dv] == {ntrk})')
+
+    # track multiplicities, reconstructed vertices taken regardless of chi2
+    _histo(hists, dframe, 'h_ntrk_mc_pv', ';N tracks PV;', 30, 0, 30,
+           'MC_Vertex_ntrk[ROOT::VecOps::Enumerate(MC_Vertex_ntrk) == 0]')
+    _histo(hists, dframe, 'h_ntrk_rc_pv', ';N tracks PV;', 30, 0, 30,
+           'Vertex_ntrk[Vertex_isPV > 0]')
+    _histo(hists, dframe, 'h_ntrk_mc_sv', ';N tracks SV;', 10, 0, 10,
+           'vtxval_mc_sv_ntrk')
+    _histo(hists, dframe, 'h_ntrk_rc_sv', ';N tracks SV;', 10, 0, 10,
+           'Vertex_ntrk[!(Vertex_isPV > 0)]')
+
+    # primary vertex resolution
+    _histo(hists, dframe, 'h_PV2MC',
+           ';Distance to MC primary vertex #mum;', 200, 0, 200,
+           '1000.f * Vertex_d2MC[vtxval_pv]')
+    for axis in ('x', 'y', 'z'):
+        _histo(hists, dframe, f'h_PV2MC_{axis}',
+               f';Distance to MC primary vertex {axis} #mum;', 200, -100, 100,
+               f'1000.f * Vertex_d2MC{axis}[vtxval_pv]')
+        _histo(hists, dframe, f'h_PV2MC_{axis}_pull',
+               f';Primary Vertex pull {axis};', 200, -10, 10,
+               f'Vertex_d2MC{axis}[vtxval_pv] / Vertex_{axis}Err[vtxval_pv]')
+
+    # secondary vertex resolution and flight distance, per track multiplicity
+    for ntrk in ntrks:
+        sv_mask = f'vtxval_sv{ntrk}'
+        mcind = f'vtxval_sv{ntrk}_mcind'
+        sv_dframe = dframe \
+            .Define(sv_mask, f'vtxval_sv && Vertex_ntrk == {ntrk}') \
+            .Define(mcind, f'Vertex_mcind[{sv_mask} && Vertex_mcind >= 0 && '
+                    'Vertex_mcind < int(MC_Vertex_ntrk.size())]')
+        _histo(hists, sv_dframe, f'h_recoeff_SV_{ntrk}trk',
+               ';N tracks MC;', 10, 0, 10,
+               'ROOT::VecOps::Take(MC_Vertex_ntrk, ROOT::VecOps::RVec<size_t>('
+               f'{mcind}.begin(), {mcind}.end()))')
+        _histo(hists, sv_dframe, f'h_SV2MC_{ntrk}trk',
+               ';Distance to MC secondary vertex #mum;', 200, 0, 200,
+               f'1000.f * Vertex_d2MC[{sv_mask}]')
+        _histo(hists, sv_dframe, f'h_FD2PV_{ntrk}trk',
+               f';Flight distance from PV {ntrk} tracks mm;', 200, 0, 10,
+               f'Vertex_d2PV[{sv_mask}]')
+        _histo(hists, sv_dframe, f'h_FD2PV_{ntrk}trk_sig',
+               f';Flight distance significance from PV {ntrk} tracks;',
+               200, 0, 50,
+               f'Vertex_d2PVSig[{sv_mask}]')
+        for axis in ('x', 'y', 'z'):
+            _histo(hists, sv_dframe, f'h_SV2MC_{axis}_{ntrk}trk',
+                   f';Distance to MC secondary vertex {axis} #mum;',
+                   200, -100, 100,
+                   f'1000.f * Vertex_d2MC{axis}[{sv_mask}]')
+            # Secondary vertex pulls keep their original (h_PV2MC_) names
+            _histo(hists, sv_dframe, f'h_PV2MC_{axis}_pull_{ntrk}trk',
+                   f';Secondary Vertex pull {axis} (N tracks = {ntrk});',
+                   200, -10, 10,
+                   f'Vertex_d2MC{axis}[{sv_mask}] / '
+                   f'Vertex_{axis}Err[{sv_mask}]')
+            _histo(hists, sv_dframe, f'h_FD2PV_{axis}_{ntrk}trk',
+                   f';Flight distance {axis} from PV {ntrk} tracks mm;',
+                   200, -10, 10,
+                   f'Vertex_d2PV{axis}[{sv_mask}]')
+            _histo(hists, sv_dframe, f'h_FD2PV_{axis}_{ntrk}trk_sig',
+                   f';Flight distance significance {axis} from PV {ntrk} '
+                   'tracks;', 200, -50, 50,
+                   f'Vertex_d2PV{axis}Sig[{sv_mask}]')
+
+    # closest displaced vertices
+    _histo(hists, dframe.Filter('!vtxval_dv_x.empty()'), 'h_dmin_PV2DV',
+           ';Minimum distance between PV and DV #mum;', 200, 0, 10000,
+           '1000. * ROOT::VecOps::Min(ROOT::VecOps::sqrt('
+           'ROOT::VecOps::pow(vtxval_dv_x - vtxval_pv_x, 2) + '
+           'ROOT::VecOps::pow(vtxval_dv_y - vtxval_pv_y, 2) + '
+           'ROOT::VecOps::pow(vtxval_dv_z - vtxval_pv_z, 2)))')
+    # unique pairs only exist with at least two displaced vertices
+    pairs_dframe = dframe \
+        .Filter('vtxval_dv_x.size() > 1') \
+        .Define('vtxval_dv_pairs',
+                'ROOT::VecOps::Combinations(vtxval_dv_x, 2)')
+    _histo(hists, pairs_dframe, 'h_dmin_DV2DV',
+           ';Minimum distance between DV #mum;', 200, 0, 5000,
+           '1000. * ROOT::VecOps::Min(ROOT::VecOps::sqrt(' + ' + '.join(
+               f'ROOT::VecOps::pow('
+               f'ROOT::VecOps::Take(vtxval_dv_{axis}, vtxval_dv_pairs[0]) - '
+               f'ROOT::VecOps::Take(vtxval_dv_{axis}, vtxval_dv_pairs[1]), 2)'
+               for axis in ('x', 'y', 'z')) + '))')
+
+    LOGGER.debug('Booked %i vertexing validation histograms', len(hists))
+
+    return hists
+
+
+# _____________________________________________________________________________
+def run(hists: dict) -> dict:
+    '''
+    Fill all the booked histograms, with one event loop per dataframe, and
+    return them by name.
+    '''
+    LOGGER.info('Filling %i vertexing validation histograms...', len(hists))
+    ROOT.RDF.RunGraphs(list(hists.values()))
+
+    return {name: hist.GetValue() for name, hist in hists.items()}
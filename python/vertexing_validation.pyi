@@ -0,0 +1,9 @@
+# generated with `stubgen vertexing_validation.py`
+
+import logging
+
+LOGGER: logging.Logger
+
+def define_vertex_selection(dframe, chi2_max: float = 10.): ...
+def book_histograms(dframe, chi2_max: float = 10., ntrks: tuple[int, ...] = (2, 3, 4, 5, 6)) -> dict: ...
+def run(hists: dict) -> dict: ...
@@ -3,6 +3,8 @@
 #include "catch2/catch_test_macros.hpp"
 #include <catch2/benchmark/catch_benchmark.hpp>
 
+#include <random>
+
 
 TEST_CASE("calculate_thrust", "[algorithms]") {
   ROOT::VecOps::RVec<float> x {0., 1., 3., 7., 11., 3.};
@@ -13,3 +15,56 @@ TEST_CASE("calculate_thrust", "[algorithms]") {
         return FCCAnalyses::Algorithms::calculate_thrust()(x, y, z);
   };
 }
+
+
+// Two back-to-back jets of particles, roughly like a hadronic Z decay
+void fill_event(size_t nParticles,
+                ROOT::VecOps::RVec<float>& x,
+                ROOT::VecOps::RVec<float>& y,
+                ROOT::VecOps::RVec<float>& z) {
+  std::mt19937 gen(nParticles);
+  std::normal_distribution<float> spread(0., 0.5);
+  std::exponential_distribution<float> momentum(0.5);
+  x.clear();
+  y.clear();
+  z.clear();
+  for (size_t i = 0; i < nParticles; ++i) {
+    float dir = i % 2 == 0 ? 1. : -1.;
+    float p = momentum(gen);
+    x.push_back(p * (0.6f * dir + spread(gen)));
+    y.push_back(p * (0.3f * dir + spread(gen)));
+    z.push_back(p * (0.74f * dir + spread(gen)));
+  }
+}
+
+
+TEST_CASE("thrust_sphericity_realistic", "[algorithms]") {
+  ROOT::VecOps::RVec<float> x, y, z;
+  FCCAnalyses::Algorithms::minimize_thrust minThrust;
+  FCCAnalyses::Algorithms::minimize_sphericity minSphericity;
+
+  for (size_t nParticles : {50, 100, 150}) {
+    fill_event(nParticles, x, y, z);
+    const std::string suffix = " " + std::to_string(nParticles) + " particles";
+
+    BENCHMARK("calculate_thrust" + suffix) {
+      return FCCAnalyses::Algorithms::calculate_thrust()(x, y, z);
+    };
+
+    BENCHMARK("calculate_thrust_sweep" + suffix) {
+      return FCCAnalyses::Algorithms::calculate_thrust_sweep()(x, y, z);
+    };
+
+    BENCHMARK("minimize_thrust" + suffix) {
+      return minThrust(x, y, z);
+    };
+
+    BENCHMARK("minimize_sphericity" + suffix) {
+      return minSphericity(x, y, z);
+    };
+
+    BENCHMARK("calculate_sphericity" + suffix) {
+      return FCCAnalyses::Algorithms::calculate_sphericity()(x, y, z);
+    };
+  }
+}
@@ -0,0 +1,59 @@
+#include "FastJet/JetClustering.h"
+
+#include "catch2/catch_test_macros.hpp"
+#include <catch2/benchmark/catch_benchmark.hpp>
+
+#include <tbb/parallel_for.h>
+#include <tbb/task_arena.h>
+
+#include <cmath>
+#include <random>
+#include <string>
+
+
+// Events with two back-to-back jets of particles, roughly like a hadronic Z
+// decay
+std::vector<std::vector<fastjet::PseudoJet>> make_events(size_t nEvents,
+                                                         size_t nParticles) {
+  std::mt19937 gen(nParticles);
+  std::normal_distribution<double> spread(0., 0.5);
+  std::exponential_distribution<double> momentum(0.5);
+  std::vector<std::vector<fastjet::PseudoJet>> events(nEvents);
+  for (auto& event : events) {
+    for (size_t i = 0; i < nParticles; ++i) {
+      double dir = i % 2 == 0 ? 1. : -1.;
+      double p = momentum(gen);
+      double px = p * (0.6 * dir + spread(gen));
+      double py = p * (0.3 * dir + spread(gen));
+      double pz = p * (0.74 * dir + spread(gen));
+      event.emplace_back(px, py, pz, std::sqrt(px * px + py * py + pz * pz));
+    }
+  }
+  return events;
+}
+
+
+// Exclusive ee_kt clustering of a block of events, run concurrently on 1 to 8
+// threads with a single functor, as in a multi-threaded RDataFrame Define
+TEST_CASE("clustering_ee_kt_scaling", "[jetclustering]") {
+  const auto events = make_events(200, 60);
+  std::vector<size_t> nJetsFound(events.size());
+
+  for (int nJets = 2; nJets <= 6; ++nJets) {
+    for (int nThreads : {1, 2, 4, 8}) {
+      JetClustering::clustering_ee_kt clustering(2, nJets, 1, 0, nThreads);
+      tbb::task_arena arena(nThreads);
+      const std::string suffix = " " + std::to_string(nJets) + " jets, " +
+                                 std::to_string(nThreads) + " threads";
+
+      BENCHMARK("clustering_ee_kt exclusive" + suffix) {
+        arena.execute([&] {
+          tbb::parallel_for(size_t(0), events.size(), [&](size_t i) {
+            nJetsFound[i] = clustering(events[i]).jets.size();
+          });
+        });
+        return nJetsFound;
+      };
+    }
+  }
+}
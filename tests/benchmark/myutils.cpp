@@ -13,3 +13,75 @@ TEST_CASE("isPV", "[basics]") {
         return FCCAnalyses::myUtils::isPV(p, index1);
   };
 }
+
+// primary vertex plus n_sv three-prong secondary vertices, each track with the
+// refitted quantities the vertex fitter attaches to the vertex object
+void fill_vertices(int n_sv,
+                   ROOT::VecOps::RVec<FCCAnalyses::VertexingUtils::FCCAnalysesVertex> &vertices,
+                   ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> &recop) {
+  const int ntr_pv = 20;
+  for (int iv = 0; iv <= n_sv; iv++) {
+    FCCAnalyses::VertexingUtils::FCCAnalysesVertex vtx;
+    int ntr = iv == 0 ? ntr_pv : 3;
+    vtx.vertex.primary = iv == 0 ? 1 : 0;
+    vtx.vertex.chi2 = 1.;
+    vtx.vertex.position = {0.1f * iv, -0.05f * iv, 0.2f * iv};
+    vtx.ntracks = ntr;
+    vtx.mc_ind = iv;
+    for (int it = 0; it < ntr; it++) {
+      edm4hep::ReconstructedParticleData p;
+      p.type = 211;
+      p.charge = it == 1 ? -1 : 1;
+      p.mass = 0.13957;
+      p.momentum = {0.3f + 0.1f * it, 0.5f - 0.05f * it, 1.f + 0.2f * iv};
+      vtx.reco_ind.push_back(recop.size());
+      vtx.reco_chi2.push_back(0.5);
+      vtx.updated_track_momentum_at_vertex.push_back(
+          TVector3(p.momentum.x, p.momentum.y, p.momentum.z));
+      vtx.updated_track_parameters.push_back(TVectorD(5));
+      vtx.final_track_phases.push_back(0.01 * it);
+      recop.push_back(p);
+    }
+    vertices.push_back(vtx);
+  }
+}
+
+// vertex block of the flavour (B/tau) stage-1 analyses: every analyzer used to
+// get its own copy of the vertex and particle collections
+TEST_CASE("Vertex chain", "[vertexing]") {
+  ROOT::VecOps::RVec<FCCAnalyses::VertexingUtils::FCCAnalysesVertex> vertices;
+  ROOT::VecOps::RVec<edm4hep::ReconstructedParticleData> recop;
+  fill_vertices(5, vertices, recop);
+
+  BENCHMARK("stage-1 vertex chain, 5 SVs") {
+    auto vertex_x = FCCAnalyses::myUtils::get_Vertex_x(vertices);
+    auto vertex_y = FCCAnalyses::myUtils::get_Vertex_y(vertices);
+    auto vertex_z = FCCAnalyses::myUtils::get_Vertex_z(vertices);
+    auto vertex_chi2 = FCCAnalyses::myUtils::get_Vertex_chi2(vertices);
+    auto vertex_ntrk = FCCAnalyses::myUtils::get_Vertex_ntracks(vertices);
+    auto vertex_mass = FCCAnalyses::myUtils::get_Vertex_mass(vertices, recop);
+    auto vertex_d2PV = FCCAnalyses::myUtils::get_Vertex_d2PV(vertices, -1);
+    auto dPV2DV_max = FCCAnalyses::myUtils::get_dPV2DV_max(vertex_d2PV);
+    auto tau23pi = FCCAnalyses::myUtils::build_tau23pi(vertices, recop);
+    return FCCAnalyses::myUtils::getFCCAnalysesComposite_mass(tau23pi);
+  };
+
+  // same chain with every argument copied, as when the analyzers took their
+  // inputs by value
+  auto copy = [](const auto &coll) { return coll; };
+  BENCHMARK("stage-1 vertex chain, 5 SVs, inputs copied (baseline)") {
+    auto vertex_x = FCCAnalyses::myUtils::get_Vertex_x(copy(vertices));
+    auto vertex_y = FCCAnalyses::myUtils::get_Vertex_y(copy(vertices));
+    auto vertex_z = FCCAnalyses::myUtils::get_Vertex_z(copy(vertices));
+    auto vertex_chi2 = FCCAnalyses::myUtils::get_Vertex_chi2(copy(vertices));
+    auto vertex_ntrk = FCCAnalyses::myUtils::get_Vertex_ntracks(copy(vertices));
+    auto vertex_mass =
+        FCCAnalyses::myUtils::get_Vertex_mass(copy(vertices), copy(recop));
+    auto vertex_d2PV =
+        FCCAnalyses::myUtils::get_Vertex_d2PV(copy(vertices), -1);
+    auto dPV2DV_max = FCCAnalyses::myUtils::get_dPV2DV_max(copy(vertex_d2PV));
+    auto tau23pi =
+        FCCAnalyses::myUtils::build_tau23pi(copy(vertices), copy(recop));
+    return FCCAnalyses::myUtils::getFCCAnalysesComposite_mass(copy(tau23pi));
+  };
+}
@@ -0,0 +1,139 @@
+#include "FCCAnalyses/VertexFitterSimple.h"
+
+#include "catch2/catch_test_macros.hpp"
+#include <catch2/benchmark/catch_benchmark.hpp>
+
+namespace FCCAnalyses::VertexFitterSimple {
+// defined in VertexFitterSimple.cc, not part of the public interface
+int supress_stdout();
+void resume_stdout(int fd);
+} // namespace FCCAnalyses::VertexFitterSimple
+
+namespace {
+// tracks coming from a common displaced vertex, with a diagonal covariance
+// matrix (edm4hep convention, units = mm)
+ROOT::VecOps::RVec<edm4hep::TrackState> make_tracks(int ntracks) {
+  ROOT::VecOps::RVec<edm4hep::TrackState> tracks;
+  for (int i = 0; i < ntracks; i++) {
+    edm4hep::TrackState track;
+    track.D0 = 0.1 * (i % 2 == 0 ? 1. : -1.);
+    track.phi = 0.4 + 0.15 * i;
+    track.omega = (i % 2 == 0 ? 1. : -1.) * (2.e-4 + 1.e-4 * i);
+    track.Z0 = 0.05 * i;
+    track.tanLambda = 0.3 - 0.1 * i;
+    track.covMatrix.fill(0.);
+    track.covMatrix[0] = 1.e-4;
+    track.covMatrix[2] = 1.e-8;
+    track.covMatrix[5] = 1.e-12;
+    track.covMatrix[9] = 1.e-4;
+    track.covMatrix[14] = 1.e-8;
+    tracks.push_back(track);
+  }
+  return tracks;
+}
+
+// VertexFitter_Tk as it was before the track parameters and covariance
+// matrices were kept in the per-thread workspace: new objects are allocated
+// for every track of every fit (no beam-spot constraint, no track indices)
+FCCAnalyses::VertexingUtils::FCCAnalysesVertex
+baseline_VertexFitter_Tk(int Primary,
+                         ROOT::VecOps::RVec<edm4hep::TrackState> tracks) {
+  namespace vfs = FCCAnalyses::VertexFitterSimple;
+  namespace vu = FCCAnalyses::VertexingUtils;
+  int fd = vfs::supress_stdout();
+
+  vu::FCCAnalysesVertex TheVertex;
+  edm4hep::VertexData result;
+  ROOT::VecOps::RVec<float> reco_chi2;
+  ROOT::VecOps::RVec<TVectorD> updated_track_parameters;
+  ROOT::VecOps::RVec<TVector3> updated_track_momentum_at_vertex;
+
+  int Ntr = tracks.size();
+  TheVertex.ntracks = Ntr;
+  bool Units_mm = true;
+
+  TVectorD **trkPar = new TVectorD *[Ntr];
+  TMatrixDSym **trkCov = new TMatrixDSym *[Ntr];
+  for (Int_t i = 0; i < Ntr; i++) {
+    edm4hep::TrackState t = tracks[i];
+    TVectorD par = vu::get_trackParam(t, Units_mm);
+    trkPar[i] = new TVectorD(par);
+    TMatrixDSym Cov = vu::get_trackCov(t, Units_mm);
+    trkCov[i] = new TMatrixDSym(Cov);
+  }
+
+  VertexFit theVertexFit(Ntr, trkPar, trkCov);
+  TVectorD x = theVertexFit.GetVtx();
+  result.position = edm4hep::Vector3f(x(0), x(1), x(2));
+  result.chi2 = theVertexFit.GetVtxChi2() / (2.0 * Ntr - 3.0);
+  TVectorD tracks_chi2 = theVertexFit.GetVtxChi2List();
+  for (int it = 0; it < Ntr; it++) {
+    reco_chi2.push_back(tracks_chi2[it]);
+  }
+  TMatrixDSym covX = theVertexFit.GetVtxCov();
+  std::array<float, 6> covMatrix;
+  covMatrix[0] = covX(0, 0);
+  covMatrix[1] = covX(1, 0);
+  covMatrix[2] = covX(1, 1);
+  covMatrix[3] = covX(2, 0);
+  covMatrix[4] = covX(2, 1);
+  covMatrix[5] = covX(2, 2);
+  result.covMatrix = covMatrix;
+  result.algorithmType = 1;
+  result.primary = Primary;
+  TheVertex.vertex = result;
+
+  VertexMore theVertexMore(&theVertexFit, Units_mm);
+  for (Int_t i = 0; i < Ntr; i++) {
+    TVectorD updated_par = theVertexFit.GetNewPar(i);
+    updated_track_parameters.push_back(
+        vu::Delphes2Edm4hep_TrackParam(updated_par, Units_mm));
+    updated_track_momentum_at_vertex.push_back(theVertexMore.GetMomentum(i));
+  }
+  TheVertex.updated_track_parameters = updated_track_parameters;
+  TheVertex.updated_track_momentum_at_vertex =
+      updated_track_momentum_at_vertex;
+  TheVertex.reco_chi2 = reco_chi2;
+
+  for (Int_t i = 0; i < Ntr; i++) {
+    delete trkPar[i];
+    delete trkCov[i];
+  }
+  delete[] trkPar;
+  delete[] trkCov;
+
+  vfs::resume_stdout(fd);
+
+  return TheVertex;
+}
+} // namespace
+
+TEST_CASE("VertexFitter_Tk", "[vertexing]") {
+  ROOT::VecOps::RVec<edm4hep::TrackState> tracks2 = make_tracks(2);
+  ROOT::VecOps::RVec<edm4hep::TrackState> tracks3 = make_tracks(3);
+  ROOT::VecOps::RVec<edm4hep::TrackState> tracks5 = make_tracks(5);
+
+  BENCHMARK("baseline 2 tracks") {
+    return baseline_VertexFitter_Tk(2, tracks2);
+  };
+
+  BENCHMARK("VertexFitter_Tk 2 tracks") {
+    return FCCAnalyses::VertexFitterSimple::VertexFitter_Tk(2, tracks2);
+  };
+
+  BENCHMARK("baseline 3 tracks") {
+    return baseline_VertexFitter_Tk(2, tracks3);
+  };
+
+  BENCHMARK("VertexFitter_Tk 3 tracks") {
+    return FCCAnalyses::VertexFitterSimple::VertexFitter_Tk(2, tracks3);
+  };
+
+  BENCHMARK("baseline 5 tracks") {
+    return baseline_VertexFitter_Tk(2, tracks5);
+  };
+
+  BENCHMARK("VertexFitter_Tk 5 tracks") {
+    return FCCAnalyses::VertexFitterSimple::VertexFitter_Tk(2, tracks5);
+  };
+}
@@ -0,0 +1,108 @@
+#include "FCCAnalyses/JetConstituentsUtils.h"
+
+// Catch2
+#include "catch2/catch_test_macros.hpp"
+
+namespace {
+// one jet made of a charged pion with a track and of a photon with a cluster
+struct JetEvent {
+  ROOT::VecOps::RVec<fastjet::PseudoJet> jets;
+  ROOT::VecOps::RVec<FCCAnalyses::JetConstituentsUtils::FCCAnalysesJetConstituents> jcs;
+  ROOT::VecOps::RVec<edm4hep::TrackState> tracks;
+  ROOT::VecOps::RVec<edm4hep::Quantity> dNdx;
+  ROOT::VecOps::RVec<edm4hep::TrackData> trackdata;
+  ROOT::VecOps::RVec<float> track_L;
+  ROOT::VecOps::RVec<edm4hep::TrackerHitData> trackerhits;
+  ROOT::VecOps::RVec<edm4hep::ClusterData> gammadata;
+  ROOT::VecOps::RVec<edm4hep::ClusterData> nhdata;
+  ROOT::VecOps::RVec<edm4hep::CalorimeterHitData> calohits;
+  TLorentzVector pv;
+
+  JetEvent() {
+    edm4hep::ReconstructedParticleData pion;
+    pion.momentum = {3., 1., 2.};
+    pion.mass = 0.13957;
+    pion.charge = 1.;
+    pion.type = 0;
+    pion.energy = std::sqrt(14. + pion.mass * pion.mass);
+    pion.tracks_begin = 0;
+    pion.clusters_begin = 1;
+    edm4hep::ReconstructedParticleData photon;
+    photon.momentum = {1., 0.5, -0.5};
+    photon.type = 22;
+    photon.energy = std::sqrt(1.5);
+    photon.tracks_begin = 1;
+    photon.clusters_begin = 0;
+    jcs.push_back({pion, photon});
+    jets.emplace_back(4., 1.5, 1.5, pion.energy + photon.energy);
+
+    edm4hep::TrackState track;
+    track.D0 = 0.05;
+    track.Z0 = -0.1;
+    track.phi = 0.3;
+    for (int i = 0; i < 15; ++i)
+      track.covMatrix[i] = 1.e-4 * (i + 1);
+    tracks.push_back(track);
+    edm4hep::TrackData trackdatum;
+    trackdatum.trackerHits_begin = 0;
+    trackdatum.trackerHits_end = 1;
+    trackdatum.dxQuantities_begin = 0;
+    trackdata.push_back(trackdatum);
+    edm4hep::Quantity quantity;
+    quantity.value = 5000.;
+    dNdx.push_back(quantity);
+    edm4hep::TrackerHitData hit;
+    hit.time = 1.e-8;
+    trackerhits.push_back(hit);
+    track_L.push_back(2000.);
+    gammadata.emplace_back();
+    pv.SetXYZT(0.001, -0.002, 0.01, 0.);
+  }
+};
+
+void check_feature(const FCCAnalyses::JetConstituentsUtils::FCCAnalysesJetConstituentsFeatures& features,
+                   const std::string& name,
+                   const ROOT::VecOps::RVec<FCCAnalyses::JetConstituentsUtils::FCCAnalysesJetConstituentsData>& ref) {
+  auto res = FCCAnalyses::JetConstituentsUtils::get_feature(features, name);
+  REQUIRE(res.size() == ref.size());
+  for (size_t i = 0; i < ref.size(); ++i)
+    REQUIRE(ROOT::VecOps::All(res[i] == ref[i]));
+}
+}
+
+TEST_CASE("get_features_cluster", "[JetConstituentsUtils]") {
+  namespace jcu = FCCAnalyses::JetConstituentsUtils;
+  JetEvent ev;
+  const float Bz = 2.;
+  auto features = jcu::get_features_cluster(ev.jets, ev.jcs, ev.tracks, ev.pv, Bz, ev.dNdx, ev.trackdata, ev.track_L,
+                                            ev.trackerhits, ev.gammadata, ev.nhdata, ev.calohits);
+  REQUIRE(features.jets_begin.size() == 2);
+  REQUIRE(features.values.size() == 2 * jcu::get_features_names().size());
+  REQUIRE(jcu::get_feature_index("pfcand_erel_log") >= 0);
+  REQUIRE(jcu::get_feature_index("pfcand_unknown") == -1);
+  REQUIRE_THROWS(jcu::get_feature(features, "pfcand_unknown"));
+
+  auto dxy = jcu::XPtoPar_dxy(ev.jcs, ev.tracks, ev.pv, Bz);
+  auto dz = jcu::XPtoPar_dz(ev.jcs, ev.tracks, ev.pv, Bz);
+  auto phi0 = jcu::XPtoPar_phi(ev.jcs, ev.tracks, ev.pv, Bz);
+  auto isChargedHad = jcu::get_isChargedHad(ev.jcs);
+  check_feature(features, "pfcand_isChargedHad", isChargedHad);
+  check_feature(features, "pfcand_isGamma", jcu::get_isGamma(ev.jcs));
+  check_feature(features, "pfcand_p", jcu::get_p(ev.jcs));
+  check_feature(features, "pfcand_erel_log", jcu::get_erel_log_cluster(ev.jets, ev.jcs));
+  check_feature(features, "pfcand_thetarel", jcu::get_thetarel_cluster(ev.jets, ev.jcs));
+  check_feature(features, "pfcand_dndx", jcu::get_dndx(ev.jcs, ev.dNdx, ev.trackdata, isChargedHad));
+  check_feature(features, "pfcand_mtof",
+                jcu::get_mtof(ev.jcs, ev.track_L, ev.trackdata, ev.trackerhits, ev.gammadata, ev.nhdata, ev.calohits,
+                              ev.pv));
+  check_feature(features, "pfcand_dxy", dxy);
+  check_feature(features, "pfcand_dz", dz);
+  check_feature(features, "pfcand_phi0", phi0);
+  check_feature(features, "pfcand_C", jcu::XPtoPar_C(ev.jcs, ev.tracks, Bz));
+  check_feature(features, "pfcand_dxydz", jcu::get_d0_z0_cov(ev.jcs, ev.tracks));
+  auto sip3d = jcu::get_Sip3dVal_clusterV(ev.jets, dxy, dz, phi0, Bz);
+  check_feature(features, "pfcand_btagSip3dVal", sip3d);
+  check_feature(features, "pfcand_btagSip3dSig",
+                jcu::get_Sip3dSig(sip3d, jcu::get_d0_cov(ev.jcs, ev.tracks), jcu::get_z0_cov(ev.jcs, ev.tracks)));
+  check_feature(features, "pfcand_btagJetDistVal", jcu::get_JetDistVal_clusterV(ev.jets, ev.jcs, dxy, dz, phi0, Bz));
+}
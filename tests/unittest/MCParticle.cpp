@@ -0,0 +1,71 @@
+#include "FCCAnalyses/MCParticle.h"
+
+// Catch2
+#include "catch2/catch_test_macros.hpp"
+
+namespace {
+// e+ e- -> Z -> tau+ tau-, tau- -> pi- nu, tau+ -> mu+ nu nu
+// indices: 0 e-, 1 e+, 2 Z, 3 tau-, 4 tau+, 5 pi-, 6 nu, 7 mu+, 8 nu, 9 nu
+struct DecayChain {
+  ROOT::VecOps::RVec<edm4hep::MCParticleData> in;
+  ROOT::VecOps::RVec<int> parents;
+  ROOT::VecOps::RVec<int> daughters;
+
+  DecayChain() {
+    const std::vector<int> pdg = {11, -11, 23, 15, -15, -211, 16, -13, -16, 14};
+    const std::vector<std::vector<int>> par = {{}, {}, {0, 1}, {2}, {2}, {3}, {3}, {4}, {4}, {4}};
+    const std::vector<std::vector<int>> dau = {{2}, {2}, {3, 4}, {5, 6}, {7, 8, 9}, {}, {}, {}, {}, {}};
+    for (size_t i = 0; i < pdg.size(); ++i) {
+      edm4hep::MCParticleData p;
+      p.PDG = pdg[i];
+      p.generatorStatus = dau[i].empty() ? 1 : 2;
+      if (i < 2) p.generatorStatus = 4;
+      p.parents_begin = parents.size();
+      for (int j : par[i]) parents.push_back(j);
+      p.parents_end = parents.size();
+      p.daughters_begin = daughters.size();
+      for (int j : dau[i]) daughters.push_back(j);
+      p.daughters_end = daughters.size();
+      in.push_back(p);
+    }
+  }
+};
+}
+
+TEST_CASE("MCDecayGraph", "[MCParticle]") {
+  DecayChain chain;
+  auto graph = FCCAnalyses::MCParticle::get_decay_graph(chain.in, chain.parents, chain.daughters);
+  REQUIRE(graph.n == 10);
+  REQUIRE(graph.parents_begin.size() == 11);
+  REQUIRE(FCCAnalyses::MCParticle::is_descendant(7, 2, graph));
+  REQUIRE(FCCAnalyses::MCParticle::is_descendant(7, 0, graph));
+  REQUIRE_FALSE(FCCAnalyses::MCParticle::is_descendant(7, 3, graph));
+  REQUIRE_FALSE(FCCAnalyses::MCParticle::is_descendant(2, 2, graph));
+  REQUIRE(FCCAnalyses::MCParticle::get_first_ancestor(7, 15, graph) == 4);
+  REQUIRE(FCCAnalyses::MCParticle::get_first_ancestor(7, 15, graph, false) == -1);
+  REQUIRE(FCCAnalyses::MCParticle::get_first_ancestor(5, 23, graph) == 2);
+  // both beam particles match, neither comes from the other
+  REQUIRE(FCCAnalyses::MCParticle::get_first_ancestor(7, 11, graph) == 0);
+  REQUIRE(FCCAnalyses::MCParticle::get_first_ancestor(7, -11, graph, false) == 1);
+}
+
+TEST_CASE("MCDecayGraph_stable_particles", "[MCParticle]") {
+  DecayChain chain;
+  auto graph = FCCAnalyses::MCParticle::get_decay_graph(chain.in, chain.parents, chain.daughters);
+  for (int i = 0; i < 10; ++i) {
+    REQUIRE(FCCAnalyses::MCParticle::get_list_of_stable_particles_from_decay(i, graph) ==
+            FCCAnalyses::MCParticle::get_list_of_stable_particles_from_decay(i, chain.in, chain.daughters));
+  }
+  auto res = FCCAnalyses::MCParticle::get_list_of_stable_particles_from_decay(2, graph);
+  REQUIRE(res == std::vector<int>{5, 6, 7, 8, 9});
+}
+
+TEST_CASE("MCDecayGraph_lepton_origin", "[MCParticle]") {
+  DecayChain chain;
+  auto graph = FCCAnalyses::MCParticle::get_decay_graph(chain.in, chain.parents, chain.daughters);
+  REQUIRE(FCCAnalyses::MCParticle::get_lepton_origin(7, graph) == -15);
+  REQUIRE(FCCAnalyses::MCParticle::get_lepton_origin(3, graph) == 23);
+  REQUIRE(FCCAnalyses::MCParticle::get_lepton_origin(5, graph) == -1);
+  REQUIRE(FCCAnalyses::MCParticle::get_lepton_origin(7, graph) ==
+          FCCAnalyses::MCParticle::get_lepton_origin(7, chain.in, chain.parents));
+}
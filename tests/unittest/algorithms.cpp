@@ -80,3 +80,35 @@ TEST_CASE("calculate_thrust", "[algorithms]") {
   REQUIRE(res[2] == Catch::Approx( 0.52436 ));
   REQUIRE(res[3] == Catch::Approx( 0.166992 ));
 }
+
+
+TEST_CASE("calculate_sphericity", "[algorithms]") {
+  ROOT::VecOps::RVec<float> x {0., 1., 3., 7., 11., 3.};
+  ROOT::VecOps::RVec<float> y {0., -1., 3., -7., -11., .3};
+  ROOT::VecOps::RVec<float> z {5., -3., 1., 4., 2., -4};
+
+  // axis orientation is arbitrary
+  auto res = FCCAnalyses::Algorithms::calculate_sphericity()(x, y, z);
+  REQUIRE(res[0] == Catch::Approx( 0.28065 ));
+  REQUIRE(std::abs(res[1]) == Catch::Approx( 0.69974 ));
+  REQUIRE(std::abs(res[3]) == Catch::Approx( 0.68560 ));
+  REQUIRE(std::abs(res[5]) == Catch::Approx( 0.20080 ));
+  REQUIRE(res[1] * res[3] < 0.);
+  REQUIRE(res[1] * res[5] > 0.);
+}
+
+
+TEST_CASE("calculate_thrust_sweep", "[algorithms]") {
+  ROOT::VecOps::RVec<float> x {0., 1., 3., 7., 11., 3.};
+  ROOT::VecOps::RVec<float> y {0., -1., 3., -7., -11., .3};
+  ROOT::VecOps::RVec<float> z {5., -3., 1., 4., 2., -4};
+
+  // same thrust as calculate_thrust, axis orientation is arbitrary
+  auto res = FCCAnalyses::Algorithms::calculate_thrust_sweep()(x, y, z);
+  REQUIRE(res[0] == Catch::Approx( 0.67978 ));
+  REQUIRE(std::abs(res[1]) == Catch::Approx( 0.83496 ));
+  REQUIRE(std::abs(res[3]) == Catch::Approx( 0.52436 ));
+  REQUIRE(std::abs(res[5]) == Catch::Approx( 0.166992 ));
+  REQUIRE(res[1] * res[3] < 0.);
+  REQUIRE(res[1] * res[5] < 0.);
+}
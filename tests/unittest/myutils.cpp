@@ -209,3 +209,53 @@ TEST_CASE("get_p", "[basics]") {
 
   REQUIRE(FCCAnalyses::myUtils::get_p(p) == Catch::Approx(3.));
 }
+
+
+TEST_CASE("VertexColl", "[basics]") {
+  ROOT::VecOps::RVec<FCCAnalyses::VertexingUtils::FCCAnalysesVertex> vVec;
+
+  FCCAnalyses::VertexingUtils::FCCAnalysesVertex v1;
+  v1.vertex.primary = 1;
+  v1.vertex.position = {0.1, 0.2, 0.3};
+  v1.vertex.covMatrix = {.04, 0., .09, 0., 0., .16};
+  v1.ntracks = 2;
+  v1.reco_ind = {0, 3};
+  vVec.push_back(v1);
+
+  FCCAnalyses::VertexingUtils::FCCAnalysesVertex v2;
+  v2.vertex.primary = 0;
+  v2.vertex.position = {1.1, -1.8, 2.3};
+  v2.ntracks = 3;
+  v2.reco_ind = {1, 2, 5};
+  v2.reco_chi2 = {.5, 1., 1.5};
+  vVec.push_back(v2);
+
+  auto coll = FCCAnalyses::VertexingUtils::get_VertexColl(vVec);
+  REQUIRE(FCCAnalyses::VertexingUtils::get_VertexColl_n(coll) == 2);
+  REQUIRE(coll.reco_ind.size() == 5);
+  REQUIRE(coll.reco_chi2[3] == Catch::Approx(1.));
+
+  auto x = FCCAnalyses::VertexingUtils::get_VertexColl_x(coll);
+  REQUIRE(x.size() == 2);
+  REQUIRE(x[1] == Catch::Approx(1.1));
+  // views share the memory of the collection
+  REQUIRE(x.data() == coll.x.data());
+
+  auto ind = FCCAnalyses::VertexingUtils::get_VertexColl_recoInd(coll, 1);
+  REQUIRE(ind.size() == 3);
+  REQUIRE(ind[2] == 5);
+  REQUIRE(FCCAnalyses::VertexingUtils::get_VertexColl_recoInd(coll, 2).empty());
+
+  auto yErr = FCCAnalyses::VertexingUtils::get_VertexColl_posErr(coll, 1);
+  REQUIRE(yErr[0] == Catch::Approx(.3));
+
+  for (int comp = -1; comp < 3; comp++) {
+    auto d2PV = FCCAnalyses::VertexingUtils::get_VertexColl_d2PV(coll, comp);
+    auto d2PV_ref = FCCAnalyses::myUtils::get_Vertex_d2PV(vVec, comp);
+    REQUIRE(d2PV[0] == Catch::Approx(0.));
+    REQUIRE(d2PV[1] == Catch::Approx(d2PV_ref[1]));
+  }
+  // components are taken as PV - vertex
+  auto d2PV_x = FCCAnalyses::VertexingUtils::get_VertexColl_d2PV(coll, 0);
+  REQUIRE(d2PV_x[1] == Catch::Approx(-1.));
+}
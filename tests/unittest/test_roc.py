@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+'''
+Unit tests of the ROC curves computed from the discriminant histograms.
+'''
+
+import unittest
+import numpy as np
+import ROOT  # type: ignore
+
+from roc import RocBooker, efficiencies, log_distance
+
+
+# _____________________________________________________________________________
+class EfficienciesTest(unittest.TestCase):
+    '''
+    Fraction of the histogram entries above the thresholds.
+    '''
+    def setUp(self):
+        self.hist = ROOT.TH1D('h_roc_test', '', 10, 0., 1.)
+        self.hist.SetDirectory(0)
+        for i in range(10):
+            self.hist.Fill(0.1 * i + 0.05)
+
+    def test_bin_edges(self):
+        '''
+        Thresholds on the bin edges.
+        '''
+        eff = efficiencies(self.hist, [0., 0.2, 0.5, 0.9, 1.])
+        np.testing.assert_allclose(eff, [1., 0.8, 0.5, 0.1, 0.])
+
+    def test_underflow_overflow(self):
+        '''
+        Underflow entries are below every threshold, thresholds above the
+        upper edge take the overflow entries.
+        '''
+        self.hist.Fill(-1.)
+        self.hist.Fill(2.)
+        eff = efficiencies(self.hist, [-2., 0., 1., 3., np.inf])
+        np.testing.assert_allclose(eff, [11. / 12., 11. / 12., 1. / 12.,
+                                         1. / 12., 1. / 12.])
+
+    def test_empty(self):
+        '''
+        No efficiency can be computed from an empty histogram.
+        '''
+        self.hist.Reset()
+        with self.assertRaises(ValueError):
+            efficiencies(self.hist, [0.5])
+
+
+# _____________________________________________________________________________
+class RocBookerTest(unittest.TestCase):
+    '''
+    ROC curves filled from a dataframe, with discriminants up to 6 decades
+    away from 1.
+    '''
+    def test_log_distance(self):
+        '''
+        Distance of the discriminant to 1 on a log scale.
+        '''
+        np.testing.assert_allclose(log_distance([0., 0.9, 0.999, 1.]),
+                                   [0., 1., 3., np.inf])
+
+    def test_curve(self):
+        '''
+        One discriminant value 1 - 10^-k per event, for k = 0, ..., 6.
+        '''
+        dframe = ROOT.RDataFrame(7) \
+            .Define('roc_test_b',
+                    'ROOT::VecOps::RVec<float>{'
+                    'float(std::pow(10., -double(rdfentry_)))}') \
+            .Define('roc_test_s', '1.f - roc_test_b')
+        booker = RocBooker()
+        booker.add('test', dframe, dframe, 'roc_test_s', 'roc_test_b')
+        booker.run()
+
+        thresholds = 1. - np.power(10., -np.arange(0.5, 6.))
+        eff_s, eff_b = booker.curve('test', thresholds)
+        expected = np.arange(6, 0, -1) / 7.
+        np.testing.assert_allclose(eff_s, expected)
+        np.testing.assert_allclose(eff_b, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()